@@ -0,0 +1,160 @@
+"""ParsedBlock 메모리 벤치마크: 기존 dict 기반 블록 + 블록별 context_path 복사 vs
+슬롯 블록 + 인턴 block_type + 공유 ContextPath.
+
+사용법:
+    python scripts/bench_block_memory.py                     # 100k 블록, 깊이 6
+    python scripts/bench_block_memory.py --blocks 500000 --depth 10
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tractara.parsing.models import (  # noqa: E402
+    EMPTY_CONTEXT_PATH,
+    BoundingBox,
+    ParsedBlock,
+)
+
+
+@dataclass
+class LegacyBoundingBox:
+    """변경 전 BoundingBox (인스턴스 __dict__)."""
+
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    page: int
+
+
+@dataclass
+class LegacyParsedBlock:  # pylint: disable=too-many-instance-attributes
+    """변경 전 ParsedBlock (인스턴스 __dict__, 블록마다 context_path 리스트)."""
+
+    page: int
+    block_type: str
+    text: Optional[str] = None
+    bbox: Optional[LegacyBoundingBox] = None
+    table_data: Optional[Dict] = None
+    equation_data: Optional[Dict] = None
+    confidence: float = 1.0
+    level: int = 999
+    context_path: List[str] = field(default_factory=list)
+    parent_id: Optional[str] = None
+    block_id: Optional[str] = None
+    section_label: Optional[str] = None
+    section_title: Optional[str] = None
+    structured_content: Optional[Dict[str, Any]] = None
+    source_xpath: Optional[str] = None
+    source_element_name: Optional[str] = None
+    xml_fragment: Optional[str] = None
+
+
+def _texts(n: int) -> List[str]:
+    """양쪽 표현이 공유하는 본문 (측정 대상에서 제외)."""
+    return [f"Paragraph {i} describing the inspection procedure." for i in range(n)]
+
+
+def _block_type(i: int) -> str:
+    # XML 태그 등에서 온 것처럼 매번 새로 만들어지는 타입 문자열
+    return "".join(["para", "graph"]) if i % 10 else "".join(["sec", "tion"])
+
+
+def build_legacy(n: int, depth: int, texts: List[str]) -> List[LegacyParsedBlock]:
+    """기존 스택 방식: 블록마다 [item["title"] for item in stack] 복사."""
+    blocks: List[LegacyParsedBlock] = []
+    stack: List[Dict] = []
+    for i in range(n):
+        is_heading = i % 10 == 0
+        level = (i // 10) % depth + 1 if is_heading else 999
+        while is_heading and stack and stack[-1]["level"] >= level:
+            stack.pop()
+        block_id = str(uuid.UUID(int=i))
+        blocks.append(
+            LegacyParsedBlock(
+                page=i // 50 + 1,
+                block_type=_block_type(i),
+                text=texts[i],
+                bbox=LegacyBoundingBox(72.0, 100.0, 540.0, 120.0, i // 50 + 1),
+                level=level,
+                context_path=[item["title"] for item in stack],
+                parent_id=stack[-1]["id"] if stack else None,
+                block_id=block_id,
+            )
+        )
+        if is_heading:
+            stack.append({"level": level, "id": block_id, "title": texts[i]})
+    return blocks
+
+
+def build_compact(n: int, depth: int, texts: List[str]) -> List[ParsedBlock]:
+    """변경 후: 스택에 경로 노드를 두고 블록은 노드를 참조만 한다."""
+    blocks: List[ParsedBlock] = []
+    stack: List[Dict] = []
+    for i in range(n):
+        is_heading = i % 10 == 0
+        level = (i // 10) % depth + 1 if is_heading else 999
+        while is_heading and stack and stack[-1]["level"] >= level:
+            stack.pop()
+        block_id = str(uuid.UUID(int=i))
+        path = stack[-1]["path"] if stack else EMPTY_CONTEXT_PATH
+        blocks.append(
+            ParsedBlock(
+                page=i // 50 + 1,
+                block_type=_block_type(i),
+                text=texts[i],
+                bbox=BoundingBox(72.0, 100.0, 540.0, 120.0, i // 50 + 1),
+                level=level,
+                context_path=path,
+                parent_id=stack[-1]["id"] if stack else None,
+                block_id=block_id,
+            )
+        )
+        if is_heading:
+            stack.append({"level": level, "id": block_id, "path": path.child(texts[i])})
+    return blocks
+
+
+def measure(builder, n: int, depth: int, texts: List[str]):
+    """builder 결과가 유지하는 순수 할당량 (bytes)과 블록 목록."""
+    gc.collect()
+    tracemalloc.start()
+    blocks = builder(n, depth, texts)
+    gc.collect()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, blocks
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--blocks", type=int, default=100_000)
+    ap.add_argument("--depth", type=int, default=6)
+    args = ap.parse_args()
+
+    texts = _texts(args.blocks)
+    legacy_bytes, legacy = measure(build_legacy, args.blocks, args.depth, texts)
+    compact_bytes, compact = measure(build_compact, args.blocks, args.depth, texts)
+
+    identical = all(
+        (a.block_type, a.context_path, a.parent_id)
+        == (b.block_type, b.context_path.to_list(), b.parent_id)
+        for a, b in zip(legacy, compact)
+    )
+    mean_depth = sum(len(b.context_path) for b in compact) / len(compact)
+    print(f"blocks={args.blocks} max_depth={args.depth} mean_path={mean_depth:.2f}")
+    print(f"{'representation':<16} {'MiB':>8} {'B/block':>8}")
+    for name, size in (("legacy", legacy_bytes), ("compact", compact_bytes)):
+        print(f"{name:<16} {size / 2**20:>8.1f} {size / args.blocks:>8.0f}")
+    print(f"reduction: {1 - compact_bytes / legacy_bytes:.0%}  identical={identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""카탈로그 메타데이터 매핑 벤치마크: YAML 규칙 매 문서 해석 vs 사전 컴파일 실행 계획.
+
+S1000D 데이터 모듈 디렉터리(없으면 합성 모듈 생성)의 각 파일에 _base + s1000d
+카탈로그 metadata 규칙을 적용하는 시간만 측정한다 (XML 파싱은 측정 밖에서 1회).
+
+사용법:
+    python scripts/bench_catalog_plan.py                     # 합성 모듈 200개 (단계 300개)
+    python scripts/bench_catalog_plan.py --dir path/to/csdb  # 실제 데이터 모듈 디렉터리
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from lxml import etree
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tractara.catalogs import catalog_loader  # noqa: E402
+from tractara.catalogs.transforms import TRANSFORM_REGISTRY  # noqa: E402
+from tractara.parsing.metadata_extractor import _evaluate_rule  # noqa: E402
+
+_MODULE = """<?xml version="1.0" encoding="UTF-8"?>
+<dmodule xmlns:dc="http://www.purl.org/dc/elements/1.1/">
+  <rdf:Description xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+    <dc:title>Bicycle - Maintenance {n}</dc:title>
+    <dc:creator>KAERI</dc:creator>
+    <dc:subject>Wheel - Brake - Chain</dc:subject>
+  </rdf:Description>
+  <identAndStatusSection>
+    <dmAddress>
+      <dmIdent>
+        <dmCode modelIdentCode="BIKE" systemDiffCode="A" systemCode="{sys:02d}"
+          subSystemCode="0" subSubSystemCode="0" assyCode="00" disassyCode="00"
+          disassyCodeVariant="A" infoCode="520" infoCodeVariant="A"
+          itemLocationCode="D"/>
+      </dmIdent>
+      <dmAddressItems>
+        <issueDate year="2024" month="3" day="{day}"/>
+        <dmTitle><techName>Bicycle {n}</techName><infoName>Removal</infoName></dmTitle>
+      </dmAddressItems>
+    </dmAddress>
+    <dmStatus issueType="changed">
+      <security securityClassification="01"/>
+      <responsiblePartnerCompany><enterpriseName>ACME</enterpriseName></responsiblePartnerCompany>
+      <originator><enterpriseName>Bike Works</enterpriseName></originator>
+      <applic id="app-1"><displayText><simplePara>All</simplePara></displayText></applic>
+      <skillLevel skillLevelCode="sk02"/>
+      <qualityAssurance><firstVerification verificationType="tabtop"/></qualityAssurance>
+    </dmStatus>
+  </identAndStatusSection>
+  <content><procedure><mainProcedure>{steps}</mainProcedure></procedure></content>
+</dmodule>
+"""
+_STEP = (
+    '<proceduralStep id="s{i}"><para>Loosen bolt {i} with the wrench.</para>'
+    "<torque><torqueValue>{i}</torqueValue><torqueUnit>Nm</torqueUnit></torque>"
+    "</proceduralStep>"
+)
+
+
+def write_modules(directory: Path, count: int, steps: int) -> List[Path]:
+    """합성 S1000D 데이터 모듈을 생성한다."""
+    body = "".join(_STEP.format(i=i) for i in range(steps))
+    paths = []
+    for n in range(count):
+        path = directory / f"DMC-BIKE-A-{n:04d}.xml"
+        path.write_text(
+            _MODULE.format(n=n, sys=n % 100, day=n % 28 + 1, steps=body),
+            encoding="utf-8",
+        )
+        paths.append(path)
+    return paths
+
+
+def legacy_values(root: Any, catalog: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """변경 전 _apply_catalog_metadata의 규칙 해석 (find/findall + 레지스트리 조회)."""
+
+    def _get_element(xpath_or_dc: str) -> Any:
+        if xpath_or_dc.startswith(".//") or "/" in xpath_or_dc:
+            return root.find(xpath_or_dc)
+        dc_uris = catalog.get(
+            "dc_namespaces",
+            [
+                "http://purl.org/dc/elements/1.1/",
+                "http://www.purl.org/dc/elements/1.1/",
+            ],
+        )
+        for uri in dc_uris:
+            el = root.find(f".//{{{uri}}}{xpath_or_dc}")
+            if el is not None:
+                return el
+        return None
+
+    def _get_elements(xpath_or_dc: str) -> List[Any]:
+        if xpath_or_dc.startswith(".//") or "/" in xpath_or_dc:
+            return root.findall(xpath_or_dc)
+        dc_uris = catalog.get(
+            "dc_namespaces",
+            [
+                "http://purl.org/dc/elements/1.1/",
+                "http://www.purl.org/dc/elements/1.1/",
+            ],
+        )
+        for uri in dc_uris:
+            els = root.findall(f".//{{{uri}}}{xpath_or_dc}")
+            if els:
+                return els
+        return []
+
+    values: List[Tuple[str, Any]] = []
+    for field_key, rules in catalog.get("metadata", {}).items():
+        rules_list = [rules] if isinstance(rules, dict) else rules
+        for rule in rules_list:
+            if "static" in rule:
+                values.append((field_key, rule["static"]))
+                continue
+            elements = _get_elements(rule.get("xpath") or rule.get("dc_element"))
+            if not elements:
+                continue
+            transform_name = rule.get("transform")
+            if transform_name and transform_name in TRANSFORM_REGISTRY:
+                transform_fn = TRANSFORM_REGISTRY[transform_name]
+                if transform_name in ("jats_author_name", "join_text"):
+                    val = transform_fn(elements)
+                else:
+                    val = transform_fn(elements[0])
+            else:
+                if "attribute" in rule:
+                    texts = [
+                        e.get(rule["attribute"])
+                        for e in elements
+                        if e.get(rule["attribute"])
+                    ]
+                else:
+                    texts = [
+                        "".join(e.itertext()).strip()
+                        for e in elements
+                        if getattr(e, "text", None) or "".join(e.itertext()).strip()
+                    ]
+                val = texts[0] if texts else None
+                if "combine_with" in rule and val:
+                    other_el = _get_element(rule["combine_with"])
+                    other_val = (
+                        "".join(other_el.itertext()).strip()
+                        if other_el is not None
+                        else ""
+                    )
+                    if other_val:
+                        val = f"{val}{rule.get('separator', ' ')}{other_val}"
+                if "split_by" in rule and val:
+                    val = [s.strip() for s in val.split(rule["split_by"]) if s.strip()]
+                if "template" in rule and val and isinstance(val, str):
+                    val = rule["template"].format(value=val)
+            if val is not None:
+                values.append((field_key, val))
+    return values
+
+
+def plan_values(root: Any, catalog: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """사전 컴파일 실행 계획으로 같은 규칙을 평가한다."""
+    plan = catalog_loader.get_catalog_plan(catalog)
+    bound = plan.bind(root)
+    values: List[Tuple[str, Any]] = []
+    for field_key, rules in plan.metadata_fields:
+        for rule in rules:
+            val = _evaluate_rule(bound, rule)
+            if val is not None:
+                values.append((field_key, val))
+    return values
+
+
+def run(roots: List[Any], catalogs: List[Dict[str, Any]], fn) -> Tuple[float, list]:
+    started = time.perf_counter()
+    results = [[fn(root, catalog) for catalog in catalogs] for root in roots]
+    return time.perf_counter() - started, results
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--dir", type=Path, default=None, help="S1000D 데이터 모듈 디렉터리")
+    ap.add_argument("--modules", type=int, default=200)
+    ap.add_argument("--steps", type=int, default=300, help="합성 모듈당 절차 단계 수")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = (
+            sorted(args.dir.glob("*.xml"))
+            if args.dir
+            else write_modules(Path(tmp), args.modules, args.steps)
+        )
+        # pylint: disable-next=c-extension-no-member
+        roots = [etree.parse(str(p)).getroot() for p in paths]
+
+    catalogs = [
+        catalog_loader.get_base_catalog(),
+        catalog_loader.detect_catalog("dmodule"),
+    ]
+    plan_values(roots[0], catalogs[1])  # 계획 컴파일 (캐시) 워밍업
+
+    legacy_s, expected = run(roots, catalogs, legacy_values)
+    plan_s, actual = run(roots, catalogs, plan_values)
+
+    elements = sum(1 for _ in roots[0].iter())
+    print(f"modules={len(roots)} elements/module={elements}")
+    print(f"{'mode':<10} {'total(s)':>9} {'ms/module':>10}")
+    for name, seconds in (("legacy", legacy_s), ("compiled", plan_s)):
+        print(f"{name:<10} {seconds:>9.3f} {seconds * 1000 / len(roots):>10.2f}")
+    print(f"speedup: {legacy_s / plan_s:.1f}x  identical={expected == actual}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""EquationDetector 벤치마크: 기존 블록별 휴리스틱 대비 수식 탐지 단계 처리량 측정.
+
+합성 블록(일반 문단, 인라인 수식 문단, 단독 수식, 도입 문장, 연락처 등)을 만들어
+기존 구현(매 블록 set/정규식 재생성 + remaining_text 재슬라이스)과
+EquationDetector 기반 구현의 분할 + 재분류 결과/시간을 비교한다.
+
+사용법:
+    python scripts/bench_equation_detector.py                  # 100k 블록
+    python scripts/bench_equation_detector.py --blocks 20000 --long-chars 200000
+"""
+import argparse
+import random
+import re
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tractara.parsing.equation_detector import EquationDetector  # noqa: E402
+from tractara.parsing.models import ParsedBlock  # noqa: E402
+from tractara.parsing.pdf_parser import (  # noqa: E402
+    _reclassify_equations,
+    _split_inline_equations,
+)
+
+_TEMPLATES = [
+    "The fatigue life of the component is evaluated for each transient in the "
+    "design specification and the results are summarized in Table {n}.",
+    "where",
+    "The environmental correction factor is given by",
+    "F_en = exp(0.935 - T* e* O*) ({n})",
+    "Here, T* is the transformed temperature and O* the dissolved oxygen.",
+    "The strain rate is defined as e_dot = d(eps)/dt ({n}) and the transformed "
+    "strain rate follows from the same relation as in Ref. ({n}) above.",
+    "Contact: reviewer@example.org, Facsimile: 301-415-2289",
+    "σ = E ε + α ΔT",
+    "Results for case {n} agree with the measured values within 5 percent, as "
+    "shown in equation (3) of the previous section.",
+]
+
+
+def build_blocks(count: int, long_chars: int, seed: int = 7):
+    """합성 블록 목록 (마지막에 긴 문단 하나 포함)."""
+    rng = random.Random(seed)
+    texts = [rng.choice(_TEMPLATES).format(n=rng.randint(1, 40)) for _ in range(count)]
+    if long_chars:
+        # 번호 있는 수식 하나 뒤에 번호 없는 긴 꼬리: 기존 구현은 꼬리에서 O(n²) 재탐색
+        sentence = "The load x = y + z is applied to the outer surface. "
+        texts.append(
+            "The load is given by P = F / A (1). "
+            + sentence * (long_chars // len(sentence))
+        )
+    return texts
+
+
+def _blocks(texts):
+    return [
+        ParsedBlock(page=1, block_type="paragraph", text=t, block_id=str(uuid.uuid4()))
+        for t in texts
+    ]
+
+
+# ── 기존 구현 (비교 기준) ────────────────────────────────────────────────────
+_LEGACY_INLINE = re.compile(
+    r"(?P<eq_text>.+?)\(\s*(?P<num>\d+(\.\d+)*[a-zA-Z]?)\s*\)", re.DOTALL
+)
+
+
+def _legacy_split(blocks):
+    out = []
+    for block in blocks:
+        text = block.text
+        if len(text) < 30 or "=" not in text:
+            out.append(block)
+            continue
+        handled, remaining, parts = False, text, []
+        while True:
+            match = _LEGACY_INLINE.search(remaining)
+            if not match:
+                break
+            cand = match.group("eq_text").strip()
+            num = match.group("num")
+            if "=" not in cand:
+                remaining = remaining[match.end() :].strip()
+                continue
+            best = 0
+            for kw in ["where", "given by", "as follows", "defined as", "is:", "is "]:
+                idx = cand.lower().rfind(kw)
+                if idx != -1:
+                    best = max(best, idx + len(kw))
+            for punc in [". ", ": ", "; ", ".\n", ":\n", ";\n"]:
+                idx = cand.rfind(punc)
+                if idx != -1:
+                    best = max(best, idx + len(punc))
+            if best == 0 and cand.find("=") > 80:
+                remaining = remaining[match.end() :].strip()
+                continue
+            prefix = remaining[: match.start() + best].strip()
+            body = cand[best:].strip()
+            if len(body) < 3 or "=" not in body:
+                remaining = remaining[match.end() :].strip()
+                continue
+            if prefix:
+                parts.append(
+                    ParsedBlock(
+                        page=1,
+                        block_type="paragraph",
+                        text=prefix,
+                        block_id=str(uuid.uuid4()),
+                    )
+                )
+            parts.append(
+                ParsedBlock(
+                    page=1,
+                    block_type="equation",
+                    text=body,
+                    equation_data={"latex": body, "equationNumber": num},
+                    block_id=str(uuid.uuid4()),
+                )
+            )
+            remaining = remaining[match.end() :].strip()
+            handled = True
+        if handled and remaining:
+            parts.append(
+                ParsedBlock(
+                    page=1,
+                    block_type="paragraph",
+                    text=remaining,
+                    block_id=str(uuid.uuid4()),
+                )
+            )
+        out.extend(parts if handled else [block])
+    return out
+
+
+def _legacy_reclassify(blocks):
+    prev_kw = (
+        "where",
+        "given by",
+        "defined as",
+        "as follows",
+        "expressed as",
+        "is",
+        "equation",
+        "equation:",
+        "식",
+        "다음과 같다",
+    )
+    for i, block in enumerate(blocks):
+        text = block.text.strip()
+        if block.block_type != "paragraph" or not text:
+            continue
+        score = 1 if len(text) < 100 else 0
+        m = re.search(r"\((?P<num>\d+(\.\d+)*[a-zA-Z]?)\)\s*$", text)
+        if m:
+            score += 2
+        prev = blocks[i - 1].text.strip().lower() if i > 0 else ""
+        nxt = blocks[i + 1].text.strip().lower() if i + 1 < len(blocks) else ""
+        if any(prev.endswith(kw) for kw in prev_kw):
+            score += 2
+        if any(
+            nxt.startswith(kw) for kw in ("where", "from", "in which", "here", "여기서")
+        ):
+            score += 1
+        if re.search(r"\b(eq\.|eqs\.|equation|수식)\b", prev + " " + nxt):
+            score += 1
+        symbols = set("∑∫√±αβγδεζηθικλμνξοπρστυφχψωΔΓΘΛΞΠΣΦΨΩ=+-*/<>≤≥≈≠")
+        count = sum(1 for c in text if c in symbols)
+        if "=" in text or count >= 2:
+            score += 2
+        if any(text.lower().endswith(kw) for kw in prev_kw):
+            score -= 3
+        if len(text) > 200 and count < 3:
+            score -= 3
+        if "@" in text and re.search(r"[\w\.-]+@[\w\.-]+", text):
+            score -= 5
+        if re.search(r"\d{2,3}-\d{3,4}-\d{4}", text) and "=" not in text:
+            score -= 5
+        if score >= 3:
+            block.block_type = "equation"
+            block.equation_data = {
+                "latex": text,
+                "equationNumber": m.group("num") if m else "",
+            }
+    return blocks
+
+
+def _signature(blocks):
+    """분류 결과 비교용: 블록 유형 + 수식 본문/번호."""
+    return [
+        (
+            b.block_type,
+            b.equation_data["latex"] if b.equation_data else None,
+            b.equation_data["equationNumber"] if b.equation_data else None,
+        )
+        for b in blocks
+    ]
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--blocks", type=int, default=100_000, help="합성 블록 수")
+    ap.add_argument("--long-chars", type=int, default=20_000, help="추가할 긴 문단 길이 (0=없음)")
+    args = ap.parse_args()
+
+    texts = build_blocks(args.blocks, args.long_chars)
+    print(f"blocks={len(texts)}  long paragraph={args.long_chars} chars")
+    print(f"{'stage':>22} {'legacy(s)':>10} {'new(s)':>8} {'speedup':>8}")
+
+    legacy_blocks, legacy_split_t = _timed(_legacy_split, _blocks(texts))
+    new_blocks, new_split_t = _timed(_split_inline_equations, _blocks(texts))
+    print(
+        f"{'split_inline':>22} {legacy_split_t:>10.3f} {new_split_t:>8.3f} "
+        f"{legacy_split_t / new_split_t:>7.1f}x"
+    )
+
+    legacy_blocks, legacy_cls_t = _timed(_legacy_reclassify, legacy_blocks)
+    new_blocks, new_cls_t = _timed(_reclassify_equations, new_blocks)
+    print(
+        f"{'reclassify':>22} {legacy_cls_t:>10.3f} {new_cls_t:>8.3f} "
+        f"{legacy_cls_t / new_cls_t:>7.1f}x"
+    )
+
+    detector = EquationDetector()
+    _, batch_t = _timed(detector.analyze_batch, texts)
+    print(f"{'analyze_batch (new)':>22} {'-':>10} {batch_t:>8.3f}")
+
+    legacy_sig, new_sig = _signature(legacy_blocks), _signature(new_blocks)
+    equations = sum(1 for kind, _, _ in new_sig if kind == "equation")
+    print(f"equations={equations}  identical classification={legacy_sig == new_sig}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""BBox 겹침 질의 마이크로 벤치마크: 순수 Python 이중 루프 vs PageBoxIndex.
+
+사용법:
+    python scripts/bench_geometry.py                       # 페이지당 2000/5000/10000 블록
+    python scripts/bench_geometry.py --blocks 20000 --queries 5000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tractara.parsing.geometry import PageBoxIndex  # noqa: E402
+
+
+def _random_boxes(rng, n: int, max_size: float, page_w=612.0, page_h=792.0):
+    xy = rng.uniform(0, [page_w, page_h], size=(n, 2))
+    wh = rng.uniform(1, max_size, size=(n, 2))
+    return np.hstack([xy, xy + wh])
+
+
+def naive_any_overlap(queries, boxes):
+    """기존 _supplement_missing_equations 방식의 선형 스캔."""
+    box_list = [tuple(b) for b in boxes.tolist()]
+    result = []
+    for bx0, by0, bx1, by1 in queries.tolist():
+        hit = False
+        for dx0, dy0, dx1, dy1 in box_list:
+            if not (bx1 < dx0 or bx0 > dx1 or by1 < dy0 or by0 > dy1):
+                hit = True
+                break
+        result.append(hit)
+    return np.array(result)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--blocks", type=int, nargs="+", default=[2000, 5000, 10000])
+    ap.add_argument("--queries", type=int, default=None, help="기본: 블록 수와 동일")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(
+        f"{'blocks':>8} {'queries':>8} {'naive(s)':>10} {'index(s)':>10} "
+        f"{'speedup':>8} {'hit%':>6} identical"
+    )
+    for n in args.blocks:
+        m = args.queries or n
+        # 블록이 많을수록 작아지는 박스 (페이지 면적 대비 점유율 일정)
+        size = 24.0 * (1000 / n) ** 0.5
+        boxes = _random_boxes(rng, n, size)
+        # 실제 보충 단계처럼 대부분 겹치지 않는 질의 박스
+        queries = _random_boxes(rng, m, size / 2)
+
+        started = time.perf_counter()
+        expected = naive_any_overlap(queries, boxes)
+        naive_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        index = PageBoxIndex.from_page_boxes({1: boxes})
+        got = index.any_overlap(1, queries)
+        index_s = time.perf_counter() - started
+
+        print(
+            f"{n:>8} {m:>8} {naive_s:>10.3f} {index_s:>10.3f} "
+            f"{naive_s / index_s:>7.1f}x {expected.mean() * 100:>6.1f} "
+            f"{bool(np.array_equal(expected, got))}"
+        )
+
+
+if __name__ == "__main__":
+    main()
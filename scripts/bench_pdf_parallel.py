@@ -0,0 +1,95 @@
+"""PyMuPDFParser 병렬 샤드 모드 벤치마크: 워커 수에 따른 스케일링 측정.
+
+사용법:
+    python scripts/bench_pdf_parallel.py                 # 합성 600페이지 PDF
+    python scripts/bench_pdf_parallel.py path/to.pdf     # 실제 PDF
+    python scripts/bench_pdf_parallel.py --pages 2000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import pymupdf  # noqa: E402
+
+from tractara.parsing.pdf_parser import PyMuPDFParser  # noqa: E402
+
+
+def build_synthetic_pdf(path: Path, pages: int, pages_per_chapter: int = 25) -> Path:
+    """북마크가 달린 합성 보고서 PDF 생성."""
+    doc = pymupdf.open()
+    toc = []
+    for p in range(pages):
+        page = doc.new_page()
+        y = 72
+        if p % pages_per_chapter == 0:
+            ch = p // pages_per_chapter + 1
+            page.insert_text((72, y), f"{ch}. Chapter {ch}", fontsize=20)
+            toc.append([1, f"{ch}. Chapter {ch}", p + 1])
+            y += 40
+        for i in range(30):
+            page.insert_text(
+                (72, y + i * 20),
+                f"Paragraph {i} on page {p + 1}: the quick brown fox jumps over it.",
+                fontsize=10,
+            )
+    doc.set_toc(toc)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _structure(parsed):
+    index = {b.block_id: i for i, b in enumerate(parsed.blocks)}
+    return [
+        (b.page, b.block_type, b.text, tuple(b.context_path), index.get(b.parent_id))
+        for b in parsed.blocks
+    ]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("pdf", nargs="?", help="벤치마크할 PDF (생략 시 합성 PDF 생성)")
+    ap.add_argument("--pages", type=int, default=600, help="합성 PDF 페이지 수")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help="측정할 워커 수 목록",
+    )
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.pdf:
+            pdf_path = Path(args.pdf)
+        else:
+            pdf_path = build_synthetic_pdf(Path(tmp) / "synthetic.pdf", args.pages)
+
+        print(f"PDF: {pdf_path}  (cpu_count={os.cpu_count()})")
+        print(f"{'workers':>8} {'seconds':>9} {'speedup':>8} {'blocks':>8} identical")
+
+        baseline_time = None
+        baseline_structure = None
+        for workers in args.workers:
+            parser = PyMuPDFParser(max_workers=workers, parallel_min_pages=1)
+            started = time.perf_counter()
+            parsed = parser.parse(pdf_path)
+            elapsed = time.perf_counter() - started
+
+            structure = _structure(parsed)
+            if baseline_time is None:
+                baseline_time, baseline_structure = elapsed, structure
+            identical = structure == baseline_structure
+            print(
+                f"{workers:>8} {elapsed:>9.2f} {baseline_time / elapsed:>7.2f}x "
+                f"{len(parsed.blocks):>8} {identical}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""XML 조각 벤치마크: 블록마다 getpath()+tostring() (기존) vs 순회 중 경로 + 저장 시
+중첩 참조 직렬화.
+
+깊게 중첩된 levelledPara 안에 절차 단계가 있는 합성 S1000D 데이터 모듈로 측정한다.
+
+사용법:
+    python scripts/bench_xml_fragments.py                    # 깊이 12, 수준당 단계 200개
+    python scripts/bench_xml_fragments.py --depth 20 --steps 500
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from lxml import etree
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tractara.catalogs import catalog_loader  # noqa: E402
+from tractara.parsing.xml_parser import CatalogDrivenStrategy  # noqa: E402
+from tractara.parsing.xml_paths import locate_elements  # noqa: E402
+from tractara.ssot.fragment_store import serialize_nested_fragments  # noqa: E402
+
+
+def build_module(depth: int, steps: int) -> bytes:
+    """수준마다 steps개 절차 단계를 가진 depth 단계 중첩 levelledPara."""
+    step = "".join(
+        f"<proceduralStep><para>Check item {i} and record the value.</para>"
+        "</proceduralStep>"
+        for i in range(steps)
+    )
+    body = ""
+    for level in reversed(range(depth)):
+        body = f"<levelledPara><title>Level {level}</title>{step}{body}</levelledPara>"
+    return (
+        "<dmodule><identAndStatusSection/><content><procedure><mainProcedure>"
+        f"{body}</mainProcedure></procedure></content></dmodule>"
+    ).encode("utf-8")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--depth", type=int, default=12)
+    ap.add_argument("--steps", type=int, default=200, help="수준당 절차 단계 수")
+    args = ap.parse_args()
+
+    # pylint: disable-next=c-extension-no-member
+    root = etree.fromstring(build_module(args.depth, args.steps))
+    strategy = CatalogDrivenStrategy(catalog_loader.detect_catalog("dmodule"))
+
+    started = time.perf_counter()
+    blocks = list(strategy.iter_blocks(root, []))
+    locators = {b.block_id: b.source_xpath for b in blocks if b.source_xpath}
+    fragments = serialize_nested_fragments(root, locators)
+    lazy_s = time.perf_counter() - started
+    lazy_chars = sum(len(xml) for xml, _refs in fragments.values())
+
+    # 기존 방식: 블록 요소마다 getpath() + 하위 트리 전체 tostring()
+    located = locate_elements(root, locators.values())
+    elements = [located[path] for path in locators.values()]
+    tree = root.getroottree()
+    started = time.perf_counter()
+    list(strategy.iter_blocks(root, []))
+    eager = {}
+    for element in elements:
+        # pylint: disable-next=c-extension-no-member
+        eager[tree.getpath(element)] = etree.tostring(element, encoding="unicode")
+    eager_s = time.perf_counter() - started
+    eager_chars = sum(len(xml) for xml in eager.values())
+
+    identical = set(eager) == set(locators.values())
+    print(f"depth={args.depth} steps/level={args.steps} blocks={len(locators)}")
+    print(f"{'mode':<8} {'time(s)':>8} {'stored MiB':>11}")
+    for name, seconds, chars in (
+        ("eager", eager_s, eager_chars),
+        ("lazy", lazy_s, lazy_chars),
+    ):
+        print(f"{name:<8} {seconds:>8.3f} {chars / 2**20:>11.2f}")
+    print(
+        f"speedup: {eager_s / lazy_s:.1f}x  "
+        f"storage: {lazy_chars / eager_chars:.1%}  paths_identical={identical}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""대용량 XML 파싱 최대 메모리 벤치마크: etree.parse 트리 순회 vs iterparse 스트리밍.
+
+합성 S1000D 데이터 모듈(절차 단계 N개)을 만들고, 모드마다 별도 프로세스에서 블록을
+끝까지 생성(개수만 셈)한 뒤 최대 RSS를 비교한다.
+
+사용법:
+    python scripts/bench_xml_stream.py                  # 단계 200k개 (~60 MiB)
+    python scripts/bench_xml_stream.py --steps 1000000
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from lxml import etree
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tractara.catalogs import catalog_loader  # noqa: E402
+from tractara.parsing.xml_parser import CatalogDrivenStrategy  # noqa: E402
+from tractara.parsing.xml_stream import StreamingCatalogStrategy  # noqa: E402
+
+_HEAD = (
+    "<dmodule><identAndStatusSection><dmAddress><dmIdent><dmCode "
+    'modelIdentCode="BIKE" systemDiffCode="A" systemCode="00" subSystemCode="0" '
+    'subSubSystemCode="0" assyCode="00" disassyCode="00" disassyCodeVariant="A" '
+    'infoCode="520" infoCodeVariant="A" itemLocationCode="D"/></dmIdent>'
+    "<dmAddressItems><dmTitle><techName>Bicycle</techName></dmTitle>"
+    "</dmAddressItems></dmAddress></identAndStatusSection>"
+    "<content><procedure><mainProcedure>"
+)
+_TAIL = "</mainProcedure></procedure></content></dmodule>"
+
+
+def write_module(path: Path, steps: int, per_section: int = 100) -> None:
+    """per_section개 단계마다 levelledPara 하나인 데이터 모듈을 스트림으로 쓴다."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_HEAD)
+        for start in range(0, steps, per_section):
+            f.write(f"<levelledPara><title>Section {start}</title>")
+            for i in range(start, min(start + per_section, steps)):
+                f.write(
+                    f"<proceduralStep><para>Inspect item {i} and record the "
+                    f"measured value in the log.</para><torque><torqueValue>{i % 90}"
+                    "</torqueValue><torqueUnit>Nm</torqueUnit></torque>"
+                    "</proceduralStep>"
+                )
+            f.write("</levelledPara>")
+        f.write(_TAIL)
+
+
+def run_child(mode: str, path: Path) -> None:
+    """블록을 모두 생성하고 '개수 초 최대RSS(KiB)'를 출력한다."""
+    catalog = catalog_loader.detect_catalog("dmodule")
+    started = time.perf_counter()
+    if mode == "tree":
+        # pylint: disable-next=c-extension-no-member
+        root = etree.parse(str(path)).getroot()
+        blocks = CatalogDrivenStrategy(catalog).iter_blocks(root)
+    else:
+        blocks = StreamingCatalogStrategy(catalog).iter_file_blocks(path)
+    count = sum(1 for _ in blocks)
+    elapsed = time.perf_counter() - started
+    print(count, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--steps", type=int, default=200_000)
+    ap.add_argument(
+        "--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS
+    )
+    args = ap.parse_args()
+    if args.child:
+        run_child(args.child[0], Path(args.child[1]))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "DMC-BIG.xml"
+        write_module(path, args.steps)
+        size_mib = path.stat().st_size / 2**20
+        print(f"steps={args.steps} file={size_mib:.1f} MiB")
+        print(f"{'mode':<8} {'blocks':>8} {'time(s)':>8} {'peak RSS MiB':>13}")
+        for mode in ("tree", "stream"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.split()
+            count, seconds, rss_kib = int(out[0]), float(out[1]), int(out[2])
+            print(f"{mode:<8} {count:>8} {seconds:>8.2f} {rss_kib / 1024:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""S1000D 절차 단계 순회 벤치마크: 단계마다 applic 전체 탐색 (기존) vs 문서당 @id 색인.
+
+applicRefId가 달린 절차 단계 N개의 합성 데이터 모듈로 CatalogDrivenStrategy 순회
+시간을 잰다. 일부 단계는 모듈 안에 없는 applic(ACT/CCT 정의)을 참조해, 기존 방식은
+그때마다 문서 전체를 훑는다.
+
+사용법:
+    python scripts/bench_xml_traversal.py                    # 2.5k/5k/10k 단계
+    python scripts/bench_xml_traversal.py --steps 10000 20000 --dangling 0.5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, List
+
+from lxml import etree
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tractara.catalogs import catalog_loader  # noqa: E402
+from tractara.parsing.xml_parser import CatalogDrivenStrategy  # noqa: E402
+
+_APPLICS = 50
+
+
+def build_module(steps: int, dangling: float) -> bytes:
+    """levelledPara마다 단계 100개, 단계마다 note와 하위 단계 하나."""
+    applics = "".join(
+        f'<applic id="app-{i}"><displayText><simplePara>Model {i}</simplePara>'
+        f'</displayText><assert applicPropertyIdent="model" '
+        f'applicPropertyType="prodattr" applicPropertyValues="M{i}"/></applic>'
+        for i in range(_APPLICS)
+    )
+    every = int(1 / dangling) if dangling > 0 else 0
+    body: List[str] = []
+    for start in range(0, steps, 100):
+        body.append(f"<levelledPara><title>Section {start}</title>")
+        for i in range(start, min(start + 100, steps)):
+            ref = f"act-{i}" if every and i % every == 0 else f"app-{i % _APPLICS}"
+            body.append(
+                f'<proceduralStep applicRefId="{ref}"><para>Inspect item '
+                f"<emphasis>{i}</emphasis> and record.</para><note><notePara>"
+                f"Keep part {i}.</notePara></note><proceduralStep><para>Sub-step {i}"
+                "</para></proceduralStep></proceduralStep>"
+            )
+        body.append("</levelledPara>")
+    return (
+        "<dmodule><identAndStatusSection><dmAddress><dmAddressItems><dmTitle>"
+        "<techName>Bicycle</techName></dmTitle></dmAddressItems></dmAddress>"
+        f"<dmStatus>{applics}</dmStatus></identAndStatusSection><content><procedure>"
+        f"<mainProcedure>{''.join(body)}</mainProcedure></procedure></content>"
+        "</dmodule>"
+    ).encode("utf-8")
+
+
+class LegacyStrategy(CatalogDrivenStrategy):
+    """변경 전 조회: 단계마다 root.find(".//applic[@id='...']")."""
+
+    def _find_by_id(self, element: Any, tag: str, id_value: str) -> Any:
+        return element.getroottree().getroot().find(f".//{tag}[@id='{id_value}']")
+
+
+def run(strategy: CatalogDrivenStrategy, root: Any):
+    started = time.perf_counter()
+    blocks = list(strategy.iter_blocks(root, []))
+    elapsed = time.perf_counter() - started
+    index = {b.block_id: i for i, b in enumerate(blocks)}
+    shape = [
+        (b.block_type, b.text, index.get(b.parent_id), b.structured_content)
+        for b in blocks
+    ]
+    return elapsed, shape
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--steps", type=int, nargs="+", default=[2500, 5000, 10000])
+    ap.add_argument("--dangling", type=float, default=0.1, help="모듈 밖 applic 참조 비율")
+    args = ap.parse_args()
+
+    catalog = catalog_loader.detect_catalog("dmodule")
+    print(
+        f"{'steps':>6} {'legacy(s)':>10} {'indexed(s)':>11} {'us/step':>8} {'speedup':>8}"
+    )
+    identical = True
+    for steps in args.steps:
+        # pylint: disable-next=c-extension-no-member
+        root = etree.fromstring(build_module(steps, args.dangling))
+        legacy_s, expected = run(LegacyStrategy(catalog), root)
+        indexed_s, actual = run(CatalogDrivenStrategy(catalog), root)
+        identical = identical and expected == actual
+        print(
+            f"{steps:>6} {legacy_s:>10.3f} {indexed_s:>11.3f} "
+            f"{indexed_s * 1e6 / steps:>8.1f} {legacy_s / indexed_s:>7.1f}x"
+        )
+    print(f"identical={identical}")
+
+
+if __name__ == "__main__":
+    main()
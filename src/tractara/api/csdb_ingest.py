@@ -0,0 +1,280 @@
+"""S1000D CSDB 디렉토리 병렬 인제스트: 샤드 → 프로세스 풀 → 배치 저장 + 재개 매니페스트."""
+# src/tractara/api/csdb_ingest.py
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..catalogs import catalog_loader
+from ..curation.term_curation_service import merge_term_candidates
+from ..landing.landing_repository import (
+    LANDING_DIR,
+    delete_doc_landing,
+    save_doc_landing_batch,
+    save_term_candidates_landing,
+)
+from ..ssot.doc_ssot_repository import delete_docs, upsert_docs
+from ..ssot.term_ssot_repository import upsert_terms as upsert_term_ssot
+from ..validation.json_schema_validator import schema_registry
+from ..validation.term_validator import filter_promotable_terms
+from .pipeline import extract_term_baselines, parse_and_map_document
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CsdbIngestReport:
+    """CSDB 인제스트 결과 요약."""
+
+    total: int
+    skipped: int
+    succeeded: int
+    failed: int
+    seconds: float
+
+    @property
+    def files_per_second(self) -> float:
+        processed = self.succeeded + self.failed
+        return processed / self.seconds if self.seconds > 0 else 0.0
+
+
+def discover_data_modules(directory: Path) -> List[Path]:
+    """CSDB 디렉토리(하위 포함)의 DMC-*.xml 데이터 모듈 (대소문자 무시, 경로 정렬)."""
+    return sorted(
+        p
+        for p in directory.rglob("*")
+        if p.is_file()
+        and p.suffix.lower() == ".xml"
+        and p.name.upper().startswith("DMC-")
+    )
+
+
+def default_manifest_path(directory: Path) -> Path:
+    """CSDB 디렉토리별 매니페스트 경로 (원본 CSDB에는 쓰지 않는다)."""
+    resolved = directory.resolve()
+    digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()[:8]
+    return LANDING_DIR / "csdb" / f"{resolved.name}-{digest}.jsonl"
+
+
+class IngestManifest:
+    """
+    재개용 매니페스트 (JSONL, 배치 커밋마다 한 번 append + fsync).
+
+    항목: file(CSDB 기준 상대 경로), size, mtimeNs, status(ok/failed), documentId/error.
+    크기·mtime이 같은 ok 항목은 다음 실행에서 건너뛰고, failed 항목은 다시 시도한다.
+    배치 저장 전에 문서 id를 '.pending' 저널에 기록하고 커밋 후 지운다. 저널이 남아
+    있으면(커밋 전 중단) 그 배치가 쓴 DOC 파일을 지워 중복 documentId를 막는다.
+    TERM은 termId 기준 upsert라 재실행해도 같은 파일을 덮어쓸 뿐이다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.pending_path = path.with_name(path.name + ".pending")
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> None:
+        """기존 항목을 읽고 커밋되지 않은 배치를 롤백한다."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.pending_path.exists():
+            doc_ids = json.loads(self.pending_path.read_text(encoding="utf-8"))
+            logger.warning(
+                "Rolling back %d documents of an uncommitted batch.", len(doc_ids)
+            )
+            delete_doc_landing(doc_ids)
+            delete_docs(doc_ids)
+            self.pending_path.unlink()
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # append 도중 중단된 마지막 줄
+                    continue
+                self.entries[entry["file"]] = entry
+
+    def is_done(self, rel_path: str, stat: os.stat_result) -> bool:
+        entry = self.entries.get(rel_path)
+        return (
+            entry is not None
+            and entry.get("status") == "ok"
+            and entry.get("size") == stat.st_size
+            and entry.get("mtimeNs") == stat.st_mtime_ns
+        )
+
+    def begin(self, doc_ids: List[str]) -> None:
+        _write_synced(self.pending_path, json.dumps(doc_ids), mode="w")
+
+    def commit(self, entries: Iterable[Dict[str, Any]]) -> None:
+        entries = list(entries)
+        _write_synced(
+            self.path,
+            "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries),
+            mode="a",
+        )
+        for entry in entries:
+            self.entries[entry["file"]] = entry
+        self.pending_path.unlink(missing_ok=True)
+
+
+def _write_synced(path: Path, text: str, mode: str) -> None:
+    with path.open(mode, encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def ingest_csdb(
+    directory: Path,
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    extract_terms: bool = True,
+    manifest_path: Optional[Path] = None,
+) -> CsdbIngestReport:
+    """
+    CSDB 디렉토리의 데이터 모듈을 병렬 인제스트한다.
+
+    파일 목록을 batch_size개씩 샤드로 나눠 프로세스 풀(워커마다 카탈로그 실행 계획과
+    스키마를 한 번 준비)에서 파싱 → DOC baseline → (선택) TERM 추출까지 수행하고,
+    부모 프로세스가 완료된 샤드마다 Landing/SSoT를 한 배치로 쓴 뒤 매니페스트에
+    커밋한다. extract_terms=False이면 LLM 없이 결정론적 단계만 실행한다.
+    workers/batch_size 기본값: CSDB_INGEST_WORKERS(0 = CPU 수), CSDB_INGEST_BATCH_SIZE.
+    """
+    if workers is None:
+        workers = int(os.getenv("CSDB_INGEST_WORKERS", "0"))
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    if batch_size is None:
+        batch_size = int(os.getenv("CSDB_INGEST_BATCH_SIZE", "64"))
+    batch_size = max(1, batch_size)
+
+    manifest = IngestManifest(manifest_path or default_manifest_path(directory))
+    manifest.load()
+
+    files = discover_data_modules(directory)
+    todo = [
+        p
+        for p in files
+        if not manifest.is_done(p.relative_to(directory).as_posix(), p.stat())
+    ]
+    shards = [todo[i : i + batch_size] for i in range(0, len(todo), batch_size)]
+    report = CsdbIngestReport(
+        total=len(files),
+        skipped=len(files) - len(todo),
+        succeeded=0,
+        failed=0,
+        seconds=0.0,
+    )
+    logger.info(
+        "🚀 CSDB ingest: %d data modules (%d already done), %d shards, %d workers",
+        report.total,
+        report.skipped,
+        len(shards),
+        workers,
+    )
+
+    started = time.perf_counter()
+
+    def _commit(records: List[Dict[str, Any]]) -> None:
+        _commit_batch(records, manifest)
+        for record in records:
+            if record["status"] == "ok":
+                report.succeeded += 1
+            else:
+                report.failed += 1
+                logger.error("❌ 실패: %s (%s)", record["file"], record["error"])
+        report.seconds = time.perf_counter() - started
+        logger.info(
+            "[%d/%d] %.1f files/s",
+            report.succeeded + report.failed,
+            len(todo),
+            report.files_per_second,
+        )
+
+    if workers == 1 or len(shards) <= 1:
+        _init_worker()
+        for shard in shards:
+            _commit(_ingest_shard(shard, directory, extract_terms))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)), initializer=_init_worker
+        ) as executor:
+            futures = [
+                executor.submit(_ingest_shard, shard, directory, extract_terms)
+                for shard in shards
+            ]
+            for future in as_completed(futures):
+                _commit(future.result())
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def _init_worker() -> None:
+    """워커 초기화: 카탈로그 로드 + 실행 계획 컴파일 + 스키마 로드 (프로세스당 1회)."""
+    catalog_loader.warm_catalog_plans()
+    schema_registry.load()
+
+
+def _ingest_shard(
+    paths: List[Path], directory: Path, extract_terms: bool
+) -> List[Dict[str, Any]]:
+    """샤드 하나 처리 (워커). 저장은 하지 않고 파일별 결과 레코드를 돌려준다."""
+    llm_api_key = (
+        os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        if extract_terms
+        else None
+    )
+    records = []
+    for path in paths:
+        stat = path.stat()
+        record: Dict[str, Any] = {
+            "file": path.relative_to(directory).as_posix(),
+            "size": stat.st_size,
+            "mtimeNs": stat.st_mtime_ns,
+        }
+        try:
+            parsed, doc_baseline = parse_and_map_document(path)
+            terms: List[Dict[str, Any]] = []
+            warnings: List[str] = []
+            if extract_terms:
+                terms = extract_term_baselines(
+                    parsed, doc_baseline["documentId"], llm_api_key, warnings
+                )
+            record.update(
+                status="ok",
+                documentId=doc_baseline["documentId"],
+                doc=doc_baseline,
+                terms=terms,
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # 데이터 모듈 하나의 오류로 샤드 전체를 잃지 않는다
+            record.update(status="failed", error=f"{type(e).__name__}: {e}")
+        records.append(record)
+    return records
+
+
+def _commit_batch(records: List[Dict[str, Any]], manifest: IngestManifest) -> None:
+    """완료된 샤드 하나를 Landing/SSoT에 배치 저장하고 매니페스트에 커밋한다."""
+    ok = [r for r in records if r["status"] == "ok"]
+    docs = [r.pop("doc") for r in ok]
+    terms = [term for r in ok for term in r.pop("terms")]
+
+    manifest.begin([doc["documentId"] for doc in docs])
+    save_doc_landing_batch(docs)
+    upsert_docs(docs)
+    if terms:
+        save_term_candidates_landing(terms)
+        promotable, _problems = filter_promotable_terms(merge_term_candidates(terms))
+        if promotable:
+            upsert_term_ssot(promotable)
+    manifest.commit(records)
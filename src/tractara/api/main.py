@@ -11,6 +11,7 @@ from fastapi import FastAPI, File, UploadFile
 from fastapi.responses import JSONResponse, RedirectResponse
 
 from ..logging_setup import configure_logging
+from ..parsing.docling_pool import shutdown_default_pool, start_default_pool
 from ..problem_details import MachineReadableError, ProblemDetails
 from ..tracing import get_trace_id, new_child_span
 from ..validation.json_schema_validator import (
@@ -31,6 +32,14 @@ async def startup_event():
     """FastAPI 시작 시 로깅 및 스키마 초기화."""
     configure_logging()
     schema_registry.load()
+    # Docling 모델 로딩을 요청마다 반복하지 않도록 변환기 워커를 미리 띄워 둔다
+    start_default_pool()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """FastAPI 종료 시 Docling 변환기 풀 정리."""
+    shutdown_default_pool()
 
 
 @app.exception_handler(SchemaValidationException)
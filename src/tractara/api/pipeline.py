@@ -3,7 +3,7 @@
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..curation.term_curation_service import merge_term_candidates
 from ..landing.landing_repository import save_doc_landing, save_term_candidates_landing
@@ -12,8 +12,17 @@ from ..normalization.term_mapper import (
     build_term_baseline_candidates,
     extract_term_candidates,
 )
+from ..parsing.models import ParsedDocument
+from ..parsing.parse_cache import (
+    TIER_METADATA,
+    TIER_TERMS,
+    get_metadata_cache,
+    get_term_cache,
+)
 from ..parsing.pdf_parser import parse_pdf
+from ..parsing.pdf_session import PdfSession
 from ..parsing.xml_parser import parse_xml
+from ..problem_details import MachineReadableError
 from ..ssot.doc_ssot_repository import upsert_doc as upsert_doc_ssot
 from ..ssot.term_ssot_repository import upsert_terms as upsert_term_ssot
 from ..validation.json_schema_validator import schema_registry
@@ -22,7 +31,9 @@ from ..validation.term_validator import filter_promotable_terms
 logger = logging.getLogger(__name__)
 
 
-def ingest_single_document(file_path: Path) -> Dict[str, Any]:
+def ingest_single_document(
+    file_path: Path, bypass_llm_cache: bool = False
+) -> Dict[str, Any]:
     """
     PDF 1개에 대한 전체 파이프라인:
       1) 파싱
@@ -31,6 +42,8 @@ def ingest_single_document(file_path: Path) -> Dict[str, Any]:
       4) TERM 후보 생성 + Landing 저장
       5) TERM 병합 + 승격 가능 TERM 필터링 + TERM SSoT 저장
       6) 요약 결과 반환
+
+    bypass_llm_cache=True이면 메타데이터/TERM LLM 캐시를 건너뛰고 항상 새로 호출한다.
     """
 
     # LLM API 키 가져오기
@@ -45,15 +58,9 @@ def ingest_single_document(file_path: Path) -> Dict[str, Any]:
         warnings.append(msg)
 
     # 1) Parsing (Docling+PyMuPDF 사용 또는 XML 파싱)
-    if file_path.suffix.lower() == ".xml":
-        parsed = parse_xml(file_path)
-    else:
-        parsed = parse_pdf(file_path)
-
     # 2) DOC baseline + 스키마 검증
-    doc_baseline = build_doc_baseline(parsed)
-    schema_registry.validate(
-        "doc", doc_baseline, instance_path=doc_baseline["documentId"]
+    parsed, doc_baseline = parse_and_map_document(
+        file_path, bypass_llm_cache=bypass_llm_cache
     )
 
     # 3) Landing + DOC SSoT
@@ -61,19 +68,17 @@ def ingest_single_document(file_path: Path) -> Dict[str, Any]:
     upsert_doc_ssot(doc_baseline)
 
     # 4) TERM 후보 생성 (이제 LLM 사용!)
-    logger.info("🚀 Starting TERM extraction (after DOC creation)...")
-    term_candidates, extraction_errors = extract_term_candidates(
-        parsed, llm_api_key=llm_api_key
+    extraction_problems: List[MachineReadableError] = []
+    prefilter_stats: Dict[str, Any] = {}
+    term_baseline_candidates = extract_term_baselines(
+        parsed,
+        doc_id,
+        llm_api_key,
+        warnings,
+        extraction_problems,
+        bypass_llm_cache=bypass_llm_cache,
+        stats=prefilter_stats,
     )
-    logger.info("🔍 Extracted %d term candidates.", len(term_candidates or []))
-
-    if extraction_errors:
-        warnings.extend(extraction_errors)
-
-    if not term_candidates and llm_api_key:
-        warnings.append("LLM API Key was present, but 0 terms were extracted.")
-
-    term_baseline_candidates = build_term_baseline_candidates(doc_id, term_candidates)
     save_term_candidates_landing(term_baseline_candidates)
 
     # 5) TERM 병합 + 승격
@@ -84,9 +89,86 @@ def ingest_single_document(file_path: Path) -> Dict[str, Any]:
         upsert_term_ssot(promotable)
 
     # 6) 클라이언트에게 돌려줄 결과
+    metrics: Dict[str, Any] = {}
+    if prefilter_stats:
+        # 새 용어 후보가 없어 LLM에 보내지 않은 청크 수
+        metrics["termPrefilter"] = prefilter_stats
+    metadata_cache = get_metadata_cache()
+    if metadata_cache is not None:
+        # 프로세스 누적 Track B 캐시 적중률
+        metrics["metadataLlmCache"] = metadata_cache.tier_stats(TIER_METADATA)
+    term_cache = get_term_cache()
+    if term_cache is not None:
+        # 프로세스 누적 TERM 청크 캐시 적중률
+        metrics["termLlmCache"] = term_cache.tier_stats(TIER_TERMS)
+
     return {
         "documentId": doc_id,
         "promotedTermCount": len(promotable),
         "termValidationProblems": [p.dict() for p in term_problems],
+        "termExtractionProblems": [p.dict() for p in extraction_problems],
         "warnings": warnings,
+        "metrics": metrics,
     }
+
+
+def parse_and_map_document(
+    file_path: Path, bypass_llm_cache: bool = False
+) -> Tuple[ParsedDocument, Dict[str, Any]]:
+    """파이프라인 1)~2): 파싱 + DOC baseline 생성 + 스키마 검증 (저장하지 않는다)."""
+    if file_path.suffix.lower() == ".xml":
+        parsed = parse_xml(file_path)
+        doc_baseline = build_doc_baseline(parsed, bypass_llm_cache=bypass_llm_cache)
+        # 메타데이터 추출이 끝났으므로 lxml 트리를 TERM 단계까지 붙잡아 두지 않는다
+        parsed.xml_source = None
+    else:
+        # PDF는 인제스트 1회당 한 번만 열고 파서/메타데이터 추출기가 세션을 공유한다
+        with PdfSession(file_path) as session:
+            parsed = parse_pdf(file_path, session=session)
+            doc_baseline = build_doc_baseline(
+                parsed, session=session, bypass_llm_cache=bypass_llm_cache
+            )
+
+    schema_registry.validate(
+        "doc", doc_baseline, instance_path=doc_baseline["documentId"]
+    )
+    return parsed, doc_baseline
+
+
+def extract_term_baselines(
+    parsed: ParsedDocument,
+    doc_id: str,
+    llm_api_key: Optional[str],
+    warnings: List[str],
+    problems: Optional[List[MachineReadableError]] = None,
+    bypass_llm_cache: bool = False,
+    stats: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    파이프라인 4): TERM 후보 추출 → TERM baseline 후보.
+    청크 실패 등 추출 경고는 warnings(문장)와 problems(구조화)에 누적한다.
+    bypass_llm_cache=True이면 TERM 캐시를 건너뛴다. stats에는 사전 필터 청크 수를 채운다.
+    """
+    logger.info("🚀 Starting TERM extraction (after DOC creation)...")
+    if stats is None:
+        stats = {}
+    term_candidates, extraction_errors = extract_term_candidates(
+        parsed,
+        llm_api_key=llm_api_key,
+        use_cache=not bypass_llm_cache,
+        stats=stats,
+    )
+    logger.info("🔍 Extracted %d term candidates.", len(term_candidates or []))
+
+    warnings.extend(problem.detail or problem.code for problem in extraction_errors)
+    if problems is not None:
+        problems.extend(extraction_errors)
+
+    if not term_candidates and llm_api_key:
+        if stats.get("chunks") and stats.get("skipped") == stats["chunks"]:
+            # 사전 필터가 모든 청크를 건너뜀 (이미 아는 용어뿐) — 경고가 아니다
+            logger.info("ℹ️ All chunks contain only known terms. No new TERMs.")
+        else:
+            warnings.append("LLM API Key was present, but 0 terms were extracted.")
+
+    return build_term_baseline_candidates(doc_id, term_candidates)
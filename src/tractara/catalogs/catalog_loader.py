@@ -1,16 +1,26 @@
 """XML 매핑 카탈로그 로더 모듈."""
 # src/tractara/catalogs/catalog_loader.py
+import hashlib
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+from .catalog_plan import CatalogPlan, compile_catalog
+
 logger = logging.getLogger(__name__)
 
 _CATALOG_DIR = Path(__file__).parent
 _LOADED_CATALOGS: Dict[str, Dict[str, Any]] = {}
 _BASE_CATALOG: Dict[str, Any] = {}
+# format_id → (YAML 경로, 로드 시점 mtime_ns)
+_CATALOG_SOURCES: Dict[str, Tuple[Path, int]] = {}
+# format_id → (컴파일 시점 mtime_ns, 실행 계획)
+_PLANS: Dict[str, Tuple[int, CatalogPlan]] = {}
+_PLAN_LOCK = threading.Lock()
+_FINGERPRINT: Optional[Tuple[Tuple[Tuple[str, int, int], ...], str]] = None
 
 
 def load_all_catalogs() -> None:
@@ -20,22 +30,76 @@ def load_all_catalogs() -> None:
         return  # Already loaded
 
     for yaml_file in _CATALOG_DIR.glob("*.yaml"):
-        try:
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            if not data or "format_id" not in data:
-                continue
-
-            format_id = data["format_id"]
-            if format_id == "_base":
-                _BASE_CATALOG.clear()
-                _BASE_CATALOG.update(data)
-            else:
-                _LOADED_CATALOGS[format_id] = data
-
-        except (yaml.YAMLError, OSError) as e:
-            logger.error("Failed to load catalog %s: %s", yaml_file.name, e)
+        _load_catalog_file(yaml_file)
+
+
+def _load_catalog_file(yaml_file: Path) -> Optional[str]:
+    """
+    YAML 하나를 로드해 레지스트리에 등록하고 format_id를 반환한다.
+    이미 등록된 카탈로그는 같은 dict 객체를 제자리 갱신한다 (호출자가 쥔 참조 유지).
+    """
+    try:
+        mtime_ns = yaml_file.stat().st_mtime_ns
+        with open(yaml_file, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    except (yaml.YAMLError, OSError) as e:
+        logger.error("Failed to load catalog %s: %s", yaml_file.name, e)
+        return None
+
+    if not data or "format_id" not in data:
+        return None
+
+    format_id = data["format_id"]
+    if format_id == "_base":
+        target = _BASE_CATALOG
+    else:
+        target = _LOADED_CATALOGS.setdefault(format_id, {})
+    target.clear()
+    target.update(data)
+    _CATALOG_SOURCES[format_id] = (yaml_file, mtime_ns)
+    return format_id
+
+
+def get_catalog_plan(catalog: Dict[str, Any]) -> CatalogPlan:
+    """
+    카탈로그의 실행 계획 (catalog_plan.compile_catalog).
+
+    레지스트리에 등록된 카탈로그는 format_id별로 캐시하고, YAML mtime이 바뀌면
+    파일을 다시 로드해(같은 dict 제자리 갱신) 재컴파일한다. 레지스트리 밖의
+    카탈로그(테스트용 dict 등)는 매번 컴파일한다.
+    """
+    format_id = catalog.get("format_id")
+    registered = (
+        _BASE_CATALOG if format_id == "_base" else _LOADED_CATALOGS.get(format_id)
+    )
+    source = _CATALOG_SOURCES.get(format_id)
+    if registered is not catalog or source is None:
+        return compile_catalog(catalog)
+
+    path, loaded_mtime = source
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = loaded_mtime
+
+    with _PLAN_LOCK:
+        cached = _PLANS.get(format_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        if mtime_ns != loaded_mtime:
+            logger.info("Catalog %s changed on disk. Reloading.", path.name)
+            _load_catalog_file(path)
+        plan = compile_catalog(catalog)
+        _PLANS[format_id] = (mtime_ns, plan)
+        return plan
+
+
+def warm_catalog_plans() -> None:
+    """모든 카탈로그를 로드하고 실행 계획을 미리 컴파일한다 (워커 프로세스 초기화용)."""
+    load_all_catalogs()
+    get_catalog_plan(get_base_catalog())
+    for catalog in list(_LOADED_CATALOGS.values()):
+        get_catalog_plan(catalog)
 
 
 def get_base_catalog() -> Dict[str, Any]:
@@ -45,6 +109,28 @@ def get_base_catalog() -> Dict[str, Any]:
     return _BASE_CATALOG
 
 
+def catalog_fingerprint() -> str:
+    """
+    카탈로그 YAML 전체 내용의 SHA-256 (파싱 캐시 키 구성용).
+    파일 이름/mtime/크기가 그대로면 이전 값을 재사용한다 (문서마다 YAML을 읽지 않음).
+    """
+    global _FINGERPRINT  # pylint: disable=global-statement
+    yaml_files = sorted(_CATALOG_DIR.glob("*.yaml"))
+    stamp = tuple(
+        (f.name, st.st_mtime_ns, st.st_size)
+        for f, st in ((f, f.stat()) for f in yaml_files)
+    )
+    if _FINGERPRINT is not None and _FINGERPRINT[0] == stamp:
+        return _FINGERPRINT[1]
+
+    digest = hashlib.sha256()
+    for yaml_file in yaml_files:
+        digest.update(yaml_file.name.encode("utf-8"))
+        digest.update(yaml_file.read_bytes())
+    _FINGERPRINT = (stamp, digest.hexdigest())
+    return _FINGERPRINT[1]
+
+
 def detect_catalog(root_tag: str) -> Optional[Dict[str, Any]]:
     """루트 태그 문자열에 매칭되는 카탈로그를 찾아 반환합니다."""
     if not _LOADED_CATALOGS:
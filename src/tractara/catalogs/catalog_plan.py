@@ -0,0 +1,265 @@
+"""카탈로그 실행 계획: YAML 매핑을 해석 완료된 질의/변환 함수/필드 규칙 묶음으로 변환."""
+# src/tractara/catalogs/catalog_plan.py
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .transforms import TRANSFORM_REGISTRY
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DC_NAMESPACES = (
+    "http://purl.org/dc/elements/1.1/",
+    "http://www.purl.org/dc/elements/1.1/",
+)
+# 요소 목록 전체를 받는 변환 (나머지는 첫 요소만 받는다)
+_LIST_TRANSFORMS = frozenset({"jats_author_name", "join_text"})
+# ".//techName", ".//{uri}title" 처럼 술어/와일드카드 없는 단일 하위 요소 질의
+_DESCENDANT_TAG = re.compile(r"^\.//((?:\{[^}]*\})?[\w.\-]+)$")
+
+
+class ElementQuery:
+    """
+    사전 해석된 요소 질의 (카탈로그 표기 그대로 ElementPath 의미).
+
+    ".//tag" 형태의 단순 하위 요소 질의는 descendant_tag로 표시해 두고, 문서 단위
+    태그 색인(BoundCatalogPlan)에서 꺼낸다. 그 밖의 경로는 find/findall로 평가한다
+    (lxml이 컴파일된 선택자를 캐시).
+    """
+
+    __slots__ = ("expression", "descendant_tag")
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        match = _DESCENDANT_TAG.match(expression)
+        self.descendant_tag: Optional[str] = match.group(1) if match else None
+
+    def all(self, root: Any) -> List[Any]:
+        """문서 순서의 모든 일치 요소 (findall과 동일)."""
+        return root.findall(self.expression)
+
+    def first(self, root: Any) -> Any:
+        """첫 일치 요소 또는 None (find와 동일)."""
+        return root.find(self.expression)
+
+
+@dataclass(frozen=True)
+class MetadataRule:
+    """metadata 필드 규칙 하나 (변환 함수 해석 완료)."""
+
+    options: Dict[str, Any]  # 원본 YAML 규칙 (출력 형식 옵션: target_field, role 등)
+    static: Any = None
+    has_static: bool = False
+    query: Optional[ElementQuery] = None
+    dc_element: Optional[str] = None  # dc_namespaces 단축 표기 (예: "title")
+    transform: Optional[Callable[[Any], Any]] = None
+    transform_takes_list: bool = False
+    combine_with: Optional["MetadataRule"] = None  # 값 뒤에 이어 붙일 요소
+
+
+@dataclass(frozen=True)
+class RelationRule:
+    """relations 규칙 하나."""
+
+    query: ElementQuery
+    relation_type: str
+    transform: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass
+class CatalogPlan:
+    """
+    카탈로그 하나의 실행 계획. catalog_loader.get_catalog_plan()이 format_id별로
+    캐시하며 YAML mtime이 바뀌면 다시 컴파일한다.
+    """
+
+    catalog: Dict[str, Any]
+    format_id: str
+    # (필드 키, 규칙들) — YAML 순서 유지
+    metadata_fields: Tuple[Tuple[str, Tuple[MetadataRule, ...]], ...] = ()
+    relations: Tuple[RelationRule, ...] = ()
+    content_rules: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    traverse_strategy: str = "recursive"
+    # 제목 블록용 dc_title 규칙 (단일 xpath 규칙일 때만)
+    title_rule: Optional[MetadataRule] = None
+    dc_namespaces: Tuple[str, ...] = _DEFAULT_DC_NAMESPACES
+    # 문서당 한 번의 트리 순회로 모을 태그 (단순 하위 요소 질의 + dc 단축 표기)
+    index_tags: Tuple[str, ...] = ()
+
+    def bind(self, root: Any) -> "BoundCatalogPlan":
+        """문서 루트에 대한 평가기 (태그 색인은 처음 필요할 때 한 번 구성)."""
+        return BoundCatalogPlan(self, root)
+
+
+class BoundCatalogPlan:
+    """
+    문서 하나에 묶인 실행 계획. 규칙마다 트리 전체를 find/findall로 훑는 대신
+    index_tags에 해당하는 요소를 한 번의 iterdescendants로 모아 태그별로 재사용한다.
+    """
+
+    def __init__(self, plan: CatalogPlan, root: Any):
+        self.plan = plan
+        self.root = root
+        self._index: Optional[Dict[str, List[Any]]] = None
+
+    def elements(self, rule: MetadataRule) -> List[Any]:
+        """규칙이 가리키는 요소 목록 (dc 단축 표기는 네임스페이스 우선순위 순)."""
+        if rule.query is not None:
+            return self.query_all(rule.query)
+        if rule.dc_element is None:
+            return []
+        index = self._tag_index()
+        for uri in self.plan.dc_namespaces:
+            found = index.get(f"{{{uri}}}{rule.dc_element}")
+            if found:
+                return found
+        return []
+
+    def first(self, rule: MetadataRule) -> Any:
+        """규칙이 가리키는 첫 요소 또는 None (combine_with, 제목 블록 등)."""
+        if rule.query is not None and rule.query.descendant_tag is None:
+            return rule.query.first(self.root)
+        found = self.elements(rule)
+        return found[0] if found else None
+
+    def query_all(self, query: ElementQuery) -> List[Any]:
+        """질의의 모든 일치 요소 (단순 하위 요소 질의는 태그 색인에서)."""
+        if query.descendant_tag is None:
+            return query.all(self.root)
+        return self._tag_index().get(query.descendant_tag, [])
+
+    def _tag_index(self) -> Dict[str, List[Any]]:
+        if self._index is None:
+            index: Dict[str, List[Any]] = {}
+            if self.plan.index_tags:
+                for el in self.root.iterdescendants(*self.plan.index_tags):
+                    index.setdefault(el.tag, []).append(el)
+            self._index = index
+        return self._index
+
+
+def compile_catalog(catalog: Dict[str, Any]) -> CatalogPlan:
+    """YAML 카탈로그 dict → CatalogPlan (질의 분류, 변환 함수 해석, 필드별 규칙 묶음)."""
+    dc_namespaces = tuple(catalog.get("dc_namespaces") or _DEFAULT_DC_NAMESPACES)
+
+    metadata_fields: List[Tuple[str, Tuple[MetadataRule, ...]]] = []
+    for field_key, rules in (catalog.get("metadata") or {}).items():
+        if isinstance(rules, dict):
+            rules = [rules]
+        elif not isinstance(rules, list):
+            continue
+        compiled = tuple(
+            rule
+            for rule in (
+                _compile_metadata_rule(r) for r in rules if isinstance(r, dict)
+            )
+            if rule is not None
+        )
+        if compiled:
+            metadata_fields.append((field_key, compiled))
+
+    relations: List[RelationRule] = []
+    for rule in catalog.get("relations") or []:
+        if not rule.get("xpath"):
+            continue
+        relations.append(
+            RelationRule(
+                query=ElementQuery(rule["xpath"]),
+                relation_type=rule.get("relation_type", "RELATED_TO"),
+                transform=_resolve_transform(rule.get("transform")),
+            )
+        )
+
+    content_cfg = catalog.get("content") or {}
+    content_rules: Dict[str, Dict[str, Any]] = {}
+    for mapping in content_cfg.get("mappings", []):
+        tags = mapping.get("tag")
+        if isinstance(tags, str):
+            content_rules[tags.lower()] = mapping
+        elif isinstance(tags, list):
+            for t in tags:
+                content_rules[t.lower()] = mapping
+
+    title_cfg = (catalog.get("metadata") or {}).get("dc_title")
+    title_rule = None
+    if isinstance(title_cfg, dict) and "xpath" in title_cfg:
+        # 제목 블록은 xpath를 항상 경로로 평가한다 (dc 단축 표기 해석 없음)
+        combine = title_cfg.get("combine_with")
+        title_rule = MetadataRule(
+            options=title_cfg,
+            query=ElementQuery(title_cfg["xpath"]),
+            combine_with=(
+                MetadataRule(options={}, query=ElementQuery(combine))
+                if combine
+                else None
+            ),
+        )
+    rules = [rule for _, field_rules in metadata_fields for rule in field_rules]
+    if title_rule is not None:
+        rules.append(title_rule)
+
+    return CatalogPlan(
+        catalog=catalog,
+        format_id=catalog.get("format_id", "unknown"),
+        metadata_fields=tuple(metadata_fields),
+        relations=tuple(relations),
+        content_rules=content_rules,
+        traverse_strategy=content_cfg.get("traverse_strategy", "recursive"),
+        title_rule=title_rule,
+        dc_namespaces=dc_namespaces,
+        index_tags=_index_tags(rules, dc_namespaces),
+    )
+
+
+def _compile_metadata_rule(rule: Dict[str, Any]) -> Optional[MetadataRule]:
+    if "static" in rule:
+        return MetadataRule(options=rule, static=rule["static"], has_static=True)
+
+    expression = rule.get("xpath") or rule.get("dc_element")
+    if not expression:
+        return None
+    transform_name = rule.get("transform")
+    return MetadataRule(
+        options=rule,
+        transform=_resolve_transform(transform_name),
+        transform_takes_list=transform_name in _LIST_TRANSFORMS,
+        combine_with=(
+            MetadataRule(options={}, **_locate(rule["combine_with"]))
+            if rule.get("combine_with")
+            else None
+        ),
+        **_locate(expression),
+    )
+
+
+def _index_tags(
+    rules: List[MetadataRule], dc_namespaces: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """문서 단위 태그 색인에 모을 태그 (단순 하위 요소 질의 + dc 요소 × 네임스페이스)."""
+    tags = set()
+    for rule in rules:
+        for candidate in (rule, rule.combine_with):
+            if candidate is None:
+                continue
+            if candidate.dc_element is not None:
+                tags.update(f"{{{uri}}}{candidate.dc_element}" for uri in dc_namespaces)
+            elif candidate.query is not None and candidate.query.descendant_tag:
+                tags.add(candidate.query.descendant_tag)
+    return tuple(sorted(tags))
+
+
+def _locate(expression: str) -> Dict[str, Any]:
+    """기존 규칙과 동일: ".//" 또는 "/"가 있으면 경로, 아니면 dc 요소 이름."""
+    if expression.startswith(".//") or "/" in expression:
+        return {"query": ElementQuery(expression)}
+    return {"dc_element": expression}
+
+
+def _resolve_transform(name: Optional[str]) -> Optional[Callable[[Any], Any]]:
+    if not name:
+        return None
+    transform = TRANSFORM_REGISTRY.get(name)
+    if transform is None:
+        logger.warning("Unknown catalog transform %r. Using text extraction.", name)
+    return transform
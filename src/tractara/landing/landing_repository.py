@@ -2,7 +2,7 @@
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 # BASE_DIR = 프로젝트 루트 (tractara) 까지 올라감
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -19,10 +19,32 @@ def save_doc_landing(doc: Dict[str, Any]) -> str:
     docs_dir = LANDING_DIR / "docs"
     docs_dir.mkdir(parents=True, exist_ok=True)
     path = docs_dir / f"{doc_id}.json"
-    path.write_text(json.dumps(doc, ensure_ascii=False, indent=2), encoding="utf-8")
+    # 문자열 전체를 만들지 않고 파일로 직접 직렬화 (대형 문서 메모리 절감)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
     return doc_id
 
 
+def save_doc_landing_batch(docs: List[Dict[str, Any]]) -> List[str]:
+    """DOC baseline 여러 개를 한 번에 저장 (벌크 인제스트 배치 단위, 디렉토리 준비 1회)."""
+    docs_dir = LANDING_DIR / "docs"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    doc_ids = []
+    for doc in docs:
+        doc_id = doc["documentId"]
+        with (docs_dir / f"{doc_id}.json").open("w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
+        doc_ids.append(doc_id)
+    return doc_ids
+
+
+def delete_doc_landing(doc_ids: Iterable[str]) -> None:
+    """DOC baseline Landing 파일 삭제 (커밋되지 않은 벌크 배치 롤백용, 없으면 무시)."""
+    docs_dir = LANDING_DIR / "docs"
+    for doc_id in doc_ids:
+        (docs_dir / f"{doc_id}.json").unlink(missing_ok=True)
+
+
 # termType → 서브디렉토리 매핑
 _TYPE_SUBDIR: Dict[str, str] = {
     "TERM-CLASS": "class",
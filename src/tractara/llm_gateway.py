@@ -0,0 +1,383 @@
+"""공용 Gemini LLM 게이트웨이: 클라이언트 재사용, 모델 목록 TTL 캐시, 모델별 토큰 버킷, 서킷 브레이커."""
+# src/tractara/llm_gateway.py
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 선호하는 모델 순서 (성능/비용/쿼터 고려). 쿼터 초과 시 다음 모델로 라우팅한다.
+MODEL_PREFERENCES = (
+    "gemini-3-flash-preview",
+    "gemini-2.5-pro",
+    "gemini-2.5-flash",
+    "gemini-2.5-flash-lite",
+    "gemini-2.0-flash",
+    "gemini-1.5-flash",
+    "gemini-1.5-flash-8b",
+    "gemini-1.5-pro",
+)
+_LAST_RESORT_MODEL = "gemini-1.5-flash"
+
+
+class ModelUnavailableError(RuntimeError):
+    """서킷이 열려 있거나 쿼터가 소진되어 요청을 보낼 수 있는 후보 모델이 없다."""
+
+
+def is_quota_error(exc: BaseException) -> bool:
+    """429 / Quota exceeded / ResourceExhausted 응답인지 여부."""
+    message = str(exc)
+    return (
+        "429" in message or "quota" in message.lower() or "ResourceExhausted" in message
+    )
+
+
+class TokenBucket:
+    """
+    토큰 버킷 요청 제한 (스레드 안전, 예약 방식).
+    분당 requests_per_minute개씩 채워지고 최대 burst개까지 모인다. 토큰이 없으면 빚을
+    지고 채워질 시각까지 대기하므로 동시 요청도 순서대로 간격이 벌어진다.
+    requests_per_minute <= 0이면 제한 없음.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        self.rate = requests_per_minute / 60.0 if requests_per_minute > 0 else 0.0
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 사용할 수 있을 때까지 남은 시간(초)을 돌려준다."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class CircuitBreaker:
+    """
+    모델별 서킷 브레이커 (스레드 안전).
+    쿼터 초과가 failure_threshold번 연속되면 cooldown초 동안 열려 요청을 막고, 쿨다운이
+    지나면 반열림 상태로 다시 시도를 허용한다. 성공하면 닫히고, 반열림 상태에서 다시
+    실패하면 곧바로 열린다.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 60.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """열려 있으면 남은 쿨다운(초), 아니면 0."""
+        return max(0.0, self._open_until - time.monotonic())
+
+    @property
+    def is_open(self) -> bool:
+        return self.remaining() > 0
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._open_until = 0.0
+
+    def record_failure(self) -> bool:
+        """쿼터 초과 1회 기록. 이번 실패로 서킷이 열렸으면 True."""
+        with self._lock:
+            self._failures += 1
+            if self._failures < self.failure_threshold:
+                return False
+            self._open_until = time.monotonic() + self.cooldown
+            return True
+
+
+def _model_rpm(model_name: str) -> float:
+    """LLM_MODEL_RPM("모델=RPM,...")의 모델별 값, 없으면 LLM_RPM (기본 0 = 제한 없음)."""
+    for item in os.getenv("LLM_MODEL_RPM", "").split(","):
+        name, _, rpm = item.partition("=")
+        if name.strip() == model_name and rpm.strip():
+            return float(rpm)
+    return float(os.getenv("LLM_RPM", "0"))
+
+
+class LLMGateway:
+    """
+    세 단계(TERM 추출, Track B 메타데이터, 수식/페이지 Vision OCR)가 공유하는 Gemini 진입점.
+
+    - genai.configure는 API 키가 바뀔 때만, GenerativeModel / instructor 클라이언트는
+      모델마다 한 번만 만든다 (프로세스 전역 재사용).
+    - 모델 목록(genai.list_models)은 LLM_MODEL_CATALOG_TTL_SECONDS(기본 3600) 동안 캐시한다.
+    - 모델별 토큰 버킷(LLM_RPM / LLM_MODEL_RPM, LLM_BURST)과 서킷 브레이커
+      (LLM_CIRCUIT_FAILURES, LLM_CIRCUIT_COOLDOWN_SECONDS)를 둔다. 쿼터 초과는 다음
+      후보 모델로 라우팅하고, 쿨다운이 지나면 선호 모델로 돌아간다.
+    - 모든 상태는 락으로 보호되며 async 호출(acall/astructured)도 같은 상태를 공유한다.
+      제한은 프로세스 단위다 (CSDB 인제스트 워커 프로세스마다 따로 적용).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._configured_key: Optional[str] = None
+        self._models: Dict[str, Any] = {}
+        self._structured_clients: Dict[str, Any] = {}
+        self._catalog: Optional[Tuple[float, List[str]]] = None
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    # ── 클라이언트 ─────────────────────────────────────────────────────────
+    def configure(self, api_key: Optional[str]) -> None:
+        """API 키가 바뀐 경우에만 genai.configure (이전 키로 만든 클라이언트는 버린다)."""
+        if not api_key:
+            return
+        with self._lock:
+            if api_key == self._configured_key:
+                return
+            # TODO: [Migration] instructor 라이브러리가 google-genai(신형 SDK)를 완벽히 지원하면 마이그레이션 필요.
+            # 현재(2026.02) instructor 1.14.x 버전은 구형 SDK(google-generativeai)와 호환성이 더 좋음.
+            # 참조: https://github.com/google-gemini/deprecated-generative-ai-python
+            import google.generativeai as genai  # pylint: disable=import-outside-toplevel
+
+            genai.configure(api_key=api_key)
+            self._configured_key = api_key
+            self._models.clear()
+            self._structured_clients.clear()
+            self._catalog = None
+
+    def model(self, model_name: str, api_key: Optional[str] = None) -> Any:
+        """모델별 GenerativeModel (재사용)."""
+        import google.generativeai as genai  # pylint: disable=import-outside-toplevel
+
+        self.configure(api_key)
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is None:
+                model = genai.GenerativeModel(model_name=model_name)
+                self._models[model_name] = model
+            return model
+
+    def structured_client(self, model_name: str, api_key: Optional[str] = None) -> Any:
+        """모델별 instructor 클라이언트 (GEMINI_JSON 모드, 재사용)."""
+        import instructor  # pylint: disable=import-outside-toplevel
+
+        model = self.model(model_name, api_key)
+        with self._lock:
+            client = self._structured_clients.get(model_name)
+            if client is None:
+                client = instructor.from_gemini(
+                    client=model, mode=instructor.Mode.GEMINI_JSON
+                )
+                self._structured_clients[model_name] = client
+            return client
+
+    # ── 모델 목록 ──────────────────────────────────────────────────────────
+    def list_models(self, api_key: Optional[str] = None) -> List[str]:
+        """사용 가능한 모델 이름 목록 (TTL 캐시, 조회 실패는 캐시하지 않고 전파한다)."""
+        ttl = float(os.getenv("LLM_MODEL_CATALOG_TTL_SECONDS", "3600"))
+        self.configure(api_key)
+        with self._lock:
+            if self._catalog is not None and time.monotonic() - self._catalog[0] < ttl:
+                return list(self._catalog[1])
+
+        import google.generativeai as genai  # pylint: disable=import-outside-toplevel
+
+        names = [m.name.replace("models/", "") for m in genai.list_models()]
+        logger.info("📋 Available Gemini models: %s", names)
+        with self._lock:
+            self._catalog = (time.monotonic(), names)
+        return list(names)
+
+    def model_candidates(self, api_key: Optional[str] = None) -> List[str]:
+        """
+        API 키로 접근 가능한 모델 중 라우팅 후보 목록 (선호 순서).
+        GEMINI_MODEL 환경변수 모델이 최우선이고, 목록 조회에 실패하면 기본 선호 목록을 쓴다.
+        """
+        candidates: List[str] = []
+        target_model = os.getenv("GEMINI_MODEL")
+        if target_model:
+            candidates.append(target_model)
+
+        try:
+            available_models = self.list_models(api_key)
+            for pref in MODEL_PREFERENCES:
+                if pref in available_models and pref not in candidates:
+                    candidates.append(pref)
+            # 선호 모델이 없으면 목록의 첫 번째 모델 사용
+            if not candidates and available_models:
+                candidates.append(available_models[0])
+        except (OSError, RuntimeError) as e:
+            logger.error("⚠️ Failed to list models: %s", e)
+            for pref in MODEL_PREFERENCES:
+                if pref not in candidates:
+                    candidates.append(pref)
+
+        return candidates or [_LAST_RESORT_MODEL]
+
+    # ── 제한/라우팅 ────────────────────────────────────────────────────────
+    def bucket(self, model_name: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(model_name)
+            if bucket is None:
+                bucket = TokenBucket(
+                    _model_rpm(model_name), int(os.getenv("LLM_BURST", "1"))
+                )
+                self._buckets[model_name] = bucket
+            return bucket
+
+    def breaker(self, model_name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(model_name)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    int(os.getenv("LLM_CIRCUIT_FAILURES", "3")),
+                    float(os.getenv("LLM_CIRCUIT_COOLDOWN_SECONDS", "60")),
+                )
+                self._breakers[model_name] = breaker
+            return breaker
+
+    def call(self, model_name: str, request: Callable[[], T], wait: bool = True) -> T:
+        """
+        model_name 모델에 대한 request()를 토큰 버킷 대기 후 실행하고 결과를 서킷에 기록한다.
+        서킷이 열려 있으면 wait=True일 때 쿨다운이 끝날 때까지 기다렸다가 시도하고,
+        wait=False이면 ModelUnavailableError. 요청 예외는 그대로 전파한다.
+        """
+        breaker = self.breaker(model_name)
+        remaining = breaker.remaining()
+        if remaining > 0:
+            if not wait:
+                raise ModelUnavailableError(
+                    f"Circuit open for model {model_name} ({remaining:.0f}s left)."
+                )
+            time.sleep(remaining)
+
+        self.bucket(model_name).acquire()
+        try:
+            result = request()
+        except Exception as exc:
+            if is_quota_error(exc) and breaker.record_failure():
+                logger.warning(
+                    "⚠️ Circuit opened for model %s (cool-down %.0fs).",
+                    model_name,
+                    breaker.cooldown,
+                )
+            raise
+        breaker.record_success()
+        return result
+
+    def structured(
+        self,
+        candidates: Sequence[str],
+        messages: List[Dict[str, Any]],
+        response_model: Any,
+        api_key: Optional[str] = None,
+        max_retries: int = 2,
+        route: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        instructor 구조화 출력 요청을 후보 모델 순서로 라우팅한다.
+        서킷이 열린 모델은 건너뛰고, 쿼터 초과면 같은 요청을 다음 후보로 보낸다.
+        보낼 수 있는 후보가 없으면 ModelUnavailableError. 그 밖의 예외는 그대로 전파한다.
+        route가 주어지면 실제로 응답한 모델 이름을 route["model"]에 기록한다
+        (응답 캐시를 선호 모델이 아닌 응답 모델 기준으로 저장하기 위함).
+        """
+        last_error: Optional[Exception] = None
+        for model_name in candidates:
+            if self.breaker(model_name).is_open:
+                continue
+            create = self.structured_client(model_name, api_key).chat.completions.create
+            try:
+                result = self.call(
+                    model_name,
+                    functools.partial(
+                        create,
+                        messages=messages,
+                        response_model=response_model,
+                        max_retries=max_retries,  # 내부 재시도 (일시적 오류용)
+                    ),
+                    wait=False,
+                )
+            except ModelUnavailableError as e:
+                last_error = e
+            except Exception as e:
+                if not is_quota_error(e):
+                    raise
+                logger.warning("⚠️ Quota exceeded for model %s.", model_name)
+                last_error = e
+            else:
+                if route is not None:
+                    route["model"] = model_name
+                return result
+
+        logger.error("❌ All fallback models exhausted.")
+        raise ModelUnavailableError(
+            f"No available model among {list(candidates)} (quota exceeded or circuit open)."
+        ) from last_error
+
+    async def acall(
+        self, model_name: str, request: Callable[[], T], wait: bool = True
+    ) -> T:
+        """call()의 async 버전 (요청은 스레드에서 실행, 제한/서킷 상태는 공유)."""
+        return await asyncio.to_thread(self.call, model_name, request, wait)
+
+    async def astructured(
+        self,
+        candidates: Sequence[str],
+        messages: List[Dict[str, Any]],
+        response_model: Any,
+        api_key: Optional[str] = None,
+        max_retries: int = 2,
+        route: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """structured()의 async 버전."""
+        return await asyncio.to_thread(
+            self.structured,
+            candidates,
+            messages,
+            response_model,
+            api_key,
+            max_retries,
+            route,
+        )
+
+
+# ── 프로세스 전역 게이트웨이 ────────────────────────────────────────────────
+_GATEWAY: Optional[LLMGateway] = None
+_GATEWAY_LOCK = threading.Lock()
+
+
+def get_gateway() -> LLMGateway:
+    """프로세스 전역 LLMGateway."""
+    global _GATEWAY  # pylint: disable=global-statement
+    with _GATEWAY_LOCK:
+        if _GATEWAY is None:
+            _GATEWAY = LLMGateway()
+        return _GATEWAY
+
+
+def reset_gateway() -> None:
+    """캐시된 클라이언트/모델 목록/제한 상태를 모두 버린다 (테스트, 키 교체용)."""
+    global _GATEWAY  # pylint: disable=global-statement
+    with _GATEWAY_LOCK:
+        _GATEWAY = None
@@ -0,0 +1,159 @@
+"""LLM 단계 입력용 구조 인식 청크 패커: 섹션 계층을 따라 블록을 토큰 예산까지 묶는다."""
+# src/tractara/normalization/chunk_packer.py
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional
+
+from ..parsing.models import ParsedBlock
+
+# 나눌 수 없는 블록 (표/수식은 통째로 한 청크에 들어간다)
+ATOMIC_BLOCK_TYPES = frozenset({"table", "equation"})
+_HEADING_BLOCK_TYPES = frozenset({"title", "section"})
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    오프라인 토큰 수 추정 (토크나이저 없이, 예산 초과를 피하도록 보수적으로).
+    ASCII는 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰으로 센다.
+    """
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+@dataclass
+class TextChunk:
+    """LLM 요청 하나에 들어갈 청크 (섹션 경로 접두어 + 블록 본문)."""
+
+    text: str
+    block_ids: List[str] = field(default_factory=list)
+    breadcrumb: List[str] = field(default_factory=list)
+    tokens: int = 0
+
+
+class _Pending:
+    """패킹 중인 청크 (블록 본문과 문맥 경로의 공통 접두어)."""
+
+    __slots__ = ("parts", "block_ids", "breadcrumb", "tokens", "chars")
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        self.block_ids: List[str] = []
+        self.breadcrumb: Optional[List[str]] = None
+        self.tokens = 0
+        self.chars = 0
+
+    def add(self, text: str, block_id: Optional[str], context: List[str]) -> None:
+        self.parts.append(text)
+        if block_id:
+            self.block_ids.append(block_id)
+        if self.breadcrumb is None:
+            self.breadcrumb = context
+        else:
+            shared = 0
+            for mine, theirs in zip(self.breadcrumb, context):
+                if mine != theirs:
+                    break
+                shared += 1
+            del self.breadcrumb[shared:]
+        self.tokens += estimate_tokens(text)
+        self.chars += len(text)
+
+    def build(self) -> TextChunk:
+        breadcrumb = self.breadcrumb or []
+        body = "\n\n".join(self.parts)
+        text = f"[{' > '.join(breadcrumb)}]\n{body}" if breadcrumb else body
+        return TextChunk(
+            text=text,
+            block_ids=self.block_ids,
+            breadcrumb=breadcrumb,
+            tokens=estimate_tokens(text),
+        )
+
+
+def pack_blocks(
+    blocks: Iterable[ParsedBlock],
+    max_tokens: Optional[int] = None,
+    min_chars: int = 20,
+) -> List[TextChunk]:
+    """
+    블록을 문서 순서로 걸으며 본문이 max_tokens(기본 LLM_CHUNK_MAX_TOKENS=2000) 이하인
+    청크로 탐욕적으로 묶는다 (섹션 경로 접두어는 예산에 넣지 않는다).
+
+    - 섹션/제목 블록은 본문 줄로 들어가고, 청크가 예산의 절반 이상 찼으면 새 섹션에서
+      청크를 끊어 형제 블록이 같은 청크에 모이도록 한다.
+    - 청크마다 멤버 블록 context_path의 공통 접두어(섹션 경로)를 한 번만 앞에 붙인다.
+    - 표/수식은 나누지 않는다 (예산보다 크면 단독 청크). 예산보다 긴 일반 블록은
+      문장 경계에서 나눈다.
+    - 본문이 min_chars 이하인 청크(짧은 머리글만 남은 경우 등)는 버린다.
+    """
+    budget = max(1, max_tokens or int(os.getenv("LLM_CHUNK_MAX_TOKENS", "2000")))
+    return [
+        pending.build()
+        for pending in _iter_pending(blocks, budget)
+        if pending.chars > min_chars
+    ]
+
+
+def _iter_pending(blocks: Iterable[ParsedBlock], budget: int) -> Iterator[_Pending]:
+    pending = _Pending()
+    for block in blocks:
+        text = (block.text or "").strip()
+        if not text:
+            continue
+        context = list(block.context_path)
+        cost = estimate_tokens(text)
+
+        if pending.parts and (
+            pending.tokens + cost > budget
+            or (
+                block.block_type in _HEADING_BLOCK_TYPES
+                and pending.tokens * 2 >= budget
+            )
+        ):
+            yield pending
+            pending = _Pending()
+
+        if cost <= budget or block.block_type in ATOMIC_BLOCK_TYPES:
+            pending.add(text, block.block_id, context)
+            continue
+
+        # 예산보다 긴 일반 블록: 문장 경계 조각마다 청크 하나
+        for piece in _split_text(text, budget):
+            if pending.parts:
+                yield pending
+                pending = _Pending()
+            pending.add(piece, block.block_id, list(context))
+    if pending.parts:
+        yield pending
+
+
+def _split_text(text: str, budget: int) -> Iterator[str]:
+    """문장(또는 줄) 경계에서 예산 이하 조각으로 나눈다. 한 문장이 넘치면 글자 단위."""
+    current: List[str] = []
+    tokens = 0
+    for sentence in _SENTENCE_BREAK.split(text):
+        if not sentence:
+            continue
+        cost = estimate_tokens(sentence) + 1
+        if current and tokens + cost > budget:
+            yield " ".join(current)
+            current, tokens = [], 0
+        if cost > budget:
+            yield from _split_chars(sentence, budget)
+            continue
+        current.append(sentence)
+        tokens += cost
+    if current:
+        yield " ".join(current)
+
+
+def _split_chars(text: str, budget: int) -> Iterator[str]:
+    # 비ASCII 1자 = 1토큰이 최악이므로 budget자 단위로 자르면 항상 예산 이하
+    for start in range(0, len(text), budget):
+        yield text[start : start + budget]
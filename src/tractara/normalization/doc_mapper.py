@@ -3,10 +3,13 @@
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import AbstractSet, Any, Dict, List, Optional
 
-from ..parsing.metadata_extractor import extract_metadata
+from lxml import etree
+
+from ..parsing.metadata_extractor import DocumentStats, extract_metadata
 from ..parsing.models import ParsedBlock, ParsedDocument
+from ..parsing.pdf_session import PdfSession
 
 # DOC 스키마 blockType enum에 허용된 값
 _VALID_BLOCK_TYPES = {
@@ -34,7 +37,7 @@ _VALID_BLOCK_TYPES = {
 
 
 def _blocks_to_content(
-    blocks: List[ParsedBlock], has_fragments: bool = False
+    blocks: List[ParsedBlock], fragment_block_ids: AbstractSet[str] = frozenset()
 ) -> List[Dict[str, Any]]:
     """
     ParsedBlock 리스트 → DOC content 배열 변환.
@@ -58,7 +61,7 @@ def _blocks_to_content(
             "parentId": b.parent_id,
             "blockType": block_type,
             "text": b.text or "",
-            "contextPath": b.context_path,  # 빈 [] 포함 항상 출력
+            "contextPath": list(b.context_path),  # 빈 [] 포함 항상 출력
         }
 
         # level: paragraph(999)는 생략
@@ -98,7 +101,7 @@ def _blocks_to_content(
             item["sourceElementName"] = b.source_element_name
 
         # Fragment Store 포인터 추가
-        if has_fragments and hasattr(b, "xml_fragment") and b.xml_fragment:
+        if item["blockId"] in fragment_block_ids:
             item["fragmentRef"] = item["blockId"]
 
         content.append(item)
@@ -106,17 +109,39 @@ def _blocks_to_content(
     return content
 
 
-def build_doc_baseline(parsed: ParsedDocument) -> Dict[str, Any]:
+def _xml_fragment_root(parsed: ParsedDocument) -> Any:
+    """조각 직렬화 대상 트리: 파싱 때의 트리, 없으면(파싱 캐시 적중) 원본을 다시 파싱."""
+    if parsed.xml_source is not None:
+        return parsed.xml_source.root
+    # pylint: disable-next=c-extension-no-member
+    return etree.parse(parsed.source_path).getroot()
+
+
+def build_doc_baseline(
+    parsed: ParsedDocument,
+    session: Optional[PdfSession] = None,
+    bypass_llm_cache: bool = False,
+) -> Dict[str, Any]:
     """
     ParsedDocument → DOC Baseline JSON.
 
     메타데이터는 metadata_extractor.extract_metadata()를 통해 추출한다.
+    session이 주어지면 파싱 단계의 PdfSession을, parsed.metadata의 본문 폰트 크기는
+    문서 통계로 메타데이터 추출에 재사용한다.
+    bypass_llm_cache=True이면 Track B 메타데이터 캐시를 건너뛴다.
+    XML 문서는 parse_xml이 남긴 트리/카탈로그(parsed.xml_source)를 재사용한다.
     여기서 만든 JSON은 DOC_baseline_schema.json을 반드시 통과해야 한다.
     """
     now = datetime.utcnow().isoformat() + "Z"
     doc_id = "DOC_" + uuid.uuid4().hex
 
-    extracted = extract_metadata(Path(parsed.source_path))
+    extracted = extract_metadata(
+        Path(parsed.source_path),
+        session=session,
+        stats=DocumentStats.from_parsed(parsed),
+        bypass_llm_cache=bypass_llm_cache,
+        xml_source=parsed.xml_source,
+    )
 
     # 스키마 필수 필드 fallback (required: dc:title, dc:type, dc:language)
     metadata: Dict[str, Any] = {
@@ -151,6 +176,8 @@ def build_doc_baseline(parsed: ParsedDocument) -> Dict[str, Any]:
 
     source_xpath_mapping = []
     fragments_to_save = {}
+    # XML 블록 조각은 저장 시점에 source_xpath로 찾아 직렬화한다 (put_tree)
+    fragment_locators = {}
     for i, b in enumerate(parsed.blocks, start=1):
         b_id = b.block_id or f"block-{i:04d}"
         if hasattr(b, "source_xpath") and b.source_xpath:
@@ -159,6 +186,8 @@ def build_doc_baseline(parsed: ParsedDocument) -> Dict[str, Any]:
             )
         if hasattr(b, "xml_fragment") and b.xml_fragment:
             fragments_to_save[b_id] = b.xml_fragment
+        elif b.source_xpath and b.source_element_name:
+            fragment_locators[b_id] = b.source_xpath
 
     doc: Dict[str, Any] = {
         "documentId": doc_id,
@@ -181,17 +210,23 @@ def build_doc_baseline(parsed: ParsedDocument) -> Dict[str, Any]:
             "sourceXPathMapping": source_xpath_mapping,
         },
         "content": _blocks_to_content(
-            parsed.blocks, has_fragments=bool(fragments_to_save)
+            parsed.blocks,
+            fragment_block_ids=fragments_to_save.keys() | fragment_locators.keys(),
         ),
     }
 
-    if fragments_to_save:
+    if fragments_to_save or fragment_locators:
         try:
             from ..ssot.fragment_store import FileFragmentStore
 
             store_dir = Path("src/data/landing/fragments")
             store = FileFragmentStore(store_dir)
             store.bulk_put(fragments_to_save)
+            if fragment_locators and (parsed.metadata or {}).get("xmlStreaming"):
+                # 스트리밍 파싱 문서: 트리를 다시 만들지 않고 파일을 한 번 더 훑는다
+                store.put_stream(Path(parsed.source_path), fragment_locators)
+            elif fragment_locators:
+                store.put_tree(_xml_fragment_root(parsed), fragment_locators)
         except Exception:  # pylint: disable=broad-exception-caught
             # Handle store init loosely if running in simple test mode without dir access
             pass
@@ -1,21 +1,32 @@
 """TERM 후보 추출 모듈: LLM 기반 CoT + Pydantic 구조화 추출."""
 # src/tractara/normalization/term_mapper.py
+import hashlib
+import json
 import logging
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-import google.generativeai as genai
-import instructor
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
+from ..llm_gateway import get_gateway
 from ..models.term_types import TermType
 from ..parsing.models import ParsedDocument
+from ..parsing.parse_cache import TIER_TERMS, get_term_cache
+from ..problem_details import MachineReadableError
 from ..tracing import get_trace_id
+from .chunk_packer import pack_blocks
+from .term_prefilter import prefilter_chunks
 
 logger = logging.getLogger(__name__)
 
+# TERM 추출 프롬프트(few-shot 포함)나 응답 모델이 바뀌면 올려 기존 캐시 항목을 무효화한다
+_TERM_PROMPT_VERSION = "1"
+
 
 # Pydantic 모델로 TERM 구조 정의
 class ExtractedTerm(BaseModel):
@@ -58,147 +69,183 @@ class TermCandidate:
 class LLMTermExtractor:
     """
     LLM 기반 TERM 추출기 (첫 번째 문서 전략: CoT + Pydantic)
+
+    extract()는 문서의 모든 청크를 최대 max_concurrency개까지 동시에 요청하고
+    (청크별 지수 백오프 재시도), 결과를 원문 청크 순서로 합친다.
+    요청은 공용 LLM 게이트웨이(llm_gateway)를 거치므로 클라이언트/모델 목록은 프로세스
+    전역으로 재사용되고, 쿼터 초과 모델은 쿨다운 동안만 건너뛴다.
+    검증된 청크 응답은 TERM 캐시(get_term_cache)에 저장해, 같은 청크는 네트워크 호출
+    없이 재사용한다 (use_cache=False이면 조회/저장 모두 생략).
     """
 
-    def __init__(self, api_key: str):
-        # Gemini 설정 (구형 SDK 사용 - 안정성 확보)
-        # TODO: [Migration] instructor 라이브러리가 google-genai(신형 SDK)를 완벽히 지원하면 마이그레이션 필요.
-        # 현재(2026.02) instructor 1.14.x 버전은 구형 SDK(google-generativeai)와 호환성이 더 좋음.
-        # 참조: https://github.com/google-gemini/deprecated-generative-ai-python
-        genai.configure(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: float = 1.0,
+        use_cache: bool = True,
+    ):
+        self.max_concurrency = max(
+            1, max_concurrency or int(os.getenv("TERM_EXTRACTION_CONCURRENCY", "4"))
+        )
+        self.max_retries = max(
+            0,
+            max_retries
+            if max_retries is not None
+            else int(os.getenv("TERM_EXTRACTION_MAX_RETRIES", "3")),
+        )
+        self.retry_backoff = retry_backoff
+        self._cache = get_term_cache() if use_cache else None
+        self.api_key = api_key
+        self._abort = threading.Event()
 
-        # 사용 가능한 모델 후보군 설정 (Fallback을 위해 리스트로 관리)
+        # 라우팅 후보 모델 (선호 순서). 캐시 조회는 선호 모델 기준, 저장은 응답 모델 기준.
         self.model_candidates = self._get_model_candidates()
-        self.current_model_idx = 0
         self.model_name = self.model_candidates[0]
 
         logger.info("🤖 Initializing Gemini with model: %s", self.model_name)
-        self._init_client()
-
-    def _init_client(self):
-        # Instructor 클라이언트 래핑 (표준화된 인터페이스 제공)
-        # 구형 SDK의 GenerativeModel 객체를 생성하여 전달
-        self.client = instructor.from_gemini(
-            client=genai.GenerativeModel(model_name=self.model_name),
-            mode=instructor.Mode.GEMINI_JSON,
-        )
 
     def _get_model_candidates(self) -> List[str]:
-        """API 키로 접근 가능한 모델 중 최적의 모델 후보 리스트 반환"""
-        candidates = []
-        target_model = os.getenv("GEMINI_MODEL")
-
-        # 1. 환경변수 모델 최우선
-        if target_model:
-            candidates.append(target_model)
-
-        # 2. 선호하는 모델 순서 (성능/비용/쿼터 고려)
-        # 429 에러 발생 시 순차적으로 다음 모델을 시도함
-        preferences = [
-            "gemini-3-flash-preview",
-            "gemini-2.5-pro",
-            "gemini-2.5-flash",
-            "gemini-2.5-flash-lite",
-            "gemini-2.0-flash",
-            "gemini-1.5-flash",
-            "gemini-1.5-flash-8b",
-            "gemini-1.5-pro",
-        ]
-
-        try:
-            # 3. 실제 사용 가능한 모델 목록 조회
-            available_models = [
-                m.name.replace("models/", "") for m in genai.list_models()
-            ]
-            logger.info("📋 Available Gemini models: %s", available_models)
-
-            for pref in preferences:
-                if pref in available_models and pref not in candidates:
-                    candidates.append(pref)
-
-            # 4. 선호 모델이 없으면 목록의 첫 번째 모델 사용
-            if not candidates and available_models:
-                candidates.append(available_models[0])
-
-        except (OSError, RuntimeError) as e:
-            logger.error("⚠️ Failed to list models: %s", e)
-            # API 호출 실패 시 기본 리스트 사용
-            for pref in preferences:
-                if pref not in candidates:
-                    candidates.append(pref)
-
-        if not candidates:
-            candidates = ["gemini-1.5-flash"]
-
-        return candidates
+        """API 키로 접근 가능한 모델 중 최적의 모델 후보 리스트 반환 (모델 목록은 TTL 캐시)"""
+        return get_gateway().model_candidates(self.api_key)
 
-    def extract(self, text_chunks: List[str]) -> Tuple[List[TermCandidate], List[str]]:
+    def extract(
+        self, text_chunks: List[str]
+    ) -> Tuple[List[TermCandidate], List[MachineReadableError]]:
         """
-        여러 텍스트 청크에서 TERM 추출
-        Returns: (candidates, error_messages)
+        여러 텍스트 청크에서 TERM 추출 (동시 요청, 결과는 청크 순서)
+        Returns: (candidates, problems) — 실패한 청크마다 구조화된 경고 하나
         """
-        all_candidates = []
-        errors = []
+        indexed = [
+            (i, chunk)
+            for i, chunk in enumerate(text_chunks)
+            # 너무 짧은 텍스트는 스킵 (기준 완화: 50 -> 20)
+            if len(chunk.strip()) >= 20
+        ]
+        self._abort.clear()
+        total = len(text_chunks)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            outcomes = list(
+                executor.map(
+                    lambda item: self._extract_with_retry(item[0], total, item[1]),
+                    indexed,
+                )
+            )
 
-        for i, chunk in enumerate(text_chunks):
-            if len(chunk.strip()) < 20:  # 너무 짧은 텍스트는 스킵 (기준 완화: 50 -> 20)
-                continue
+        all_candidates: List[TermCandidate] = []
+        problems: List[MachineReadableError] = []
+        skipped = 0
+        for outcome in outcomes:
+            if outcome is None:
+                skipped += 1
+            elif isinstance(outcome, MachineReadableError):
+                problems.append(outcome)
+            else:
+                all_candidates.extend(outcome)
+
+        if self._abort.is_set():
+            # 🚨 API 키 만료 또는 권한 에러: 남은 청크는 요청하지 않았다
+            problems.append(
+                MachineReadableError(
+                    code="llm_api_key_invalid",
+                    target="GEMINI_API_KEY",
+                    detail="Critical: API Key issue. Please check your .env file.",
+                    meta={"skippedChunks": skipped},
+                )
+            )
+        return all_candidates, problems
 
+    def _extract_with_retry(
+        self, index: int, total: int, chunk: str
+    ) -> Union[List[TermCandidate], MachineReadableError, None]:
+        """
+        청크 하나 추출 (지수 백오프 재시도). 성공 시 후보 목록, 실패 시 구조화된 경고,
+        치명적 API 키 오류로 중단된 뒤라 요청하지 않았으면 None.
+        """
+        cache_key = _term_cache_key(chunk, self.model_name)
+        if self._cache is not None:
+            payload = self._cache.get(TIER_TERMS, cache_key)
+            if payload is not None:
+                try:
+                    cached = TermExtractionResult.model_validate(payload)
+                    logger.info("TERM cache hit for chunk %d/%d", index + 1, total)
+                    return _to_candidates(cached)
+                except ValidationError as e:
+                    logger.warning("Incompatible TERM cache entry (%s). Ignoring.", e)
+
+        for attempt in range(self.max_retries + 1):
+            if self._abort.is_set():
+                return None
             logger.info(
-                "Sending chunk %d/%d to LLM (len=%d)...",
-                i + 1,
-                len(text_chunks),
-                len(chunk),
+                "Sending chunk %d/%d to LLM (len=%d)...", index + 1, total, len(chunk)
             )
+            route: Dict[str, Any] = {}
             try:
-                result = self._extract_from_chunk(chunk)
-                candidates = [
-                    TermCandidate(
-                        term=t.term,
-                        definition_en=t.definition_en,
-                        definition_ko=t.definition_ko,
-                        headword_en=t.headword_en,
-                        headword_ko=t.headword_ko,
-                        domain=t.domain,
-                        context=t.context,
-                        term_type=t.term_type,
-                    )
-                    for t in result.terms
-                ]
-                all_candidates.extend(candidates)
-
-                logger.info("Extracted %d terms from chunk", len(candidates))
-                logger.debug("CoT reasoning: %s", result.reasoning)
-
-            except (ValueError, RuntimeError, ConnectionError) as e:
-                msg = f"Chunk {i+1} failed: {str(e)}"
-                logger.error("❌ TERM extraction failed: %s", msg, exc_info=True)
-
-                # 🚨 API 키 만료 또는 권한 에러 발생 시 즉시 중단
-                if "expired" in str(e).lower() or "400" in str(e) or "403" in str(e):
+                result = self._extract_from_chunk(chunk, route)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                message = str(e)
+                if "expired" in message.lower() or "400" in message or "403" in message:
                     logger.critical(
                         "🛑 Critical API Error: API Key expired or invalid. Stopping."
                     )
-                    errors.append(
-                        "Critical: API Key issue. Please check your .env file."
-                    )
-                    break
+                    self._abort.set()
+                    return None
 
                 # 404 모델 에러인 경우 사용 가능한 모델 목록 출력 (디버깅용)
-                if "404" in str(e) and "models/" in str(e):
+                if "404" in message and "models/" in message:
                     try:
-                        available_models = [m.name for m in genai.list_models()]
+                        available_models = get_gateway().list_models(self.api_key)
                         logger.error("Available models: %s", available_models)
                     except (OSError, RuntimeError) as list_err:
                         logger.error("Failed to list models: %s", list_err)
 
-                errors.append(msg)
+                if attempt < self.max_retries:
+                    backoff = self.retry_backoff * 2.0**attempt
+                    logger.warning(
+                        "TERM chunk %d/%d failed (%s). Retrying in %.1fs.",
+                        index + 1,
+                        total,
+                        e,
+                        backoff,
+                    )
+                    time.sleep(backoff)
+                    continue
+
+                msg = f"Chunk {index + 1} failed: {message}"
+                logger.error("❌ TERM extraction failed: %s", msg)
+                return MachineReadableError(
+                    code="term_chunk_failed",
+                    target=f"chunks[{index}]",
+                    detail=msg,
+                    meta={
+                        "chunkIndex": index,
+                        "attempts": attempt + 1,
+                        "errorType": type(e).__name__,
+                    },
+                )
 
-        return all_candidates, errors
+            if self._cache is not None:
+                # 폴백 모델이 응답했으면 그 모델 키로 저장한다 (선호 모델 응답으로 재사용 방지)
+                self._cache.put(
+                    TIER_TERMS,
+                    _term_cache_key(chunk, route.get("model", self.model_name)),
+                    result.model_dump(mode="json"),
+                )
+            candidates = _to_candidates(result)
+            logger.info(
+                "Extracted %d terms from chunk %d/%d", len(candidates), index + 1, total
+            )
+            logger.debug("CoT reasoning: %s", result.reasoning)
+            return candidates
+        return None
 
-    def _extract_from_chunk(self, text: str) -> TermExtractionResult:
+    def _extract_from_chunk(
+        self, text: str, route: Optional[Dict[str, Any]] = None
+    ) -> TermExtractionResult:
         """
         단일 청크에서 TERM 추출 (Instructor + CoT)
+        route가 주어지면 실제로 응답한 모델 이름을 route["model"]에 기록한다.
         """
         # Few-shot 예제
         few_shot_example = """
@@ -256,48 +303,61 @@ class LLMTermExtractor:
 추론 과정을 reasoning 필드에 자세히 기록하고, terms 배열에 추출 결과를 담으세요.
 """
 
-        # 모델 Fallback 루프
-        while True:
-            try:
-                # Instructor를 통한 구조화된 출력 요청
-                response = self.client.chat.completions.create(
-                    messages=[{"role": "user", "content": prompt}],
-                    response_model=TermExtractionResult,
-                    max_retries=2,  # 내부 재시도 (일시적 오류용)
-                )
-                return response
-            except Exception as e:
-                # 429 Quota Exceeded 에러 처리
-                if (
-                    "429" in str(e)
-                    or "Quota exceeded" in str(e)
-                    or "ResourceExhausted" in str(e)
-                ):
-                    logger.warning("⚠️ Quota exceeded for model %s.", self.model_name)
-
-                    # 다음 모델로 전환
-                    self.current_model_idx += 1
-                    if self.current_model_idx < len(self.model_candidates):
-                        self.model_name = self.model_candidates[self.current_model_idx]
-                        logger.info(
-                            "🔄 Switching to fallback model: %s", self.model_name
-                        )
-                        self._init_client()
-                        continue
-                    logger.error("❌ All fallback models exhausted.")
-                    raise e
-                raise e
+        # Instructor를 통한 구조화된 출력 요청 (쿼터 초과 시 게이트웨이가 다음 후보 모델로 라우팅)
+        return get_gateway().structured(
+            self.model_candidates,
+            messages=[{"role": "user", "content": prompt}],
+            response_model=TermExtractionResult,
+            api_key=self.api_key,
+            route=route,
+        )
+
+
+def _term_cache_key(chunk: str, model_name: str) -> str:
+    """정규화된 청크 텍스트(공백 축약) + 프롬프트 버전 + 모델 이름 해시."""
+    identity = {
+        "text": " ".join(chunk.split()),
+        "prompt": _TERM_PROMPT_VERSION,
+        "model": model_name,
+    }
+    encoded = json.dumps(identity, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _to_candidates(result: TermExtractionResult) -> List[TermCandidate]:
+    return [
+        TermCandidate(
+            term=t.term,
+            definition_en=t.definition_en,
+            definition_ko=t.definition_ko,
+            headword_en=t.headword_en,
+            headword_ko=t.headword_ko,
+            domain=t.domain,
+            context=t.context,
+            term_type=t.term_type,
+        )
+        for t in result.terms
+    ]
 
 
 def extract_term_candidates(
-    parsed: ParsedDocument, llm_api_key: Optional[str] = None
-) -> Tuple[List[TermCandidate], List[str]]:
+    parsed: ParsedDocument,
+    llm_api_key: Optional[str] = None,
+    use_cache: bool = True,
+    stats: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[TermCandidate], List[MachineReadableError]]:
     """
     ParsedDocument에서 TERM 후보 추출
 
     첫 번째 문서 전략:
     - LLM 기반 추출 (CoT + Few-shot)
     - Instructor로 구조화된 출력 보장
+    - 블록을 구조 인식 청크(chunk_packer)로 묶어 문서 전체 청크를 동시 요청 (TERM_EXTRACTION_CONCURRENCY), 실패 청크는
+      구조화된 경고(MachineReadableError)로 돌려준다
+    - 청크 응답은 TERM 캐시에 저장되어, 바뀌지 않은 문서를 다시 인제스트하면 LLM을
+      호출하지 않는다 (use_cache=False이면 우회)
+    - 결정론적 사전 필터(term_prefilter)로 TERM SSoT에 없는 용어 후보가 있는 청크만
+      LLM에 보낸다. stats가 주어지면 {"chunks", "skipped"}를 채운다.
     """
     # 인자로 키가 안 넘어왔으면 환경 변수에서 조회
     if not llm_api_key:
@@ -313,25 +373,42 @@ def extract_term_candidates(
                 definition_en=None,
                 definition_ko="경년열화 관리 프로그램",
             )
-        ], ["No LLM API Key provided."]
+        ], [
+            MachineReadableError(
+                code="llm_api_key_missing",
+                target="GEMINI_API_KEY",
+                detail="No LLM API Key provided.",
+            )
+        ]
 
-    # 텍스트 청크 준비
-    text_chunks = [
-        block.text for block in parsed.blocks if block.text and len(block.text) > 20
-    ]
+    # 텍스트 청크 준비: 섹션 계층을 따라 짧은 블록을 토큰 예산까지 묶는다
+    packed = pack_blocks(parsed.blocks)
 
-    if not text_chunks:
+    if not packed:
         logger.warning(
             "⚠️ No text chunks > 20 chars found in document. Term extraction skipped."
         )
-        return [], ["No text chunks found in document (OCR might be needed)."]
+        return [], [
+            MachineReadableError(
+                code="no_text_chunks",
+                target=parsed.source_path,
+                detail="No text chunks found in document (OCR might be needed).",
+            )
+        ]
+
+    # 새 용어 후보가 없는 청크는 LLM에 보내지 않는다
+    prefiltered = prefilter_chunks(packed)
+    if stats is not None:
+        stats.update(prefiltered.as_metrics())
+    text_chunks = [chunk.text for chunk in prefiltered.chunks]
+    if not text_chunks:
+        logger.info("All %d chunks contain only known terms. LLM skipped.", len(packed))
+        return [], []
 
     # LLM 추출
-    extractor = LLMTermExtractor(api_key=llm_api_key)
-    # 더 많은 용어를 찾기 위해 청크 수 증가 (테스트용 1개)
-    chunks_to_process = text_chunks[:1]
-    logger.info("Sending %d text chunks to LLM...", len(chunks_to_process))
-    candidates, errors = extractor.extract(chunks_to_process)
+    extractor = LLMTermExtractor(api_key=llm_api_key, use_cache=use_cache)
+    logger.info("Sending %d text chunks to LLM...", len(text_chunks))
+    candidates, errors = extractor.extract(text_chunks)
 
     logger.info(
         "Extracted %d TERM candidates. Errors: %d", len(candidates), len(errors)
@@ -0,0 +1,223 @@
+"""TERM 추출 전 결정론적 사전 필터: 새 용어 후보가 없는 청크는 LLM에 보내지 않는다."""
+# src/tractara/normalization/term_prefilter.py
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from ..ssot import term_ssot_repository
+from .chunk_packer import TextChunk
+
+logger = logging.getLogger(__name__)
+
+# "Full Name (ABBR)" — 괄호 안 약어와 앞 단어들
+_ABBREVIATION = re.compile(r"\(\s*([A-Z][A-Za-z0-9&/-]{1,11})\s*\)")
+# 단독 약어 (대문자 2자 이상, 숫자 포함 가능: LOCA, RPV, NUREG, CO2)
+_ACRONYM = re.compile(r"\b[A-Z][A-Z0-9]*[A-Z][A-Z0-9]*s?\b")
+# 대문자로 시작하는 2~6단어 구 (Fatigue Monitoring, Reactor Coolant System)
+_CAPITALIZED_PHRASE = re.compile(r"\b[A-Z][a-z]+(?:[ -][A-Z][a-z]+){1,5}\b")
+# 한글 4자 이상 연속 (복합 명사 후보)
+_HANGUL_RUN = re.compile(r"[가-힣]{4,}")
+_WORD = re.compile(r"[A-Za-z][A-Za-z0-9-]*")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+# 문장 첫머리 등에서 대문자로 쓰였을 뿐인 앞 단어
+_LEADING_STOPWORDS = frozenset(
+    {"The", "A", "An", "This", "These", "That", "Those", "In", "For", "Of", "And"}
+)
+# 복합 명사 뒤에 붙는 조사 (긴 것부터 제거)
+_KOREAN_PARTICLES = (
+    "에서는",
+    "으로는",
+    "에서",
+    "으로",
+    "에는",
+    "과의",
+    "와의",
+    "은",
+    "는",
+    "이",
+    "가",
+    "을",
+    "를",
+    "의",
+    "에",
+    "로",
+    "와",
+    "과",
+    "도",
+    "및",
+)
+# 명사가 아닌 서술어/수식어 어미 (후보에서 제외)
+_KOREAN_PREDICATE_ENDINGS = (
+    "다",
+    "며",
+    "고",
+    "면",
+    "서",
+    "지",
+    "요",
+    "게",
+    "니",
+    "는",
+    "된",
+    "한",
+    "인",
+    "함",
+    "됨",
+    "하",
+    "되",
+    "있",
+    "없",
+    "했",
+    "였",
+    "야",
+    "어",
+)
+
+
+def normalize_term_key(text: str) -> str:
+    """
+    용어 비교 키: 소문자, 영숫자/한글 외 문자는 공백 하나로, 4자 이상 영단어의 단수형.
+    ("Aging-Management Programs" → "aging management program")
+    """
+    return " ".join(_singular(w) for w in _NON_WORD.sub(" ", text.lower()).split())
+
+
+def _singular(word: str) -> str:
+    # 복수형 s 하나만 떼어 단수/복수를 같은 키로 본다 (색인과 후보에 똑같이 적용)
+    if len(word) > 3 and word.isascii() and word.endswith("s"):
+        return word if word.endswith("ss") else word[:-1]
+    return word
+
+
+def _strip_particle(word: str) -> str:
+    for particle in _KOREAN_PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= 2:
+            return word[: -len(particle)]
+    return word
+
+
+def find_term_candidates(text: str) -> Set[str]:
+    """
+    청크에서 결정론적으로 찾은 용어 후보 (정규화 키).
+    - 약어 패턴: "Full Name (ABBR)"의 ABBR과 앞 단어들(약어 글자 수만큼), 단독 약어
+    - 대문자로 시작하는 다단어 구 (앞의 관사/전치사 제외)
+    - 한글 복합 명사 (4자 이상 연속, 조사 제거, 서술어 어미로 끝나면 제외)
+    """
+    candidates: List[str] = []
+
+    for match in _ABBREVIATION.finditer(text):
+        abbr = match.group(1)
+        candidates.append(abbr)
+        initials = sum(1 for ch in abbr if ch.isupper())
+        preceding = _WORD.findall(text[max(0, match.start() - 120) : match.start()])
+        if initials >= 2 and len(preceding) >= initials:
+            candidates.append(" ".join(preceding[-initials:]))
+
+    candidates.extend(_ACRONYM.findall(text))
+
+    for phrase in _CAPITALIZED_PHRASE.findall(text):
+        words = re.split(r"[ -]", phrase)
+        while words and words[0] in _LEADING_STOPWORDS:
+            words.pop(0)
+        if len(words) >= 2:
+            candidates.append(" ".join(words))
+
+    for run in _HANGUL_RUN.findall(text):
+        noun = _strip_particle(run)
+        if len(noun) >= 4 and not noun.endswith(_KOREAN_PREDICATE_ENDINGS):
+            candidates.append(noun)
+
+    return {key for key in map(normalize_term_key, candidates) if key}
+
+
+def build_known_term_index(terms: Iterable[dict]) -> FrozenSet[str]:
+    """
+    SSoT TERM의 term / headword_en / headword_ko 정규화 키 집합.
+    한글 표제어는 4자 이상 구성 단어도 함께 넣는다 ("경년열화 관리 프로그램" → "경년열화").
+    """
+    index: Set[str] = set()
+    for term in terms:
+        for field_name in ("term", "headword_en", "headword_ko"):
+            value = term.get(field_name)
+            if not isinstance(value, str) or not value.strip():
+                continue
+            key = normalize_term_key(value)
+            if key:
+                index.add(key)
+            if field_name == "headword_ko":
+                index.update(
+                    normalize_term_key(_strip_particle(run))
+                    for run in _HANGUL_RUN.findall(value)
+                )
+    return frozenset(index)
+
+
+_INDEX_LOCK = threading.Lock()
+_INDEX_CACHE: Optional[Tuple[Tuple[str, Tuple[int, ...]], FrozenSet[str]]] = None
+
+
+def known_term_index() -> FrozenSet[str]:
+    """TERM SSoT 색인 (SSoT 디렉터리 서명이 바뀔 때만 다시 읽는다)."""
+    global _INDEX_CACHE  # pylint: disable=global-statement
+    cache_key = (
+        str(term_ssot_repository.SSOT_TERM_DIR),
+        term_ssot_repository.terms_signature(),
+    )
+    with _INDEX_LOCK:
+        if _INDEX_CACHE is None or _INDEX_CACHE[0] != cache_key:
+            _INDEX_CACHE = (
+                cache_key,
+                build_known_term_index(term_ssot_repository.iter_terms()),
+            )
+        return _INDEX_CACHE[1]
+
+
+@dataclass
+class PrefilterResult:
+    """사전 필터 결과: LLM에 보낼 청크와 건너뛴 청크 수."""
+
+    chunks: List[TextChunk]
+    total: int
+    skipped: int
+
+    def as_metrics(self) -> dict:
+        return {"chunks": self.total, "skipped": self.skipped}
+
+
+def prefilter_chunks(
+    chunks: List[TextChunk], known: Optional[FrozenSet[str]] = None
+) -> PrefilterResult:
+    """
+    SSoT에 없는 용어 후보가 하나라도 있는 청크만 남긴다 (순서 유지).
+    후보가 전혀 없거나 모든 후보가 이미 SSoT에 있는 청크는 건너뛴다.
+    섹션 경로 접두어는 같은 섹션의 모든 청크에 반복되므로 후보를 찾지 않는다
+    (섹션 제목 블록 자체는 본문에 들어 있다).
+    TERM_PREFILTER_ENABLED=0이면 모든 청크를 그대로 돌려준다.
+    """
+    if os.getenv("TERM_PREFILTER_ENABLED", "1").lower() in ("0", "false", "no"):
+        return PrefilterResult(chunks=list(chunks), total=len(chunks), skipped=0)
+
+    if known is None:
+        known = known_term_index()
+    kept = [chunk for chunk in chunks if find_term_candidates(_body(chunk)) - known]
+    result = PrefilterResult(
+        chunks=kept, total=len(chunks), skipped=len(chunks) - len(kept)
+    )
+    logger.info(
+        "TERM prefilter: %d/%d chunks have unseen term candidates (%d skipped, %d known terms)",
+        len(kept),
+        len(chunks),
+        result.skipped,
+        len(known),
+    )
+    return result
+
+
+def _body(chunk: TextChunk) -> str:
+    if chunk.breadcrumb:
+        return chunk.text.split("\n", 1)[-1]
+    return chunk.text
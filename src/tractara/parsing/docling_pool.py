@@ -0,0 +1,489 @@
+"""Docling 변환기 풀: 사전 초기화된 DoclingParser 워커 프로세스 재사용."""
+# src/tractara/parsing/docling_pool.py
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .models import ParsedBlock, ParsedDocument
+
+logger = logging.getLogger(__name__)
+
+# 워커 → 부모 메시지 종류
+_MSG_READY = "ready"
+_MSG_STARTED = "started"
+_MSG_IDLE = "idle"
+_MSG_RESULT = "result"
+_MSG_ERROR = "error"
+_MSG_RETIRED = "retired"
+_MSG_INIT_FAILED = "init_failed"
+
+# 워커 예외를 부모에서 재발생시킬 때 허용하는 타입 (parse_pdf의 fallback 분기와 호환)
+_REMOTE_EXCEPTIONS: Dict[str, type] = {
+    "ImportError": ImportError,
+    "ModuleNotFoundError": ImportError,
+    "OSError": OSError,
+    "FileNotFoundError": OSError,
+    "ValueError": ValueError,
+}
+
+
+# (job_id, pdf_path, page_range) — page_range가 None이면 문서 전체
+_Job = Tuple[int, str, Optional[Tuple[int, int]]]
+
+
+@dataclass
+class DoclingPoolConfig:
+    """
+    풀 설정. 환경 변수로도 지정할 수 있다.
+      - size:               워커 프로세스 수 (DOCLING_POOL_SIZE, 0이면 풀 비활성)
+      - num_threads:        워커당 Docling AcceleratorOptions.num_threads
+                            (DOCLING_NUM_THREADS)
+      - max_documents:      워커 재활용 주기(문서 수) (DOCLING_MAX_DOCS_PER_WORKER)
+      - max_rss_mb:         워커 RSS 임계치(MB), 0이면 비활성 (DOCLING_MAX_RSS_MB)
+      - job_timeout:        문서/창 하나의 변환 한도(초, 워커가 시작한 시점부터).
+                            넘기면 워커를 재시작한다. 0이면 비활성
+                            (DOCLING_JOB_TIMEOUT_SECONDS)
+    """
+
+    size: int = 1
+    num_threads: int = 4
+    max_documents: int = 50
+    max_rss_mb: int = 0
+    job_timeout: float = 1800.0
+
+    @classmethod
+    def from_env(cls) -> "DoclingPoolConfig":
+        """환경 변수에서 설정을 읽는다."""
+        return cls(
+            size=int(os.getenv("DOCLING_POOL_SIZE", "1")),
+            num_threads=int(os.getenv("DOCLING_NUM_THREADS", "4")),
+            max_documents=int(os.getenv("DOCLING_MAX_DOCS_PER_WORKER", "50")),
+            max_rss_mb=int(os.getenv("DOCLING_MAX_RSS_MB", "0")),
+            job_timeout=float(os.getenv("DOCLING_JOB_TIMEOUT_SECONDS", "1800")),
+        )
+
+
+def _default_parser_factory(num_threads: int) -> Any:
+    from .pdf_parser import DoclingParser  # pylint: disable=import-outside-toplevel
+
+    return DoclingParser(num_threads=num_threads)
+
+
+def _current_rss_mb() -> float:
+    """현재 프로세스 RSS(MB). /proc을 못 읽으면 최대 RSS로 대체."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        import resource  # pylint: disable=import-outside-toplevel
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _worker_main(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    worker_id: int,
+    task_queue: Any,
+    result_queue: Any,
+    parser_factory: Callable[[int], Any],
+    config: DoclingPoolConfig,
+) -> None:
+    """
+    워커 프로세스 본체: 변환기를 한 번만 초기화하고 전용 큐에서 문서(또는 페이지 창)를
+    받아 처리한다. 작업을 마칠 때마다 유휴 알림을 보내 다음 작업을 배정받는다.
+    창 작업도 max_documents 계산에서 문서 하나로 센다.
+    max_documents 또는 max_rss_mb에 도달하면 현재 작업을 끝낸 뒤 은퇴한다.
+    """
+    try:
+        parser = parser_factory(config.num_threads)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        result_queue.put(
+            (_MSG_INIT_FAILED, worker_id, None, (type(e).__name__, str(e)))
+        )
+        return
+
+    result_queue.put((_MSG_READY, worker_id, None, os.getpid()))
+    processed = 0
+
+    while True:
+        job = task_queue.get()
+        if job is None:  # 종료 신호
+            return
+
+        job_id, pdf_path, page_range = job
+        result_queue.put((_MSG_STARTED, worker_id, job_id, None))
+        try:
+            if page_range is None:
+                parsed = parser.parse(Path(pdf_path))
+            else:
+                parsed = parser.parse_window(Path(pdf_path), *page_range)
+            result_queue.put((_MSG_RESULT, worker_id, job_id, parsed))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            result_queue.put(
+                (_MSG_ERROR, worker_id, job_id, (type(e).__name__, str(e)))
+            )
+
+        processed += 1
+        rss_mb = _current_rss_mb()
+        if processed >= config.max_documents or (
+            config.max_rss_mb and rss_mb >= config.max_rss_mb
+        ):
+            result_queue.put(
+                (_MSG_RETIRED, worker_id, None, {"processed": processed, "rss": rss_mb})
+            )
+            return
+        result_queue.put((_MSG_IDLE, worker_id, None, None))
+
+
+class DoclingConverterPool:
+    """
+    장기 실행 Docling 변환기 풀.
+
+    - API/벌크 인제스트 시작 시 start()로 워커를 띄워 모델 로딩 비용을 한 번만 지불한다.
+    - 문서는 부모의 대기열에 쌓였다가 유휴 워커의 전용 작업 큐로 하나씩 배정되므로,
+      부모는 어느 워커가 어떤 작업을 갖고 있는지 항상 안다. 디스패처 스레드가 결과를
+      Future에 연결한다.
+    - 워커는 N개 문서 처리 또는 RSS 임계치 초과 시 은퇴하고 새 워커로 교체된다
+      (Docling의 장기 실행 메모리 증가 대응).
+    - 워커가 비정상 종료되면 배정된 문서는 RuntimeError로 실패 처리된다.
+    - 변환 시작 후 job_timeout을 넘긴 워커는 강제 종료·교체되고 그 문서는 TimeoutError로
+      실패 처리된다 (대기열에서 기다린 시간은 세지 않는다).
+    """
+
+    def __init__(
+        self,
+        config: Optional[DoclingPoolConfig] = None,
+        parser_factory: Callable[[int], Any] = _default_parser_factory,
+        start_method: str = "spawn",
+    ):
+        self.config = config or DoclingPoolConfig.from_env()
+        self._factory = parser_factory
+        self._ctx = mp.get_context(start_method)
+        self._result_queue: Any = None
+        self._workers: Dict[int, Any] = {}
+        self._task_queues: Dict[int, Any] = {}  # worker_id → 전용 작업 큐
+        self._idle: Deque[int] = deque()
+        self._pending: Deque[_Job] = deque()
+        self._in_flight: Dict[int, int] = {}  # worker_id → job_id (배정 시점부터)
+        self._deadlines: Dict[int, float] = {}  # worker_id → 변환 마감 (시작 알림 기준)
+        self._futures: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._worker_ids = itertools.count()
+        self._job_ids = itertools.count()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._init_error: Optional[BaseException] = None
+        self.recycled_count = 0
+
+    # ── 수명 관리 ──────────────────────────────────────────────────────────
+    def __enter__(self) -> "DoclingConverterPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    @property
+    def running(self) -> bool:
+        """풀이 작업을 받을 수 있는 상태인지 여부."""
+        return self._dispatcher is not None and not self._stopping.is_set()
+
+    def start(self) -> None:
+        """워커 프로세스와 디스패처 스레드를 시작한다."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._result_queue = self._ctx.Queue()
+        for _ in range(max(1, self.config.size)):
+            self._spawn_worker()
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="docling-pool-dispatcher", daemon=True
+        )
+        self._dispatcher.start()
+        logger.info(
+            "Docling converter pool started: size=%d, num_threads=%d, "
+            "max_documents=%d, max_rss_mb=%d, job_timeout=%s",
+            self.config.size,
+            self.config.num_threads,
+            self.config.max_documents,
+            self.config.max_rss_mb,
+            self.config.job_timeout,
+        )
+
+    def ensure_size(self, size: int) -> None:
+        """
+        워커 수를 최소 size로 늘린다 (줄이지 않는다). 늘린 워커는 풀이 종료될 때까지
+        유지되므로 모델 로딩 비용은 늘어날 때 한 번만 든다.
+        """
+        with self._lock:
+            missing = size - self.config.size
+            if missing <= 0 or not self.running:
+                return
+            self.config = replace(self.config, size=size)
+        for _ in range(missing):
+            self._spawn_worker()
+        logger.info("Docling converter pool grown to %d workers", size)
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        """모든 워커에 종료 신호를 보내고 정리한다. 대기 중인 작업은 실패 처리된다."""
+        if self._dispatcher is None:
+            return
+        self._stopping.set()
+        with self._lock:
+            workers = list(self._workers.values())
+            task_queues = list(self._task_queues.values())
+        for task_queue in task_queues:
+            task_queue.put(None)
+        for proc in workers:
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+        self._dispatcher.join(timeout)
+        self._dispatcher = None
+        self._fail_pending(RuntimeError("Docling converter pool shut down"))
+        self._workers.clear()
+        self._task_queues.clear()
+        self._idle.clear()
+        logger.info("Docling converter pool stopped (recycled=%d)", self.recycled_count)
+
+    # ── 작업 제출 ──────────────────────────────────────────────────────────
+    def submit(self, pdf_path: Path) -> "Future[ParsedDocument]":
+        """문서를 대기열에 넣고 Future를 반환한다."""
+        return self._submit(pdf_path, None)
+
+    def submit_window(
+        self, pdf_path: Path, first_page: int, last_page: int
+    ) -> "Future[List[ParsedBlock]]":
+        """페이지 창(1-based, 포함) 변환 작업. 결과는 계층 부여 전 블록 목록이다."""
+        return self._submit(pdf_path, (first_page, last_page))
+
+    def _submit(self, pdf_path: Path, page_range: Optional[Tuple[int, int]]) -> Future:
+        if self._init_error is not None:
+            raise self._init_error
+        if not self.running:
+            raise RuntimeError("Docling converter pool is not running")
+
+        future: Future = Future()
+        job_id = next(self._job_ids)
+        with self._lock:
+            self._futures[job_id] = future
+            self._pending.append((job_id, str(pdf_path), page_range))
+            self._assign_locked()
+        return future
+
+    def parse(self, pdf_path: Path, timeout: Optional[float] = None) -> ParsedDocument:
+        """DoclingParser.parse와 동일한 동기 인터페이스."""
+        return self.submit(pdf_path).result(timeout)
+
+    # ── 내부 ───────────────────────────────────────────────────────────────
+    def _spawn_worker(self) -> None:
+        worker_id = next(self._worker_ids)
+        task_queue = self._ctx.Queue()
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                worker_id,
+                task_queue,
+                self._result_queue,
+                self._factory,
+                self.config,
+            ),
+            name=f"docling-worker-{worker_id}",
+            daemon=True,
+        )
+        proc.start()
+        with self._lock:
+            self._workers[worker_id] = proc
+            self._task_queues[worker_id] = task_queue
+
+    def _assign_locked(self) -> None:
+        """대기 중인 작업을 유휴 워커에 배정한다 (self._lock 보유 상태에서 호출)."""
+        while self._pending and self._idle:
+            worker_id = self._idle.popleft()
+            if worker_id not in self._workers:
+                continue
+            job = self._pending.popleft()
+            if job[0] not in self._futures:  # 이미 실패 처리된 작업
+                self._idle.appendleft(worker_id)
+                continue
+            self._in_flight[worker_id] = job[0]
+            self._task_queues[worker_id].put(job)
+
+    def _dispatch_loop(self) -> None:
+        next_check = 0.0
+        while not self._stopping.is_set():
+            try:
+                kind, worker_id, job_id, payload = self._result_queue.get(timeout=1.0)
+            except queue.Empty:
+                self._reap_dead_workers()
+                self._restart_overdue_workers()
+                continue
+            except (EOFError, OSError):
+                return
+            self._handle_message(kind, worker_id, job_id, payload)
+            # 결과가 계속 들어와 큐가 비지 않아도 마감은 주기적으로 확인한다
+            now = time.monotonic()
+            if now >= next_check:
+                self._restart_overdue_workers()
+                next_check = now + 1.0
+
+    def _handle_message(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, kind: str, worker_id: int, job_id: Optional[int], payload: Any
+    ) -> None:
+        if kind in (_MSG_READY, _MSG_IDLE):
+            if kind == _MSG_READY:
+                logger.info("Docling worker %d ready (pid=%s)", worker_id, payload)
+            with self._lock:
+                if worker_id in self._workers:
+                    self._idle.append(worker_id)
+                    self._assign_locked()
+        elif kind == _MSG_STARTED:
+            with self._lock:
+                if self.config.job_timeout > 0 and self._in_flight.get(worker_id) == (
+                    job_id
+                ):
+                    self._deadlines[worker_id] = (
+                        time.monotonic() + self.config.job_timeout
+                    )
+        elif kind in (_MSG_RESULT, _MSG_ERROR):
+            with self._lock:
+                if self._in_flight.get(worker_id) == job_id:
+                    del self._in_flight[worker_id]
+                    self._deadlines.pop(worker_id, None)
+                future = self._futures.pop(job_id, None)
+            if future is None:
+                return
+            if kind == _MSG_RESULT:
+                future.set_result(payload)
+            else:
+                exc_name, message = payload
+                exc_type = _REMOTE_EXCEPTIONS.get(exc_name, RuntimeError)
+                future.set_exception(exc_type(f"{exc_name}: {message}"))
+        elif kind == _MSG_RETIRED:
+            logger.info(
+                "Docling worker %d retired (%s). Respawning.", worker_id, payload
+            )
+            self._retire_worker(worker_id)
+            self.recycled_count += 1
+            if not self._stopping.is_set():
+                self._spawn_worker()
+        elif kind == _MSG_INIT_FAILED:
+            exc_name, message = payload
+            exc_type = _REMOTE_EXCEPTIONS.get(exc_name, RuntimeError)
+            self._init_error = exc_type(f"Docling worker init failed: {message}")
+            logger.error("Docling worker %d init failed: %s", worker_id, message)
+            self._retire_worker(worker_id)
+            self._stopping.set()
+            self._fail_pending(self._init_error)
+
+    def _retire_worker(self, worker_id: int) -> None:
+        with self._lock:
+            proc = self._workers.pop(worker_id, None)
+            self._task_queues.pop(worker_id, None)
+        if proc is not None:
+            proc.join(5.0)
+
+    def _drop_worker(self, worker_id: int) -> Tuple[Any, Optional[Future]]:
+        """워커를 풀에서 빼고 (프로세스, 배정돼 있던 작업의 Future)를 돌려준다."""
+        with self._lock:
+            proc = self._workers.pop(worker_id, None)
+            self._task_queues.pop(worker_id, None)
+            self._deadlines.pop(worker_id, None)
+            job_id = self._in_flight.pop(worker_id, None)
+            future = self._futures.pop(job_id, None) if job_id is not None else None
+        return proc, future
+
+    def _reap_dead_workers(self) -> None:
+        """비정상 종료된 워커를 교체하고 배정돼 있던 작업을 실패 처리한다."""
+        with self._lock:
+            dead = [wid for wid, p in self._workers.items() if not p.is_alive()]
+        for worker_id in dead:
+            _, future = self._drop_worker(worker_id)
+            logger.error("Docling worker %d died unexpectedly. Respawning.", worker_id)
+            if future is not None:
+                future.set_exception(
+                    RuntimeError(f"Docling worker {worker_id} died during conversion")
+                )
+            if not self._stopping.is_set():
+                self._spawn_worker()
+
+    def _restart_overdue_workers(self) -> None:
+        """변환 마감을 넘긴 워커를 강제 종료·교체하고 그 작업을 TimeoutError로 실패 처리한다."""
+        now = time.monotonic()
+        with self._lock:
+            overdue = [
+                wid for wid, deadline in self._deadlines.items() if deadline <= now
+            ]
+        for worker_id in overdue:
+            proc, future = self._drop_worker(worker_id)
+            logger.error(
+                "Docling worker %d exceeded job_timeout (%ss). Restarting.",
+                worker_id,
+                self.config.job_timeout,
+            )
+            if proc is not None:
+                proc.terminate()
+                proc.join(5.0)
+            if future is not None:
+                future.set_exception(
+                    TimeoutError(
+                        f"Docling conversion did not finish within "
+                        f"{self.config.job_timeout}s (worker {worker_id} restarted)"
+                    )
+                )
+            if not self._stopping.is_set():
+                self._spawn_worker()
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        with self._lock:
+            pending = list(self._futures.values())
+            self._futures.clear()
+            self._pending.clear()
+            self._in_flight.clear()
+            self._deadlines.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(exc)
+
+
+# ── 프로세스 전역 기본 풀 (API / 벌크 인제스트 시작 시 생성) ────────────────
+_DEFAULT_POOL: Optional[DoclingConverterPool] = None
+
+
+def start_default_pool(
+    config: Optional[DoclingPoolConfig] = None,
+) -> Optional[DoclingConverterPool]:
+    """기본 풀을 시작한다. size가 0이면 풀을 만들지 않는다 (문서별 DoclingParser 사용)."""
+    global _DEFAULT_POOL  # pylint: disable=global-statement
+    config = config or DoclingPoolConfig.from_env()
+    if config.size <= 0:
+        logger.info("Docling converter pool disabled (size=0).")
+        return None
+    if _DEFAULT_POOL is None or not _DEFAULT_POOL.running:
+        _DEFAULT_POOL = DoclingConverterPool(config)
+        _DEFAULT_POOL.start()
+    return _DEFAULT_POOL
+
+
+def get_default_pool() -> Optional[DoclingConverterPool]:
+    """실행 중인 기본 풀 (없으면 None)."""
+    if _DEFAULT_POOL is not None and _DEFAULT_POOL.running:
+        return _DEFAULT_POOL
+    return None
+
+
+def shutdown_default_pool() -> None:
+    """기본 풀을 종료한다."""
+    global _DEFAULT_POOL  # pylint: disable=global-statement
+    if _DEFAULT_POOL is not None:
+        _DEFAULT_POOL.shutdown()
+        _DEFAULT_POOL = None
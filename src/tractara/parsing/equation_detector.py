@@ -0,0 +1,314 @@
+"""수식 탐지 엔진: 패턴/키워드를 한 번만 컴파일하고 블록당 선형 스캔으로 판정한다."""
+# src/tractara/parsing/equation_detector.py
+import re
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+# 수식 기호 (유니코드 그리스 문자 + 연산자)
+MATH_SYMBOLS = "∑∫√±αβγδεζηθικλμνξοπρστυφχψωΔΓΘΛΞΠΣΦΨΩ=+-*/<>≤≥≈≠"
+
+# 앞 문단이 이 키워드로 끝나면 다음 블록이 수식일 가능성이 높다 (도입 문장)
+LEAD_IN_KEYWORDS = (
+    "where",
+    "given by",
+    "defined as",
+    "as follows",
+    "expressed as",
+    "is",
+    "equation",
+    "equation:",
+    "식",
+    "다음과 같다",
+)
+# 뒤 문단이 이 키워드로 시작하면 앞 블록이 수식일 가능성이 높다 (변수 설명)
+FOLLOW_UP_KEYWORDS = ("where", "from", "in which", "here", "여기서")
+
+# 인라인 수식 분할 시 수식 시작점으로 보는 도입 키워드 / 문장 끝 부호
+_INTRO_KEYWORDS = ("where", "given by", "as follows", "defined as", "is:", "is ")
+_INTRO_PUNCTUATION = (". ", ": ", "; ", ".\n", ":\n", ";\n")
+
+# 도입 키워드 앞 "=" 허용 거리 (키워드가 없을 때 이보다 멀면 분할하지 않음)
+_MAX_BARE_EQUALS_OFFSET = 80
+
+Span = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class InlineSplit:
+    """문단 내 인라인 수식 하나의 분할 지점 (원문 기준 [start, end) 오프셋, 공백 제거 후)."""
+
+    prefix: Span  # 수식 앞 문단 조각 (비어 있으면 start == end)
+    equation: Span
+    number: str
+
+
+@dataclass(frozen=True)
+class EquationAnalysis:
+    """블록 하나의 판정 결과: 문맥 점수 기반 분류 + 인라인 수식 분할 지점."""
+
+    is_equation: bool
+    score: int = 0
+    equation_number: str = ""
+    splits: Tuple[InlineSplit, ...] = ()
+    suffix: Optional[Span] = None  # splits가 있을 때 마지막 수식 뒤 조각
+
+
+class BlockContext(NamedTuple):
+    """이웃 판정에 쓰이는 블록 텍스트 특징 (블록당 한 번만 계산해 앞/뒤 블록이 공유)."""
+
+    ends_with_lead_in: bool  # "where", "given by" 등으로 끝남
+    starts_with_follow_up: bool  # "where", "here" 등으로 시작
+    mentions_equation: bool  # "eq.", "equation", "수식" 언급
+
+
+_NOT_EQUATION = EquationAnalysis(is_equation=False)
+_EMPTY_CONTEXT = BlockContext(False, False, False)
+
+
+class EquationDetector:
+    """
+    수식 탐지 휴리스틱 엔진.
+
+    모든 정규식/키워드/기호 테이블은 생성 시 한 번만 준비한다. 블록 판정은 C 수준의
+    선형 패스(strip/lower/translate, 앵커된 정규식)로만 이루어지고, 인라인 분할은
+    커서를 앞으로만 옮기며 원문을 잘라 내지 않으므로 긴 문단에서도 선형이다.
+    """
+
+    # 점수 임계값: 이 값 이상이면 equation으로 재분류
+    threshold = 3
+
+    def __init__(self) -> None:
+        self._drop_symbols = str.maketrans("", "", MATH_SYMBOLS)
+        # 끝 괄호 번호: "(1)", "(1.2)" / 분류용은 "(13a)"처럼 문자 접미사 허용
+        self._strict_number = re.compile(r"\((?P<num>\d+(?:\.\d+)*)\)")
+        self._suffixed_number = re.compile(r"\((?P<num>\d+(?:\.\d+)*[a-zA-Z]?)\)")
+        # 인라인 수식 번호 (괄호 안 공백 허용)
+        self._inline_number = re.compile(r"\(\s*(?P<num>\d+(?:\.\d+)*[a-zA-Z]?)\s*\)")
+        # 도입 키워드/부호의 "마지막 끝 위치"를 뒤집은 문자열의 첫 매치로 찾는다
+        reversed_intro = sorted(
+            (kw[::-1] for kw in _INTRO_KEYWORDS + _INTRO_PUNCTUATION),
+            key=len,
+            reverse=True,
+        )
+        self._reversed_intro = re.compile(
+            "|".join(re.escape(kw) for kw in reversed_intro), re.IGNORECASE
+        )
+        self._reference = re.compile(r"\b(eq\.|eqs\.|equation|수식)\b")
+        self._email = re.compile(r"[\w\.-]+@[\w\.-]+")
+        self._phone = re.compile(r"\d{2,3}-\d{3,4}-\d{4}")
+        self._whitespace = re.compile(r"\s*")
+
+    # ── 단일 블록 API ──────────────────────────────────────────────────────
+    def context(self, text: Optional[str]) -> BlockContext:
+        """블록 텍스트의 이웃 특징. 배치/스트리밍에서 블록당 한 번만 계산한다."""
+        normalized = text.strip().lower() if text else ""
+        if not normalized:
+            return _EMPTY_CONTEXT
+        return BlockContext(
+            ends_with_lead_in=normalized.endswith(LEAD_IN_KEYWORDS),
+            starts_with_follow_up=normalized.startswith(FOLLOW_UP_KEYWORDS),
+            mentions_equation=("eq" in normalized or "수식" in normalized)
+            and self._reference.search(normalized) is not None,
+        )
+
+    def is_equation(self, text: str) -> bool:
+        """블록 단독 휴리스틱: 끝 괄호 번호, 또는 수식 기호 3개 이상/비율 10% 초과."""
+        if self._trailing_number(text.strip(), self._strict_number) is not None:
+            return True
+        symbol_count = self._count_symbols(text)
+        return len(text) > 3 and (symbol_count >= 3 or symbol_count / len(text) > 0.1)
+
+    def trailing_number(self, text: str) -> Optional[str]:
+        """텍스트가 "(1.2)" / "(13a)" 형태 수식 번호로 끝나면 번호를 반환한다."""
+        return self._trailing_number(text.strip(), self._suffixed_number)
+
+    def classify(
+        self,
+        text: str,
+        prev_context: BlockContext = _EMPTY_CONTEXT,
+        next_context: BlockContext = _EMPTY_CONTEXT,
+        own_context: Optional[BlockContext] = None,
+    ) -> EquationAnalysis:
+        """
+        주변 블록 문맥으로 수식 점수를 매긴다.
+        *_context는 context()로 계산한 특징이며, own_context를 넘기면 재계산하지 않는다.
+        """
+        text = text.strip() if text else ""
+        if not text:
+            return _NOT_EQUATION
+        if own_context is None:
+            own_context = self.context(text)
+
+        # S1: 짧은 텍스트
+        score = 1 if len(text) < 100 else 0
+
+        # S2: 괄호형 수식 번호로 끝남 (강한 시그널)
+        number = self._trailing_number(text, self._suffixed_number)
+        if number is not None:
+            score += 2
+
+        # S3/S4: 앞 문단 끝 / 뒤 문단 시작 키워드
+        if prev_context.ends_with_lead_in:
+            score += 2
+        if next_context.starts_with_follow_up:
+            score += 1
+
+        # S5: 주변 블록의 수식 지칭 단어
+        if prev_context.mentions_equation or next_context.mentions_equation:
+            score += 1
+
+        # S6: 수학 기호 ("=" 포함 또는 기호 2개 이상)
+        symbol_count = self._count_symbols(text)
+        has_equals = "=" in text
+        if has_equals or symbol_count >= 2:
+            score += 2
+
+        # S7 (Penalty): 도입 문장 자체, 긴 일반 문장, 이메일, 전화/팩스 번호
+        if own_context.ends_with_lead_in:
+            score -= 3
+        if len(text) > 200 and symbol_count < 3:
+            score -= 3
+        if "@" in text and self._email.search(text):
+            score -= 5
+        if not has_equals and "-" in text and self._phone.search(text):
+            score -= 5
+
+        return EquationAnalysis(
+            is_equation=score >= self.threshold,
+            score=score,
+            equation_number=number or "",
+        )
+
+    def split_points(self, text: str) -> Tuple[Tuple[InlineSplit, ...], Optional[Span]]:
+        """
+        문단 안에 끼어 있는 "… = … (n)" 형태 수식의 분할 지점을 찾는다.
+
+        반환: (분할 목록, 마지막 수식 뒤 조각 span). 분할이 없으면 ((), None).
+        수식 번호 앞 구간에 "="이 없으면 일반 참조로 보고 건너뛰며, 건너뛴 텍스트는
+        다음 조각(prefix 또는 suffix)에 그대로 남는다.
+        """
+        if not text or len(text) < 30 or "=" not in text:
+            return (), None
+
+        splits: List[InlineSplit] = []
+        cursor = 0  # 후보 구간 시작 (직전 번호 뒤, 공백 건너뜀)
+        segment_start = 0  # 아직 어떤 조각에도 속하지 않은 텍스트 시작
+        while True:
+            # 번호 앞에 최소 한 글자의 후보 구간이 있어야 한다
+            match = self._inline_number.search(text, cursor + 1)
+            if match is None:
+                break
+
+            equation = self._equation_span(
+                text, *_strip_span(text, cursor, match.start())
+            )
+            if equation is not None:
+                splits.append(
+                    InlineSplit(
+                        prefix=_strip_span(text, segment_start, equation[0]),
+                        equation=equation,
+                        number=match.group("num"),
+                    )
+                )
+                segment_start = match.end()
+
+            cursor = self._whitespace.match(text, match.end()).end()
+
+        if not splits:
+            return (), None
+        return tuple(splits), _strip_span(text, segment_start, len(text))
+
+    def analyze(
+        self,
+        text: Optional[str],
+        prev_context: BlockContext = _EMPTY_CONTEXT,
+        next_context: BlockContext = _EMPTY_CONTEXT,
+        own_context: Optional[BlockContext] = None,
+    ) -> EquationAnalysis:
+        """classify + split_points를 한 결과로 묶는다."""
+        if not text:
+            return _NOT_EQUATION
+        verdict = self.classify(text, prev_context, next_context, own_context)
+        splits, suffix = self.split_points(text)
+        if not splits:
+            return verdict
+        return EquationAnalysis(
+            is_equation=verdict.is_equation,
+            score=verdict.score,
+            equation_number=verdict.equation_number,
+            splits=splits,
+            suffix=suffix,
+        )
+
+    # ── 배치 API ──────────────────────────────────────────────────────────
+    def analyze_batch(
+        self,
+        texts: Sequence[Optional[str]],
+        eligible: Optional[Sequence[bool]] = None,
+    ) -> List[EquationAnalysis]:
+        """
+        연속된 블록 텍스트 목록을 한 번에 판정한다 (이웃 = 목록상 앞/뒤 블록).
+
+        eligible이 주어지면 False인 블록(예: paragraph가 아닌 블록)은 판정하지 않고
+        이웃 문맥으로만 쓰인다. 이웃 특징(BlockContext)은 블록당 한 번만 계산된다.
+        """
+        contexts = [self.context(text) for text in texts]
+        results: List[EquationAnalysis] = []
+        last = len(texts) - 1
+        for i, text in enumerate(texts):
+            if eligible is not None and not eligible[i]:
+                results.append(_NOT_EQUATION)
+                continue
+            results.append(
+                self.analyze(
+                    text,
+                    contexts[i - 1] if i > 0 else _EMPTY_CONTEXT,
+                    contexts[i + 1] if i < last else _EMPTY_CONTEXT,
+                    contexts[i],
+                )
+            )
+        return results
+
+    # ── 내부 ───────────────────────────────────────────────────────────────
+    def _count_symbols(self, text: str) -> int:
+        return len(text) - len(text.translate(self._drop_symbols))
+
+    @staticmethod
+    def _trailing_number(text: str, pattern: "re.Pattern[str]") -> Optional[str]:
+        # 번호 패턴에는 "("가 하나뿐이므로 매치는 마지막 "("에서만 시작할 수 있다
+        if not text.endswith(")"):
+            return None
+        match = pattern.fullmatch(text, text.rfind("("))
+        return match.group("num") if match else None
+
+    def _equation_span(self, text: str, start: int, end: int) -> Optional[Span]:
+        """번호 앞 후보 구간 [start, end)에서 수식 본문 span. 수식이 아니면 None."""
+        equals_at = text.find("=", start, end)
+        if equals_at == -1:
+            return None  # "=" 없는 번호는 일반 참조 (예: "see Ref. (3)")
+
+        # 가장 마지막 도입 키워드/문장 끝 부호 이후를 수식의 시작으로 본다
+        eq_start = self._intro_end(text, start, end)
+        if eq_start is None:
+            if equals_at - start > _MAX_BARE_EQUALS_OFFSET:
+                return None  # 도입부 없이 "="이 너무 멀면 긴 문장 오탐지
+            eq_start = start
+
+        eq_start, eq_end = _strip_span(text, eq_start, end)
+        if eq_end - eq_start < 3 or text.find("=", eq_start, eq_end) == -1:
+            return None
+        return eq_start, eq_end
+
+    def _intro_end(self, text: str, start: int, end: int) -> Optional[int]:
+        """[start, end) 안에서 도입 키워드/문장 끝 부호가 마지막으로 끝나는 위치."""
+        match = self._reversed_intro.search(text[start:end][::-1])
+        return end - match.start() if match else None
+
+
+def _strip_span(text: str, start: int, end: int) -> Span:
+    """text[start:end].strip()에 해당하는 오프셋."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
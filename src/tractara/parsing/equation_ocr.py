@@ -0,0 +1,225 @@
+"""수식 크롭 이미지 Gemini Vision OCR: 동시 실행 + 다중 이미지 배치 + 크롭 해시 캐시."""
+# src/tractara/parsing/equation_ocr.py
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pymupdf
+from PIL import Image
+
+from ..llm_gateway import get_gateway
+from .parse_cache import TIER_OCR, ParseCache, get_parse_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gemini-3-flash-preview"
+
+# 프롬프트 변경 시 올려 크롭 캐시를 무효화한다
+_PROMPT_VERSION = "1"
+
+_SINGLE_PROMPT = (
+    "This image contains a single mathematical equation. "
+    "Return ONLY the equation in LaTeX format, without equation numbers, "
+    "without $$ delimiters, without any explanation. "
+    "Example: F_{en} = \\exp(0.935 - T^* \\dot{\\varepsilon}^* O^*)"
+)
+
+_BATCH_PROMPT = (
+    "Each of the following {count} images contains a single mathematical equation. "
+    "Return ONLY a JSON array of {count} strings, one LaTeX equation per image in "
+    "the same order, without equation numbers, without $$ delimiters, without any "
+    'explanation. Example: ["F_{{en}} = \\\\exp(0.935 - T^*)", "a = b + c"]'
+)
+
+
+@dataclass
+class EquationCrop:
+    """렌더링된 수식 영역 (PNG 바이트 + 내용 해시)."""
+
+    png: bytes
+    digest: str
+
+
+def render_equation_crop(
+    page: "pymupdf.Page",  # type: ignore[name-defined]
+    bbox: Tuple[float, float, float, float],
+    padding: int = 10,
+    dpi: int = 300,
+) -> EquationCrop:
+    """BBox → 크롭 PNG (패딩 추가로 잘림 방지). PyMuPDF 호출이므로 호출 스레드에서 수행."""
+    x0, y0, x1, y1 = bbox
+    clip = pymupdf.Rect(x0 - padding, y0 - padding, x1 + padding, y1 + padding)
+    png = page.get_pixmap(dpi=dpi, clip=clip).tobytes("png")
+    return EquationCrop(png=png, digest=hashlib.sha256(png).hexdigest())
+
+
+class EquationOcrClient:
+    """
+    수식 크롭 OCR 클라이언트.
+
+    - GenerativeModel은 공용 LLM 게이트웨이에서 재사용하고, 요청은 게이트웨이의 모델별
+      토큰 버킷/서킷 브레이커를 거친다.
+    - ocr_many()는 크롭 해시로 중복을 제거하고 캐시(parse_cache의 ocr 계층)를 조회한 뒤,
+      남은 크롭을 batch_size장씩 묶어 max_concurrency 개까지 동시에 요청한다.
+    - 결과는 입력 순서대로 반환되며 실패한 항목은 None이다 (호출자가 fallback).
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model_name: str = DEFAULT_MODEL,
+        max_concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        cache: Optional[ParseCache] = None,
+    ):
+        self.api_key = (
+            api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        )
+        self.model_name = model_name
+        self.max_concurrency = max(
+            1, max_concurrency or int(os.getenv("EQUATION_OCR_CONCURRENCY", "4"))
+        )
+        self.batch_size = max(
+            1, batch_size or int(os.getenv("EQUATION_OCR_BATCH_SIZE", "1"))
+        )
+        self.cache = cache if cache is not None else get_parse_cache()
+        self._model: Any = None
+
+    @property
+    def available(self) -> bool:
+        """API 키가 있어 OCR을 시도할 수 있는지 여부."""
+        return bool(self.api_key)
+
+    def ocr_many(self, crops: Sequence[EquationCrop]) -> List[Optional[str]]:
+        """크롭 목록을 OCR해 입력 순서대로 LaTeX(또는 None)를 반환한다."""
+        if not crops or not self.available:
+            return [None] * len(crops)
+
+        results: Dict[str, Optional[str]] = {}
+        pending: List[EquationCrop] = []
+        seen = set()
+        for crop in crops:
+            if crop.digest in seen:
+                continue
+            seen.add(crop.digest)
+            cached = self._cache_get(crop.digest)
+            if cached is not None:
+                results[crop.digest] = cached
+            else:
+                pending.append(crop)
+
+        if pending:
+            batches = [
+                pending[i : i + self.batch_size]
+                for i in range(0, len(pending), self.batch_size)
+            ]
+            logger.info(
+                "Equation OCR: %d crops (%d unique, %d uncached) in %d requests",
+                len(crops),
+                len(seen),
+                len(pending),
+                len(batches),
+            )
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                for batch, latexes in zip(
+                    batches, executor.map(self._ocr_batch, batches)
+                ):
+                    for crop, latex in zip(batch, latexes):
+                        results[crop.digest] = latex
+                        if latex:
+                            self._cache_put(crop.digest, latex)
+
+        return [results.get(crop.digest) for crop in crops]
+
+    def ocr_one(self, crop: EquationCrop) -> Optional[str]:
+        """단일 크롭 OCR."""
+        return self.ocr_many([crop])[0]
+
+    # ── 내부 ───────────────────────────────────────────────────────────────
+    def _get_model(self) -> Any:
+        if self._model is not None:
+            return self._model
+        return get_gateway().model(self.model_name, self.api_key)
+
+    def _generate(self, contents: List[Any]) -> Any:
+        return get_gateway().call(
+            self.model_name,
+            lambda: self._get_model().generate_content(contents=contents),
+        )
+
+    def _ocr_batch(self, batch: List[EquationCrop]) -> List[Optional[str]]:
+        """한 요청으로 batch를 처리. 다중 이미지 응답이 어긋나면 단건 요청으로 재시도."""
+        if len(batch) > 1:
+            latexes = self._request_many(batch)
+            if latexes is not None:
+                return latexes
+            logger.warning(
+                "Batched equation OCR response mismatch. Retrying %d crops singly.",
+                len(batch),
+            )
+        return [self._request_one(crop) for crop in batch]
+
+    def _request_one(self, crop: EquationCrop) -> Optional[str]:
+        try:
+            response = self._generate(
+                [_SINGLE_PROMPT, Image.open(io.BytesIO(crop.png))]
+            )
+            return _clean_latex(response.text)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Vision OCR failed, falling back to PyMuPDF text: %s", exc)
+            return None
+
+    def _request_many(self, batch: List[EquationCrop]) -> Optional[List[Optional[str]]]:
+        try:
+            contents: List[Any] = [_BATCH_PROMPT.format(count=len(batch))]
+            contents.extend(Image.open(io.BytesIO(c.png)) for c in batch)
+            response = self._generate(contents)
+            parsed = _parse_json_array(response.text)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Batched vision OCR failed: %s", exc)
+            return None
+
+        if parsed is None or len(parsed) != len(batch):
+            return None
+        return [
+            _clean_latex(item) if isinstance(item, str) else None for item in parsed
+        ]
+
+    def _cache_key(self, digest: str) -> str:
+        return f"{digest}-{self.model_name}-{_PROMPT_VERSION}".replace("/", "_")
+
+    def _cache_get(self, digest: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        payload = self.cache.get(TIER_OCR, self._cache_key(digest))
+        return payload.get("latex") if isinstance(payload, dict) else None
+
+    def _cache_put(self, digest: str, latex: str) -> None:
+        if self.cache is not None:
+            self.cache.put(TIER_OCR, self._cache_key(digest), {"latex": latex})
+
+
+def _clean_latex(text: Optional[str]) -> Optional[str]:
+    """빈 응답이나 오류 메시지 필터."""
+    latex = (text or "").strip()
+    if not latex or len(latex) < 3:
+        return None
+    return latex
+
+
+def _parse_json_array(text: str) -> Optional[List[Any]]:
+    """응답 텍스트에서 JSON 배열을 추출한다 (```json 펜스 허용)."""
+    match = re.search(r"\[.*\]", text or "", re.DOTALL)
+    if not match:
+        return None
+    try:
+        parsed = json.loads(match.group(0))
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, list) else None
@@ -0,0 +1,229 @@
+"""BBox 기하 엔진: 페이지별 NumPy 박스 인덱스 + 벡터화 겹침/포함/IoU 질의."""
+# src/tractara/parsing/geometry.py
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple
+
+import numpy as np
+
+# 한 번에 브로드캐스트하는 질의 수 (청크가 작을수록 x 창이 좁아진다)
+_QUERY_CHUNK = 256
+
+Box = Tuple[float, float, float, float]
+
+
+def as_boxes(boxes: Iterable[Sequence[float]]) -> np.ndarray:
+    """(x0, y0, x1, y1) 시퀀스 → (n, 4) float64 배열."""
+    return np.asarray(list(boxes), dtype=np.float64).reshape(-1, 4)
+
+
+def normalize_to_top_left(boxes: np.ndarray, page_heights: np.ndarray) -> np.ndarray:
+    """
+    좌하단 원점(Docling/PDF 사용자 좌표) 박스를 좌상단 원점(PyMuPDF)으로 변환한다.
+
+    변환 결과가 음수가 되는 박스는 이미 좌상단 원점이라고 보고 원본을 유지한다
+    (Docling prov에 원점 정보가 보존되지 않는 경우 대비).
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    heights = np.broadcast_to(np.asarray(page_heights, dtype=np.float64), (len(boxes),))
+    flipped = np.column_stack(
+        (boxes[:, 0], heights - boxes[:, 3], boxes[:, 2], heights - boxes[:, 1])
+    )
+    keep_raw = (flipped[:, 1] < 0) | (flipped[:, 3] < 0)
+    flipped[keep_raw] = boxes[keep_raw]
+    return flipped
+
+
+def pad_boxes(boxes: np.ndarray, padding: float) -> np.ndarray:
+    """모든 변을 padding만큼 확장한다."""
+    return np.asarray(boxes, dtype=np.float64) + np.array(
+        [-padding, -padding, padding, padding]
+    )
+
+
+def overlap_matrix(
+    queries: np.ndarray, boxes: np.ndarray, inclusive: bool = True
+) -> np.ndarray:
+    """(m, n) 겹침 행렬. inclusive=True이면 변이 맞닿는 경우도 겹침으로 본다."""
+    q = queries[:, None, :]
+    b = boxes[None, :, :]
+    if inclusive:
+        return (
+            (q[..., 2] >= b[..., 0])
+            & (q[..., 0] <= b[..., 2])
+            & (q[..., 3] >= b[..., 1])
+            & (q[..., 1] <= b[..., 3])
+        )
+    return (
+        (q[..., 2] > b[..., 0])
+        & (q[..., 0] < b[..., 2])
+        & (q[..., 3] > b[..., 1])
+        & (q[..., 1] < b[..., 3])
+    )
+
+
+def containment_matrix(outer: np.ndarray, inner: np.ndarray) -> np.ndarray:
+    """(m, n) 행렬: outer[i]가 inner[j]를 완전히 포함하는지."""
+    o = outer[:, None, :]
+    i = inner[None, :, :]
+    return (
+        (o[..., 0] <= i[..., 0])
+        & (o[..., 1] <= i[..., 1])
+        & (o[..., 2] >= i[..., 2])
+        & (o[..., 3] >= i[..., 3])
+    )
+
+
+def iou_matrix(queries: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """(m, n) IoU 행렬."""
+    q = queries[:, None, :]
+    b = boxes[None, :, :]
+    iw = np.clip(
+        np.minimum(q[..., 2], b[..., 2]) - np.maximum(q[..., 0], b[..., 0]), 0, None
+    )
+    ih = np.clip(
+        np.minimum(q[..., 3], b[..., 3]) - np.maximum(q[..., 1], b[..., 1]), 0, None
+    )
+    inter = iw * ih
+    area_q = (queries[:, 2] - queries[:, 0]) * (queries[:, 3] - queries[:, 1])
+    area_b = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    union = area_q[:, None] + area_b[None, :] - inter
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(union > 0, inter / union, 0.0)
+
+
+class PageBoxIndex:
+    """
+    페이지별 박스 집합 (좌상단 원점, x0 오름차순 정렬).
+
+    sort-and-sweep: 질의를 x 기준으로 정렬해 _QUERY_CHUNK 단위로 나누고, 청크마다
+    x0 정렬 배열에 대한 searchsorted로 [하한, 상한) 후보 구간만 브로드캐스트 비교한다.
+    하한은 "박스 최대 폭"으로 box.x1 ≥ 기준값을 만족할 수 없는 박스를 잘라낸다.
+    """
+
+    def __init__(self) -> None:
+        self._boxes: Dict[int, np.ndarray] = {}
+        self._order: Dict[int, np.ndarray] = {}
+        self._max_width: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return sum(len(b) for b in self._boxes.values())
+
+    @classmethod
+    def from_page_boxes(cls, page_boxes: Dict[int, np.ndarray]) -> "PageBoxIndex":
+        """{page: (n, 4) 좌상단 원점 박스} 로부터 인덱스를 만든다."""
+        index = cls()
+        for page, boxes in page_boxes.items():
+            index.set_page(page, boxes)
+        return index
+
+    def set_page(self, page: int, boxes: np.ndarray) -> None:
+        """페이지 박스 집합을 설정한다 (원래 순서의 인덱스는 order로 보존)."""
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        order = np.argsort(boxes[:, 0], kind="stable")
+        self._boxes[page] = boxes[order]
+        self._order[page] = order
+        self._max_width[page] = (
+            float((boxes[:, 2] - boxes[:, 0]).max()) if len(boxes) else 0.0
+        )
+
+    def boxes(self, page: int) -> np.ndarray:
+        """페이지 박스 (입력 순서)."""
+        sorted_boxes = self._boxes.get(page)
+        if sorted_boxes is None:
+            return np.empty((0, 4))
+        restored = np.empty_like(sorted_boxes)
+        restored[self._order[page]] = sorted_boxes
+        return restored
+
+    def any_overlap(
+        self, page: int, queries: np.ndarray, inclusive: bool = True
+    ) -> np.ndarray:
+        """각 질의 박스가 페이지의 어떤 박스와라도 겹치는지 (m,) 불리언."""
+        # 겹치려면 box.x0 <= query.x1, box.x1 >= query.x0 (inclusive)
+        return self._sweep(
+            page,
+            queries,
+            hi_col=2,
+            lo_col=0,
+            side="right" if inclusive else "left",
+            reduce=lambda chunk, boxes: overlap_matrix(
+                chunk, boxes, inclusive=inclusive
+            ).any(axis=1),
+            fill=False,
+        )
+
+    def contained_by(self, page: int, queries: np.ndarray) -> np.ndarray:
+        """각 질의 박스가 페이지의 어떤 박스에 완전히 포함되는지 (m,) 불리언."""
+        # 포함하려면 box.x0 <= query.x0, box.x1 >= query.x1
+        return self._sweep(
+            page,
+            queries,
+            hi_col=0,
+            lo_col=2,
+            side="right",
+            reduce=lambda chunk, boxes: containment_matrix(boxes, chunk).any(axis=0),
+            fill=False,
+        )
+
+    def max_iou(self, page: int, queries: np.ndarray) -> np.ndarray:
+        """각 질의 박스의 페이지 내 최대 IoU (m,)."""
+        # 교집합 면적이 양수이려면 box.x0 < query.x1, box.x1 > query.x0
+        return self._sweep(
+            page,
+            queries,
+            hi_col=2,
+            lo_col=0,
+            side="left",
+            reduce=lambda chunk, boxes: iou_matrix(chunk, boxes).max(axis=1),
+            fill=0.0,
+        )
+
+    def _sweep(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        page: int,
+        queries: np.ndarray,
+        hi_col: int,
+        lo_col: int,
+        side: str,
+        reduce: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        fill: Any,
+    ) -> np.ndarray:
+        """
+        질의를 hi_col 기준으로 정렬해 청크로 나누고, 청크마다
+        min(lo_col) - 최대 폭 <= box.x0 <= max(hi_col) 구간의 박스에만
+        reduce를 적용한다 (결과는 입력 순서).
+        """
+        queries = np.asarray(queries, dtype=np.float64).reshape(-1, 4)
+        result = np.full(len(queries), fill)
+        boxes = self._boxes.get(page)
+        if boxes is None or len(boxes) == 0 or len(queries) == 0:
+            return result
+
+        x0_sorted = boxes[:, 0]
+        max_width = self._max_width[page]
+        query_order = np.argsort(queries[:, hi_col], kind="stable")
+        for start in range(0, len(queries), _QUERY_CHUNK):
+            idx = query_order[start : start + _QUERY_CHUNK]
+            chunk = queries[idx]
+            hi = int(np.searchsorted(x0_sorted, chunk[-1, hi_col], side=side))
+            lo = int(
+                np.searchsorted(
+                    x0_sorted, chunk[:, lo_col].min() - max_width, side="left"
+                )
+            )
+            if hi <= lo:
+                continue
+            result[idx] = reduce(chunk, boxes[lo:hi])
+        return result
+
+
+def first_below(tops: np.ndarray, query_tops: np.ndarray) -> np.ndarray:
+    """
+    각 질의 y에 대해, tops(문서 순서) 중 처음으로 질의보다 아래(y 큼)에 있는 위치.
+    없으면 len(tops). 읽기 순서를 유지한 채 블록을 끼워 넣을 위치를 구할 때 사용한다.
+    """
+    tops = np.asarray(tops, dtype=np.float64)
+    query_tops = np.asarray(query_tops, dtype=np.float64)
+    if len(tops) == 0:
+        return np.zeros(len(query_tops), dtype=np.int64)
+    below = query_tops[:, None] < tops[None, :]
+    return np.where(below.any(axis=1), below.argmax(axis=1), len(tops))
@@ -10,17 +10,25 @@ PDF 메타데이터 추출 파이프라인.
   3단계 — 병합: Track A(title/identifier) 우선, 나머지 Track B
 """
 
+import hashlib
+import json
 import logging
 import os
 import re
-from collections import Counter
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import pymupdf
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+from tractara.catalogs import catalog_loader
+from tractara.catalogs.catalog_plan import BoundCatalogPlan, MetadataRule
+
+from ..llm_gateway import ModelUnavailableError, get_gateway
+from .models import ParsedDocument, XmlSource
+from .parse_cache import TIER_METADATA, get_metadata_cache
+from .pdf_session import PdfSession, open_session
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +77,10 @@ _IDENTIFIER_RE = re.compile(r"^[A-Z][A-Z0-9]{1,}[-/][A-Z0-9][-A-Z0-9/.-]*$")
 # 예: "NUREG/CR-5704 ANL-98/31" → ["NUREG/CR-5704", "ANL-98/31"]
 _IDENTIFIER_INLINE_RE = re.compile(r"[A-Z][A-Z0-9]{1,}[-/][A-Z0-9][-A-Z0-9/.-]*")
 _VALID_SCHEMES = frozenset({"DOI", "URI", "ISBN", "ISSN", "DOCKET"})
+# 파싱 통계 없이 단독 실행할 때 본문 폰트 크기 추정에 디코딩하는 최대 페이지 수
+_FONT_SAMPLE_PAGES = 24
+# Track B 프롬프트/출력 스키마 변경 시 올려 메타데이터 캐시를 무효화한다
+_TRACK_B_PROMPT_VERSION = "1"
 
 
 # ── Pydantic 모델 (Track B LLM 출력 구조) ─────────────────────────────────────
@@ -188,58 +200,85 @@ class ExtractedMetadata:
     doc_status: str | None = None
 
 
+@dataclass
+class DocumentStats:
+    """
+    파싱 단계에서 이미 계산한 문서 통계. 주어진 항목은 메타데이터 추출에서 재계산하지 않는다.
+      - body_font_size:     본문 폰트 크기 (ParsedDocument.metadata["bodyFontSize"])
+      - frontmatter_blocks: 처음 4페이지 + 마지막 2페이지 블록
+    """
+
+    body_font_size: float | None = None
+    frontmatter_blocks: list[_FrontBlock] | None = None
+
+    @classmethod
+    def from_parsed(cls, parsed: ParsedDocument) -> "DocumentStats":
+        """파서가 ParsedDocument.metadata에 남긴 통계 (파싱 캐시 적중 시에도 유지)."""
+        body_font_size = (parsed.metadata or {}).get("bodyFontSize")
+        return cls(body_font_size=float(body_font_size) if body_font_size else None)
+
+
 # ── Phase 1: Front-Matter Isolation ──────────────────────────────────────────
 def _extract_frontmatter_blocks(
     pdf_path: Path,
+    session: PdfSession | None = None,
+    stats: DocumentStats | None = None,
 ) -> tuple[list[_FrontBlock], float]:
     """
     처음 4페이지 + 마지막 2페이지의 텍스트 블록을 수집한다.
-    body_font_size는 전체 페이지 span의 폰트 크기 최빈값으로 추정한다.
+
+    body_font_size는 stats에 있으면 그대로 쓰고, 없으면 span 폰트 크기 최빈값으로
+    추정한다. 세션에 전체 통계가 없으면 최대 _FONT_SAMPLE_PAGES 페이지 표본만 디코딩한다.
+    session이 주어지면 파서가 이미 디코딩한 페이지 dict와 span 통계를 재사용한다.
 
     Returns: (front_matter_blocks, body_font_size)
     """
-    doc = pymupdf.open(str(pdf_path))
-    total_pages = len(doc)
+    stats = stats or DocumentStats()
+    if stats.frontmatter_blocks is not None and stats.body_font_size is not None:
+        return stats.frontmatter_blocks, stats.body_font_size
 
-    front_indices = set(range(min(4, total_pages)))
-    back_indices = set(range(max(0, total_pages - 2), total_pages))
-    target_indices = front_indices | back_indices
+    with open_session(pdf_path, session) as pdf:
+        body_font_size = stats.body_font_size
+        if body_font_size is None:
+            body_font_size = pdf.sample_body_font_size(_FONT_SAMPLE_PAGES)
+        if stats.frontmatter_blocks is not None:
+            return stats.frontmatter_blocks, body_font_size
 
-    blocks: list[_FrontBlock] = []
-    font_sizes: list[float] = []
+        total_pages = pdf.page_count
 
-    for page_index, page in enumerate(doc):
-        page_dict = page.get_text("dict")
-        page_width = page.rect.width
-        page_height = page.rect.height
+        front_indices = set(range(min(4, total_pages)))
+        back_indices = set(range(max(0, total_pages - 2), total_pages))
+        target_indices = sorted(front_indices | back_indices)
 
-        for b in page_dict.get("blocks", []):
-            if b["type"] != 0:  # 0: text block
-                continue
+        blocks: list[_FrontBlock] = []
 
-            text_parts: list[str] = []
-            max_font_size = 0.0
-            is_bold = False
-
-            for line in b["lines"]:
-                for span in line["spans"]:
-                    raw = span["text"]
-                    if not raw.strip():
-                        continue
-                    text_parts.append(raw)
-                    size = round(span["size"], 1)
-                    # body_font_size 추정용: 전체 페이지에서 수집
-                    font_sizes.append(size)
-                    max_font_size = max(max_font_size, size)
-                    if span["flags"] & 16:  # bit 4 = bold
-                        is_bold = True
-
-            clean_text = re.sub(r" {2,}", " ", " ".join(text_parts)).strip()
-            if not clean_text:
-                continue
+        for page_index in target_indices:
+            page_dict = pdf.page_dict(page_index)
+            page_width, page_height = pdf.page_size(page_index)
+
+            for b in page_dict.get("blocks", []):
+                if b["type"] != 0:  # 0: text block
+                    continue
+
+                text_parts: list[str] = []
+                max_font_size = 0.0
+                is_bold = False
+
+                for line in b["lines"]:
+                    for span in line["spans"]:
+                        raw = span["text"]
+                        if not raw.strip():
+                            continue
+                        text_parts.append(raw)
+                        size = round(span["size"], 1)
+                        max_font_size = max(max_font_size, size)
+                        if span["flags"] & 16:  # bit 4 = bold
+                            is_bold = True
+
+                clean_text = re.sub(r" {2,}", " ", " ".join(text_parts)).strip()
+                if not clean_text:
+                    continue
 
-            # front-matter 대상 페이지에서만 블록 수집
-            if page_index in target_indices:
                 x0, y0, x1, y1 = b["bbox"]
                 blocks.append(
                     _FrontBlock(
@@ -256,9 +295,6 @@ def _extract_frontmatter_blocks(
                     )
                 )
 
-    doc.close()
-
-    body_font_size = Counter(font_sizes).most_common(1)[0][0] if font_sizes else 10.0
     return blocks, body_font_size
 
 
@@ -420,42 +456,64 @@ def _build_llm_prompt(frontmatter_text: str) -> str:
 {frontmatter_text[:3000]}"""
 
 
-def _run_track_b(blocks: list[_FrontBlock], api_key: str) -> LLMMetadata | None:
+def _track_b_cache_key(frontmatter_text: str, model_name: str) -> str:
+    """정규화된 front-matter 텍스트(공백 축약) + 프롬프트 버전 + 모델 이름 해시."""
+    identity = {
+        "text": " ".join(frontmatter_text.split()),
+        "prompt": _TRACK_B_PROMPT_VERSION,
+        "model": model_name,
+    }
+    encoded = json.dumps(identity, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _run_track_b(
+    blocks: list[_FrontBlock], api_key: str, use_cache: bool = True
+) -> LLMMetadata | None:
     """
-    Track B 진입점. Gemini + instructor로 의미론적 메타데이터를 추출한다.
+    Track B 진입점. Gemini + instructor로 의미론적 메타데이터를 추출한다 (공용 LLM 게이트웨이 경유).
+    검증된 결과는 메타데이터 캐시에 저장해, 같은 표지/서문이면 재호출하지 않는다
+    (use_cache=False이면 조회/저장 모두 생략).
     실패 시 None 반환 (Track A 결과만으로 graceful fallback).
     """
-    try:
-        import google.generativeai as genai
-        import instructor
-    except ImportError:
-        logger.warning("instructor 또는 google-generativeai 미설치. Track B 건너뜀.")
-        return None
-
     frontmatter_text = "\n".join(b.text for b in blocks)
     if len(frontmatter_text.strip()) < 20:
         logger.warning("Front-matter 텍스트 부족. Track B 건너뜀.")
         return None
 
     model_name = os.getenv("GEMINI_MODEL", "gemini-3-flash-preview")
-    genai.configure(api_key=api_key)
-    client = instructor.from_gemini(
-        client=genai.GenerativeModel(model_name=model_name),
-        mode=instructor.Mode.GEMINI_JSON,
-    )
+    cache = get_metadata_cache() if use_cache else None
+    cache_key = _track_b_cache_key(frontmatter_text, model_name)
+    if cache is not None:
+        payload = cache.get(TIER_METADATA, cache_key)
+        if payload is not None:
+            try:
+                result = LLMMetadata.model_validate(payload)
+                logger.info("Track B 캐시 적중: title=%r", result.dc_title)
+                return result
+            except ValidationError as e:
+                logger.warning("Incompatible Track B cache entry (%s). Ignoring.", e)
 
     try:
-        result: LLMMetadata = client.chat.completions.create(  # type: ignore[assignment]
+        result = get_gateway().structured(
+            [model_name],
             messages=[{"role": "user", "content": _build_llm_prompt(frontmatter_text)}],
             response_model=LLMMetadata,
+            api_key=api_key,
             max_retries=2,
         )
         logger.info("Track B 추출 성공: title=%r, type=%r", result.dc_title, result.dc_type)
-        return result
-    except (ValueError, KeyError, ConnectionError) as e:
+    except ImportError:
+        logger.warning("instructor 또는 google-generativeai 미설치. Track B 건너뜀.")
+        return None
+    except (ValueError, KeyError, ConnectionError, ModelUnavailableError) as e:
         logger.error("Track B LLM 호출 실패: %s", e)
         return None
 
+    if cache is not None:
+        cache.put(TIER_METADATA, cache_key, result.model_dump(mode="json"))
+    return result
+
 
 # ── Phase 3: 결과 병합 ────────────────────────────────────────────────────────
 def _merge_results(
@@ -613,237 +671,210 @@ def _merge_xml_metadata(
 
 
 def _apply_catalog_metadata(root: Any, catalog: dict[str, Any]) -> ExtractedMetadata:
-    """YAML 카탈로그에 정의된 metadata 매핑을 XML에 적용합니다."""
+    """
+    YAML 카탈로그에 정의된 metadata 매핑을 XML에 적용합니다.
+    카탈로그는 catalog_loader가 캐시한 실행 계획(사전 컴파일 XPath, 해석된 변환 함수,
+    필드별 규칙 묶음)으로 평가한다.
+    """
     meta = ExtractedMetadata()
-    meta_cfg = catalog.get("metadata", {})
-    if not meta_cfg:
+    plan = catalog_loader.get_catalog_plan(catalog)
+    if not plan.metadata_fields:
         return meta
 
-    from tractara.catalogs.transforms import TRANSFORM_REGISTRY
-
-    def _get_element(xpath_or_dc: str) -> Any:
-        if xpath_or_dc.startswith(".//") or "/" in xpath_or_dc:
-            return root.find(xpath_or_dc)
-        # Handle dc:element shortcut (e.g. title -> dc:title)
-        dc_uris = catalog.get(
-            "dc_namespaces",
-            [
-                "http://purl.org/dc/elements/1.1/",
-                "http://www.purl.org/dc/elements/1.1/",
-            ],
-        )
-        for uri in dc_uris:
-            el = root.find(f".//{{{uri}}}{xpath_or_dc}")
-            if el is not None:
-                return el
-        return None
-
-    def _get_elements(xpath_or_dc: str) -> list[Any]:
-        if xpath_or_dc.startswith(".//") or "/" in xpath_or_dc:
-            return root.findall(xpath_or_dc)
-        dc_uris = catalog.get(
-            "dc_namespaces",
-            [
-                "http://purl.org/dc/elements/1.1/",
-                "http://www.purl.org/dc/elements/1.1/",
-            ],
-        )
-        for uri in dc_uris:
-            els = root.findall(f".//{{{uri}}}{xpath_or_dc}")
-            if els:
-                return els
-        return []
-
-    # Process each DC field defined in catalog
-    for field_key, rules in meta_cfg.items():
+    bound = plan.bind(root)
+    for field_key, rules in plan.metadata_fields:
         if not hasattr(meta, field_key):
             continue
+        store = _FIELD_STORES.get(field_key, _store_scalar)
+        for rule in rules:
+            val = _evaluate_rule(bound, rule)
+            if val is not None:
+                store(meta, field_key, val, rule.options)
 
-        # Convert single rule to list for uniform processing
-        if isinstance(rules, dict):
-            rules_list = [rules]
-        elif isinstance(rules, list):
-            rules_list = rules
-        else:
-            continue
+    logger.info(
+        "Catalog mapping %s applied. title=%r", catalog.get("format_id"), meta.dc_title
+    )
+    return meta
 
-        for rule in rules_list:
-            # 1. Static value
-            if "static" in rule:
-                val = rule["static"]
-            else:
-                # 2. Extract values based on xpath or dc_element
-                xpath = rule.get("xpath") or rule.get("dc_element")
-                if not xpath:
-                    continue
 
-                elements = _get_elements(xpath)
-                if not elements:
-                    continue
+def _evaluate_rule(bound: BoundCatalogPlan, rule: MetadataRule) -> Any:
+    """규칙 하나의 원시 값 (정적 값 → 변환 함수 → 기본 텍스트 추출 순)."""
+    if rule.has_static:
+        return rule.static
 
-                # 3. Apply Transform if registered
-                transform_name = rule.get("transform")
-                val = None
-                if transform_name and transform_name in TRANSFORM_REGISTRY:
-                    transform_fn = TRANSFORM_REGISTRY[transform_name]
-                    if transform_name in ("jats_author_name", "join_text"):
-                        val = transform_fn(elements)  # specifically takes list
-                    else:
-                        val = transform_fn(elements[0])
-                else:
-                    # Default text extraction
-                    if "attribute" in rule:
-                        attr = rule["attribute"]
-                        texts = [e.get(attr) for e in elements if e.get(attr)]
-                    else:
-                        texts = [
-                            "".join(e.itertext()).strip()
-                            for e in elements
-                            if getattr(e, "text", None) or "".join(e.itertext()).strip()
-                        ]
-                    val = texts[0] if texts else None
-
-                    # Special handlers based on rules
-                    if "combine_with" in rule and val:
-                        other_el = _get_element(rule["combine_with"])
-                        other_val = (
-                            "".join(other_el.itertext()).strip()
-                            if other_el is not None
-                            else ""
-                        )
-                        sep = rule.get("separator", " ")
-                        if other_val:
-                            val = f"{val}{sep}{other_val}"
-
-                    if "split_by" in rule and val:
-                        val = [
-                            s.strip() for s in val.split(rule["split_by"]) if s.strip()
-                        ]
-
-                    if "truncate" in rule and val and isinstance(val, str):
-                        val = val[: rule["truncate"]].lower()
-
-                    if "template" in rule and val and isinstance(val, str):
-                        val = rule["template"].format(value=val)
-
-            # Formatting Output values into specific struct shapes
-            if val is None:
-                continue
+    elements = bound.elements(rule)
+    if not elements:
+        return None
 
-            # Get current value for cumulative updates
-            current_val = getattr(meta, field_key, None)
-
-            # dc_creator/publisher/contributor expects list of dicts
-            if field_key in ("dc_creator", "dc_publisher", "dc_contributor"):
-                if isinstance(val, list) and all(isinstance(i, dict) for i in val):
-                    new_items = val
-                else:
-                    # Default struct formatting per JSON Schema
-                    if field_key == "dc_creator":
-                        item = {
-                            "name": val,
-                            "entityType": rule.get("entity_type", "organization"),
-                        }
-                    elif field_key == "dc_publisher":
-                        item = {"name": val, "role": rule.get("role", "publisher")}
-                        org_type = rule.get("organization_type")
-                        if org_type and org_type in _VALID_ORG_TYPES:
-                            item["organizationType"] = org_type
-                    else:  # dc_contributor
-                        item = {
-                            "name": val,
-                            "entityType": rule.get("entity_type", "organization"),
-                        }
-                        item["role"] = rule.get("role", "contributor")
-                    new_items = [item]
-
-                if current_val:
-                    # Merge lists
-                    setattr(meta, field_key, current_val + new_items)
-                else:
-                    setattr(meta, field_key, new_items)
-
-            # dc_identifier expects list of dicts
-            elif field_key == "dc_identifier":
-                if isinstance(val, list) and all(isinstance(i, dict) for i in val):
-                    new_items = val
-                else:
-                    new_items = [{"scheme": rule.get("scheme", "URI"), "value": val}]
-
-                if current_val:
-                    setattr(meta, field_key, current_val + new_items)
-                else:
-                    setattr(meta, field_key, new_items)
-
-            # dc_date, dc_rights expects dict
-            elif field_key in ("dc_date", "dc_rights"):
-                target_field = rule.get("target_field")
-                if "dumb_down" in rule:
-                    # Dumb down mapping (like securityClassification -> accessRights)
-                    mapping = rule["dumb_down"]
-                    target_val = mapping.get(val, mapping.get("_default", {}))
-                    new_dict = target_val
-                elif target_field:
-                    new_dict = {target_field: val}
-                elif isinstance(val, dict):
-                    new_dict = val
-                else:
-                    # Best guess for date
-                    if field_key == "dc_date":
-                        new_dict = {"issued": val}
-                    else:
-                        new_dict = {}
-
-                if current_val and isinstance(current_val, dict):
-                    current_val.update(new_dict or {})
-                else:
-                    setattr(meta, field_key, new_dict)
-
-            # dc_coverage expects an object
-            elif field_key == "dc_coverage":
-                if isinstance(val, dict):
-                    new_dict = val
-                elif isinstance(val, str):
-                    target = rule.get("target_field", "spatialCoverage")
-                    new_dict = {target: val}
-                else:
-                    new_dict = {}
-
-                if current_val and isinstance(current_val, dict):
-                    current_val.update(new_dict)
-                else:
-                    setattr(meta, field_key, new_dict)
-
-            # String or List values (title, type, subject, language, description)
-            else:
-                if (
-                    field_key == "dc_type"
-                    and rule.get("validate_enum")
-                    and val not in _VALID_DOC_TYPES
-                ):
-                    continue
+    # Apply Transform if registered
+    if rule.transform is not None:
+        if rule.transform_takes_list:
+            return rule.transform(elements)  # specifically takes list
+        return rule.transform(elements[0])
+
+    # Default text extraction
+    options = rule.options
+    if "attribute" in options:
+        attr = options["attribute"]
+        texts = [e.get(attr) for e in elements if e.get(attr)]
+    else:
+        texts = [
+            "".join(e.itertext()).strip()
+            for e in elements
+            if getattr(e, "text", None) or "".join(e.itertext()).strip()
+        ]
+    val: Any = texts[0] if texts else None
+
+    # Special handlers based on rules
+    if rule.combine_with is not None and val:
+        other_el = bound.first(rule.combine_with)
+        other_val = "".join(other_el.itertext()).strip() if other_el is not None else ""
+        sep = options.get("separator", " ")
+        if other_val:
+            val = f"{val}{sep}{other_val}"
+
+    if "split_by" in options and val:
+        val = [s.strip() for s in val.split(options["split_by"]) if s.strip()]
+
+    if "truncate" in options and val and isinstance(val, str):
+        val = val[: options["truncate"]].lower()
+
+    if "template" in options and val and isinstance(val, str):
+        val = options["template"].format(value=val)
+
+    return val
+
+
+# ── 필드별 출력 형식 (카탈로그 규칙 값 → ExtractedMetadata 구조) ─────────────────
+def _store_agents(
+    meta: ExtractedMetadata, field_key: str, val: Any, rule: dict[str, Any]
+) -> None:
+    """dc_creator/publisher/contributor: list of dicts (누적)."""
+    if isinstance(val, list) and all(isinstance(i, dict) for i in val):
+        new_items = val
+    else:
+        # Default struct formatting per JSON Schema
+        if field_key == "dc_creator":
+            item = {
+                "name": val,
+                "entityType": rule.get("entity_type", "organization"),
+            }
+        elif field_key == "dc_publisher":
+            item = {"name": val, "role": rule.get("role", "publisher")}
+            org_type = rule.get("organization_type")
+            if org_type and org_type in _VALID_ORG_TYPES:
+                item["organizationType"] = org_type
+        else:  # dc_contributor
+            item = {
+                "name": val,
+                "entityType": rule.get("entity_type", "organization"),
+            }
+            item["role"] = rule.get("role", "contributor")
+        new_items = [item]
+
+    current_val = getattr(meta, field_key, None)
+    setattr(meta, field_key, current_val + new_items if current_val else new_items)
+
+
+def _store_identifier(
+    meta: ExtractedMetadata, field_key: str, val: Any, rule: dict[str, Any]
+) -> None:
+    """dc_identifier: list of dicts (누적)."""
+    if isinstance(val, list) and all(isinstance(i, dict) for i in val):
+        new_items = val
+    else:
+        new_items = [{"scheme": rule.get("scheme", "URI"), "value": val}]
+
+    current_val = getattr(meta, field_key, None)
+    setattr(meta, field_key, current_val + new_items if current_val else new_items)
+
+
+def _store_date_or_rights(
+    meta: ExtractedMetadata, field_key: str, val: Any, rule: dict[str, Any]
+) -> None:
+    """dc_date/dc_rights: dict (기존 dict에 병합)."""
+    target_field = rule.get("target_field")
+    if "dumb_down" in rule:
+        # Dumb down mapping (like securityClassification -> accessRights)
+        mapping = rule["dumb_down"]
+        new_dict = mapping.get(val, mapping.get("_default", {}))
+    elif target_field:
+        new_dict = {target_field: val}
+    elif isinstance(val, dict):
+        new_dict = val
+    elif field_key == "dc_date":
+        # Best guess for date
+        new_dict = {"issued": val}
+    else:
+        new_dict = {}
+
+    current_val = getattr(meta, field_key, None)
+    if current_val and isinstance(current_val, dict):
+        current_val.update(new_dict or {})
+    else:
+        setattr(meta, field_key, new_dict)
+
+
+def _store_coverage(
+    meta: ExtractedMetadata, field_key: str, val: Any, rule: dict[str, Any]
+) -> None:
+    """dc_coverage: object (기존 dict에 병합)."""
+    if isinstance(val, dict):
+        new_dict = val
+    elif isinstance(val, str):
+        new_dict = {rule.get("target_field", "spatialCoverage"): val}
+    else:
+        new_dict = {}
+
+    current_val = getattr(meta, field_key, None)
+    if current_val and isinstance(current_val, dict):
+        current_val.update(new_dict)
+    else:
+        setattr(meta, field_key, new_dict)
+
+
+def _store_scalar(
+    meta: ExtractedMetadata, field_key: str, val: Any, rule: dict[str, Any]
+) -> None:
+    """String or List values (title, type, subject, language, description)."""
+    if (
+        field_key == "dc_type"
+        and rule.get("validate_enum")
+        and val not in _VALID_DOC_TYPES
+    ):
+        return
 
-                if (
-                    isinstance(val, str)
-                    and isinstance(current_val, str)
-                    and field_key == "dc_description"
-                ):
-                    sep = rule.get("join_separator", "; ")
-                    setattr(meta, field_key, f"{current_val}{sep}{val}")
-                else:
-                    setattr(meta, field_key, val)
+    current_val = getattr(meta, field_key, None)
+    if (
+        isinstance(val, str)
+        and isinstance(current_val, str)
+        and field_key == "dc_description"
+    ):
+        sep = rule.get("join_separator", "; ")
+        setattr(meta, field_key, f"{current_val}{sep}{val}")
+    else:
+        setattr(meta, field_key, val)
 
-    logger.info(
-        "Catalog mapping %s applied. title=%r", catalog.get("format_id"), meta.dc_title
-    )
-    return meta
 
+_FIELD_STORES = {
+    "dc_creator": _store_agents,
+    "dc_publisher": _store_agents,
+    "dc_contributor": _store_agents,
+    "dc_identifier": _store_identifier,
+    "dc_date": _store_date_or_rights,
+    "dc_rights": _store_date_or_rights,
+    "dc_coverage": _store_coverage,
+}
 
-def _extract_xml_metadata(xml_path: Path) -> ExtractedMetadata:
+
+def _extract_xml_metadata(
+    xml_path: Path, source: XmlSource | None = None
+) -> ExtractedMetadata:
     """XML 파일에서 메타데이터를 추출하여 ExtractedMetadata 구조체로 매핑합니다.
 
     1단계: _base.yaml 카탈로그를 이용해 공통 요소 추출
     2단계: 루트 태그에 맞는 개별 포맷 카탈로그(JATS/S1000D) 로 빈 필드 보충
+    source(parse_xml의 트리 + 감지된 카탈로그)가 있으면 파일을 다시 파싱하지 않는다.
     """
     try:
         from lxml import etree
@@ -852,18 +883,19 @@ def _extract_xml_metadata(xml_path: Path) -> ExtractedMetadata:
         return ExtractedMetadata()
 
     try:
-        tree = etree.parse(str(xml_path))  # pylint: disable=c-extension-no-member
-        root = tree.getroot()
-
-        from tractara.catalogs import catalog_loader
+        if source is not None:
+            root = source.root
+            specific_cat = source.catalog
+        else:
+            tree = etree.parse(str(xml_path))  # pylint: disable=c-extension-no-member
+            root = tree.getroot()
+            specific_cat = catalog_loader.detect_catalog(root.tag.lower())
 
         # 1단계: base 카탈로그 추출 (DC 네임스페이스)
         base_cat = catalog_loader.get_base_catalog()
         meta = _apply_catalog_metadata(root, base_cat)
 
-        # 2단계: 스키마별 카탈로그 감지 및 적용
-        tag = root.tag.lower()
-        specific_cat = catalog_loader.detect_catalog(tag)
+        # 2단계: 스키마별 카탈로그 적용
         if specific_cat:
             schema_meta = _apply_catalog_metadata(root, specific_cat)
             meta = _merge_xml_metadata(meta, schema_meta)
@@ -877,6 +909,10 @@ def _extract_xml_metadata(xml_path: Path) -> ExtractedMetadata:
 def extract_metadata(
     pdf_path: Path,
     api_key: str | None = None,
+    session: PdfSession | None = None,
+    stats: DocumentStats | None = None,
+    bypass_llm_cache: bool = False,
+    xml_source: XmlSource | None = None,
 ) -> ExtractedMetadata:
     """
     PDF 또는 XML 파일에서 메타데이터를 추출 (Track A + Track B 결합).
@@ -884,13 +920,18 @@ def extract_metadata(
     1단계: Front-Matter Isolation (처음 4페이지 + 마지막 2페이지) (PDF만 해당)
     2단계: Track A (결정론적) + Track B (LLM) 병렬 실행 (PDF만 해당)
     3단계: 결과 병합 (Track A title/identifier 우선)
+
+    session: 파싱 단계에서 연 PdfSession (PDF만 해당, 없으면 새로 연다)
+    stats: 파싱 단계의 문서 통계 (PDF만 해당, 없으면 표본 페이지로 추정)
+    bypass_llm_cache: True이면 Track B 캐시를 조회/저장하지 않고 항상 LLM을 호출한다
+    xml_source: parse_xml이 만든 트리/카탈로그 (XML만 해당, 없으면 파일을 다시 파싱)
     """
     if pdf_path.suffix.lower() == ".xml":
-        return _extract_xml_metadata(pdf_path)
+        return _extract_xml_metadata(pdf_path, xml_source)
 
     resolved_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
 
-    blocks, body_font_size = _extract_frontmatter_blocks(pdf_path)
+    blocks, body_font_size = _extract_frontmatter_blocks(pdf_path, session, stats)
     logger.info(
         "Front-matter blocks: %d, body_font_size: %spt", len(blocks), body_font_size
     )
@@ -903,7 +944,7 @@ def extract_metadata(
             tuple[str | None, list[dict[str, str]] | None]
         ] = executor.submit(_run_track_a, blocks, body_font_size)
         future_b: Future[LLMMetadata | None] | None = (
-            executor.submit(_run_track_b, blocks, resolved_key)
+            executor.submit(_run_track_b, blocks, resolved_key, not bypass_llm_cache)
             if resolved_key
             else None
         )
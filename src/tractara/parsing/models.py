@@ -1,10 +1,83 @@
 """공용 파싱 데이터 구조 모델."""
 # src/tractara/parsing/models.py
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import copy
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
 
-@dataclass
+class ContextPath(Sequence[str]):
+    """
+    불변 조상 제목 체인 (부모 포인터 연결).
+
+    같은 섹션 아래의 블록들은 노드 하나를 공유하고, 하위 섹션은 child()로 노드 하나만
+    덧붙인다 (블록마다 제목 리스트를 복사하지 않음). 리스트는 직렬화/인덱싱 시에만 만든다.
+    """
+
+    __slots__ = ("parent", "title", "_depth")
+
+    def __init__(
+        self, parent: Optional["ContextPath"] = None, title: Optional[str] = None
+    ):
+        self.parent = parent
+        self.title = title
+        self._depth = 0 if parent is None else parent._depth + 1
+
+    @classmethod
+    def of(cls, titles: Iterable[str]) -> "ContextPath":
+        """제목 시퀀스로부터 체인을 만든다 (빈 시퀀스 → EMPTY_CONTEXT_PATH)."""
+        if isinstance(titles, ContextPath):
+            return titles
+        node = EMPTY_CONTEXT_PATH
+        for title in titles:
+            node = node.child(title)
+        return node
+
+    def child(self, title: str) -> "ContextPath":
+        """title을 덧붙인 하위 경로."""
+        return ContextPath(self, title)
+
+    def to_list(self) -> List[str]:
+        """제목 리스트로 구체화한다 (루트 → 말단 순서)."""
+        titles: List[str] = [""] * self._depth
+        node = self
+        for i in range(self._depth - 1, -1, -1):
+            titles[i] = node.title
+            node = node.parent
+        return titles
+
+    def __len__(self) -> int:
+        return self._depth
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_list())
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore[override]
+        # 슬라이스는 리스트로 돌려준다 (기존 List[str] 필드와 같은 비교 의미)
+        if index == -1 and self._depth:
+            return self.title
+        return self.to_list()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, ContextPath):
+            return self._depth == other._depth and self.to_list() == other.to_list()
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.to_list()))
+
+    def __repr__(self) -> str:
+        return f"ContextPath({self.to_list()!r})"
+
+
+EMPTY_CONTEXT_PATH = ContextPath()
+
+
+@dataclass(slots=True)
 class BoundingBox:
     """PDF 좌표 정보"""
 
@@ -25,9 +98,12 @@ class BoundingBox:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedBlock:
-    """단일 파싱 블록."""
+    """
+    단일 파싱 블록 (__slots__, block_type 인턴, context_path는 공유 ContextPath).
+    context_path에 리스트를 넘기면 ContextPath로 변환한다.
+    """
 
     page: int
     block_type: str
@@ -38,7 +114,7 @@ class ParsedBlock:
     confidence: float = 1.0
     # 계층 구조 필드
     level: int = 999  # 0: Title, 1: Section, 2+: Subsection, 999: Paragraph
-    context_path: List[str] = field(default_factory=list)
+    context_path: ContextPath = EMPTY_CONTEXT_PATH
     parent_id: Optional[str] = None
     block_id: Optional[str] = None
     # 섹션 메타데이터
@@ -51,6 +127,36 @@ class ParsedBlock:
     source_element_name: Optional[str] = None
     xml_fragment: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # 수십만 블록이 같은 몇 가지 타입 문자열을 공유하도록 인턴한다
+        self.block_type = sys.intern(self.block_type)
+        if not isinstance(self.context_path, ContextPath):
+            self.context_path = ContextPath.of(self.context_path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 Dictionary (None 필드 생략, context_path는 리스트로 구체화)."""
+        data: Dict[str, Any] = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is None:
+                continue
+            if f.name == "bbox":
+                value = value.to_dict()
+            elif f.name == "context_path":
+                value = value.to_list()
+            elif isinstance(value, (dict, list)):
+                value = copy.deepcopy(value)
+            data[f.name] = value
+        return data
+
+
+@dataclass
+class XmlSource:
+    """XML 입력의 파싱된 루트 요소와 감지된 포맷 카탈로그 (파싱 ↔ 메타데이터 추출 공유)."""
+
+    root: Any
+    catalog: Optional[Dict[str, Any]] = None
+
 
 @dataclass
 class ParsedDocument:
@@ -63,3 +169,32 @@ class ParsedDocument:
     relations: List[Dict[str, Any]] = field(default_factory=list)
     # Fragment Store 저장을 위한 원본 XML 조각들 (block_id -> xml_string)
     xml_fragments: Dict[str, str] = field(default_factory=dict)
+    # XML 파싱 시 만든 lxml 트리/카탈로그 (메타데이터 추출 재사용용, 직렬화·캐시 제외)
+    xml_source: Optional[XmlSource] = field(default=None, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 Dictionary (블록의 None 필드는 생략해 크기를 줄인다)."""
+        return {
+            "source_path": self.source_path,
+            "blocks": [block.to_dict() for block in self.blocks],
+            "metadata": copy.deepcopy(self.metadata),
+            "relations": copy.deepcopy(self.relations),
+            "xml_fragments": dict(self.xml_fragments),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ParsedDocument":
+        """to_dict() 결과로부터 ParsedDocument를 복원합니다."""
+        blocks = []
+        for raw in data.get("blocks", []):
+            block = dict(raw)
+            if block.get("bbox") is not None:
+                block["bbox"] = BoundingBox(**block["bbox"])
+            blocks.append(ParsedBlock(**block))
+        return cls(
+            source_path=data["source_path"],
+            blocks=blocks,
+            metadata=data.get("metadata"),
+            relations=data.get("relations", []),
+            xml_fragments=data.get("xml_fragments", {}),
+        )
@@ -0,0 +1,115 @@
+"""페이지 단위 스캔/디지털 판별: 폰트 유무, 이미지 커버리지, 텍스트 길이 + 대형 문서 샘플링."""
+# src/tractara/parsing/page_triage.py
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pymupdf
+
+from .pdf_session import PdfSession
+
+logger = logging.getLogger(__name__)
+
+# 판별 규칙 변경 시 올려 parse_pdf 캐시를 무효화한다
+TRIAGE_VERSION = "1"
+
+KIND_DIGITAL = "digital"  # 텍스트 레이어가 있는 페이지 → Docling/PyMuPDF
+KIND_SCANNED = "scanned"  # 이미지뿐인 페이지 → Vision
+
+# 이 비율 이상을 이미지가 덮으면 스캔 후보
+_IMAGE_COVERAGE_THRESHOLD = 0.5
+# 스캔 후보 중 텍스트가 이보다 적으면 스캔 (OCR 텍스트 레이어가 있는 스캔본은 디지털)
+_MIN_TEXT_CHARS = 50
+# 이보다 긴 문서는 stride 간격으로 샘플링하고, 판정이 바뀌는 구간만 전수 조사
+_FULL_SCAN_PAGES = 200
+_SAMPLE_STRIDE = 4
+
+
+@dataclass
+class PageTriage:
+    """페이지 하나의 판별 결과."""
+
+    page_index: int
+    kind: str
+    has_fonts: bool = False
+    image_coverage: float = 0.0
+    text_chars: Optional[int] = None  # 스캔 후보일 때만 측정
+    inferred: bool = False  # 샘플링 구간에서 이웃 판정을 물려받음
+
+
+def probe_page(pdf: PdfSession, page_index: int) -> PageTriage:
+    """
+    단일 페이지 판별. 폰트/이미지 리소스 목록과 이미지 배치만 보고(텍스트 디코딩 없음),
+    이미지가 페이지 대부분을 덮는 후보 페이지에서만 텍스트 길이를 잰다.
+    """
+    page = pdf.page(page_index)
+    has_fonts = bool(page.get_fonts())
+    # 이미지 리소스가 없으면 콘텐츠 스트림을 훑는 배치 조회도 생략한다
+    coverage = _image_coverage(page) if page.get_images() else 0.0
+
+    if coverage < _IMAGE_COVERAGE_THRESHOLD:
+        # 이미지가 적은 페이지: 텍스트가 있든 없든(빈 페이지) Vision 대상이 아니다
+        return PageTriage(page_index, KIND_DIGITAL, has_fonts, coverage)
+    if not has_fonts:
+        return PageTriage(page_index, KIND_SCANNED, has_fonts, coverage, text_chars=0)
+
+    text_chars = len(page.get_text("text").strip())
+    kind = KIND_SCANNED if text_chars < _MIN_TEXT_CHARS else KIND_DIGITAL
+    return PageTriage(page_index, kind, has_fonts, coverage, text_chars)
+
+
+def triage_pages(
+    pdf: PdfSession,
+    full_scan_pages: int = _FULL_SCAN_PAGES,
+    sample_stride: int = _SAMPLE_STRIDE,
+) -> List[PageTriage]:
+    """
+    전체 페이지 판별 결과 (페이지 순서).
+
+    full_scan_pages 이하 문서는 모든 페이지를 조사한다. 더 긴 문서는 sample_stride 간격
+    (+ 마지막 페이지)만 조사한 뒤, 인접 샘플의 판정이 같으면 사이 페이지가 이를 물려받고
+    다르면 그 구간을 전수 조사한다 (스캔 부록처럼 연속 구간으로 섞인 문서를 가정).
+    같은 판정의 두 샘플 사이에 끼인 stride 미만의 짧은 구간은 놓칠 수 있다.
+    """
+    page_count = pdf.page_count
+    if page_count <= full_scan_pages or sample_stride <= 1:
+        return [probe_page(pdf, i) for i in range(page_count)]
+
+    samples = sorted(set(range(0, page_count, sample_stride)) | {page_count - 1})
+    probed: Dict[int, PageTriage] = {i: probe_page(pdf, i) for i in samples}
+    for left, right in zip(samples, samples[1:]):
+        if probed[left].kind != probed[right].kind:
+            for i in range(left + 1, right):
+                probed[i] = probe_page(pdf, i)
+
+    results: List[PageTriage] = []
+    last_sample = probed[0]
+    for i in range(page_count):
+        triage = probed.get(i)
+        if triage is None:
+            triage = PageTriage(i, last_sample.kind, inferred=True)
+        else:
+            last_sample = triage
+        results.append(triage)
+
+    logger.info(
+        "Page triage: %d pages (%d probed), %d scanned",
+        page_count,
+        len(probed),
+        sum(1 for t in results if t.kind == KIND_SCANNED),
+    )
+    return results
+
+
+def _image_coverage(page) -> float:
+    """페이지 면적 대비 이미지 배치 영역 비율 (겹침은 무시, 1.0 상한)."""
+    clip = page.rect
+    page_area = clip.width * clip.height
+    if page_area <= 0:
+        return 0.0
+    covered = 0.0
+    for info in page.get_image_info():
+        bbox = info.get("bbox")
+        if bbox:
+            covered += abs(pymupdf.Rect(clip) & bbox)
+    return min(1.0, covered / page_area)
@@ -0,0 +1,323 @@
+"""콘텐츠 주소 기반 파싱 캐시: 원시 Docling 출력 + ParsedDocument 2계층 디스크 캐시."""
+# src/tractara/parsing/parse_cache.py
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import ParsedDocument
+
+logger = logging.getLogger(__name__)
+
+# BASE_DIR = src/ (landing_repository와 동일한 기준)
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CACHE_DIR = BASE_DIR / "data" / "cache" / "parse"
+DEFAULT_METADATA_CACHE_DIR = BASE_DIR / "data" / "cache" / "metadata"
+DEFAULT_TERM_CACHE_DIR = BASE_DIR / "data" / "cache" / "terms"
+
+# 캐시 계층
+TIER_RAW = "raw"  # 모델 추론 결과 (예: DoclingDocument.export_to_dict())
+TIER_PARSED = "parsed"  # 매핑까지 끝난 최종 ParsedDocument
+TIER_OCR = "ocr"  # 수식 크롭 이미지 해시 → Vision OCR LaTeX
+TIER_METADATA = "metadata"  # Front-matter 텍스트 해시 → Track B LLM 메타데이터
+TIER_TERMS = "terms"  # 청크 텍스트 해시 → TERM 추출 LLM 응답
+_TIERS = (TIER_RAW, TIER_PARSED, TIER_OCR, TIER_METADATA, TIER_TERMS)
+
+_SUFFIX = ".json.gz"
+_HASH_CHUNK = 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path_str: str, mtime_ns: int, size: int) -> str:
+    """파일 바이트 SHA-256 (경로+mtime+크기로 메모이제이션)."""
+    del mtime_ns, size  # 메모이제이션 키로만 사용
+    digest = hashlib.sha256()
+    with open(path_str, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """파일 내용의 SHA-256 hex digest."""
+    stat = os.stat(path)
+    return _file_digest(str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+class ParseCache:
+    """
+    파일 바이트 SHA-256 + 파서 이름/버전/옵션으로 키를 만드는 디스크 캐시.
+
+    - raw:    모델 추론 결과 (Docling 레이아웃 분석). 매핑 코드가 바뀌어도 재사용된다.
+    - parsed: 최종 ParsedDocument (gzip JSON, None 필드 생략).
+    - ocr:    수식 크롭 이미지 해시별 Vision OCR 결과 (equation_ocr).
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제 (LRU).
+      조회 시 파일 mtime을 갱신해 사용 시각으로 삼는다.
+    - ttl_seconds가 주어지면 저장 후 그 시간이 지난 항목은 미스로 보고 삭제한다.
+      이때 조회가 mtime을 갱신하지 않으므로 (mtime = 저장 시각) 크기 초과 시
+      가장 오래 전에 저장된 항목부터 삭제된다.
+    - 쓰기는 임시 파일 + os.replace로 원자적이므로 여러 프로세스가 공유해도 안전하다.
+    """
+
+    def __init__(
+        self,
+        root: Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = 2 << 30,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.hits: Dict[str, int] = {tier: 0 for tier in _TIERS}
+        self.misses: Dict[str, int] = {tier: 0 for tier in _TIERS}
+
+    # ── 키 ─────────────────────────────────────────────────────────────────
+    @staticmethod
+    def make_key(
+        file_path: Path,
+        parser: str,
+        version: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """파일 내용 + 파서 식별 정보로 캐시 키를 만든다."""
+        identity = {
+            "file": file_digest(file_path),
+            "parser": parser,
+            "version": version,
+            "options": options or {},
+        }
+        encoded = json.dumps(identity, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    # ── 조회/저장 ──────────────────────────────────────────────────────────
+    def get(self, tier: str, key: str) -> Optional[Any]:
+        """캐시된 JSON 페이로드를 반환한다 (없거나 손상되면 None)."""
+        path = self._path(tier, key)
+        try:
+            if self.ttl_seconds is not None and (
+                time.time() - path.stat().st_mtime > self.ttl_seconds
+            ):
+                self._unlink(path)
+                raise FileNotFoundError(path)
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            self._count(self.misses, tier)
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning("Corrupted parse cache entry %s (%s). Dropping.", path, e)
+            self._unlink(path)
+            self._count(self.misses, tier)
+            return None
+
+        if self.ttl_seconds is None:
+            try:
+                os.utime(path)  # LRU: 사용 시각 갱신
+            except OSError:
+                pass
+        self._count(self.hits, tier)
+        return payload
+
+    def put(self, tier: str, key: str, payload: Any) -> None:
+        """JSON 직렬화 가능한 페이로드를 저장한다. 실패해도 예외를 던지지 않는다."""
+        path = self._path(tier, key)
+        tmp_name: Optional[str] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as raw_f, gzip.GzipFile(
+                fileobj=raw_f, mode="wb", compresslevel=6
+            ) as gz:
+                gz.write(
+                    json.dumps(
+                        payload, ensure_ascii=False, separators=(",", ":")
+                    ).encode("utf-8")
+                )
+            size = os.path.getsize(tmp_name)
+            os.replace(tmp_name, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to write parse cache entry %s: %s", path, e)
+            # 임시 파일은 크기 집계(*.json.gz)에 잡히지 않으므로 여기서 지운다
+            if tmp_name is not None:
+                self._unlink(Path(tmp_name))
+            return
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += size
+        self._evict_if_needed()
+
+    def get_document(self, key: str) -> Optional[ParsedDocument]:
+        """parsed 계층에서 ParsedDocument를 복원한다."""
+        payload = self.get(TIER_PARSED, key)
+        if payload is None:
+            return None
+        try:
+            return ParsedDocument.from_dict(payload)
+        except (KeyError, TypeError) as e:
+            logger.warning("Incompatible parse cache entry %s (%s).", key, e)
+            self._unlink(self._path(TIER_PARSED, key))
+            return None
+
+    def put_document(self, key: str, parsed: ParsedDocument) -> None:
+        """ParsedDocument를 parsed 계층에 저장한다."""
+        self.put(TIER_PARSED, key, parsed.to_dict())
+
+    # ── 통계/관리 ──────────────────────────────────────────────────────────
+    def stats(self) -> Dict[str, Any]:
+        """계층별 hit/miss 카운터와 적중률."""
+        return {tier: self.tier_stats(tier) for tier in _TIERS}
+
+    def tier_stats(self, tier: str) -> Dict[str, Any]:
+        """단일 계층의 hit/miss 카운터와 적중률."""
+        with self._lock:
+            hits, misses = self.hits[tier], self.misses[tier]
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hitRate": round(hits / total, 4) if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 삭제한다."""
+        for path, _, _ in self._scan():
+            self._unlink(path)
+        with self._lock:
+            self._total_bytes = 0
+
+    # ── 내부 ───────────────────────────────────────────────────────────────
+    def _path(self, tier: str, key: str) -> Path:
+        if tier not in _TIERS:
+            raise ValueError(f"Unknown parse cache tier: {tier}")
+        return self.root / tier / key[:2] / f"{key}{_SUFFIX}"
+
+    def _count(self, counter: Dict[str, int], tier: str) -> None:
+        with self._lock:
+            counter[tier] += 1
+
+    def _scan(self) -> List[Tuple[Path, float, int]]:
+        entries: List[Tuple[Path, float, int]] = []
+        for tier in _TIERS:
+            tier_dir = self.root / tier
+            if not tier_dir.is_dir():
+                continue
+            for path in tier_dir.glob(f"*/*{_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        with self._lock:
+            if self._total_bytes is not None and self._total_bytes <= self.max_bytes:
+                return
+            # 다른 프로세스의 쓰기도 반영하도록 실제 디렉터리를 다시 스캔한다
+            entries = self._scan()
+            total = sum(size for _, _, size in entries)
+            if total > self.max_bytes:
+                for path, _, size in sorted(entries, key=lambda e: e[1]):
+                    if total <= self.max_bytes:
+                        break
+                    self._unlink(path)
+                    total -= size
+                logger.info("Parse cache evicted to %d bytes", total)
+            self._total_bytes = total
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+# ── 프로세스 전역 캐시 (환경 변수 설정) ────────────────────────────────────
+_DEFAULT_CACHE: Optional[ParseCache] = None
+_METADATA_CACHE: Optional[ParseCache] = None
+_TERM_CACHE: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """
+    환경 변수 설정에 따른 공용 캐시. 비활성화되어 있으면 None.
+      - PARSE_CACHE_ENABLED: "0"/"false"이면 비활성 (기본 활성)
+      - PARSE_CACHE_DIR:     캐시 디렉터리 (기본 src/data/cache/parse)
+      - PARSE_CACHE_MAX_MB:  최대 크기 MB (기본 2048)
+    """
+    global _DEFAULT_CACHE  # pylint: disable=global-statement
+    if os.getenv("PARSE_CACHE_ENABLED", "1").lower() in ("0", "false", "no"):
+        return None
+
+    root = Path(os.getenv("PARSE_CACHE_DIR") or DEFAULT_CACHE_DIR)
+    max_bytes = int(os.getenv("PARSE_CACHE_MAX_MB", "2048")) * 1024 * 1024
+    if (
+        _DEFAULT_CACHE is None
+        or _DEFAULT_CACHE.root != root
+        or _DEFAULT_CACHE.max_bytes != max_bytes
+    ):
+        _DEFAULT_CACHE = ParseCache(root, max_bytes)
+    return _DEFAULT_CACHE
+
+
+def get_metadata_cache() -> Optional[ParseCache]:
+    """
+    Track B 메타데이터 LLM 응답 캐시 (파싱 캐시와 별도 디렉터리/크기/TTL). 비활성이면 None.
+      - METADATA_CACHE_ENABLED:  "0"/"false"이면 비활성 (기본 활성)
+      - METADATA_CACHE_DIR:      캐시 디렉터리 (기본 src/data/cache/metadata)
+      - METADATA_CACHE_MAX_MB:   최대 크기 MB (기본 64)
+      - METADATA_CACHE_TTL_DAYS: 저장 후 유효 기간 일 (기본 30, 0이면 무기한)
+    """
+    global _METADATA_CACHE  # pylint: disable=global-statement
+    if os.getenv("METADATA_CACHE_ENABLED", "1").lower() in ("0", "false", "no"):
+        return None
+
+    root = Path(os.getenv("METADATA_CACHE_DIR") or DEFAULT_METADATA_CACHE_DIR)
+    max_bytes = int(os.getenv("METADATA_CACHE_MAX_MB", "64")) * 1024 * 1024
+    ttl_days = float(os.getenv("METADATA_CACHE_TTL_DAYS", "30"))
+    ttl_seconds = ttl_days * 86400 if ttl_days > 0 else None
+    if (
+        _METADATA_CACHE is None
+        or _METADATA_CACHE.root != root
+        or _METADATA_CACHE.max_bytes != max_bytes
+        or _METADATA_CACHE.ttl_seconds != ttl_seconds
+    ):
+        _METADATA_CACHE = ParseCache(root, max_bytes, ttl_seconds)
+    return _METADATA_CACHE
+
+
+def get_term_cache() -> Optional[ParseCache]:
+    """
+    TERM 추출 LLM 응답 캐시 (청크 단위, 별도 디렉터리/크기/TTL). 비활성이면 None.
+      - TERM_CACHE_ENABLED:  "0"/"false"이면 비활성 (기본 활성)
+      - TERM_CACHE_DIR:      캐시 디렉터리 (기본 src/data/cache/terms)
+      - TERM_CACHE_MAX_MB:   최대 크기 MB (기본 256)
+      - TERM_CACHE_TTL_DAYS: 저장 후 유효 기간 일 (기본 0 = 무기한)
+    """
+    global _TERM_CACHE  # pylint: disable=global-statement
+    if os.getenv("TERM_CACHE_ENABLED", "1").lower() in ("0", "false", "no"):
+        return None
+
+    root = Path(os.getenv("TERM_CACHE_DIR") or DEFAULT_TERM_CACHE_DIR)
+    max_bytes = int(os.getenv("TERM_CACHE_MAX_MB", "256")) * 1024 * 1024
+    ttl_days = float(os.getenv("TERM_CACHE_TTL_DAYS", "0"))
+    ttl_seconds = ttl_days * 86400 if ttl_days > 0 else None
+    if (
+        _TERM_CACHE is None
+        or _TERM_CACHE.root != root
+        or _TERM_CACHE.max_bytes != max_bytes
+        or _TERM_CACHE.ttl_seconds != ttl_seconds
+    ):
+        _TERM_CACHE = ParseCache(root, max_bytes, ttl_seconds)
+    return _TERM_CACHE
@@ -1,28 +1,210 @@
 """PDF 파싱 모듈: 하이브리드 전략 (Docling → PyMuPDF → Gemini Vision)."""
 # src/tractara/parsing/pdf_parser.py
+import bisect
+import importlib.metadata
+import importlib.util
 import io
+import itertools
 import logging
 import os
 import re
+import time
 import uuid
 from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 # PyMuPDF 임포트
 import pymupdf
 from PIL import Image
 
-from .models import BoundingBox, ParsedBlock, ParsedDocument
+from ..llm_gateway import get_gateway
+from .docling_pool import DoclingConverterPool, get_default_pool, start_default_pool
+from .equation_detector import BlockContext, EquationDetector
+from .equation_ocr import EquationOcrClient, render_equation_crop
+from .geometry import (
+    PageBoxIndex,
+    as_boxes,
+    first_below,
+    normalize_to_top_left,
+    pad_boxes,
+)
+from .models import (
+    EMPTY_CONTEXT_PATH,
+    BoundingBox,
+    ContextPath,
+    ParsedBlock,
+    ParsedDocument,
+)
+from .page_triage import KIND_SCANNED, TRIAGE_VERSION, triage_pages
+from .parse_cache import TIER_RAW, ParseCache, get_parse_cache
+from .pdf_session import (
+    PdfSession,
+    build_span_table,
+    estimate_body_font_size,
+    open_session,
+)
 from .section_classifier import (
     SectionClassifier,
     SectionFeatures,
     extract_section_label,
 )
+from .vision_pages import (
+    DEFAULT_CHECKPOINT_DIR,
+    PageCheckpoint,
+    RateLimiter,
+    iter_rendered_pages,
+    render_page_png,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _BlockFeatures:
+    """PyMuPDF 텍스트 블록 하나의 분류 입력 특징 (샤드 워커 → 부모 전달용)."""
+
+    page_index: int
+    text: str
+    max_font_size: float
+    is_bold: bool
+    font_name: str
+    page_width: float
+    bbox: Tuple[float, float, float, float]
+
+
+@dataclass
+class _ShardResult:
+    """페이지 샤드 하나의 추출 결과."""
+
+    start: int
+    end: int
+    features: List[_BlockFeatures]
+    font_sizes: np.ndarray  # 텍스트가 있는 span의 폰트 크기 (문서 순서)
+    toc_page_texts: Dict[int, str]  # ToC 탐지 대상 페이지(앞 16쪽)의 평문
+
+
+# ToC 페이지 탐지 범위 (앞쪽 페이지 수)
+_TOC_SCAN_PAGES = 16
+
+# 사전 컴파일된 수식 탐지 엔진 (상태 없음, 프로세스 공용)
+_EQUATION_DETECTOR = EquationDetector()
+
+
+def _iter_block_features(pdf: PdfSession, page_indices: Iterable[int]):
+    """지정한 페이지들의 텍스트 블록 특징을 문서 순서대로 생성한다."""
+    for page_index in page_indices:
+        page_dict = pdf.page_dict(page_index)
+        page_width = pdf.page_size(page_index)[0]
+        for block in page_dict.get("blocks", []):
+            if block["type"] != 0:  # 0: text, 1: image
+                continue
+
+            text_parts: List[str] = []
+            max_font_size = 0.0
+            is_bold = False
+            font_name_counter: Counter = Counter()
+
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    text_parts.append(span["text"])
+                    if span["size"] > max_font_size:
+                        max_font_size = span["size"]
+                    if span["flags"] & 16:  # bit 4 = bold
+                        is_bold = True
+                    if span["text"].strip():
+                        font_name_counter[span["font"]] += 1
+
+            clean_text = " ".join(text_parts).strip()
+            if not clean_text:
+                continue
+
+            dominant_font = (
+                font_name_counter.most_common(1)[0][0] if font_name_counter else ""
+            )
+            yield _BlockFeatures(
+                page_index=page_index,
+                text=clean_text,
+                max_font_size=max_font_size,
+                is_bold=is_bold,
+                font_name=dominant_font,
+                page_width=page_width,
+                bbox=tuple(block["bbox"]),
+            )
+
+
+def _extract_shard(pdf_path: str, start: int, end: int) -> _ShardResult:
+    """
+    프로세스 풀 워커: [start, end) 페이지를 자체 세션으로 디코딩해
+    블록 특징, 폰트 크기 샘플, ToC 후보 페이지 텍스트를 반환한다.
+    """
+    with PdfSession(Path(pdf_path)) as pdf:
+        pages = range(start, end)
+        features = list(_iter_block_features(pdf, pages))
+        table = build_span_table((i, pdf.page_dict(i)) for i in pages)
+        toc_page_texts = {
+            i: pdf.page_text(i) for i in range(start, min(end, _TOC_SCAN_PAGES))
+        }
+    return _ShardResult(
+        start=start,
+        end=end,
+        features=features,
+        font_sizes=table.size[table.has_text],
+        toc_page_texts=toc_page_texts,
+    )
+
+
+def _plan_shards(
+    page_count: int, bookmarks: List, n_shards: int
+) -> List[Tuple[int, int]]:
+    """
+    페이지 범위를 최대 n_shards개의 연속 구간 [start, end)로 나눈다.
+    균등 분할 지점 근처(구간 길이의 1/4 이내)에 북마크 시작 페이지가 있으면
+    그 페이지를 경계로 사용한다. 입력이 같으면 항상 같은 결과를 낸다.
+    """
+    if n_shards <= 1 or page_count <= 1:
+        return [(0, page_count)]
+
+    bookmark_starts = sorted(
+        {
+            page_no - 1
+            for (_level, _title, page_no) in bookmarks
+            if 0 < page_no - 1 < page_count
+        }
+    )
+    step = page_count / n_shards
+    tolerance = max(1, int(step / 4))
+
+    cuts: List[int] = []
+    for k in range(1, n_shards):
+        target = round(k * step)
+        cut = target
+        pos = bisect.bisect_left(bookmark_starts, target)
+        nearby = [
+            bookmark_starts[j]
+            for j in (pos - 1, pos)
+            if 0 <= j < len(bookmark_starts)
+            and abs(bookmark_starts[j] - target) <= tolerance
+        ]
+        if nearby:
+            cut = min(nearby, key=lambda b: (abs(b - target), b))
+        if 0 < cut < page_count and (not cuts or cut > cuts[-1]):
+            cuts.append(cut)
+
+    bounds = [0] + cuts + [page_count]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
 class PyMuPDFParser:
     """
     텍스트 기반 PDF 파서 (PyMuPDF).
@@ -36,224 +218,275 @@ class PyMuPDFParser:
       Phase 1 — 블록 루프:
         - 블록 특징 추출 → SectionClassifier.classify()
         - 스택 기반 parent_id / context_path 추적
+
+    병렬 모드 (max_workers > 1, 페이지 수 ≥ parallel_min_pages):
+      페이지 범위를 북마크 경계 기준으로 샤드 분할 → ProcessPoolExecutor에서
+      샤드별 페이지 디코딩/블록 특징 추출 → 부모 프로세스가 샤드 순서대로
+      폰트 통계·ToC를 합치고 분류 + context_stack 재구성을 결정론적으로 수행한다.
+      결과는 직렬 모드와 동일하다 (block_id UUID 값 제외).
     """
 
-    def parse(self, pdf_path: Path) -> ParsedDocument:
-        doc = pymupdf.open(pdf_path)
-        blocks: List[ParsedBlock] = []
+    VERSION = "3.0.0"
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        parallel_min_pages: int = 200,
+    ):
+        self.max_workers = (
+            max_workers
+            if max_workers is not None
+            else int(os.getenv("PDF_PARSE_WORKERS", "1"))
+        )
+        self.parallel_min_pages = parallel_min_pages
 
-        # ── Phase 0: 문서 레벨 전처리 ─────────────────────────────────────
+    def parse(
+        self, pdf_path: Path, session: Optional[PdfSession] = None
+    ) -> ParsedDocument:
+        """PyMuPDF 기반 PDF 파싱. session이 주어지면 페이지 디코딩 결과를 재사용한다."""
+        with open_session(pdf_path, session) as pdf:
+            blocks = list(self.iter_blocks(pdf_path, session=pdf))
+            # 파싱 중 계산(캐시)된 값 → 메타데이터 추출이 재계산하지 않도록 기록
+            body_font_size = pdf.body_font_size()
 
-        # 본문 폰트 크기 추정 (전체 span 폰트 크기 최빈값)
-        font_sizes: List[float] = []
-        for page in doc:
-            for b in page.get_text("dict")["blocks"]:
-                if b["type"] == 0:
-                    for line in b["lines"]:
-                        for span in line["spans"]:
-                            if span["text"].strip():
-                                font_sizes.append(round(span["size"], 1))
-
-        body_font_size = (
-            Counter(font_sizes).most_common(1)[0][0] if font_sizes else 10.0
+        return ParsedDocument(
+            source_path=str(pdf_path),
+            blocks=blocks,
+            metadata={
+                "parser": "pymupdf_section_classifier",
+                "version": self.VERSION,
+                "bodyFontSize": body_font_size,
+            },
         )
+
+    def iter_blocks(
+        self, pdf_path: Path, session: Optional[PdfSession] = None
+    ) -> Iterator[ParsedBlock]:
+        """
+        블록을 페이지 순서대로 하나씩 생성한다 (후처리 단계까지 스트리밍).
+
+        session이 없으면 페이지 dict를 보관하지 않는 세션을 열어 피크 메모리를
+        페이지 수와 무관하게 유지한다 (본문 폰트 통계용 사전 패스 1회 추가).
+        병렬 모드는 샤드 결과를 모두 모은 뒤 생성을 시작한다.
+        """
+        with open_session(pdf_path, session, cache_pages=False) as pdf:
+            if self.max_workers > 1 and pdf.page_count >= self.parallel_min_pages:
+                blocks = self._parse_blocks_parallel(pdf_path, pdf)
+            else:
+                blocks = self._parse_blocks(pdf)
+
+            # 후처리 1: 문맥 기반 분할 (인라인 수식 추출)
+            # 후처리 2: 문맥 기반 수식 탐지 및 재분류 (단독 블록 대상)
+            yield from _iter_reclassify_equations(_iter_split_inline_equations(blocks))
+
+    def _parse_blocks(self, pdf: PdfSession) -> Iterator[ParsedBlock]:
+        # ── Phase 0: 문서 레벨 전처리 ─────────────────────────────────────
+
+        # 본문 폰트 크기 추정 (전체 span 폰트 크기 최빈값, 세션 span 테이블 기반)
+        body_font_size = pdf.body_font_size()
         logger.info("Detected body font size: %spt", body_font_size)
 
         # S급 힌트 1: PDF 북마크
-        pdf_bookmarks = doc.get_toc()  # [(level, title, page_no), ...]
+        pdf_bookmarks = pdf.get_toc()  # [(level, title, page_no), ...]
         logger.info("PDF bookmarks found: %d", len(pdf_bookmarks))
 
         # S급 힌트 2: ToC 페이지 파싱
-        toc_entries = self._extract_toc_entries(doc)
+        toc_entries = self._extract_toc_entries(pdf)
         logger.info("ToC entries parsed: %d", len(toc_entries))
 
         # 분류기 초기화
         classifier = SectionClassifier(body_font_size, pdf_bookmarks, toc_entries)
 
         # ── Phase 1: 블록 루프 ────────────────────────────────────────────
+        features = _iter_block_features(pdf, range(pdf.page_count))
+        return self._assemble_blocks(features, classifier)
+
+    def _parse_blocks_parallel(
+        self, pdf_path: Path, pdf: PdfSession
+    ) -> Iterator[ParsedBlock]:
+        """페이지 샤드 병렬 추출 + 결정론적 병합."""
+        pdf_bookmarks = pdf.get_toc()
+        logger.info("PDF bookmarks found: %d", len(pdf_bookmarks))
 
-        # 스택: [{"level": int, "id": str, "title": str}]
-        context_stack: List[Dict] = []
+        n_shards = min(self.max_workers * 2, pdf.page_count)
+        shards = _plan_shards(pdf.page_count, pdf_bookmarks, n_shards)
+        logger.info(
+            "Parallel PyMuPDF parse: %d pages, %d shards, %d workers",
+            pdf.page_count,
+            len(shards),
+            self.max_workers,
+        )
 
-        for page_index, page in enumerate(doc):
-            page_dict = page.get_text("dict")
-            page_width = page.rect.width
-
-            for block in page_dict.get("blocks", []):
-                if block["type"] != 0:  # 0: text, 1: image
-                    continue
-
-                # 블록 특징 추출
-                text_parts: List[str] = []
-                max_font_size = 0.0
-                is_bold = False
-                font_name_counter: Counter = Counter()
-
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text_parts.append(span["text"])
-                        if span["size"] > max_font_size:
-                            max_font_size = span["size"]
-                        if span["flags"] & 16:  # bit 4 = bold
-                            is_bold = True
-                        if span["text"].strip():
-                            font_name_counter[span["font"]] += 1
-
-                clean_text = " ".join(text_parts).strip()
-                if not clean_text:
-                    continue
-
-                dominant_font = (
-                    font_name_counter.most_common(1)[0][0] if font_name_counter else ""
+        # executor.map은 제출 순서대로 결과를 돌려주므로 병합 순서가 고정된다
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            results: List[_ShardResult] = list(
+                executor.map(
+                    _extract_shard,
+                    [str(pdf_path)] * len(shards),
+                    [start for start, _ in shards],
+                    [end for _, end in shards],
                 )
-                bbox_x0, bbox_y0, bbox_x1, bbox_y1 = block["bbox"]
+            )
+
+        # Phase 0 (병합): 샤드별 통계를 문서 순서대로 결합
+        body_font_size = estimate_body_font_size(
+            np.concatenate([r.font_sizes for r in results])
+        )
+        pdf.seed_body_font_size(body_font_size)
+        logger.info("Detected body font size: %spt", body_font_size)
 
-                # 분류기 호출
-                features = SectionFeatures(
+        toc_page_texts: Dict[int, str] = {}
+        for r in results:
+            toc_page_texts.update(r.toc_page_texts)
+        toc_entries = _parse_toc_pages(
+            toc_page_texts[i] for i in sorted(toc_page_texts)
+        )
+        logger.info("ToC entries parsed: %d", len(toc_entries))
+
+        classifier = SectionClassifier(body_font_size, pdf_bookmarks, toc_entries)
+
+        # Phase 1 (병합): 샤드 경계를 가로질러 context_stack을 이어서 재구성
+        features = itertools.chain.from_iterable(r.features for r in results)
+        return self._assemble_blocks(features, classifier)
+
+    def _assemble_blocks(
+        self, features: Iterable[_BlockFeatures], classifier: SectionClassifier
+    ) -> Iterator[ParsedBlock]:
+        """블록 특징 시퀀스 → 분류 + 스택 기반 parent_id/context_path 부여 (생성기)."""
+        # 스택: [{"level": int, "id": str, "path": ContextPath (제목 포함 경로)}]
+        context_stack: List[Dict] = []
+
+        for feat in features:
+            clean_text = feat.text
+            bbox_x0, bbox_y0, bbox_x1, bbox_y1 = feat.bbox
+            page_no = feat.page_index + 1
+
+            # 분류기 호출
+            result = classifier.classify(
+                SectionFeatures(
                     text=clean_text,
-                    max_font_size=max_font_size,
-                    is_bold=is_bold,
-                    font_name=dominant_font,
-                    page_width=page_width,
+                    max_font_size=feat.max_font_size,
+                    is_bold=feat.is_bold,
+                    font_name=feat.font_name,
+                    page_width=feat.page_width,
                     bbox_x0=bbox_x0,
                     bbox_x1=bbox_x1,
                 )
-                result = classifier.classify(features)
-
-                # 수식 감지 덮어쓰기 (휴리스틱)
-                equation_data = None
-                if result.block_type == "paragraph" and self._is_equation(clean_text):
-                    result.block_type = "equation"
-
-                    # 수식 번호 추출 시도
-                    eq_num_match = re.search(r"\((?P<num>\d+(\.\d+)*)\)$", clean_text)
-                    eq_num = eq_num_match.group("num") if eq_num_match else None
+            )
 
-                    equation_data = {
-                        "latex": clean_text,  # 원시 텍스트 보존
-                        "equationNumber": eq_num if eq_num else "",
-                    }
+            # 수식 감지 덮어쓰기 (휴리스틱)
+            equation_data = None
+            if result.block_type == "paragraph" and self._is_equation(clean_text):
+                result.block_type = "equation"
 
-                # 스택 조정: 현재 레벨보다 깊거나 같은 이전 섹션 닫기
-                level = result.level
-                while context_stack and context_stack[-1]["level"] >= level:
-                    context_stack.pop()
-
-                # 부모 연결 및 컨텍스트 경로 수집
-                parent_id = context_stack[-1]["id"] if context_stack else None
-                current_context_path = [item["title"] for item in context_stack]
-                block_id = str(uuid.uuid4())
-
-                blocks.append(
-                    ParsedBlock(
-                        page=page_index + 1,
-                        block_type=result.block_type,
-                        text=clean_text,
-                        bbox=BoundingBox(
-                            x0=bbox_x0,
-                            y0=bbox_y0,
-                            x1=bbox_x1,
-                            y1=bbox_y1,
-                            page=page_index + 1,
-                        ),
-                        table_data=None,
-                        equation_data=equation_data,
-                        confidence=result.confidence,
-                        level=level,
-                        context_path=current_context_path,
-                        parent_id=parent_id,
-                        block_id=block_id,
-                        section_label=result.section_label,
-                        section_title=result.section_title,
-                    )
-                )
+                # 수식 번호 추출 시도
+                eq_num_match = re.search(r"\((?P<num>\d+(\.\d+)*)\)$", clean_text)
+                eq_num = eq_num_match.group("num") if eq_num_match else None
 
-                # 섹션만 스택에 푸시 (paragraph나 equation은 부모가 될 수 없음)
-                if level < 999:
-                    context_stack.append(
-                        {
-                            "level": level,
-                            "id": block_id,
-                            "title": clean_text,
-                        }
-                    )
+                equation_data = {
+                    "latex": clean_text,  # 원시 텍스트 보존
+                    "equationNumber": eq_num if eq_num else "",
+                }
 
-        doc.close()
+            # 스택 조정: 현재 레벨보다 깊거나 같은 이전 섹션 닫기
+            level = result.level
+            while context_stack and context_stack[-1]["level"] >= level:
+                context_stack.pop()
 
-        # 후처리 1: 문맥 기반 분할 (인라인 수식 추출)
-        blocks = _split_inline_equations(blocks)
+            # 부모 연결 및 컨텍스트 경로 수집
+            parent_id = context_stack[-1]["id"] if context_stack else None
+            current_context_path = (
+                context_stack[-1]["path"] if context_stack else EMPTY_CONTEXT_PATH
+            )
+            block_id = str(uuid.uuid4())
 
-        # 후처리 2: 문맥 기반 수식 탐지 및 재분류 (단독 블록 대상)
-        blocks = _reclassify_equations(blocks)
+            yield ParsedBlock(
+                page=page_no,
+                block_type=result.block_type,
+                text=clean_text,
+                bbox=BoundingBox(
+                    x0=bbox_x0,
+                    y0=bbox_y0,
+                    x1=bbox_x1,
+                    y1=bbox_y1,
+                    page=page_no,
+                ),
+                table_data=None,
+                equation_data=equation_data,
+                confidence=result.confidence,
+                level=level,
+                context_path=current_context_path,
+                parent_id=parent_id,
+                block_id=block_id,
+                section_label=result.section_label,
+                section_title=result.section_title,
+            )
 
-        return ParsedDocument(
-            source_path=str(pdf_path),
-            blocks=blocks,
-            metadata={"parser": "pymupdf_section_classifier", "version": "3.0.0"},
-        )
+            # 섹션만 스택에 푸시 (paragraph나 equation은 부모가 될 수 없음)
+            if level < 999:
+                context_stack.append(
+                    {
+                        "level": level,
+                        "id": block_id,
+                        "path": current_context_path.child(clean_text),
+                    }
+                )
 
     # ── 내부 헬퍼 ─────────────────────────────────────────────────────────
 
-    def _extract_toc_entries(self, doc) -> List[Dict]:
-        """
-        ToC 페이지를 탐지하고 섹션 엔트리를 파싱한다.
-
-        탐지 전략:
-          - 첫 15페이지에서 "contents" / "목차" / "table of contents" 키워드 검색
-          - 발견된 페이지의 텍스트 라인에서 점선+페이지번호 제거 후 섹션 라벨 추출
+    def _extract_toc_entries(self, pdf: PdfSession) -> List[Dict]:
+        """ToC 페이지를 탐지하고 섹션 엔트리를 파싱한다 (_parse_toc_pages 참조)."""
+        return _parse_toc_pages(
+            pdf.page_text(i) for i in range(min(_TOC_SCAN_PAGES, pdf.page_count))
+        )
 
-        반환: [{"label": "1.2", "title": "Background"}, ...]
-        """
-        entries: List[Dict] = []
+    def _is_equation(self, text: str) -> bool:
+        """수식 여부 휴리스틱 탐지 (EquationDetector.is_equation 래퍼)"""
+        return _EQUATION_DETECTOR.is_equation(text)
 
-        for page_index, page in enumerate(doc):
-            if page_index > 15:
-                break
 
-            page_text = page.get_text().strip()
-            first_300 = page_text[:300].lower()
+def _parse_toc_pages(page_texts: Iterable[str]) -> List[Dict]:
+    """
+    ToC 페이지를 탐지하고 섹션 엔트리를 파싱한다.
 
-            toc_keywords = ("contents", "목차", "table of contents")
-            if not any(kw in first_300 for kw in toc_keywords):
-                continue
+    탐지 전략:
+      - 첫 15페이지에서 "contents" / "목차" / "table of contents" 키워드 검색
+      - 발견된 페이지의 텍스트 라인에서 점선+페이지번호 제거 후 섹션 라벨 추출
 
-            # ToC 페이지 발견 → 라인별 파싱
-            for line in page_text.split("\n"):
-                line = line.strip()
-                if len(line) < 3:
-                    continue
+    반환: [{"label": "1.2", "title": "Background"}, ...]
+    """
+    entries: List[Dict] = []
 
-                # 점선 및 끝 페이지 번호 제거
-                # 예: "1.2 Background ............. 45" → "1.2 Background"
-                cleaned = re.sub(r"[.\s]{3,}\d+\s*$", "", line).strip()
-                cleaned = re.sub(r"\.{3,}", "", cleaned).strip()
+    for raw_text in page_texts:
+        page_text = raw_text.strip()
+        first_300 = page_text[:300].lower()
 
-                if len(cleaned) < 3:
-                    continue
+        toc_keywords = ("contents", "목차", "table of contents")
+        if not any(kw in first_300 for kw in toc_keywords):
+            continue
 
-                label, title = extract_section_label(cleaned)
-                if label:
-                    entries.append({"label": label, "title": title or cleaned})
+        # ToC 페이지 발견 → 라인별 파싱
+        for line in page_text.split("\n"):
+            line = line.strip()
+            if len(line) < 3:
+                continue
 
-            # 첫 번째 ToC 페이지만 처리
-            break
+            # 점선 및 끝 페이지 번호 제거
+            # 예: "1.2 Background ............. 45" → "1.2 Background"
+            cleaned = re.sub(r"[.\s]{3,}\d+\s*$", "", line).strip()
+            cleaned = re.sub(r"\.{3,}", "", cleaned).strip()
 
-        return entries
+            if len(cleaned) < 3:
+                continue
 
-    def _is_equation(self, text: str) -> bool:
-        """수식 여부 휴리스틱 탐지"""
-        # 끝이 괄호 번호로 끝나는 경우: "E = mc^2 (1.1)"
-        if re.search(r"\(\d+(\.\d+)*\)$", text.strip()):
-            return True
+            label, title = extract_section_label(cleaned)
+            if label:
+                entries.append({"label": label, "title": title or cleaned})
 
-        # 수학 기호 비율 확인
-        math_symbols = set("∑∫√±αβγδεζηθικλμνξοπρστυφχψωΔΓΘΛΞΠΣΦΨΩ=+-*/<>≤≥≈≠")
-        symbol_count = sum(1 for char in text if char in math_symbols)
-        # 3개 이상의 수식 기호가 있거나 전체 길이 대비 기호 비율이 10% 이상이면 수식으로 간주 (방정식 등)
-        if len(text) > 3 and (symbol_count >= 3 or (symbol_count / len(text)) > 0.1):
-            return True
+        # 첫 번째 ToC 페이지만 처리
+        break
 
-        return False
+    return entries
 
 
 class DoclingParser:
@@ -262,9 +495,16 @@ class DoclingParser:
 
     Docling은 자체적으로 계층 구조를 제공하므로 SectionClassifier를 우회한다.
     section/title 블록에 한해 extract_section_label()로 sectionLabel/sectionTitle을 추출한다.
+
+    변환기 초기화(모델 로딩)는 비싸므로 반복 인제스트에서는 docling_pool의
+    DoclingConverterPool이 워커당 한 번만 생성해 재사용한다.
+    변환 결과(DoclingDocument)는 parse_cache의 raw 계층에 저장되어
+    매핑 코드만 바뀐 재인제스트에서는 모델 추론을 건너뛴다.
     """
 
-    def __init__(self):
+    VERSION = "2.0.0"
+
+    def __init__(self, num_threads: int = 4):
         try:
             import torch
             from docling.datamodel.base_models import InputFormat
@@ -292,7 +532,7 @@ class DoclingParser:
 
             pipeline_options = PdfPipelineOptions()
             pipeline_options.accelerator_options = AcceleratorOptions(
-                num_threads=4, device=device
+                num_threads=num_threads, device=device
             )
 
             self.converter = DocumentConverter(
@@ -316,16 +556,86 @@ class DoclingParser:
         except ImportError as e:
             raise ImportError(f"Docling 라이브러리가 설치되지 않았습니다: {e}") from e
 
-    def parse(
-        self, pdf_path: Path
-    ) -> ParsedDocument:  # pylint: disable=too-many-locals
+    def parse(self, pdf_path: Path) -> ParsedDocument:
         """Docling 기반 PDF 파싱."""
-        result = self.converter.convert(pdf_path)
-        doc = result.document
-        blocks: List[ParsedBlock] = []
+        return ParsedDocument(
+            source_path=str(pdf_path),
+            blocks=list(self.iter_blocks(pdf_path)),
+            metadata={"parser": "docling", "version": self.VERSION},
+        )
 
-        context_stack: List[Dict] = []
+    def iter_blocks(self, pdf_path: Path) -> Iterator[ParsedBlock]:
+        """
+        Docling 변환 결과를 요소 단위로 블록화해 하나씩 생성한다 (후처리 포함).
+        변환 자체는 Docling이 문서 단위로 수행한다.
+        """
+        document = self.convert(pdf_path)
+        yield from _iter_reclassify_equations(
+            _iter_split_inline_equations(self._iter_docling_items(document))
+        )
 
+    def convert(
+        self, pdf_path: Path, page_range: Optional[Tuple[int, int]] = None
+    ) -> Any:
+        """
+        Docling 변환 (raw 캐시 계층 조회 → 미스 시 모델 추론 후 저장).
+        page_range(1-based, 포함)를 주면 해당 페이지 창만 변환한다 (창별로 캐시).
+        """
+        cache = get_parse_cache()
+        cache_key = None
+        if cache is not None:
+            options: Dict[str, Any] = {"do_table_structure": True}
+            if page_range is not None:
+                options["page_range"] = list(page_range)
+            try:
+                cache_key = cache.make_key(
+                    pdf_path,
+                    "docling_raw",
+                    _package_version("docling"),
+                    options,
+                )
+            except OSError:
+                cache_key = None
+
+        if cache_key is not None:
+            raw = cache.get(TIER_RAW, cache_key)
+            if raw is not None:
+                from docling_core.types.doc import DoclingDocument
+
+                logger.info("♻️ Docling raw cache hit: %s", pdf_path)
+                return DoclingDocument.model_validate(raw)
+
+        if page_range is not None:
+            document = self.converter.convert(pdf_path, page_range=page_range).document
+        else:
+            document = self.converter.convert(pdf_path).document
+        if cache_key is not None:
+            cache.put(TIER_RAW, cache_key, document.export_to_dict())
+        return document
+
+    def parse_window(
+        self, pdf_path: Path, first_page: int, last_page: int
+    ) -> List[ParsedBlock]:
+        """
+        [first_page, last_page] (1-based, 포함) 페이지 창만 변환해 계층 부여 전의 블록을
+        반환한다. 창 사이의 섹션 스택은 parse_docling_windowed가 재구성한다.
+        """
+        document = self.convert(pdf_path, page_range=(first_page, last_page))
+        blocks = list(self._iter_docling_records(document))
+        # page_range 변환 결과가 창 기준 페이지 번호를 쓰는 버전 대비
+        if blocks and min(b.page for b in blocks) < first_page:
+            for block in blocks:
+                block.page += first_page - 1
+                if block.bbox is not None:
+                    block.bbox.page = block.page
+        return blocks
+
+    def _iter_docling_items(self, doc: Any) -> Iterator[ParsedBlock]:
+        """DoclingDocument.iterate_items() → ParsedBlock (스택 기반 계층 부여)."""
+        return _link_docling_blocks(self._iter_docling_records(doc))
+
+    def _iter_docling_records(self, doc: Any) -> Iterator[ParsedBlock]:
+        """DoclingDocument 요소 → 계층(parent_id/context_path) 부여 전 ParsedBlock."""
         for item, level in doc.iterate_items():
             label = str(getattr(item, "label", "")).lower()
             text = getattr(item, "text", "").strip()
@@ -346,15 +656,6 @@ class DoclingParser:
             elif "list" in label:
                 block_type = "list"
 
-            # 스택 조정 (Docling level이 None인 본문은 스택 유지)
-            if block_type in ["title", "section"] and level is not None:
-                while context_stack and context_stack[-1]["level"] >= level:
-                    context_stack.pop()
-
-            parent_id = context_stack[-1]["id"] if context_stack else None
-            current_context_path = [item["title"] for item in context_stack]
-            block_id = str(uuid.uuid4())
-
             # sectionLabel / sectionTitle 추출 (Docling은 classifier 우회)
             sec_label, sec_title = None, None
             if block_type in ["title", "section"]:
@@ -364,6 +665,7 @@ class DoclingParser:
 
             bbox = self._extract_bbox(item)
 
+            # level이 None인 요소는 999 (제목이어도 스택에 올리지 않음, _link_docling_blocks)
             parsed_block = ParsedBlock(
                 page=item.prov[0].page_no if hasattr(item, "prov") and item.prov else 1,
                 block_type=block_type,
@@ -371,9 +673,7 @@ class DoclingParser:
                 bbox=bbox,
                 confidence=1.0,
                 level=level if level is not None else 999,
-                context_path=current_context_path,
-                parent_id=parent_id,
-                block_id=block_id,
+                block_id=str(uuid.uuid4()),
                 section_label=sec_label,
                 section_title=sec_title,
             )
@@ -391,28 +691,7 @@ class DoclingParser:
             elif block_type == "equation":
                 parsed_block.equation_data = {"latex": text}
 
-            blocks.append(parsed_block)
-
-            if block_type in ["title", "section"] and level is not None:
-                context_stack.append(
-                    {
-                        "level": level,
-                        "id": block_id,
-                        "title": text,
-                    }
-                )
-
-        # 후처리 1: 문맥 기반 분할 (인라인 수식 추출)
-        blocks = _split_inline_equations(blocks)
-
-        # 후처리 2: 문맥 기반 수식 탐지 및 재분류 (단독 블록 대상)
-        blocks = _reclassify_equations(blocks)
-
-        return ParsedDocument(
-            source_path=str(pdf_path),
-            blocks=blocks,
-            metadata={"parser": "docling", "version": "2.0.0"},
-        )
+            yield parsed_block
 
     def _extract_bbox(self, item) -> Optional[BoundingBox]:
         """Docling 아이템에서 BoundingBox 추출."""
@@ -429,173 +708,379 @@ class DoclingParser:
         return None
 
 
+def _link_docling_blocks(blocks: Iterable[ParsedBlock]) -> Iterator[ParsedBlock]:
+    """Docling 블록 시퀀스에 스택 기반 parent_id/context_path를 부여한다 (창 경계 무관)."""
+    context_stack: List[Dict] = []
+
+    for block in blocks:
+        is_heading = block.block_type in ["title", "section"] and block.level != 999
+
+        # 스택 조정 (Docling level이 None인 본문은 스택 유지)
+        if is_heading:
+            while context_stack and context_stack[-1]["level"] >= block.level:
+                context_stack.pop()
+
+        block.parent_id = context_stack[-1]["id"] if context_stack else None
+        block.context_path = (
+            context_stack[-1]["path"] if context_stack else EMPTY_CONTEXT_PATH
+        )
+        yield block
+
+        if is_heading:
+            context_stack.append(
+                {
+                    "level": block.level,
+                    "id": block.block_id,
+                    "path": block.context_path.child(block.text),
+                }
+            )
+
+
+def parse_docling_windowed(  # pylint: disable=too-many-locals
+    pdf_path: Path,
+    page_count: int,
+    window_pages: int,
+    pool: DoclingConverterPool,
+    max_retries: int = 2,
+) -> ParsedDocument:
+    """
+    대형 PDF를 window_pages 페이지 창으로 나눠 워커 프로세스에서 병렬 변환한다.
+
+    - 각 창은 독립적으로 Docling 변환 + 요소 매핑되고(프로세스당 메모리 = 창 크기),
+      부모는 창 순서대로 이어 붙인 뒤 섹션 스택을 다시 쌓아 계층을 재구성한다.
+    - 실패한 창만 max_retries회까지 다시 제출한다. 워커 사망도 창 단위 실패로 처리된다.
+      job_timeout을 넘긴 창은 풀이 워커를 재시작하고 실패 처리하므로 새 워커에서 재시도된다.
+    - 창은 공용 풀에서 변환한다. 풀 워커 수가 창 병렬도 DOCLING_WINDOW_WORKERS
+      (기본 min(4, CPU 수))보다 적으면 그만큼 한 번 늘리고 유지한다 (호출마다 풀을
+      새로 띄우지 않으므로 모델 로딩은 늘어날 때 한 번뿐이고 프로세스 수는 상한이 있다).
+    - 창 경계에 걸친 문단/표는 두 블록으로 나뉠 수 있다.
+    """
+    windows = [
+        (first, min(first + window_pages - 1, page_count))
+        for first in range(1, page_count + 1, window_pages)
+    ]
+    workers = int(os.getenv("DOCLING_WINDOW_WORKERS", str(min(4, os.cpu_count() or 1))))
+    pool.ensure_size(min(workers, len(windows)))
+
+    logger.info(
+        "Docling windowed conversion: %d pages in %d windows of %d",
+        page_count,
+        len(windows),
+        window_pages,
+    )
+    results: Dict[int, List[ParsedBlock]] = {}
+    attempts = {index: 1 for index in range(len(windows))}
+    futures = {
+        pool.submit_window(pdf_path, *window): index
+        for index, window in enumerate(windows)
+    }
+    while futures:
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            index = futures.pop(future)
+            try:
+                results[index] = future.result()
+            except ImportError:
+                raise
+            except (OSError, RuntimeError, ValueError) as e:
+                first, last = windows[index]
+                if attempts[index] > max_retries:
+                    raise RuntimeError(
+                        f"Docling window pages {first}-{last} failed "
+                        f"after {attempts[index]} attempts: {e}"
+                    ) from e
+                attempts[index] += 1
+                logger.warning(
+                    "Docling window pages %d-%d failed (%s). Retrying (%d/%d).",
+                    first,
+                    last,
+                    e,
+                    attempts[index] - 1,
+                    max_retries,
+                )
+                futures[pool.submit_window(pdf_path, first, last)] = index
+
+    blocks = itertools.chain.from_iterable(results[i] for i in range(len(windows)))
+    return ParsedDocument(
+        source_path=str(pdf_path),
+        blocks=list(
+            _iter_reclassify_equations(
+                _iter_split_inline_equations(_link_docling_blocks(blocks))
+            )
+        ),
+        metadata={
+            "parser": "docling",
+            "version": DoclingParser.VERSION,
+            "windows": len(windows),
+        },
+    )
+
+
 class GeminiVisionParser:
     """
     백업 파서: 스캔된 문서나 복잡한 표 처리를 위한 VLM (Vision-Language Model).
     gemini-3-flash-preview를 사용하여 이미지에서 구조화된 데이터를 추출.
+
+    - 전체 페이지를 처리한다. 렌더링은 프로세스 풀(render_workers)에서, API 요청은
+      max_concurrency 스레드에서 분당 requests_per_minute 제한 아래 동시에 수행한다.
+      모델 클라이언트와 모델별 토큰 버킷/서킷 브레이커는 공용 LLM 게이트웨이를 쓴다.
+    - 완료된 페이지는 즉시 디스크에 체크포인트되므로, 크래시나 쿼터 오류 후 재실행하면
+      남은 페이지만 요청한다. 모든 페이지가 끝나면 체크포인트를 지운다.
+    - 블록은 완료 순서와 무관하게 페이지 순서대로 생성된다.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
-        import google.generativeai as genai  # type: ignore
+    VERSION = "2.0.0"
+    # 프롬프트/렌더링 변경 시 올려 페이지 체크포인트를 무효화한다
+    PROMPT_VERSION = "1"
+    PROMPT = (
+        "Extract all text from this page. Return raw text. "
+        "For equations or mathematical formulas, "
+        "extract them strictly in LaTeX format."
+    )
 
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        render_workers: Optional[int] = None,
+        checkpoint_dir: Optional[Path] = None,
+        dpi: int = 150,
+        max_retries: int = 3,
+    ):
         self.api_key = (
             api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         )
         if not self.api_key:
             raise ValueError("Gemini API Key is missing for Vision Parser.")
 
-        genai.configure(api_key=self.api_key)
         self.model_name = "gemini-3-flash-preview"
-
-    def parse(self, pdf_path: Path) -> ParsedDocument:
-        """PDF를 이미지로 변환 후 Gemini에게 구조화 요청."""
-        doc = pymupdf.open(pdf_path)
-        blocks: List[ParsedBlock] = []
-
-        for page_index, page in enumerate(doc):
-            if page_index >= 3:
-                break
-
-            pix = page.get_pixmap(dpi=150)
-            img_data = pix.tobytes("png")
-            image = Image.open(io.BytesIO(img_data))
-
-            prompt = (
-                "Extract all text from this page. Return raw text. "
-                "For equations or mathematical formulas, "
-                "extract them strictly in LaTeX format."
-            )
-            import google.generativeai as genai
-
-            response = genai.GenerativeModel(self.model_name).generate_content(
-                contents=[prompt, image],
+        self.max_concurrency = max(
+            1, max_concurrency or int(os.getenv("VISION_CONCURRENCY", "4"))
+        )
+        self.rate_limiter = RateLimiter(
+            requests_per_minute
+            if requests_per_minute is not None
+            else float(os.getenv("VISION_RPM", "60"))
+        )
+        self.render_workers = (
+            render_workers
+            if render_workers is not None
+            else int(
+                os.getenv("VISION_RENDER_WORKERS", str(min(4, os.cpu_count() or 1)))
             )
-
-            blocks.append(
-                ParsedBlock(
-                    page=page_index + 1,
-                    block_type="paragraph",
-                    text=response.text,
-                    confidence=0.8,
-                )
+        )
+        if checkpoint_dir is None and os.getenv(
+            "VISION_CHECKPOINT_ENABLED", "1"
+        ).lower() not in ("0", "false", "no"):
+            checkpoint_dir = Path(
+                os.getenv("VISION_CHECKPOINT_DIR") or DEFAULT_CHECKPOINT_DIR
             )
+        self.checkpoint_dir = checkpoint_dir
+        self.dpi = dpi
+        self.max_retries = max_retries
+        self._model: Any = None
 
-        doc.close()
-
+    def parse(
+        self,
+        pdf_path: Path,
+        session: Optional[PdfSession] = None,
+        pages: Optional[Sequence[int]] = None,
+    ) -> ParsedDocument:
+        """PDF를 이미지로 변환 후 Gemini에게 구조화 요청."""
         return ParsedDocument(
             source_path=str(pdf_path),
-            blocks=blocks,
-            metadata={"parser": "gemini_vision", "version": "1.0.0"},
+            blocks=list(self.iter_blocks(pdf_path, session=session, pages=pages)),
+            metadata={"parser": "gemini_vision", "version": self.VERSION},
         )
 
+    def iter_blocks(
+        self,
+        pdf_path: Path,
+        session: Optional[PdfSession] = None,
+        pages: Optional[Sequence[int]] = None,
+    ) -> Iterator[ParsedBlock]:
+        """
+        페이지 블록을 페이지 순서대로 생성한다 (체크포인트된 페이지는 요청 생략).
+        pages(0-based)를 주면 해당 페이지만 처리한다 (혼합 문서의 스캔 페이지 라우팅).
+        """
+        with open_session(pdf_path, session) as pdf:
+            targets = sorted(set(pages)) if pages is not None else range(pdf.page_count)
+            checkpoint = self._checkpoint_for(pdf_path)
+            texts = checkpoint.load_all() if checkpoint is not None else {}
+            pending = [i for i in targets if i not in texts]
+            if texts:
+                logger.info(
+                    "Vision parse resuming: %d/%d pages from checkpoint",
+                    len(targets) - len(pending),
+                    len(targets),
+                )
 
-def _ocr_equation_region(
-    page: "pymupdf.Page",  # type: ignore[name-defined]
-    bbox: Tuple[float, float, float, float],
-    padding: int = 10,
-) -> Optional[str]:
-    """수식 BBox 영역을 이미지로 크롭 후 Gemini Vision으로 LaTeX를 추출한다.
-
-    API 키가 없거나 호출 실패 시 None을 반환하여 호출자가 fallback 할 수 있게 한다.
-    """
-    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        return None
+            completed = self._transcribe(pdf_path, pdf, pending, checkpoint)
+            for page_index in targets:
+                while page_index not in texts:
+                    done_index, text = next(completed)
+                    texts[done_index] = text
+                yield ParsedBlock(
+                    page=page_index + 1,
+                    block_type="paragraph",
+                    text=texts.pop(page_index),
+                    confidence=0.8,
+                )
 
-    try:
-        x0, y0, x1, y1 = bbox
-        # 1. BBox → 크롭 이미지 (패딩 추가로 잘림 방지)
-        clip = pymupdf.Rect(
-            x0 - padding,
-            y0 - padding,
-            x1 + padding,
-            y1 + padding,
-        )
-        pix = page.get_pixmap(dpi=300, clip=clip)
-        img_bytes = pix.tobytes("png")
+        if checkpoint is not None:
+            checkpoint.clear()
 
-        # 2. Gemini Vision 호출
-        import google.generativeai as genai  # pylint: disable=import-outside-toplevel
+    # ── 내부 ───────────────────────────────────────────────────────────────
+    def _checkpoint_for(self, pdf_path: Path) -> Optional[PageCheckpoint]:
+        if self.checkpoint_dir is None:
+            return None
+        try:
+            return PageCheckpoint.for_document(
+                self.checkpoint_dir,
+                pdf_path,
+                f"{self.model_name}-p{self.PROMPT_VERSION}-{self.dpi}dpi",
+            )
+        except OSError:
+            return None
 
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel("gemini-3-flash-preview")
+    def _transcribe(
+        self,
+        pdf_path: Path,
+        pdf: PdfSession,
+        pending: List[int],
+        checkpoint: Optional[PageCheckpoint],
+    ) -> Iterator[Tuple[int, str]]:
+        """pending 페이지를 렌더링 → 동시 요청하고 (page_index, text)를 완료 순서로 생성."""
+        if not pending:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        in_flight: Dict[Future, int] = {}
+        try:
+            for page_index, png in iter_rendered_pages(
+                pdf_path,
+                pending,
+                self.dpi,
+                self.render_workers,
+                render_local=lambda i: render_page_png(pdf.page(i), self.dpi),
+            ):
+                # 렌더링이 요청보다 너무 앞서지 않도록 대기 중 요청 수를 제한한다
+                while len(in_flight) >= self.max_concurrency * 2:
+                    yield from self._collect(in_flight)
+                future = executor.submit(
+                    self._transcribe_page, page_index, png, checkpoint
+                )
+                in_flight[future] = page_index
+            while in_flight:
+                yield from self._collect(in_flight)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _collect(in_flight: Dict[Future, int]) -> Iterator[Tuple[int, str]]:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            page_index = in_flight.pop(future)
+            yield page_index, future.result()
+
+    def _transcribe_page(
+        self, page_index: int, png: bytes, checkpoint: Optional[PageCheckpoint]
+    ) -> str:
+        """단일 페이지 요청 (속도 제한 + 지수 백오프 재시도). 성공 시 즉시 체크포인트."""
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = get_gateway().call(
+                    self.model_name,
+                    lambda: self._get_model().generate_content(
+                        contents=[self.PROMPT, Image.open(io.BytesIO(png))],
+                    ),
+                )
+                text = response.text
+                break
+            except Exception as exc:  # pylint: disable=broad-except
+                if attempt == self.max_retries:
+                    raise RuntimeError(
+                        f"Vision parse failed on page {page_index + 1} "
+                        f"after {attempt + 1} attempts: {exc}"
+                    ) from exc
+                backoff = 2.0**attempt
+                if "429" in str(exc) or "quota" in str(exc).lower():
+                    self.rate_limiter.penalize(backoff)
+                logger.warning(
+                    "Vision request for page %d failed (%s). Retrying in %.0fs.",
+                    page_index + 1,
+                    exc,
+                    backoff,
+                )
+                time.sleep(backoff)
 
-        prompt = (
-            "This image contains a single mathematical equation. "
-            "Return ONLY the equation in LaTeX format, without equation numbers, "
-            "without $$ delimiters, without any explanation. "
-            "Example: F_{en} = \\exp(0.935 - T^* \\dot{\\varepsilon}^* O^*)"
-        )
+        if checkpoint is not None:
+            checkpoint.save(page_index, text)
+        return text
 
-        image = Image.open(io.BytesIO(img_bytes))
-        response = model.generate_content(contents=[prompt, image])
-        latex = response.text.strip()
+    def _get_model(self) -> Any:
+        if self._model is not None:
+            return self._model
+        return get_gateway().model(self.model_name, self.api_key)
 
-        # 빈 응답이나 오류 메시지 필터
-        if not latex or len(latex) < 3:
-            return None
 
-        logger.info("Vision OCR for equation: %s", latex)
-        return latex
+@dataclass
+class _EquationCandidate:
+    """Docling이 누락한 수식 후보 (스캔 단계 수집 결과)."""
 
-    except Exception as exc:  # pylint: disable=broad-except
-        logger.warning("Vision OCR failed, falling back to PyMuPDF text: %s", exc)
-        return None
+    page_index: int
+    text: str
+    equation_number: str
+    bbox: Tuple[float, float, float, float]
 
 
 def _supplement_missing_equations(
-    doc_path: Path, docling_blocks: List[ParsedBlock]
+    doc_path: Path,
+    docling_blocks: List[ParsedBlock],
+    session: Optional[PdfSession] = None,
 ) -> List[ParsedBlock]:
     """
     Docling이 통째로 텍스트를 누락한 영역에 대해 PyMuPDF로 가볍게 스캔하여
     수식 패턴이 있는 블록을 보충한다.
-    Gemini Vision API 키가 있으면 크롭 OCR로 정확한 LaTeX를 취득한다.
+    Gemini Vision API 키가 있으면 크롭 OCR로 정확한 LaTeX를 취득한다
+    (스캔 단계에서 크롭을 모두 모은 뒤 EquationOcrClient로 동시/배치 처리).
+    session이 주어지면 이미 디코딩된 페이지 dict를 재사용한다.
     """
     try:
-        doc = pymupdf.open(doc_path)
+        scope = open_session(doc_path, session)
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.warning("Surgical supplement failed to open PDF: %s", e)
         return docling_blocks
 
-    supplemented_blocks = list(docling_blocks)
+    with scope as pdf:
+        return _supplement_from_session(pdf, docling_blocks)
+
+
+def _supplement_from_session(
+    pdf: PdfSession, docling_blocks: List[ParsedBlock]
+) -> List[ParsedBlock]:  # pylint: disable=too-many-locals
+    """_supplement_missing_equations 본체 (열린 세션 기준)."""
 
     # 예: "(12)" 같은 괄호형 수식 번호로 끝나는 패턴
     eq_num_pattern = re.compile(r"\(\s*(?P<num>\d+(\.\d+)*[a-zA-Z]?)\s*\)\s*$")
     # 수학 함수명 패턴 (= 기호가 폰트 디코딩 오류로 소실된 경우 보조 탐지용)
     math_func_pattern = re.compile(r"\b(exp|ln|log|sin|cos|tan|sqrt)\b", re.IGNORECASE)
 
-    # 페이지별로 docling block들의 bbox를 O(N) 비교를 위해 미리 구성
-    from collections import defaultdict
-
-    docling_bboxes_by_page = defaultdict(list)
-
-    # PDF 페이지 높이(Height)를 구해서 Y좌표를 통일하기 위해 미리 한 번 스캔
-    page_heights = {}
-    for p_idx, p in enumerate(doc):
-        page_heights[p_idx + 1] = p.rect.height
-
-    for b in docling_blocks:
-        if b.bbox and b.text and len(b.text.strip()) >= 5:
-            ph = page_heights.get(b.bbox.page, 800)
-            dy0 = ph - b.bbox.y1
-            dy1 = ph - b.bbox.y0
-            if dy0 < 0 or dy1 < 0:
-                dy0, dy1 = b.bbox.y0, b.bbox.y1
-
-            docling_bboxes_by_page[b.bbox.page].append(
-                {
-                    "x0": b.bbox.x0 - 5,
-                    "y0": dy0 - 5,
-                    "x1": b.bbox.x1 + 5,
-                    "y1": dy1 + 5,
-                    "text": b.text,
-                }
-            )
+    # Docling 블록 bbox를 좌상단 원점으로 통일해 페이지별 인덱스 구성 (5pt 여유)
+    page_heights = {
+        p_idx + 1: pdf.page_size(p_idx)[1] for p_idx in range(pdf.page_count)
+    }
+    docling_index = _docling_box_index(
+        [b for b in docling_blocks if b.text and len(b.text.strip()) >= 5],
+        page_heights,
+        padding=5.0,
+    )
 
-    added_count = 0
-    for page_index, page in enumerate(doc):
-        page_num = page_index + 1
-        page_dict = page.get_text("dict")
+    candidates: List[_EquationCandidate] = []
+    for page_index, page_dict in pdf.iter_page_dicts():
+        page_candidates: List[_EquationCandidate] = []
 
         for block in page_dict.get("blocks", []):
             if block["type"] != 0:  # text block
@@ -621,153 +1106,183 @@ def _supplement_missing_equations(
             if not has_equals and not has_math_func:
                 continue
 
-            bx0, by0, bx1, by1 = block["bbox"]
-
-            # 겹침 확인 (Docling이 이미 잡았다면 패스)
-            is_overlap = False
-            for db in docling_bboxes_by_page[page_num]:
-                dx0, dy0, dx1, dy1 = db["x0"], db["y0"], db["x1"], db["y1"]
-                if not (bx1 < dx0 or bx0 > dx1 or by1 < dy0 or by0 > dy1):
-                    is_overlap = True
-                    break
-
-            if not is_overlap:
-                eq_num = eq_num_match.group("num").strip()
-
-                # Gemini Vision으로 정확한 LaTeX 취득 시도
-                vision_latex = _ocr_equation_region(page, (bx0, by0, bx1, by1))
-
-                if vision_latex:
-                    latex_text = vision_latex
-                    display_text = vision_latex
-                else:
-                    # fallback: PyMuPDF 텍스트에서 수식 번호 제거 후 사용
-                    latex_text = eq_num_pattern.sub("", text).strip()
-                    latex_text = re.sub(r"\s{2,}", " ", latex_text)
-                    display_text = text
-
-                new_block = ParsedBlock(
-                    page=page_num,
-                    block_type="equation",
-                    text=display_text,
-                    equation_data={"latex": latex_text, "equationNumber": eq_num},
-                    bbox=BoundingBox(x0=bx0, y0=by0, x1=bx1, y1=by1, page=page_num),
-                    level=999,
-                    block_id=str(uuid.uuid4()),
+            page_candidates.append(
+                _EquationCandidate(
+                    page_index=page_index,
+                    text=text,
+                    equation_number=eq_num_match.group("num").strip(),
+                    bbox=tuple(block["bbox"]),
                 )
-                supplemented_blocks.append(new_block)
-                added_count += 1
-
-    doc.close()
-
-    if added_count > 0:
-        logger.info(
-            "Surgically supplemented %d missing equations using PyMuPDF.", added_count
-        )
-        # 페이지와 y 좌표 순으로 재정렬
-        supplemented_blocks.sort(key=lambda b: (b.page, b.bbox.y0 if b.bbox else 0))
+            )
 
-    return supplemented_blocks
+        # 겹침 확인 (Docling이 이미 잡았다면 패스) — 페이지 단위 일괄 질의
+        if page_candidates:
+            overlaps = docling_index.any_overlap(
+                page_index + 1, as_boxes(c.bbox for c in page_candidates)
+            )
+            candidates.extend(c for c, hit in zip(page_candidates, overlaps) if not hit)
 
+    # 수식 크롭 OCR: 렌더링은 순차(PyMuPDF), 요청은 동시/배치, 결과는 후보 순서대로
+    ocr_client = EquationOcrClient()
+    vision_latexes: List[Optional[str]] = [None] * len(candidates)
+    if candidates and ocr_client.available:
+        try:
+            crops = [
+                render_equation_crop(pdf.page(c.page_index), c.bbox) for c in candidates
+            ]
+            vision_latexes = ocr_client.ocr_many(crops)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Vision OCR failed, falling back to PyMuPDF text: %s", exc)
 
-def _split_inline_equations(blocks: List[ParsedBlock]) -> List[ParsedBlock]:
-    """
-    긴 문단(paragraph) 내에 끼어있는 수식을 분리하여 별도 equation 블록으로 추출한다.
-    앵커: '(숫자)' 혹은 '(숫자.숫자)' 형태의 수식 번호가 문단 중간/끝에 등장하고,
-          그 앞에 수식 기호(=)가 존재하는 패턴을 찾는다.
-    """
     new_blocks: List[ParsedBlock] = []
+    for cand, vision_latex in zip(candidates, vision_latexes):
+        page_num = cand.page_index + 1
+        bx0, by0, bx1, by1 = cand.bbox
+
+        if vision_latex:
+            logger.info("Vision OCR for equation: %s", vision_latex)
+            latex_text = vision_latex
+            display_text = vision_latex
+        else:
+            # fallback: PyMuPDF 텍스트에서 수식 번호 제거 후 사용
+            latex_text = eq_num_pattern.sub("", cand.text).strip()
+            latex_text = re.sub(r"\s{2,}", " ", latex_text)
+            display_text = cand.text
+
+        new_block = ParsedBlock(
+            page=page_num,
+            block_type="equation",
+            text=display_text,
+            equation_data={
+                "latex": latex_text,
+                "equationNumber": cand.equation_number,
+            },
+            bbox=BoundingBox(x0=bx0, y0=by0, x1=bx1, y1=by1, page=page_num),
+            level=999,
+            block_id=str(uuid.uuid4()),
+        )
+        new_blocks.append(new_block)
+
+    if not new_blocks:
+        return list(docling_blocks)
 
-    # 예: "(12)", "(1.1)", "(13a)" 등 수식 번호 패턴 (단어 경계 확인)
-    # 텍스트 내에 줄바꿈이 있을 수 있으므로 re.DOTALL 적용
-    eq_num_pattern = re.compile(
-        r"(?P<eq_text>.+?)\(\s*(?P<num>\d+(\.\d+)*[a-zA-Z]?)\s*\)", re.DOTALL
+    logger.info(
+        "Surgically supplemented %d missing equations using PyMuPDF.", len(new_blocks)
+    )
+    return _merge_by_position(docling_blocks, new_blocks, page_heights)
+
+
+def _docling_box_index(
+    blocks: List[ParsedBlock], page_heights: Dict[int, float], padding: float = 0.0
+) -> PageBoxIndex:
+    """Docling 블록 bbox(좌하단 원점 가능) → 좌상단 원점 PageBoxIndex."""
+    by_page: Dict[int, List[Tuple[float, float, float, float]]] = {}
+    for b in blocks:
+        if b.bbox:
+            by_page.setdefault(b.bbox.page, []).append(_bbox_tuple(b.bbox))
+    return PageBoxIndex.from_page_boxes(
+        {
+            page: pad_boxes(
+                normalize_to_top_left(as_boxes(boxes), page_heights.get(page, 800)),
+                padding,
+            )
+            for page, boxes in by_page.items()
+        }
     )
 
-    for block in blocks:
-        if block.block_type != "paragraph" or not block.text or len(block.text) < 30:
-            new_blocks.append(block)
-            continue
 
-        text = block.text
-        # = 기호가 없으면 인라인 수식으로 취급 안 함
-        if "=" not in text:
-            new_blocks.append(block)
-            continue
+def _bbox_tuple(bbox: BoundingBox) -> Tuple[float, float, float, float]:
+    return (bbox.x0, bbox.y0, bbox.x1, bbox.y1)
 
-        parts_handled = False
-        remaining_text = text
-        block_splits: List[ParsedBlock] = []
 
-        while True:
-            match = eq_num_pattern.search(remaining_text)
-            if not match:
-                break
+def _merge_by_position(
+    docling_blocks: List[ParsedBlock],
+    new_blocks: List[ParsedBlock],
+    page_heights: Dict[int, float],
+) -> List[ParsedBlock]:
+    """
+    보충 블록(좌상단 원점)을 Docling 읽기 순서를 유지한 채 끼워 넣는다.
+    같은 페이지에서 처음으로 보충 블록보다 아래에 시작하는 Docling 블록 앞에 넣고,
+    그런 블록이 없으면 그 페이지의 마지막 Docling 블록 뒤에 넣는다.
+    """
+    # 페이지별 Docling 블록의 전역 인덱스와 정규화된 상단 y
+    page_members: Dict[int, List[int]] = {}
+    for i, b in enumerate(docling_blocks):
+        if b.bbox:
+            page_members.setdefault(b.bbox.page, []).append(i)
+    page_tops = {
+        page: normalize_to_top_left(
+            as_boxes(_bbox_tuple(docling_blocks[i].bbox) for i in members),
+            page_heights.get(page, 800),
+        )[:, 1]
+        for page, members in page_members.items()
+    }
+    block_pages = [b.page for b in docling_blocks]
+
+    inserts: Dict[int, List[ParsedBlock]] = {}
+    new_blocks = sorted(new_blocks, key=lambda b: (b.page, b.bbox.y0))
+    for page in sorted({b.page for b in new_blocks}):
+        on_page = [b for b in new_blocks if b.page == page]
+        members = page_members.get(page, [])
+        if members:
+            positions = first_below(
+                page_tops[page], np.array([b.bbox.y0 for b in on_page])
+            )
+            for b, pos in zip(on_page, positions):
+                at = members[pos] if pos < len(members) else members[-1] + 1
+                inserts.setdefault(at, []).append(b)
+        else:
+            # 해당 페이지에 Docling 블록이 없으면 다음 페이지 첫 블록 앞에 둔다
+            at = bisect.bisect_right(block_pages, page)
+            inserts.setdefault(at, []).extend(on_page)
 
-            candidate_text = match.group("eq_text").strip()
-            eq_num = match.group("num")
+    merged: List[ParsedBlock] = []
+    for i, b in enumerate(docling_blocks):
+        merged.extend(inserts.get(i, []))
+        merged.append(b)
+    merged.extend(inserts.get(len(docling_blocks), []))
+    return merged
 
-            # 수식 기호가 없으면 일반 참조일 수 있으므로 패스
-            if "=" not in candidate_text:
-                # 현재 매치의 끝 위치 다음부터 남은 텍스트 재탐색
-                remaining_text = remaining_text[match.end() :].strip()
-                continue
 
-            # 역방향으로 도입 키워드 찾기 (예: given by)
-            # 가장 가까운 도입 키워드나 문장 끝 부호 이후를 수식의 시작으로 간주
-            best_start_idx = 0
-
-            # 1. 도입 키워드 찾기
-            for kw in ["where", "given by", "as follows", "defined as", "is:", "is "]:
-                # 마지막 등장을 찾기
-                idx = candidate_text.lower().rfind(kw)
-                if idx != -1:
-                    # 원본 텍스트에서의 인덱스를 기준으로 자름
-                    best_start_idx = max(best_start_idx, idx + len(kw))
-
-            # 2. 문장 끝 부호 찾기 (도입 키워드가 발견되지 않았거나 더 가까운 부품이 있을 때)
-            for punc in [". ", ": ", "; ", ".\n", ":\n", ";\n"]:
-                idx = candidate_text.rfind(punc)
-                if idx != -1:
-                    best_start_idx = max(best_start_idx, idx + len(punc))
-
-            # 만약 찾지 못했다면 전체를 수식으로 볼지 판단.
-            # 하지만 = 기호가 아주 앞쪽에 있다면 전체를 수식으로 삼을 수 있음.
-            if best_start_idx == 0:
-                eq_start_idx = candidate_text.find("=")
-                if eq_start_idx > 80:  # 너무 멀면 오탐지(글이 길 때) 방지, 하지만 여유를 좀 둠
-                    # 수식 분할 포기하고 스킵
-                    remaining_text = remaining_text[match.end() :].strip()
-                    continue
-
-            prefix = remaining_text[: match.start() + best_start_idx].strip()
-            equation_body = candidate_text[best_start_idx:].strip()
-
-            # 수식 분할 조건: 최소한의 길이와 '=' 포함 검증
-            if len(equation_body) < 3 or "=" not in equation_body:
-                remaining_text = remaining_text[match.end() :].strip()
-                continue
+def _split_inline_equations(blocks: List[ParsedBlock]) -> List[ParsedBlock]:
+    """
+    긴 문단(paragraph) 내에 끼어있는 수식을 분리하여 별도 equation 블록으로 추출한다.
+    앵커: '(숫자)' 혹은 '(숫자.숫자)' 형태의 수식 번호가 문단 중간/끝에 등장하고,
+          그 앞에 수식 기호(=)가 존재하는 패턴을 찾는다.
+    """
+    return list(_iter_split_inline_equations(blocks))
 
-            # prefix가 있으면 앞부분 paragraph 생성
-            if prefix:
-                prefix_block = ParsedBlock(
-                    page=block.page,
-                    block_type="paragraph",
-                    text=prefix,
-                    bbox=block.bbox,
-                    level=block.level,
-                    context_path=block.context_path,
-                    parent_id=block.parent_id,
-                    block_id=str(uuid.uuid4()),
-                )
-                block_splits.append(prefix_block)
 
-            # equation 블록 생성
-            eq_block = ParsedBlock(
+def _iter_split_inline_equations(
+    blocks: Iterable[ParsedBlock],
+) -> Iterator[ParsedBlock]:
+    """_split_inline_equations의 스트리밍 단계 (블록 단위 처리, 윈도우 불필요)."""
+    for block in blocks:
+        yield from _split_block_inline_equations(block)
+
+
+def _split_block_inline_equations(block: ParsedBlock) -> List[ParsedBlock]:
+    """단일 paragraph 블록을 [앞 문단, 수식, ..., 뒤 문단]으로 분할한다."""
+    if block.block_type != "paragraph" or not block.text:
+        return [block]
+
+    text = block.text
+    splits, suffix = _EQUATION_DETECTOR.split_points(text)
+    if not splits:
+        return [block]
+
+    block_splits: List[ParsedBlock] = []
+    for split in splits:
+        prefix = text[split.prefix[0] : split.prefix[1]]
+        if prefix:
+            block_splits.append(_split_paragraph(block, prefix))
+        equation_body = text[split.equation[0] : split.equation[1]]
+        block_splits.append(
+            ParsedBlock(
                 page=block.page,
                 block_type="equation",
                 text=equation_body,
-                equation_data={"latex": equation_body, "equationNumber": eq_num},
+                equation_data={"latex": equation_body, "equationNumber": split.number},
                 bbox=block.bbox,
                 level=block.level,
                 context_path=block.context_path,
@@ -776,31 +1291,25 @@ def _split_inline_equations(blocks: List[ParsedBlock]) -> List[ParsedBlock]:
                 section_label=block.section_label,
                 section_title=block.section_title,
             )
-            block_splits.append(eq_block)
-
-            remaining_text = remaining_text[match.end() :].strip()
-            parts_handled = True
-
-        if parts_handled:
-            # 남은 뒷부분 텍스트
-            if remaining_text:
-                suffix_block = ParsedBlock(
-                    page=block.page,
-                    block_type="paragraph",
-                    text=remaining_text,
-                    bbox=block.bbox,
-                    level=block.level,
-                    context_path=block.context_path,
-                    parent_id=block.parent_id,
-                    block_id=str(uuid.uuid4()),
-                )
-                block_splits.append(suffix_block)
-
-            new_blocks.extend(block_splits)
-        else:
-            new_blocks.append(block)
+        )
 
-    return new_blocks
+    if suffix is not None and suffix[0] < suffix[1]:
+        block_splits.append(_split_paragraph(block, text[suffix[0] : suffix[1]]))
+    return block_splits
+
+
+def _split_paragraph(block: ParsedBlock, text: str) -> ParsedBlock:
+    """분할된 문단 조각 블록 (원 블록의 위치/계층 정보 상속)."""
+    return ParsedBlock(
+        page=block.page,
+        block_type="paragraph",
+        text=text,
+        bbox=block.bbox,
+        level=block.level,
+        context_path=block.context_path,
+        parent_id=block.parent_id,
+        block_id=str(uuid.uuid4()),
+    )
 
 
 def _reclassify_equations(blocks: List[ParsedBlock]) -> List[ParsedBlock]:
@@ -808,131 +1317,270 @@ def _reclassify_equations(blocks: List[ParsedBlock]) -> List[ParsedBlock]:
     파싱된 블록 리스트를 순회하며 좌우 문맥(Context)을 평가하여 수식을 탐지/재분류한다.
     기존 paragraph 블록 중에서 수식일 가능성이 높은 것을 판단.
     """
-    for i, block in enumerate(blocks):
-        if block.block_type != "paragraph" or not block.text:
-            continue
+    return list(_iter_reclassify_equations(blocks))
 
-        text = block.text.strip()
-        if not text:
-            continue
 
-        score = 0
-
-        # S1: 아주 짧은 텍스트 길이 (일반 문단은 보통 길음)
-        if len(text) < 100:
-            score += 1
-
-        # S2: 괄호형 수식 번호로 끝나는 패턴
-        eq_num = None
-        eq_num_match = re.search(r"\((?P<num>\d+(\.\d+)*[a-zA-Z]?)\)\s*$", text)
-        if eq_num_match:
-            eq_num = eq_num_match.group("num")
-            score += 2  # 강한 시그널
-
-        # 주변 블록 컨텍스트
-        prev_block_text = blocks[i - 1].text if i > 0 else None
-        next_block_text = blocks[i + 1].text if i < len(blocks) - 1 else None
-        prev_text = prev_block_text.strip().lower() if prev_block_text else ""
-        next_text = next_block_text.strip().lower() if next_block_text else ""
-
-        # S3: 앞 문단 끝 키워드
-        prev_keywords = (
-            "where",
-            "given by",
-            "defined as",
-            "as follows",
-            "expressed as",
-            "is",
-            "equation",
-            "equation:",
-            "식",
-            "다음과 같다",
+def _iter_reclassify_equations(blocks: Iterable[ParsedBlock]) -> Iterator[ParsedBlock]:
+    """
+    _reclassify_equations의 스트리밍 단계.
+    앞 1블록(look-behind) / 뒤 1블록(look-ahead) 윈도우만 유지하며, 이웃 특징
+    (BlockContext)은 블록당 한 번만 계산해 다음 블록으로 넘긴다.
+    재분류는 block_type/equation_data만 바꾸고 text는 그대로이므로 결과는 리스트 버전과 같다.
+    """
+    iterator = iter(blocks)
+    current = next(iterator, None)
+    if current is None:
+        return
+    prev_context = _EQUATION_DETECTOR.context(None)
+    current_context = _EQUATION_DETECTOR.context(current.text)
+
+    while current is not None:
+        upcoming = next(iterator, None)
+        upcoming_context = _EQUATION_DETECTOR.context(
+            upcoming.text if upcoming is not None else None
         )
-        if any(prev_text.endswith(kw) for kw in prev_keywords):
-            score += 2
-
-        # S4: 뒤 문단 시작 키워드
-        next_keywords = ("where", "from", "in which", "here", "여기서")
-        if any(next_text.startswith(kw) for kw in next_keywords):
-            score += 1
-
-        # S5: 주변 블록 수식 지칭 단어 (본문이 아니라 내부에 있을 때만)
-        surrounding_text = prev_text + " " + next_text
-        if re.search(r"\b(eq\.|eqs\.|equation|수식)\b", surrounding_text):
-            score += 1
-
-        # S6: 특수 수학 기호 (유니코드 및 연산자)
-        # 하이픈(-)은 일반 텍스트에서도 많이 쓰이므로, 단독 하이픈만 있는 경우는 기호에서 제외하거나 가중치를 낮춤
-        math_symbols = set("∑∫√±αβγδεζηθικλμνξοπρστυφχψωΔΓΘΛΞΠΣΦΨΩ=+-*/<>≤≥≈≠")
-        symbol_count = sum(1 for char in text if char in math_symbols)
-        # = 기호가 있거나 전체 기호가 2개 이상일 때
-        if "=" in text or symbol_count >= 2:
-            score += 2
-
-        # S7 (Penalty) : 일반 문장형 텍스트 및 오탐지(이메일, 전화번호 등) 방지
-        # 1. 텍스트 자체가 "given by", "where" 등으로 끝나는 건 보통 도입 문장
-        if any(text.lower().endswith(kw) for kw in prev_keywords):
-            score -= 3
-        # 2. 너무 긴 문장은 수식 아님 (특수기호가 많지 않은 한)
-        if len(text) > 200 and symbol_count < 3:
-            score -= 3
-        # 3. 이메일 주소 형태인 경우
-        if "@" in text and re.search(r"[\w\.-]+@[\w\.-]+", text):
-            score -= 5
-        # 4. 전화번호/팩스 번호 형태 (예: Facsimile: 301-415-2289)
-        if re.search(r"\d{2,3}-\d{3,4}-\d{4}", text) and "=" not in text:
-            score -= 5
-
-        # 최종 평가: 3점 이상이면 수식으로 판단
-        if score >= 3:
-            block.block_type = "equation"
-            block.equation_data = {
-                "latex": text,  # 향후 수식 정제 모델이 붙는다면 여기서 처리
-                "equationNumber": eq_num if eq_num else "",
-            }
-
-    return blocks
-
-
-def parse_pdf(path: Path) -> ParsedDocument:
+        _apply_equation_verdict(
+            current, prev_context, upcoming_context, current_context
+        )
+        yield current
+        prev_context, current_context = current_context, upcoming_context
+        current = upcoming
+
+
+def _apply_equation_verdict(
+    block: ParsedBlock,
+    prev_context: BlockContext,
+    next_context: BlockContext,
+    own_context: BlockContext,
+) -> None:
+    """EquationDetector.classify 결과가 수식이면 paragraph 블록을 equation으로 바꾼다."""
+    if block.block_type != "paragraph" or not block.text:
+        return
+
+    verdict = _EQUATION_DETECTOR.classify(
+        block.text, prev_context, next_context, own_context
+    )
+    if verdict.is_equation:
+        block.block_type = "equation"
+        block.equation_data = {
+            "latex": block.text.strip(),  # 향후 수식 정제 모델이 붙는다면 여기서 처리
+            "equationNumber": verdict.equation_number,
+        }
+
+
+def parse_pdf(path: Path, session: Optional[PdfSession] = None) -> ParsedDocument:
     """
     하이브리드 파싱 전략: Docling (최우선) → PyMuPDF → Gemini Vision (스캔본)
 
     1. Docling: 표, 레이아웃, 계층 구조 완벽 지원 (SectionClassifier 우회)
     2. PyMuPDF: 안정적 텍스트 추출 + SectionClassifier 적용
     3. Gemini Vision: 스캔 문서 전용 (비용 발생)
+
+    session: 인제스트 단위로 공유되는 PdfSession. 없으면 내부에서 열고 닫는다.
+
+    결과는 parse_cache의 parsed 계층에 저장되어 같은 파일 재인제스트 시 재사용된다.
+    에러로 인한 fallback 결과는 캐시하지 않는다.
+    """
+    cache = get_parse_cache()
+    cache_key = _parse_pdf_cache_key(path) if cache is not None else None
+    if cache_key is not None:
+        cached = cache.get_document(cache_key)
+        if cached is not None:
+            logger.info("♻️ Parse cache hit: %s", path)
+            cached.source_path = str(path)
+            return cached
+
+    parsed_doc, cacheable = _parse_pdf_hybrid(path, session)
+
+    if cache_key is not None and cacheable:
+        cache.put_document(cache_key, parsed_doc)
+    return parsed_doc
+
+
+def _parse_pdf_cache_key(path: Path) -> Optional[str]:
+    """parse_pdf 결과 캐시 키: 파일 내용 + 파서 버전 + 경로 선택에 영향을 주는 환경."""
+    has_gemini_key = bool(os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY"))
+    try:
+        return ParseCache.make_key(
+            path,
+            "parse_pdf",
+            f"docling-{DoclingParser.VERSION}/pymupdf-{PyMuPDFParser.VERSION}"
+            f"/gemini-{GeminiVisionParser.VERSION}",
+            {
+                "docling": importlib.util.find_spec("docling") is not None,
+                "gemini": has_gemini_key,
+                "triage": TRIAGE_VERSION,
+            },
+        )
+    except OSError:
+        return None
+
+
+def _package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _parse_pdf_hybrid(
+    path: Path, session: Optional[PdfSession]
+) -> Tuple[ParsedDocument, bool]:
+    """
+    parse_pdf 본체. (결과, 캐시 가능 여부)를 반환한다.
+
+    페이지 단위 판별(page_triage) 후 텍스트 페이지는 Docling/PyMuPDF로, 이미지뿐인
+    스캔 페이지는 Gemini Vision으로 보내고 하나의 ParsedDocument로 합친다.
     """
     logger.info("Parsing PDF with Hybrid Strategy: %s", path)
 
     try:
-        doc = pymupdf.open(path)
-        total_text_len = sum(len(page.get_text()) for page in doc)
-        is_scanned = (len(doc) > 0) and (total_text_len / len(doc) < 50)
-        doc.close()
+        with open_session(path, session) as pdf:
+            scanned_pages = [
+                t.page_index for t in triage_pages(pdf) if t.kind == KIND_SCANNED
+            ]
+            has_gemini_key = bool(
+                os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+            )
 
-        if not is_scanned:
+            if scanned_pages and len(scanned_pages) == pdf.page_count:
+                logger.info("🖼️ Scanned PDF 감지: Gemini Vision(VLM) 사용")
+                if not has_gemini_key:
+                    logger.warning("⚠️ Gemini API Key 없음. PyMuPDF로 강제 진행")
+                    return PyMuPDFParser().parse(path, session=pdf), True
+                return GeminiVisionParser().parse(path, session=pdf), True
+
+            parsed_doc, cacheable = _parse_digital_pdf(path, pdf)
+            if not scanned_pages:
+                return parsed_doc, cacheable
+
+            logger.info(
+                "🖼️ 스캔 페이지 %d/%d개 감지: 해당 페이지만 Gemini Vision 사용",
+                len(scanned_pages),
+                pdf.page_count,
+            )
+            if not has_gemini_key:
+                logger.warning("⚠️ Gemini API Key 없음. 스캔 페이지 OCR 생략")
+                return parsed_doc, cacheable
             try:
-                logger.info("🚀 Docling 파서 시도 (표/구조 최적화)")
-                parsed_doc = DoclingParser().parse(path)
-
-                # 외과적 보충 (Surgical Supplement): Docling 누락 수식 채우기
-                parsed_doc.blocks = _supplement_missing_equations(
-                    path, parsed_doc.blocks
+                vision_blocks = list(
+                    GeminiVisionParser().iter_blocks(
+                        path, session=pdf, pages=scanned_pages
+                    )
                 )
+            except (RuntimeError, ValueError) as e:
+                logger.warning("⚠️ 스캔 페이지 Vision 실패 (%s). 텍스트 페이지만 사용", e)
+                return parsed_doc, False
 
-                return parsed_doc
-            except (ImportError, OSError, RuntimeError) as e:
-                logger.warning(
-                    "⚠️ Docling 실패 (%s). PyMuPDF + SectionClassifier로 전환.", e
-                )
-                return PyMuPDFParser().parse(path)
-        else:
-            logger.info("🖼️ Scanned PDF 감지: Gemini Vision(VLM) 사용")
-            if not (os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")):
-                logger.warning("⚠️ Gemini API Key 없음. PyMuPDF로 강제 진행")
-                return PyMuPDFParser().parse(path)
-            return GeminiVisionParser().parse(path)
+            parsed_doc.blocks = _stitch_vision_pages(parsed_doc.blocks, vision_blocks)
+            parsed_doc.metadata["visionPages"] = [i + 1 for i in scanned_pages]
+            return parsed_doc, cacheable
 
     except (OSError, RuntimeError, ValueError) as e:
         logger.warning("⚠️ 파싱 중 에러 (%s). PyMuPDF fallback 모드.", e)
-        return PyMuPDFParser().parse(path)
+        return PyMuPDFParser().parse(path, session=session), False
+
+
+def _parse_digital_pdf(path: Path, pdf: PdfSession) -> Tuple[ParsedDocument, bool]:
+    """텍스트 레이어 경로: Docling (+ 수식 보충) → 실패 시 PyMuPDF + SectionClassifier."""
+    try:
+        logger.info("🚀 Docling 파서 시도 (표/구조 최적화)")
+        pool = get_default_pool()
+        window_pages = int(os.getenv("DOCLING_WINDOW_PAGES", "50"))
+        windowed = window_pages > 0 and pdf.page_count >= int(
+            os.getenv("DOCLING_WINDOW_MIN_PAGES", "200")
+        )
+        if windowed and pool is None:
+            # 창 변환은 공용 풀이 필요하다: 기본 풀을 띄워 프로세스 수명 동안 재사용
+            # (DOCLING_POOL_SIZE=0이면 풀 없이 문서 전체를 한 번에 변환)
+            pool = start_default_pool()
+        if windowed and pool is not None:
+            parsed_doc = parse_docling_windowed(
+                path, pdf.page_count, window_pages, pool=pool
+            )
+        elif pool is not None:
+            parsed_doc = pool.parse(path)
+        else:
+            parsed_doc = DoclingParser().parse(path)
+
+        # 외과적 보충 (Surgical Supplement): Docling 누락 수식 채우기
+        parsed_doc.blocks = _supplement_missing_equations(
+            path, parsed_doc.blocks, session=pdf
+        )
+        # 보충 단계에서 디코딩한 페이지 dict로 계산 → 메타데이터 추출이 표본 추정하지 않도록 기록
+        parsed_doc.metadata = {
+            **(parsed_doc.metadata or {}),
+            "bodyFontSize": pdf.body_font_size(),
+        }
+
+        return parsed_doc, True
+    except ImportError as e:
+        logger.warning("⚠️ Docling 미설치 (%s). PyMuPDF + SectionClassifier로 전환.", e)
+        return PyMuPDFParser().parse(path, session=pdf), True
+    except (OSError, RuntimeError) as e:
+        logger.warning("⚠️ Docling 실패 (%s). PyMuPDF + SectionClassifier로 전환.", e)
+        return PyMuPDFParser().parse(path, session=pdf), False
+
+
+_HEADING_TYPES = ("title", "section", "subsection")
+
+
+def _stitch_vision_pages(
+    digital_blocks: List[ParsedBlock], vision_blocks: List[ParsedBlock]
+) -> List[ParsedBlock]:
+    """
+    Vision 페이지의 디지털 블록(대개 비어 있거나 잡음)을 Vision 블록으로 교체하고
+    페이지 순서로 병합한다. Vision 블록은 직전 제목 블록의 계층(parent/context)을 잇는다.
+
+    Docling OCR이 스캔 페이지에서 찾은 제목도 함께 제거되므로, 남은 블록 중 제거된
+    제목을 부모로 가리키던 블록은 가장 가까운 남은 조상으로 다시 연결하고 context_path를
+    다시 계산한다 (문서 순서상 부모가 항상 자식보다 앞선다).
+    """
+    vision_pages: Set[int] = {b.page for b in vision_blocks}
+    removed_parent: Dict[Optional[str], Optional[str]] = {
+        b.block_id: b.parent_id
+        for b in digital_blocks
+        if b.page in vision_pages and b.block_id
+    }
+    # 남은 제목 block_id → 그 하위 블록의 context_path
+    child_paths: Dict[str, ContextPath] = {}
+
+    def relink(block: ParsedBlock) -> None:
+        parent = block.parent_id
+        while parent in removed_parent:
+            parent = removed_parent[parent]
+        block.parent_id = parent
+        if parent is None:
+            block.context_path = EMPTY_CONTEXT_PATH
+        elif parent in child_paths:
+            block.context_path = child_paths[parent]
+        if block.block_type in _HEADING_TYPES and block.block_id:
+            child_paths[block.block_id] = block.context_path.child(block.text)
+
+    merged: List[ParsedBlock] = []
+    pending = iter(vision_blocks)
+    upcoming = next(pending, None)
+    heading: Optional[ParsedBlock] = None
+
+    def adopt(block: ParsedBlock) -> ParsedBlock:
+        if heading is not None:
+            block.parent_id = heading.block_id
+            block.context_path = heading.context_path.child(heading.text)
+        return block
+
+    for block in digital_blocks:
+        if block.page in vision_pages:
+            continue
+        while upcoming is not None and upcoming.page < block.page:
+            merged.append(adopt(upcoming))
+            upcoming = next(pending, None)
+        if removed_parent:
+            relink(block)
+        merged.append(block)
+        if block.block_type in _HEADING_TYPES:
+            heading = block
+
+    while upcoming is not None:
+        merged.append(adopt(upcoming))
+        upcoming = next(pending, None)
+    return merged
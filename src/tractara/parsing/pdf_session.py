@@ -0,0 +1,243 @@
+"""PDF 세션 모듈: 인제스트 1회당 PDF를 한 번만 열고 페이지 디코딩 결과를 공유한다."""
+# src/tractara/parsing/pdf_session.py
+import logging
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pymupdf
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SpanTable:
+    """
+    문서 전체 텍스트 span의 컬럼형 테이블 (NumPy 배열).
+
+    행 하나가 span 하나에 대응한다.
+      - size:     폰트 크기 (pt, 원시값)
+      - flags:    PyMuPDF span flags (bit 4 = bold)
+      - bbox:     (n, 4) 배열 [x0, y0, x1, y1]
+      - page:     0-based 페이지 인덱스
+      - has_text: span 텍스트가 공백이 아닌지 여부
+    """
+
+    size: np.ndarray
+    flags: np.ndarray
+    bbox: np.ndarray
+    page: np.ndarray
+    has_text: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.size.shape[0])
+
+
+class PdfSession:
+    """
+    PDF 핸들 + 페이지별 text dict 메모이제이션 + 컬럼형 span 테이블.
+
+    ingest_single_document에서 한 번 생성해 모든 파서/추출기에 전달한다.
+    각 페이지는 get_text("dict")로 정확히 한 번만 디코딩되며,
+    평문 텍스트와 span 통계는 모두 이 dict에서 파생된다.
+
+    cache_pages=False이면 페이지 dict/텍스트를 보관하지 않는다 (스트리밍 파싱용).
+    이 경우 메모리는 페이지 수와 무관하게 평탄하지만 페이지를 다시 읽을 때마다
+    재디코딩한다. span 테이블 등 컬럼형 통계는 그대로 캐시된다.
+    """
+
+    def __init__(self, pdf_path: Path, cache_pages: bool = True):
+        self.path = Path(pdf_path)
+        self.doc = pymupdf.open(str(pdf_path))
+        self.cache_pages = cache_pages
+        self._page_dicts: Dict[int, Dict[str, Any]] = {}
+        self._page_texts: Dict[int, str] = {}
+        self._page_sizes: Dict[int, Tuple[float, float]] = {}
+        self._span_table: Optional[SpanTable] = None
+        self._body_font_size: Optional[float] = None
+
+    # ── 수명 관리 ──────────────────────────────────────────────────────────
+    def __enter__(self) -> "PdfSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.doc)
+
+    @property
+    def page_count(self) -> int:
+        """전체 페이지 수."""
+        return len(self.doc)
+
+    def close(self) -> None:
+        """PDF 핸들을 닫고 캐시를 해제한다."""
+        if self.doc is not None:
+            self.doc.close()
+            self.doc = None
+        self._page_dicts.clear()
+        self._page_texts.clear()
+
+    # ── 페이지 단위 접근 ───────────────────────────────────────────────────
+    def page(self, page_index: int) -> Any:
+        """0-based 인덱스의 pymupdf.Page를 반환한다 (렌더링/크롭 용도)."""
+        return self.doc[page_index]
+
+    def page_dict(self, page_index: int) -> Dict[str, Any]:
+        """페이지의 get_text("dict") 결과 (메모이제이션)."""
+        cached = self._page_dicts.get(page_index)
+        if cached is None:
+            page = self.doc[page_index]
+            cached = page.get_text("dict")
+            if self.cache_pages:
+                self._page_dicts[page_index] = cached
+            self._page_sizes.setdefault(page_index, (page.rect.width, page.rect.height))
+        return cached
+
+    def page_size(self, page_index: int) -> Tuple[float, float]:
+        """페이지 (width, height)."""
+        size = self._page_sizes.get(page_index)
+        if size is None:
+            rect = self.doc[page_index].rect
+            size = (rect.width, rect.height)
+            self._page_sizes[page_index] = size
+        return size
+
+    def page_text(self, page_index: int) -> str:
+        """
+        페이지 평문 텍스트. page_dict에서 파생하므로 추가 디코딩이 없다.
+        (라인은 span 연결, 블록/라인 사이는 줄바꿈)
+        """
+        cached = self._page_texts.get(page_index)
+        if cached is None:
+            lines: List[str] = []
+            for block in self.page_dict(page_index).get("blocks", []):
+                if block.get("type") != 0:
+                    continue
+                for line in block.get("lines", []):
+                    lines.append("".join(span["text"] for span in line["spans"]))
+            cached = "\n".join(lines)
+            if self.cache_pages:
+                self._page_texts[page_index] = cached
+        return cached
+
+    def iter_page_dicts(self):
+        """(page_index, page_dict) 를 페이지 순서대로 생성한다."""
+        for page_index in range(self.page_count):
+            yield page_index, self.page_dict(page_index)
+
+    def get_toc(self) -> List[Any]:
+        """PDF 북마크 [(level, title, page_no), ...]."""
+        return self.doc.get_toc()
+
+    # ── 문서 단위 통계 ─────────────────────────────────────────────────────
+    def span_table(self) -> SpanTable:
+        """전체 페이지 span을 컬럼형 테이블로 반환한다 (최초 1회 구성)."""
+        if self._span_table is not None:
+            return self._span_table
+
+        self._span_table = build_span_table(self.iter_page_dicts())
+        logger.debug("Span table built: %d spans", len(self._span_table))
+        return self._span_table
+
+    def body_font_size(self, default: float = 10.0) -> float:
+        """
+        본문 폰트 크기 추정: 텍스트가 있는 span의 폰트 크기(소수 1자리) 최빈값.
+        동률이면 문서에서 먼저 등장한 크기를 택한다 (Counter.most_common과 동일).
+        """
+        if self._body_font_size is not None:
+            return self._body_font_size
+
+        table = self.span_table()
+        self._body_font_size = estimate_body_font_size(
+            table.size[table.has_text], default
+        )
+        return self._body_font_size
+
+    def sample_body_font_size(self, max_pages: int, default: float = 10.0) -> float:
+        """
+        본문 폰트 크기를 최대 max_pages 페이지 표본으로 추정한다 (단독 메타데이터 추출용).
+        이미 계산된 값이나 span 테이블이 있거나, 문서가 짧거나, 모든 페이지 dict가
+        이미 캐시되어 있으면 (추가 디코딩 없이) 전체 기준 값을 쓴다.
+        표본 추정치는 캐시하지 않는다 (파서가 나중에 전체 기준 값을 계산할 수 있도록).
+        """
+        if (
+            self._body_font_size is not None
+            or self._span_table is not None
+            or self.page_count <= max_pages
+            or len(self._page_dicts) == self.page_count
+        ):
+            return self.body_font_size(default)
+
+        # 첫/마지막 페이지를 포함한 균등 간격 표본
+        indices = np.unique(
+            np.linspace(0, self.page_count - 1, max(max_pages, 2)).round().astype(int)
+        )
+        table = build_span_table((int(i), self.page_dict(int(i))) for i in indices)
+        return estimate_body_font_size(table.size[table.has_text], default)
+
+    def seed_body_font_size(self, body_font_size: float) -> None:
+        """외부(예: 병렬 샤드 파서)에서 이미 계산한 본문 폰트 크기를 주입한다."""
+        self._body_font_size = body_font_size
+
+
+def build_span_table(page_dicts: Iterable[Tuple[int, Dict[str, Any]]]) -> SpanTable:
+    """(page_index, page_dict) 시퀀스로부터 컬럼형 span 테이블을 구성한다."""
+    sizes: List[float] = []
+    flags: List[int] = []
+    bboxes: List[Tuple[float, float, float, float]] = []
+    pages: List[int] = []
+    has_text: List[bool] = []
+
+    for page_index, page_dict in page_dicts:
+        for block in page_dict.get("blocks", []):
+            if block.get("type") != 0:
+                continue
+            for line in block.get("lines", []):
+                for span in line["spans"]:
+                    sizes.append(span["size"])
+                    flags.append(span["flags"])
+                    bboxes.append(tuple(span["bbox"]))
+                    pages.append(page_index)
+                    has_text.append(bool(span["text"].strip()))
+
+    return SpanTable(
+        size=np.asarray(sizes, dtype=np.float64),
+        flags=np.asarray(flags, dtype=np.int64),
+        bbox=np.asarray(bboxes, dtype=np.float64).reshape(-1, 4),
+        page=np.asarray(pages, dtype=np.int32),
+        has_text=np.asarray(has_text, dtype=bool),
+    )
+
+
+def estimate_body_font_size(sizes: np.ndarray, default: float = 10.0) -> float:
+    """
+    폰트 크기 배열(문서 순서)의 소수 1자리 최빈값.
+    동률이면 먼저 등장한 크기를 택한다 (Counter.most_common과 동일).
+    """
+    rounded = np.round(np.asarray(sizes, dtype=np.float64), 1)
+    if rounded.size == 0:
+        return default
+
+    values, first_index, counts = np.unique(
+        rounded, return_index=True, return_counts=True
+    )
+    top = np.flatnonzero(counts == counts.max())
+    winner = top[np.argmin(first_index[top])]
+    return float(values[winner])
+
+
+def open_session(
+    pdf_path: Path, session: Optional[PdfSession] = None, cache_pages: bool = True
+) -> ContextManager[PdfSession]:
+    """
+    세션 스코프 헬퍼.
+    session이 주어지면 그대로 사용하고 닫지 않는다 (소유권은 호출자).
+    없으면 새 세션을 열고 with 블록 종료 시 닫는다 (cache_pages는 새 세션에만 적용).
+    """
+    if session is not None:
+        return nullcontext(session)
+    return PdfSession(pdf_path, cache_pages=cache_pages)
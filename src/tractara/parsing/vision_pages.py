@@ -0,0 +1,177 @@
+"""페이지 단위 Vision 파싱 지원: 페이지 렌더링 풀, 요청 속도 제한, 페이지 체크포인트."""
+# src/tractara/parsing/vision_pages.py
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pymupdf
+
+from .parse_cache import BASE_DIR, file_digest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = BASE_DIR / "data" / "cache" / "vision_pages"
+
+# 렌더링 워커 하나가 한 번에 처리하는 페이지 수
+_RENDER_CHUNK_PAGES = 4
+
+
+class RateLimiter:
+    """
+    분당 요청 수 제한 (최소 간격 방식, 스레드 안전).
+    acquire()는 다음 요청 슬롯까지 대기한다. requests_per_minute <= 0이면 제한 없음.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """다음 요청 슬롯을 예약하고 그 시각까지 대기한다."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def penalize(self, seconds: float) -> None:
+        """쿼터 초과 응답 후 모든 요청을 seconds만큼 뒤로 미룬다."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+class PageCheckpoint:
+    """
+    문서별 페이지 결과 체크포인트 (페이지당 JSON 파일, 원자적 쓰기).
+
+    디렉터리 키 = 파일 내용 SHA-256 + 파서 식별 정보이므로, 같은 PDF를 같은 설정으로
+    다시 파싱하면 완료된 페이지는 건너뛰고 중단된 지점부터 이어서 처리한다.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    @classmethod
+    def for_document(
+        cls, root: Path, pdf_path: Path, identity: str
+    ) -> "PageCheckpoint":
+        """PDF 내용 + identity(모델/프롬프트/DPI 등)로 체크포인트 디렉터리를 정한다."""
+        digest = file_digest(pdf_path)
+        return cls(Path(root) / f"{digest[:32]}-{identity}".replace("/", "_"))
+
+    def load_all(self) -> Dict[int, str]:
+        """완료된 페이지 {page_index: text}."""
+        pages: Dict[int, str] = {}
+        if not self.directory.is_dir():
+            return pages
+        for path in self.directory.glob("page-*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    payload = json.load(f)
+                pages[int(payload["page_index"])] = payload["text"]
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning("Dropping corrupted page checkpoint %s (%s)", path, e)
+                _unlink(path)
+        return pages
+
+    def save(self, page_index: int, text: str) -> None:
+        """페이지 결과를 저장한다 (임시 파일 + os.replace). 실패해도 예외를 던지지 않는다."""
+        path = self.directory / f"page-{page_index:06d}.json"
+        tmp_name: Optional[str] = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"page_index": page_index, "text": text}, f, ensure_ascii=False
+                )
+            os.replace(tmp_name, path)
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to write page checkpoint %s: %s", path, e)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        """문서 체크포인트를 삭제한다 (전체 페이지 완료 후)."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def render_page_png(page: "pymupdf.Page", dpi: int) -> bytes:  # type: ignore[name-defined]
+    """페이지 전체를 PNG로 렌더링한다."""
+    return page.get_pixmap(dpi=dpi).tobytes("png")
+
+
+def _render_page_chunk(
+    pdf_path: str, page_indices: List[int], dpi: int
+) -> List[Tuple[int, bytes]]:
+    """프로세스 풀 워커: 자체 문서 핸들로 페이지 묶음을 렌더링한다."""
+    with pymupdf.open(pdf_path) as doc:
+        return [(i, render_page_png(doc[i], dpi)) for i in page_indices]
+
+
+def iter_rendered_pages(
+    pdf_path: Path,
+    page_indices: Sequence[int],
+    dpi: int,
+    workers: int,
+    render_local: Optional[Callable[[int], bytes]] = None,
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    (page_index, png)를 page_indices 순서대로 생성한다.
+
+    workers > 1이면 프로세스 풀에서 _RENDER_CHUNK_PAGES 단위로 렌더링하되, 소비자보다
+    workers * 2 묶음 이상 앞서 나가지 않도록 제출 창을 제한한다 (PNG 메모리 상한).
+    그 외에는 render_local(page_index) 또는 직접 연 문서로 호출 스레드에서 렌더링한다.
+    """
+    if workers <= 1 or len(page_indices) <= _RENDER_CHUNK_PAGES:
+        if render_local is not None:
+            for i in page_indices:
+                yield i, render_local(i)
+            return
+        with pymupdf.open(str(pdf_path)) as doc:
+            for i in page_indices:
+                yield i, render_page_png(doc[i], dpi)
+        return
+
+    chunks = [
+        list(page_indices[i : i + _RENDER_CHUNK_PAGES])
+        for i in range(0, len(page_indices), _RENDER_CHUNK_PAGES)
+    ]
+    window: Deque[Future] = deque()
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        next_chunk = 0
+        while next_chunk < len(chunks) or window:
+            while next_chunk < len(chunks) and len(window) < workers * 2:
+                window.append(
+                    executor.submit(
+                        _render_page_chunk, str(pdf_path), chunks[next_chunk], dpi
+                    )
+                )
+                next_chunk += 1
+            yield from window.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _unlink(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
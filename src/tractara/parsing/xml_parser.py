@@ -1,22 +1,82 @@
 """XML 파싱 모듈 (JATS + S1000D)."""
 # src/tractara/parsing/xml_parser.py
 import logging
+import os
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from lxml import etree
 
 from tractara.catalogs import catalog_loader
+from tractara.catalogs.catalog_plan import ElementQuery
+from tractara.catalogs.transforms import TRANSFORM_REGISTRY
 
-from .models import ParsedBlock, ParsedDocument
+from .models import ContextPath, ParsedBlock, ParsedDocument, XmlSource
+from .parse_cache import get_parse_cache
 from .section_classifier import extract_section_label
+from .xml_paths import child_paths, element_path
 
 logger = logging.getLogger(__name__)
 
 
+# 매핑 코드(전략/변환) 버전: 출력이 바뀌는 수정 시 올려 parse_cache를 무효화한다
+XML_PARSER_VERSION = "1.1.0"
+
+_DMIDENT_QUERY = ElementQuery(".//dmIdent")
+
+
 def parse_xml(file_path: Path) -> ParsedDocument:
-    """XML 파일을 파싱하여 ParsedDocument로 변환합니다."""
+    """
+    XML 파일을 파싱하여 ParsedDocument로 변환합니다.
+    결과는 parse_cache(파일 내용 + 파서 버전 + 카탈로그 지문 키)에 저장/재사용됩니다.
+    새로 파싱한 결과는 xml_source(lxml 루트 + 감지된 카탈로그)를 함께 담는다.
+    캐시 적중 시에는 트리가 없으므로 메타데이터 추출이 파일을 한 번 파싱한다.
+    XML_STREAM_MIN_MB 이상인 파일은 iterparse 스트리밍 전략으로 파싱한다
+    (xml_stream.StreamingCatalogStrategy, xml_source에는 헤더만 남는다).
+    """
+    streaming = _use_streaming(file_path)
+    cache = get_parse_cache()
+    cache_key = None
+    if cache is not None:
+        options: Dict[str, Any] = {"catalogs": catalog_loader.catalog_fingerprint()}
+        if streaming:
+            options["streaming"] = True  # source_xpath 형식이 다르다
+        try:
+            cache_key = cache.make_key(
+                file_path, "parse_xml", XML_PARSER_VERSION, options
+            )
+        except OSError:
+            cache_key = None
+
+    if cache_key is not None:
+        cached = cache.get_document(cache_key)
+        if cached is not None:
+            logger.info("Parse cache hit: %s", file_path.name)
+            cached.source_path = str(file_path)
+            return cached
+
+    parsed = _parse_xml_uncached(file_path, streaming)
+    if cache_key is not None:
+        cache.put_document(cache_key, parsed)
+    return parsed
+
+
+def _use_streaming(file_path: Path) -> bool:
+    """XML_STREAM_MIN_MB(기본 256, 0 = 끔) 이상 크기의 파일은 스트리밍 파싱."""
+    min_mb = int(os.getenv("XML_STREAM_MIN_MB", "256"))
+    try:
+        return min_mb > 0 and file_path.stat().st_size >= min_mb * 1024 * 1024
+    except OSError:
+        return False
+
+
+def _parse_xml_uncached(file_path: Path, streaming: bool = False) -> ParsedDocument:
+    """캐시를 거치지 않고 XML을 파싱합니다 (카탈로그 감지 → 전략 선택)."""
+    if streaming:
+        parsed = _parse_xml_streaming(file_path)
+        if parsed is not None:
+            return parsed
     try:
         tree = etree.parse(str(file_path))  # pylint: disable=c-extension-no-member
         root = tree.getroot()
@@ -41,7 +101,39 @@ def parse_xml(file_path: Path) -> ParsedDocument:
             )
             parser = GenericXmlStrategy()
 
-        return parser.parse(root, str(file_path))
+        parsed = parser.parse(root, str(file_path))
+        # 메타데이터 추출이 같은 트리/카탈로그를 재사용하도록 보관 (캐시에는 저장되지 않음)
+        parsed.xml_source = XmlSource(root, catalog)
+        return parsed
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error("Failed to parse XML file %s: %s", file_path, e)
+        raise
+
+
+def _parse_xml_streaming(file_path: Path) -> Optional[ParsedDocument]:
+    """
+    루트 태그만 읽어 카탈로그를 감지하고 스트리밍 전략으로 파싱한다.
+    카탈로그가 없는 범용 XML은 None (전체 텍스트 한 블록이라 트리 방식과 차이 없음).
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from .xml_stream import StreamingCatalogStrategy
+
+    try:
+        # pylint: disable-next=c-extension-no-member
+        for _event, element in etree.iterparse(
+            str(file_path), events=("start",), huge_tree=True
+        ):
+            root_tag = element.tag
+            break
+        else:
+            return None
+        catalog = catalog_loader.detect_catalog(root_tag.lower())
+        if not catalog:
+            return None
+        logger.info(
+            "Streaming XML parse (%s): %s", catalog.get("format_id"), file_path.name
+        )
+        return StreamingCatalogStrategy(catalog).parse_file(file_path)
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.error("Failed to parse XML file %s: %s", file_path, e)
         raise
@@ -50,71 +142,116 @@ def parse_xml(file_path: Path) -> ParsedDocument:
 class CatalogDrivenStrategy:
     """YAML 카탈로그에 정의된 매핑 규칙에 따라 XML 구조를 파싱합니다."""
 
+    # source_xpath 형식: False = getpath() 호환, True = 전 단계 순번 (스트리밍)
+    index_all_paths = False
+
     def __init__(self, catalog: Dict[str, Any]):
         self.catalog = catalog
-        self.format_id = catalog.get("format_id", "unknown")
-        # Pre-process mappings for faster lookup Strategy logic
-        self.content_rules = {}
-        content_cfg = catalog.get("content", {})
-        self.traverse_strategy = content_cfg.get("traverse_strategy", "recursive")
-
-        for mapping in content_cfg.get("mappings", []):
-            tags = mapping.get("tag")
-            if isinstance(tags, str):
-                self.content_rules[tags.lower()] = mapping
-            elif isinstance(tags, list):
-                for t in tags:
-                    self.content_rules[t.lower()] = mapping
-
-    def _get_tracking_info(self, element: Any) -> Dict[str, Any]:
-        info = {
-            "source_xpath": None,
+        # 사전 컴파일된 실행 계획 (format_id별 캐시, YAML 변경 시 재컴파일)
+        self.plan = catalog_loader.get_catalog_plan(catalog)
+        self.format_id = self.plan.format_id
+        self.content_rules = self.plan.content_rules
+        self.traverse_strategy = self.plan.traverse_strategy
+        # (태그, @id) → 첫 요소. 문서마다 처음 조회할 때 한 번 만든다 (_find_by_id)
+        self._id_index: Optional[Dict[Tuple[str, str], Any]] = None
+
+    @staticmethod
+    def _get_tracking_info(element: Any, path: Optional[str]) -> Dict[str, Any]:
+        """
+        블록 추적 정보: 순회 중 만든 요소 경로(locator)와 태그 이름.
+        원본 XML 조각은 여기서 직렬화하지 않는다 — Fragment Store에 저장할 때
+        source_xpath로 요소를 찾아 한 번만 직렬화한다 (FileFragmentStore.put_tree).
+        """
+        return {
+            "source_xpath": path,
             "source_element_name": element.tag
-            if hasattr(element, "tag") and isinstance(element.tag, str)
+            if isinstance(element.tag, str)
             else None,
-            "xml_fragment": None,
         }
-        try:
-            if hasattr(element, "getroottree"):
-                info["source_xpath"] = element.getroottree().getpath(element)
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
-        try:
-            if info["source_element_name"]:
-                info[
-                    "xml_fragment"
-                ] = etree.tostring(  # pylint: disable=c-extension-no-member
-                    element, encoding="unicode"
-                )
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
-        return info
 
     def parse(self, root: Any, source_path: str) -> ParsedDocument:
-        blocks: List[ParsedBlock] = []
         relations: List[Dict[str, Any]] = []
+        blocks = list(self.iter_blocks(root, relations))
+
+        return ParsedDocument(
+            source_path=source_path,
+            blocks=blocks,
+            metadata={"parser": f"{self.format_id}_xml", "version": "1.0.0"},
+            relations=relations,
+        )
 
+    def iter_blocks(
+        self, root: Any, relations: Optional[List[Dict[str, Any]]] = None
+    ) -> Iterator[ParsedBlock]:
+        """
+        요소 단위로 블록을 하나씩 생성한다 (문서 순서).
+        relations가 주어지면 순회 중 발견한 관계를 그 리스트에 누적한다.
+        """
+        if relations is None:
+            relations = []
+        self._id_index = None
+
+        yield from self._header_blocks(root, relations)
+
+        # 본문 순회
+        if self.traverse_strategy == "jats_body":
+            body = root.find(".//body")
+            if body is not None:
+                yield from self._traverse_node(
+                    body,
+                    relations,
+                    parent_id=None,
+                    level=1,
+                    context_path=[],
+                    node_path=element_path(body),
+                )
+
+            # 참조 처리 (JATS 특화 부분 - 현재는 하드코딩 유지, 추후 카탈로그 확장 가능)
+            ref_list = root.find(".//ref-list")
+            if ref_list is not None:
+                yield self._references_block(ref_list, relations)
+        else:  # default recursive (like S1000D)
+            content = root.find(".//content")
+            if content is not None:
+                rqmts_el = content.find(".//procedure/preliminaryRqmts")
+                if rqmts_el is not None:
+                    yield self._rqmts_block(rqmts_el, element_path(rqmts_el))
+                yield from self._traverse_node(
+                    content,
+                    relations,
+                    parent_id=None,
+                    level=1,
+                    context_path=[],
+                    node_path=element_path(content),
+                )
+                rqmts_el = content.find(".//procedure/closeRqmts")
+                if rqmts_el is not None:
+                    yield self._rqmts_block(rqmts_el, element_path(rqmts_el))
+
+    def _header_blocks(
+        self, root: Any, relations: List[Dict[str, Any]]
+    ) -> Iterator[ParsedBlock]:
+        """제목 블록 + 카탈로그 relations (본문 순회 전에 한 번)."""
         # (Title is extracted during metadata parsing, but for block generation we might want it here if specified)
         # For backward compatibility with tests/existing logic, we leave title block generation as a special case or
         # let metadata extractor handle it. Both JATS and S1000D previously created a title block here.
         # Let's extract title using the metadata rules just for the title block if possible, or fallback.
-        from tractara.catalogs.transforms import TRANSFORM_REGISTRY
+        bound = self.plan.bind(root)
 
         # 문서 제목 추출 (Block용)
         title_text = ""
-        meta_cfg = self.catalog.get("metadata", {})
-        title_cfg = meta_cfg.get("dc_title", {})
-        if "xpath" in title_cfg:
-            main_el = root.find(title_cfg["xpath"])
+        title_rule = self.plan.title_rule
+        if title_rule is not None:
+            main_el = bound.first(title_rule)
             text_val = (
                 "".join(main_el.itertext()).strip() if main_el is not None else ""
             )
-            if "combine_with" in title_cfg:
-                other_el = root.find(title_cfg["combine_with"])
+            if title_rule.combine_with is not None:
+                other_el = bound.first(title_rule.combine_with)
                 other_val = (
                     "".join(other_el.itertext()).strip() if other_el is not None else ""
                 )
-                sep = title_cfg.get("separator", " ")
+                sep = title_rule.options.get("separator", " ")
                 if text_val and other_val:
                     title_text = f"{text_val}{sep}{other_val}"
                 else:
@@ -124,40 +261,26 @@ class CatalogDrivenStrategy:
 
         dmcode_fields: Any = {}
         if self.format_id == "s1000d":
-            dmc_func = TRANSFORM_REGISTRY.get("dmc_raw_fields")
-            dmcode_el = root.find(".//dmIdent")
-            if dmcode_el is not None and dmc_func:
-                dmcode_fields = dmc_func(dmcode_el)
+            dmcode_el = _DMIDENT_QUERY.first(root)
+            if dmcode_el is not None:
+                dmcode_fields = TRANSFORM_REGISTRY["dmc_raw_fields"](dmcode_el)
 
         if title_text or dmcode_fields:
             sc = {"s1000d_dmCode": dmcode_fields} if dmcode_fields else None
-            blocks.append(
-                ParsedBlock(
-                    page=1,
-                    block_type="title",
-                    text=title_text or "Untitled",
-                    level=0,
-                    block_id=str(uuid.uuid4()),
-                    structured_content=sc,
-                )
+            yield ParsedBlock(
+                page=1,
+                block_type="title",
+                text=title_text or "Untitled",
+                level=0,
+                block_id=str(uuid.uuid4()),
+                structured_content=sc,
             )
 
         # Extract relations from catalog
-        for rule in self.catalog.get("relations", []):
-            xpath = rule.get("xpath")
-            if not xpath:
-                continue
-            elements = root.findall(xpath)
-            if not elements:
-                continue
-
-            transform_name = rule.get("transform")
-            relation_type = rule.get("relation_type", "RELATED_TO")
-
-            for el in elements:
-                val = None
-                if transform_name and transform_name in TRANSFORM_REGISTRY:
-                    val = TRANSFORM_REGISTRY[transform_name](el)
+        for rule in self.plan.relations:
+            for el in rule.query.all(root):
+                if rule.transform is not None:
+                    val = rule.transform(el)
                 else:
                     val = "".join(el.itertext()).strip()
 
@@ -165,228 +288,240 @@ class CatalogDrivenStrategy:
                     relations.append(
                         {
                             "sourceBlockId": None,
-                            "relationType": relation_type,
+                            "relationType": rule.relation_type,
                             "target": val,
                             "confidence": 1.0,
                         }
                     )
 
-        # 본문 순회
-        if self.traverse_strategy == "jats_body":
-            body = root.find(".//body")
-            if body is not None:
-                self._traverse_node(
-                    body, blocks, relations, parent_id=None, level=1, context_path=[]
-                )
-
-            # 참조 처리 (JATS 특화 부분 - 현재는 하드코딩 유지, 추후 카탈로그 확장 가능)
-            ref_list = root.find(".//ref-list")
-            if ref_list is not None:
-                ref_block = ParsedBlock(
-                    page=1,
-                    block_type="section",
-                    text="References",
-                    level=1,
-                    block_id=str(uuid.uuid4()),
-                )
-                blocks.append(ref_block)
-                for ref in ref_list.findall(".//ref"):
-                    ref_id = ref.get("id", "")
-                    ref_text = "".join(ref.itertext()).strip()
-                    relations.append(
-                        {
-                            "sourceBlockId": None,
-                            "relationType": "CITES",
-                            "target": f"#{ref_id}",
-                            "citationText": ref_text,
-                            "confidence": 1.0,
-                        }
-                    )
-        else:  # default recursive (like S1000D)
-            content = root.find(".//content")
-            if content is not None:
-                rqmts_tag = "preliminaryRqmts"
-                rqmts_el = content.find(f".//procedure/{rqmts_tag}")
-                if rqmts_el is not None:
-                    structured = self._parse_rqmts(rqmts_el)
-                    blocks.append(
-                        ParsedBlock(
-                            page=1,
-                            block_type="section",
-                            text=rqmts_tag,
-                            level=1,
-                            block_id=str(uuid.uuid4()),
-                            structured_content=structured,
-                            **self._get_tracking_info(rqmts_el),
-                        )
-                    )
-                self._traverse_node(
-                    content, blocks, relations, parent_id=None, level=1, context_path=[]
-                )
-                rqmts_tag = "closeRqmts"
-                rqmts_el = content.find(f".//procedure/{rqmts_tag}")
-                if rqmts_el is not None:
-                    structured = self._parse_rqmts(rqmts_el)
-                    blocks.append(
-                        ParsedBlock(
-                            page=1,
-                            block_type="section",
-                            text=rqmts_tag,
-                            level=1,
-                            block_id=str(uuid.uuid4()),
-                            structured_content=structured,
-                            **self._get_tracking_info(rqmts_el),
-                        )
-                    )
+    def _find_by_id(self, element: Any, tag: str, id_value: str) -> Any:
+        """
+        element가 속한 문서에서 .//tag[@id='id_value']의 첫 요소 (없으면 None).
+        단계마다 문서 전체를 훑지 않도록 @id 색인을 문서당 한 번 만들어 재사용한다.
+        """
+        if self._id_index is None:
+            index: Dict[Tuple[str, str], Any] = {}
+            root = element.getroottree().getroot()
+            for el in root.iterfind(".//*[@id]"):
+                index.setdefault((el.tag, el.get("id")), el)
+            self._id_index = index
+        return self._id_index.get((tag, id_value))
+
+    @staticmethod
+    def _spaced_text(element: Any) -> str:
+        """하위 텍스트 조각을 strip해 공백 하나로 잇는다 (절차 단계 본문 형식)."""
+        return " ".join(part for part in map(str.strip, element.itertext()) if part)
+
+    @staticmethod
+    def _references_block(ref_list: Any, relations: List[Dict]) -> ParsedBlock:
+        """JATS ref-list → "References" 섹션 블록 (각 ref는 CITES 관계로 누적)."""
+        for ref in ref_list.findall(".//ref"):
+            ref_id = ref.get("id", "")
+            ref_text = "".join(ref.itertext()).strip()
+            relations.append(
+                {
+                    "sourceBlockId": None,
+                    "relationType": "CITES",
+                    "target": f"#{ref_id}",
+                    "citationText": ref_text,
+                    "confidence": 1.0,
+                }
+            )
+        return ParsedBlock(
+            page=1,
+            block_type="section",
+            text="References",
+            level=1,
+            block_id=str(uuid.uuid4()),
+        )
 
-        return ParsedDocument(
-            source_path=source_path,
-            blocks=blocks,
-            metadata={"parser": f"{self.format_id}_xml", "version": "1.0.0"},
-            relations=relations,
+    def _rqmts_block(self, rqmts_el: Any, path: str) -> ParsedBlock:
+        """S1000D preliminaryRqmts/closeRqmts → 조건 요약 섹션 블록."""
+        return ParsedBlock(
+            page=1,
+            block_type="section",
+            text=rqmts_el.tag,
+            level=1,
+            block_id=str(uuid.uuid4()),
+            structured_content=self._parse_rqmts(rqmts_el),
+            **self._get_tracking_info(rqmts_el, path),
         )
 
     def _traverse_node(
         self,
         element: Any,
-        blocks: List[ParsedBlock],
         relations: List[Dict],
         parent_id: Optional[str],
         level: int,
-        context_path: List[str],
-    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-branches,too-many-statements
-        """요소 트리를 순회하며 블록을 생성합니다."""
-        current_context = list(context_path)
-
-        for child in element:
-            if not isinstance(child.tag, str):
-                continue
+        context_path: Sequence[str],
+        node_path: str,
+    ) -> Iterator[
+        ParsedBlock
+    ]:  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """요소 트리를 순회하며 블록을 생성합니다 (생성기). node_path는 element의 절대 경로."""
+        current_context = ContextPath.of(context_path)
+
+        for child, child_path in child_paths(element, node_path, self.index_all_paths):
             tag = child.tag.lower()
             rule = self.content_rules.get(tag)
 
-            if rule:
-                block_type = (
-                    tag
-                    if rule.get("block_type_from_tag")
-                    else rule.get("block_type", "paragraph")
-                )
-
-                if block_type == "section":
-                    # Title extraction
-                    title_child_tag = rule.get("title_child", "title")
-                    title_el = child.find(title_child_tag) if title_child_tag else None
-                    sec_title = (
-                        "".join(title_el.itertext()).strip()
-                        if title_el is not None
-                        else "Untitled Section"
-                    )
-
-                    label, title = extract_section_label(sec_title)
-                    block_id = str(uuid.uuid4())
-
-                    sec_block = ParsedBlock(
-                        page=1,
-                        block_type="section",
-                        text=sec_title,
-                        level=level,
+            if rule is None:
+                # Rule not found, recursively traverse if not a leaf node with text (or depending on strategy)
+                if len(child) > 0:
+                    yield from self._traverse_node(
+                        child,
+                        relations,
                         parent_id=parent_id,
+                        level=level,
                         context_path=current_context,
-                        section_label=label,
-                        section_title=title or sec_title,
-                        block_id=block_id,
-                        **self._get_tracking_info(child),
+                        node_path=child_path,
                     )
-                    blocks.append(sec_block)
+            elif self._block_type(rule, tag) == "section":
+                sec_block = self._section_block(
+                    child, child_path, rule, parent_id, level, current_context
+                )
+                yield sec_block
+                yield from self._traverse_node(
+                    child,
+                    relations,
+                    parent_id=sec_block.block_id,
+                    level=level + 1,
+                    context_path=current_context.child(sec_block.text),
+                    node_path=child_path,
+                )
+            else:
+                yield from self._mapped_blocks(
+                    child,
+                    child_path,
+                    rule,
+                    relations,
+                    parent_id,
+                    level,
+                    current_context,
+                )
 
-                    new_context = current_context + [sec_title]
-                    self._traverse_node(
-                        child,
-                        blocks,
-                        relations,
-                        parent_id=block_id,
-                        level=level + 1,
-                        context_path=new_context,
-                    )
+    @staticmethod
+    def _block_type(rule: Dict[str, Any], tag: str) -> str:
+        return (
+            tag
+            if rule.get("block_type_from_tag")
+            else rule.get("block_type", "paragraph")
+        )
 
-                elif block_type in ("paragraph", "note", "warning", "caution"):
-                    text = "".join(child.itertext()).strip()
-                    if not text:
-                        continue
+    def _section_block(
+        self,
+        element: Any,
+        path: str,
+        rule: Dict[str, Any],
+        parent_id: Optional[str],
+        level: int,
+        context_path: ContextPath,
+    ) -> (
+        ParsedBlock
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """섹션 요소 → 섹션 블록 (제목은 title_child 자식 요소)."""
+        # Title extraction
+        title_child_tag = rule.get("title_child", "title")
+        title_el = element.find(title_child_tag) if title_child_tag else None
+        sec_title = (
+            "".join(title_el.itertext()).strip()
+            if title_el is not None
+            else "Untitled Section"
+        )
 
-                    prefix = rule.get("prefix", "")
-                    if "prefix_template" in rule:
-                        prefix = rule["prefix_template"].format(TAG=tag.upper()) + " "
+        label, title = extract_section_label(sec_title)
+        return ParsedBlock(
+            page=1,
+            block_type="section",
+            text=sec_title,
+            level=level,
+            parent_id=parent_id,
+            context_path=context_path,
+            section_label=label,
+            section_title=title or sec_title,
+            block_id=str(uuid.uuid4()),
+            **self._get_tracking_info(element, path),
+        )
 
-                    block_id = str(uuid.uuid4())
+    def _mapped_blocks(
+        self,
+        child: Any,
+        child_path: str,
+        rule: Dict[str, Any],
+        relations: List[Dict],
+        parent_id: Optional[str],
+        level: int,
+        current_context: ContextPath,
+    ) -> Iterator[
+        ParsedBlock
+    ]:  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """섹션이 아닌 매핑 요소 하나 → 블록들 (하위 트리는 이 요소가 소비한다)."""
+        tag = child.tag.lower()
+        block_type = self._block_type(rule, tag)
+
+        if block_type in ("paragraph", "note", "warning", "caution"):
+            text = "".join(child.itertext()).strip()
+            if not text:
+                return
+
+            prefix = rule.get("prefix", "")
+            if "prefix_template" in rule:
+                prefix = rule["prefix_template"].format(TAG=tag.upper()) + " "
+
+            block_id = str(uuid.uuid4())
+
+            yield ParsedBlock(
+                page=1,
+                block_type=block_type,
+                text=f"{prefix}{text}",
+                parent_id=parent_id,
+                context_path=current_context,
+                block_id=block_id,
+                **self._get_tracking_info(child, child_path),
+            )
 
-                    blocks.append(
-                        ParsedBlock(
-                            page=1,
-                            block_type=block_type,
-                            text=f"{prefix}{text}",
-                            parent_id=parent_id,
-                            context_path=current_context,
-                            block_id=block_id,
-                            **self._get_tracking_info(child),
-                        )
+            # JATS style xref handling
+            for xref in child.findall(".//xref"):
+                ref_id = xref.get("rid")
+                ref_type = xref.get("ref-type")
+                if ref_id and ref_type == "bibr":
+                    relations.append(
+                        {
+                            "sourceBlockId": block_id,
+                            "relationType": "CITES",
+                            "target": f"#{ref_id}",
+                            "citationText": xref.text or "",
+                            "confidence": 0.9,
+                        }
                     )
 
-                    # JATS style xref handling
-                    for xref in child.findall(".//xref"):
-                        ref_id = xref.get("rid")
-                        ref_type = xref.get("ref-type")
-                        if ref_id and ref_type == "bibr":
-                            relations.append(
-                                {
-                                    "sourceBlockId": block_id,
-                                    "relationType": "CITES",
-                                    "target": f"#{ref_id}",
-                                    "citationText": xref.text or "",
-                                    "confidence": 0.9,
-                                }
-                            )
-
-                elif block_type == "procedureStep":
-                    self._parse_procedural_step(
-                        child, blocks, relations, parent_id, current_context, level
-                    )
+        elif block_type == "procedureStep":
+            yield from self._parse_procedural_step(
+                child, child_path, parent_id, current_context, level
+            )
 
-                elif block_type in ("table", "equation"):
-                    text = "".join(child.itertext()).strip()
-                    eq_data = {"latex": text} if block_type == "equation" else None
-                    blocks.append(
-                        ParsedBlock(
-                            page=1,
-                            block_type=block_type,
-                            text=text,
-                            parent_id=parent_id,
-                            context_path=current_context,
-                            block_id=str(uuid.uuid4()),
-                            equation_data=eq_data,
-                            **self._get_tracking_info(child),
-                        )
-                    )
-            else:
-                # Rule not found, recursively traverse if not a leaf node with text (or depending on strategy)
-                if len(child) > 0:
-                    self._traverse_node(
-                        child,
-                        blocks,
-                        relations,
-                        parent_id=parent_id,
-                        level=level,
-                        context_path=current_context,
-                    )
+        elif block_type in ("table", "equation"):
+            text = "".join(child.itertext()).strip()
+            eq_data = {"latex": text} if block_type == "equation" else None
+            yield ParsedBlock(
+                page=1,
+                block_type=block_type,
+                text=text,
+                parent_id=parent_id,
+                context_path=current_context,
+                block_id=str(uuid.uuid4()),
+                equation_data=eq_data,
+                **self._get_tracking_info(child, child_path),
+            )
 
     def _parse_procedural_step(
         self,
         step_el: Any,
-        list_of_blocks: List[ParsedBlock],
-        relations: List[Dict],
+        step_path: str,
         parent_id: Optional[str],
-        context_path: List[str],
+        context_path: Sequence[str],
         level: int,
-    ):
+    ) -> Iterator[ParsedBlock]:
         # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-branches,too-many-statements
         """절차 단계 파싱 (S1000D 특화 로직 유지, 중첩 및 분리 파싱)"""
         text_parts = []
@@ -400,13 +535,11 @@ class CatalogDrivenStrategy:
         nested_steps = []
         notes = []
 
-        for child in step_el:
-            if not isinstance(child.tag, str):
-                continue
+        for child, child_path in child_paths(step_el, step_path, self.index_all_paths):
             tag = child.tag.lower()
 
             if tag == "note":
-                note_text = " ".join([t.strip() for t in child.itertext() if t.strip()])
+                note_text = self._spaced_text(child)
                 if note_text:
                     notes.append(
                         ParsedBlock(
@@ -416,11 +549,11 @@ class CatalogDrivenStrategy:
                             parent_id=step_id,
                             context_path=context_path,
                             block_id=str(uuid.uuid4()),
-                            **self._get_tracking_info(child),
+                            **self._get_tracking_info(child, child_path),
                         )
                     )
             elif tag in ("warning", "caution"):
-                warn_text = " ".join([t.strip() for t in child.itertext() if t.strip()])
+                warn_text = self._spaced_text(child)
                 if warn_text:
                     notes.append(
                         ParsedBlock(
@@ -430,17 +563,15 @@ class CatalogDrivenStrategy:
                             parent_id=step_id,
                             context_path=context_path,
                             block_id=str(uuid.uuid4()),
-                            **self._get_tracking_info(child),
+                            **self._get_tracking_info(child, child_path),
                         )
                     )
             elif tag == "proceduralstep":
-                nested_steps.append(child)
+                nested_steps.append((child, child_path))
             elif tag == "para":
-                text_parts.append(
-                    " ".join([t.strip() for t in child.itertext() if t.strip()])
-                )
+                text_parts.append(self._spaced_text(child))
             elif tag == "reqcondno":
-                text = " ".join([t.strip() for t in child.itertext() if t.strip()])
+                text = self._spaced_text(child)
                 structured_content["conditions"].append(
                     {
                         "type": "required_condition",
@@ -449,7 +580,7 @@ class CatalogDrivenStrategy:
                     }
                 )
             elif tag == "supportequipdescr":
-                text = " ".join([t.strip() for t in child.itertext() if t.strip()])
+                text = self._spaced_text(child)
                 structured_content["conditions"].append(
                     {"type": "support_equipment", "description": text}
                 )
@@ -469,30 +600,18 @@ class CatalogDrivenStrategy:
                     )
                     text_parts.append(f"Torque: {val} {unit}")
             else:
-                text_parts.append(
-                    " ".join([t.strip() for t in child.itertext() if t.strip()])
-                )
-
-        list_of_blocks.extend(notes)
+                text_parts.append(self._spaced_text(child))
 
         full_text = " ".join([p for p in text_parts if p]).strip()
 
         applic_ref = step_el.get("applicRefId")
         if applic_ref:
             structured_content["applicRefId"] = applic_ref
-            root = (
-                step_el.getroottree().getroot()
-                if hasattr(step_el, "getroottree")
-                else None
-            )
-            if root is not None:
-                applic_el = root.find(f".//applic[@id='{applic_ref}']")
-                if applic_el is not None:
-                    from tractara.catalogs.transforms import TRANSFORM_REGISTRY
-
-                    applic_func = TRANSFORM_REGISTRY.get("applic_tree")
-                    if applic_func:
-                        structured_content["applicTree"] = applic_func(applic_el)
+            applic_el = self._find_by_id(step_el, "applic", applic_ref)
+            if applic_el is not None:
+                applic_func = TRANSFORM_REGISTRY.get("applic_tree")
+                if applic_func:
+                    structured_content["applicTree"] = applic_func(applic_el)
 
         has_substance = (
             bool(full_text)
@@ -503,6 +622,12 @@ class CatalogDrivenStrategy:
         )
 
         # Only create step block if it has substantial content or nested steps
+        if not has_substance:
+            # Empty shell -> attach notes directly to parent
+            for n in notes:
+                n.parent_id = parent_id
+        yield from notes
+
         if has_substance:
             step_block = ParsedBlock(
                 page=1,
@@ -512,19 +637,14 @@ class CatalogDrivenStrategy:
                 context_path=context_path,
                 block_id=step_id,
                 level=level,
-                **self._get_tracking_info(step_el),
+                **self._get_tracking_info(step_el, step_path),
             )
             step_block.structured_content = structured_content
+            yield step_block
 
-            list_of_blocks.append(step_block)
-        else:
-            # Empty shell -> attach notes directly to parent
-            for n in notes:
-                n.parent_id = parent_id
-
-        for ns in nested_steps:
-            self._parse_procedural_step(
-                ns, list_of_blocks, relations, step_id, context_path, level + 1
+        for nested_el, nested_path in nested_steps:
+            yield from self._parse_procedural_step(
+                nested_el, nested_path, step_id, context_path, level + 1
             )
 
     def _parse_rqmts(self, el: Any) -> Dict[str, List]:
@@ -0,0 +1,113 @@
+"""XML 요소 경로(locator): 트리 순회용 getpath() 호환 경로 + 스트리밍용 전 단계 순번 경로."""
+# src/tractara/parsing/xml_paths.py
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+def child_paths(
+    parent: Any, parent_path: str, index_all: bool = False
+) -> Iterator[Tuple[Any, str]]:
+    """
+    parent의 자식 요소와 그 절대 경로 (getroottree().getpath()와 같은 문자열).
+
+    getpath()는 요소마다 형제를 처음부터 훑어 위치를 세므로 형제가 많은 목록에서
+    블록 수의 제곱에 비례한다. 여기서는 부모 경로에 태그와 형제 순번을 이어 붙인다.
+    네임스페이스 요소는 접두어 표기 규칙이 복잡해 getpath()로 위임한다.
+    index_all=True이면 StreamPaths와 같은 전 단계 순번 형식을 쓴다.
+    주석/처리 명령 노드는 건너뛴다.
+    """
+    children = [child for child in parent if isinstance(child.tag, str)]
+    if index_all:
+        counts: Dict[str, int] = {}
+        for position, child in enumerate(children, start=1):
+            tag = child.tag
+            if tag[0] == "{":
+                yield child, f"{parent_path}/*[{position}]"
+            else:
+                counts[tag] = counts.get(tag, 0) + 1
+                yield child, f"{parent_path}/{tag}[{counts[tag]}]"
+        return
+
+    totals = Counter(child.tag for child in children)
+    seen: Dict[str, int] = {}
+    tree = None
+    for child in children:
+        tag = child.tag
+        if tag[0] == "{":
+            if tree is None:
+                tree = parent.getroottree()
+            yield child, tree.getpath(child)
+            continue
+        if totals[tag] > 1:
+            seen[tag] = seen.get(tag, 0) + 1
+            yield child, f"{parent_path}/{tag}[{seen[tag]}]"
+        else:
+            yield child, f"{parent_path}/{tag}"
+
+
+def element_path(element: Any) -> str:
+    """순회 시작점 요소 하나의 절대 경로."""
+    return element.getroottree().getpath(element)
+
+
+def locate_elements(root: Any, paths: Iterable[str]) -> Dict[str, Any]:
+    """
+    절대 경로 → 요소 (child_paths와 같은 규칙으로 트리를 한 번 내려가며 찾는다).
+    찾는 경로의 조상 경로로만 내려가므로 관련 없는 하위 트리는 방문하지 않는다.
+    """
+    wanted = set(paths)
+    prefixes = set()
+    for path in wanted:
+        cut = path.rfind("/")
+        while cut > 0:
+            prefix = path[:cut]
+            if prefix in prefixes:
+                break
+            prefixes.add(prefix)
+            cut = path.rfind("/", 0, cut)
+
+    found: Dict[str, Any] = {}
+    root_path = element_path(root)
+    if root_path in wanted:
+        found[root_path] = root
+    stack = [(root, root_path)] if root_path in prefixes else []
+    while stack:
+        parent, parent_path = stack.pop()
+        for child, path in child_paths(parent, parent_path):
+            if path in wanted:
+                found[path] = child
+            if path in prefixes:
+                stack.append((child, path))
+    return found
+
+
+class StreamPaths:
+    """
+    iterparse 순회용 경로 (start/end 이벤트마다 start()/end() 호출).
+
+    스트리밍 중에는 뒤따르는 같은 태그 형제가 있는지 알 수 없으므로 모든 단계에 순번을
+    붙인다 ("/dmodule[1]/content[1]/para[3]"). getpath()와 문자열은 다르지만 같은 요소를
+    가리키는 XPath다. 네임스페이스 요소는 "*[n]" (n번째 자식 요소).
+    """
+
+    __slots__ = ("_stack",)
+
+    def __init__(self) -> None:
+        # 단계별 [경로, 태그별 자식 수, 자식 요소 수]
+        self._stack: List[List[Any]] = [["", {}, 0]]
+
+    def start(self, tag: str) -> str:
+        frame = self._stack[-1]
+        frame[2] += 1
+        if tag[0] == "{":
+            step = f"*[{frame[2]}]"
+        else:
+            counts = frame[1]
+            counts[tag] = counts.get(tag, 0) + 1
+            step = f"{tag}[{counts[tag]}]"
+        path = f"{frame[0]}/{step}"
+        self._stack.append([path, {}, 0])
+        return path
+
+    def end(self) -> None:
+        self._stack.pop()
@@ -0,0 +1,295 @@
+"""대용량 XML 스트리밍 파싱: iterparse로 카탈로그 content.mappings를 점진 적용."""
+# src/tractara/parsing/xml_stream.py
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+from .models import (
+    EMPTY_CONTEXT_PATH,
+    ContextPath,
+    ParsedBlock,
+    ParsedDocument,
+    XmlSource,
+)
+from .xml_parser import CatalogDrivenStrategy
+from .xml_paths import StreamPaths
+
+logger = logging.getLogger(__name__)
+
+# 프레임 종류
+_OUTSIDE = 0  # 본문 컨테이너 밖 (헤더, JATS back 등)
+_CONTAINER = 1  # 본문 컨테이너 (S1000D content / JATS body)
+_TRANSPARENT = 2  # 매핑 없는 본문 요소: 자식으로 순회 계속
+_SECTION = 3  # 섹션 매핑 요소
+_TITLE = 4  # 미확정 섹션의 첫 자식 제목 요소 (닫힐 때 섹션 블록 확정)
+_LEAF = 5  # 섹션이 아닌 매핑 요소: 닫힐 때 하위 트리 전체로 블록 생성
+_INNER = 6  # 리프/제목/통째 처리 섹션의 하위: 상위 요소가 처리한다
+
+_RQMTS_TAGS = ("preliminaryRqmts", "closeRqmts")
+
+_ChildParams = Tuple[Optional[str], int, ContextPath]
+
+
+@dataclass(slots=True)
+class _Frame:  # pylint: disable=too-many-instance-attributes
+    """열린 요소 하나의 순회 상태."""
+
+    element: Any
+    path: str
+    kind: int
+    rule: Optional[Dict[str, Any]] = None
+    # 이 요소가 블록이 될 때의 부모 id / 수준 / 문맥
+    parent_id: Optional[str] = None
+    level: int = 1
+    context: ContextPath = EMPTY_CONTEXT_PATH
+    # 자식에게 물려줄 (부모 id, 수준, 문맥) — 섹션은 제목 확정 후 채운다
+    child_params: Optional[_ChildParams] = None
+    clear: bool = False  # 닫히고 처리한 뒤 비운다
+    held: bool = False  # 하위 트리를 이 영역이 닫힐 때까지 보존 (rqmts, ref-list)
+    capture: bool = False  # 제목보다 다른 자식이 먼저 나온 섹션: 닫힐 때 통째 처리
+    rqmts: Optional[str] = None
+    refs: bool = False
+
+
+class StreamingCatalogStrategy(CatalogDrivenStrategy):
+    """
+    iterparse 기반 CatalogDrivenStrategy. 매핑 요소가 닫힐 때 블록을 만들고 처리한
+    요소를 비워, 최대 메모리가 문서 크기가 아니라 가장 큰 블록 하나에 비례한다.
+
+    - 헤더(본문 컨테이너 앞부분)는 컨테이너가 열릴 때 이미 완성되어 있으므로 그때
+      제목 블록/relations를 만들고, 비우지 않고 남겨 메타데이터 추출이 재사용한다.
+    - 섹션 블록은 첫 자식인 제목 요소가 닫힐 때 만든다. 다른 자식이 제목보다 먼저
+      나오는 섹션은 닫힐 때 트리 방식으로 통째 처리한다.
+    - 블록 내용·순서는 트리 방식과 같다. 차이: source_xpath는 StreamPaths 형식이고,
+      preliminaryRqmts 블록은 본문 맨 앞이 아니라 문서상 위치에 나온다.
+    """
+
+    index_all_paths = True
+
+    def __init__(self, catalog: Dict[str, Any]):
+        super().__init__(catalog)
+        self.root: Any = None
+        self._container_tag = (
+            "body" if self.traverse_strategy == "jats_body" else "content"
+        )
+        self._container_state = 0  # 0: 이전, 1: 안, 2: 이후
+        self._rqmts_seen: set = set()
+        self._refs_seen = False
+        self._rqmts_buffer: Optional[List[ParsedBlock]] = None
+        self._container_end: List[ParsedBlock] = []
+        self._doc_end: List[ParsedBlock] = []
+        self._doc_end_relations: List[Dict[str, Any]] = []
+
+    def parse_file(self, file_path: Path) -> ParsedDocument:
+        """XML 파일을 스트리밍 파싱한다 (xml_source는 헤더만 남은 트리)."""
+        relations: List[Dict[str, Any]] = []
+        blocks = list(self.iter_file_blocks(file_path, relations))
+        return ParsedDocument(
+            source_path=str(file_path),
+            blocks=blocks,
+            metadata={
+                "parser": f"{self.format_id}_xml",
+                "version": "1.0.0",
+                "xmlStreaming": True,
+            },
+            relations=relations,
+            xml_source=XmlSource(self.root, self.catalog),
+        )
+
+    def iter_file_blocks(
+        self, file_path: Path, relations: Optional[List[Dict[str, Any]]] = None
+    ) -> Iterator[ParsedBlock]:
+        """파일을 한 번 읽으며 블록을 문서 순서로 생성한다 (인스턴스당 한 번)."""
+        if relations is None:
+            relations = []
+        paths = StreamPaths()
+        frames: List[_Frame] = []
+        header_done = False
+
+        # pylint: disable-next=c-extension-no-member
+        events = etree.iterparse(
+            str(file_path), events=("start", "end"), huge_tree=True
+        )
+        for event, element in events:
+            if event == "start":
+                frame = self._open(
+                    element, paths.start(element.tag), frames[-1] if frames else None
+                )
+                frames.append(frame)
+                if frame.kind == _CONTAINER:
+                    header_done = True
+                    yield from self._header_blocks(self.root, relations)
+                elif frame.kind == _SECTION and not frame.rule.get(
+                    "title_child", "title"
+                ):
+                    yield from self._emit([self._resolve_section(frame)])
+            else:
+                paths.end()
+                frame = frames.pop()
+                yield from self._emit(
+                    self._close(frame, frames[-1] if frames else None, relations)
+                )
+
+        if not header_done and self.root is not None:
+            yield from self._header_blocks(self.root, relations)
+        yield from self._doc_end
+        relations.extend(self._doc_end_relations)
+
+    def _emit(self, blocks: Iterable[ParsedBlock]) -> Iterator[ParsedBlock]:
+        """preliminaryRqmts 안에서 만든 블록은 rqmts 블록 뒤로 미룬다."""
+        for block in blocks:
+            if self._rqmts_buffer is not None:
+                self._rqmts_buffer.append(block)
+            else:
+                yield block
+
+    def _open(self, element: Any, path: str, parent: Optional[_Frame]) -> _Frame:
+        if parent is None:
+            self.root = element
+            return _Frame(element, path, _OUTSIDE)
+
+        frame = self._classify(element, path, parent)
+        tag = element.tag
+        # 트리 방식의 content.find(".//procedure/preliminaryRqmts") 등과 같은 첫 요소
+        if (
+            self._container_state == 1
+            and tag in _RQMTS_TAGS
+            and tag not in self._rqmts_seen
+            and parent.element.tag == "procedure"
+        ):
+            self._rqmts_seen.add(tag)
+            frame.rqmts = tag
+            frame.held = True
+            if tag == "preliminaryRqmts":
+                self._rqmts_buffer = []
+        if (
+            self.traverse_strategy == "jats_body"
+            and tag == "ref-list"
+            and not self._refs_seen
+        ):
+            self._refs_seen = True
+            frame.refs = True
+            frame.held = True
+        return frame
+
+    def _classify(self, element: Any, path: str, parent: _Frame) -> _Frame:
+        if parent.kind in (_LEAF, _TITLE, _INNER) or parent.capture:
+            return _Frame(element, path, _INNER, held=parent.held)
+
+        if parent.kind == _OUTSIDE:
+            if self._container_state == 0 and element.tag == self._container_tag:
+                self._container_state = 1
+                return _Frame(
+                    element,
+                    path,
+                    _CONTAINER,
+                    child_params=(None, 1, EMPTY_CONTEXT_PATH),
+                )
+            # 헤더는 남기고, 컨테이너 이후 요소(JATS back 등)만 비운다
+            return _Frame(
+                element,
+                path,
+                _OUTSIDE,
+                held=parent.held,
+                clear=self._container_state == 2 and not parent.held,
+            )
+
+        if parent.child_params is None:
+            # 제목 미확정 섹션의 첫 자식
+            if element.tag == parent.rule.get("title_child", "title"):
+                return _Frame(
+                    element, path, _TITLE, held=parent.held, clear=not parent.held
+                )
+            parent.capture = True
+            return _Frame(element, path, _INNER, held=parent.held)
+
+        parent_id, level, context = parent.child_params
+        tag = element.tag.lower()
+        rule = self.content_rules.get(tag)
+        if rule is None:
+            kind = _TRANSPARENT
+        elif self._block_type(rule, tag) == "section":
+            kind = _SECTION
+        else:
+            kind = _LEAF
+        return _Frame(
+            element,
+            path,
+            kind,
+            rule=rule,
+            parent_id=parent_id,
+            level=level,
+            context=context,
+            child_params=parent.child_params if kind == _TRANSPARENT else None,
+            held=parent.held,
+            clear=not parent.held,
+        )
+
+    def _resolve_section(self, frame: _Frame) -> ParsedBlock:
+        block = self._section_block(
+            frame.element,
+            frame.path,
+            frame.rule,
+            frame.parent_id,
+            frame.level,
+            frame.context,
+        )
+        frame.child_params = (
+            block.block_id,
+            frame.level + 1,
+            frame.context.child(block.text),
+        )
+        return block
+
+    def _close(
+        self, frame: _Frame, parent: Optional[_Frame], relations: List[Dict]
+    ) -> Iterator[ParsedBlock]:
+        element = frame.element
+        if frame.kind == _LEAF:
+            yield from self._mapped_blocks(
+                element,
+                frame.path,
+                frame.rule,
+                relations,
+                frame.parent_id,
+                frame.level,
+                frame.context,
+            )
+        elif frame.kind == _SECTION and frame.child_params is None:
+            # 자식이 없거나(제목 없음) 통째 처리 대상
+            yield self._resolve_section(frame)
+            if frame.capture:
+                yield from self._traverse_node(
+                    element, relations, *frame.child_params, node_path=frame.path
+                )
+        elif frame.kind == _TITLE:
+            yield self._resolve_section(parent)
+            if len(element) > 0:
+                yield from self._traverse_node(
+                    element, relations, *parent.child_params, node_path=frame.path
+                )
+        elif frame.kind == _CONTAINER:
+            self._container_state = 2
+            yield from self._container_end
+
+        if frame.rqmts == "preliminaryRqmts":
+            buffered, self._rqmts_buffer = self._rqmts_buffer, None
+            yield self._rqmts_block(element, frame.path)
+            yield from buffered
+        elif frame.rqmts == "closeRqmts":
+            self._container_end.append(self._rqmts_block(element, frame.path))
+        if frame.refs:
+            self._doc_end.append(
+                self._references_block(element, self._doc_end_relations)
+            )
+
+        if frame.clear:
+            element.clear(keep_tail=True)
+            # 처리가 끝난 앞 형제도 제거한다 (헤더가 있는 컨테이너 밖은 제외)
+            if parent is not None and parent.kind != _OUTSIDE:
+                parent_element = parent.element
+                while element.getprevious() is not None:
+                    del parent_element[0]
@@ -1,5 +1,12 @@
-"""Document 벌크 인제스트 스크립트."""
+"""Document 벌크 인제스트 스크립트.
+
+사용법:
+    python src/tractara/scripts/ingest_bulk.py                     # data/ 폴더 순차 인제스트
+    python src/tractara/scripts/ingest_bulk.py --csdb path/to/csdb  # S1000D CSDB 병렬 인제스트
+    python src/tractara/scripts/ingest_bulk.py --csdb path/to/csdb --no-terms --workers 8
+"""
 # !/usr/bin/env python3
+import argparse
 import logging
 import sys
 from pathlib import Path
@@ -15,8 +22,10 @@ sys.path.append(str(project_root))
 
 # 2. 프로젝트 모듈 임포트 (sys.path 설정 후)
 try:
+    from tractara.api.csdb_ingest import ingest_csdb
     from tractara.api.pipeline import ingest_single_document
     from tractara.logging_setup import configure_logging
+    from tractara.parsing.docling_pool import shutdown_default_pool, start_default_pool
     from tractara.validation.json_schema_validator import schema_registry
 except ImportError as e:
     print(f"❌ Error importing project modules: {e}")
@@ -29,12 +38,61 @@ load_dotenv(override=True)
 logger = logging.getLogger("bulk_ingest")
 
 
+def _parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Document 벌크 인제스트")
+    ap.add_argument(
+        "--csdb",
+        type=Path,
+        default=None,
+        help="S1000D CSDB 디렉토리 (DMC-*.xml 병렬 인제스트, 매니페스트로 재개)",
+    )
+    ap.add_argument("--workers", type=int, default=None, help="CSDB 워커 프로세스 수")
+    ap.add_argument("--batch-size", type=int, default=None, help="CSDB 샤드/배치 크기")
+    ap.add_argument("--no-terms", action="store_true", help="LLM TERM 추출 생략 (결정론적 단계만)")
+    ap.add_argument("--manifest", type=Path, default=None, help="CSDB 매니페스트 경로")
+    return ap.parse_args()
+
+
+def run_csdb(args: argparse.Namespace) -> None:
+    """S1000D CSDB 디렉토리 병렬 인제스트 실행."""
+    if not args.csdb.is_dir():
+        logger.error("❌ CSDB 디렉토리를 찾을 수 없습니다: %s", args.csdb)
+        sys.exit(1)
+
+    report = ingest_csdb(
+        args.csdb,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        extract_terms=not args.no_terms,
+        manifest_path=args.manifest,
+    )
+
+    logger.info("=" * 60)
+    logger.info("📊 CSDB 수집 완료 리포트")
+    logger.info("   - 데이터 모듈 : %d", report.total)
+    logger.info("   - 건너뜀     : %d (매니페스트)", report.skipped)
+    logger.info("   - 성공       : %d", report.succeeded)
+    logger.info("   - 실패       : %d", report.failed)
+    logger.info(
+        "   - 처리 속도  : %.1f files/s (%.1fs)",
+        report.files_per_second,
+        report.seconds,
+    )
+    logger.info("=" * 60)
+
+
 def main():
     """Document 벌크 인제스트 실행."""
+    args = _parse_args()
+
     # 1. 로깅 및 스키마 초기화
     configure_logging()
     schema_registry.load()
 
+    if args.csdb is not None:
+        run_csdb(args)
+        return
+
     # 2. 데이터 디렉토리 설정
     # 사용자가 지정한 경로: /workspaces/Tractara/data
     # 로컬 개발 환경 호환성을 위해 프로젝트 루트 기준 data 폴더도 확인
@@ -59,28 +117,38 @@ def main():
 
     logger.info("🚀 일괄 수집 시작: %s 내 %d개 파일", target_dir, len(target_files))
 
+    # 3. PDF가 있으면 Docling 변환기 풀을 한 번만 기동 (문서마다 모델 로딩 방지)
+    if any(p.suffix.lower() == ".pdf" for p in target_files):
+        start_default_pool()
+
     # 4. 파일별 수집 실행
     success_count = 0
     fail_count = 0
 
-    for i, file_path in enumerate(target_files, 1):
-        logger.info("[%d/%d] 처리 중: %s ...", i, len(target_files), file_path.name)
-        try:
-            # 파이프라인 실행
-            result = ingest_single_document(file_path)
-
-            doc_id = result.get("documentId", "Unknown ID")
-            term_count = result.get("promotedTermCount", 0)
-
-            logger.info(
-                "✅ 성공: %s (DocID: %s, Terms: %s)", file_path.name, doc_id, term_count
-            )
-            success_count += 1
-
-        except (OSError, RuntimeError, ValueError) as e:
-            logger.error("❌ 실패: %s", file_path.name)
-            logger.error("   이유: %s", str(e))
-            fail_count += 1
+    try:
+        for i, file_path in enumerate(target_files, 1):
+            logger.info("[%d/%d] 처리 중: %s ...", i, len(target_files), file_path.name)
+            try:
+                # 파이프라인 실행
+                result = ingest_single_document(file_path)
+
+                doc_id = result.get("documentId", "Unknown ID")
+                term_count = result.get("promotedTermCount", 0)
+
+                logger.info(
+                    "✅ 성공: %s (DocID: %s, Terms: %s)",
+                    file_path.name,
+                    doc_id,
+                    term_count,
+                )
+                success_count += 1
+
+            except (OSError, RuntimeError, ValueError) as e:
+                logger.error("❌ 실패: %s", file_path.name)
+                logger.error("   이유: %s", str(e))
+                fail_count += 1
+    finally:
+        shutdown_default_pool()
 
     # 5. 최종 리포트
     logger.info("=" * 60)
@@ -2,7 +2,7 @@
 # src/tractara/ssot/doc_ssot_repository.py
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 SSOT_DOC_DIR = BASE_DIR / "data" / "ssot" / "docs"
@@ -17,3 +17,17 @@ def upsert_doc(doc: Dict[str, Any]) -> None:
     doc_id = doc["documentId"]
     path = SSOT_DOC_DIR / f"{doc_id}.json"
     path.write_text(json.dumps(doc, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def upsert_docs(docs: List[Dict[str, Any]]) -> None:
+    """DOC SSoT 배치 저장/갱신 (벌크 인제스트 배치 단위)."""
+    for doc in docs:
+        path = SSOT_DOC_DIR / f"{doc['documentId']}.json"
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
+
+
+def delete_docs(doc_ids: Iterable[str]) -> None:
+    """DOC SSoT 파일 삭제 (커밋되지 않은 벌크 배치 롤백용, 없으면 무시)."""
+    for doc_id in doc_ids:
+        (SSOT_DOC_DIR / f"{doc_id}.json").unlink(missing_ok=True)
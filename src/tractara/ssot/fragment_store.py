@@ -1,8 +1,17 @@
 """Fragment Store (원본 XML 조각 저장소) 모듈."""
 # src/tractara/ssot/fragment_store.py
 import json
+import re
 from pathlib import Path
-from typing import Dict, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+
+from lxml import etree
+
+from ..parsing.xml_paths import StreamPaths, locate_elements
+
+# 중첩 조각 자리표시 (처리 명령): 상위 블록 조각 안에서 하위 블록 요소를 대신한다
+_REF_PI_TARGET = "tractara-fragment"
+_REF_PATTERN = re.compile(r"<\?tractara-fragment ([^?\s]+)\?>")
 
 
 class FragmentStore(Protocol):
@@ -15,6 +24,59 @@ class FragmentStore(Protocol):
     def bulk_put(self, fragments: Dict[str, str]) -> None:
         ...
 
+    def put_tree(self, root: Any, locators: Dict[str, str]) -> int:
+        ...
+
+    def put_stream(self, xml_path: Path, locators: Dict[str, str]) -> int:
+        ...
+
+
+def serialize_nested_fragments(
+    root: Any, locators: Dict[str, str]
+) -> Dict[str, Tuple[str, List[str]]]:
+    """
+    block_id → (XML 조각, 조각 안에서 참조하는 하위 block_id 목록).
+
+    locators(block_id → 절대 요소 경로)의 요소를 안쪽부터 한 번씩만 직렬화한다.
+    직렬화를 마친 요소는 잠시 자리표시 처리 명령으로 바꿔 두므로 상위 블록 조각은
+    하위 블록 내용을 다시 담지 않는다 (중첩 깊이와 무관하게 전체 O(문서 크기)).
+    트리는 끝난 뒤 원래대로 되돌린다.
+    """
+    located = locate_elements(root, locators.values())
+    owners: Dict[Any, str] = {}
+    for block_id, path in locators.items():
+        element = located.get(path)
+        if element is not None:
+            owners.setdefault(element, block_id)
+
+    ordered = [el for el in root.iter() if el in owners]
+    fragments: Dict[str, Tuple[str, List[str]]] = {}
+    swapped = []
+    try:
+        # 문서 역순 = 하위 요소가 조상보다 먼저
+        for element in reversed(ordered):
+            block_id = owners[element]
+            # pylint: disable-next=c-extension-no-member
+            xml = etree.tostring(element, encoding="unicode", with_tail=False)
+            fragments[block_id] = (xml, _REF_PATTERN.findall(xml))
+            parent = element.getparent()
+            if parent is not None:
+                # pylint: disable-next=c-extension-no-member
+                placeholder = etree.ProcessingInstruction(_REF_PI_TARGET, block_id)
+                placeholder.tail = element.tail
+                parent.replace(element, placeholder)
+                swapped.append((parent, element, placeholder))
+    finally:
+        for parent, element, placeholder in reversed(swapped):
+            parent.replace(placeholder, element)
+
+    # 같은 요소를 가리키는 블록이 여럿이면 같은 조각을 공유한다
+    for block_id, path in locators.items():
+        element = located.get(path)
+        if block_id not in fragments and element is not None:
+            fragments[block_id] = fragments[owners[element]]
+    return fragments
+
 
 # LLM과 RAG 엔진이 읽어야 할 SSoT JSON은 극도로 가볍고 순수하게 유지되며, 마이그레이션 모듈은 필요할 때만 O(1)의 속도로 원본 조각을 꺼내 쓸 수 있게
 class FileFragmentStore:
@@ -29,14 +91,14 @@ class FileFragmentStore:
         safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in block_id)
         return self.base_dir / f"{safe_id}.json"
 
-    def put(self, block_id: str, xml_fragment: str) -> None:
+    def put(self, block_id: str, xml_fragment: str, refs: Sequence[str] = ()) -> None:
+        record: Dict[str, Any] = {"blockId": block_id, "xmlFragment": xml_fragment}
+        if refs:
+            # 하위 블록 조각은 복사하지 않고 참조만 둔다 (get()이 펼침)
+            record["fragmentRefs"] = list(refs)
         path = self._get_path(block_id)
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(
-                {"blockId": block_id, "xmlFragment": xml_fragment},
-                f,
-                ensure_ascii=False,
-            )
+            json.dump(record, f, ensure_ascii=False)
 
     def get(self, block_id: str) -> Optional[str]:
         path = self._get_path(block_id)
@@ -45,15 +107,85 @@ class FileFragmentStore:
         try:
             with open(path, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                return data.get("xmlFragment")
         except Exception:  # pylint: disable=broad-exception-caught
             return None
+        fragment = data.get("xmlFragment")
+        if fragment is None or not data.get("fragmentRefs"):
+            return fragment
+
+        def _expand(match: "re.Match[str]") -> str:
+            child = self.get(match.group(1))
+            return child if child is not None else match.group(0)
+
+        return _REF_PATTERN.sub(_expand, fragment)
 
     def bulk_put(self, fragments: Dict[str, str]) -> None:
         for block_id, xml_fragment in fragments.items():
             if xml_fragment:
                 self.put(block_id, xml_fragment)
 
+    def put_tree(self, root: Any, locators: Dict[str, str]) -> int:
+        """
+        파싱된 XML 트리에서 블록 조각을 지연 생성해 저장하고 저장한 개수를 반환한다.
+        locators는 block_id → 요소 경로 (ParsedBlock.source_xpath).
+        """
+        fragments = serialize_nested_fragments(root, locators)
+        for block_id, (xml_fragment, refs) in fragments.items():
+            self.put(block_id, xml_fragment, refs)
+        return len(fragments)
+
+    def put_stream(self, xml_path: Path, locators: Dict[str, str]) -> int:
+        """
+        put_tree의 스트리밍 판 (xml_stream으로 파싱한 대용량 문서용).
+        파일을 iterparse로 한 번 읽으며 locator(StreamPaths 형식) 요소가 닫힐 때 바로
+        직렬화해 저장하고, 블록 조각 밖의 요소는 처리 즉시 비운다.
+        """
+        owners: Dict[str, List[str]] = {}
+        for block_id, path in locators.items():
+            owners.setdefault(path, []).append(block_id)
+
+        paths = StreamPaths()
+        open_paths: List[Optional[str]] = []
+        open_blocks = 0  # 열려 있는 블록 요소 수 (조상 조각이 하위 트리를 필요로 함)
+        stored = 0
+        # pylint: disable-next=c-extension-no-member
+        for event, element in etree.iterparse(
+            str(xml_path), events=("start", "end"), huge_tree=True
+        ):
+            if event == "start":
+                path = paths.start(element.tag)
+                located = path in owners
+                open_paths.append(path if located else None)
+                open_blocks += located
+                continue
+
+            paths.end()
+            path = open_paths.pop()
+            parent = element.getparent()
+            if path is not None:
+                open_blocks -= 1
+                # pylint: disable-next=c-extension-no-member
+                xml = etree.tostring(element, encoding="unicode", with_tail=False)
+                refs = _REF_PATTERN.findall(xml)
+                block_ids = owners[path]
+                for block_id in block_ids:
+                    self.put(block_id, xml, refs)
+                stored += len(block_ids)
+                if open_blocks and parent is not None:
+                    # pylint: disable-next=c-extension-no-member
+                    placeholder = etree.ProcessingInstruction(
+                        _REF_PI_TARGET, block_ids[0]
+                    )
+                    placeholder.tail = element.tail
+                    parent.replace(element, placeholder)
+                    continue
+            if not open_blocks:
+                element.clear(keep_tail=True)
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+        return stored
+
 
 class RedisFragmentStore:
     """추후 Redis 전환용 Stub"""
@@ -69,3 +201,9 @@ class RedisFragmentStore:
 
     def bulk_put(self, fragments: Dict[str, str]) -> None:
         raise NotImplementedError("Redis store not yet implemented")
+
+    def put_tree(self, root: Any, locators: Dict[str, str]) -> int:
+        raise NotImplementedError("Redis store not yet implemented")
+
+    def put_stream(self, xml_path: Path, locators: Dict[str, str]) -> int:
+        raise NotImplementedError("Redis store not yet implemented")
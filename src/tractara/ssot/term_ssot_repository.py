@@ -2,7 +2,7 @@
 # src/tractara/ssot/term_ssot_repository.py
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 SSOT_TERM_DIR = BASE_DIR / "data" / "ssot" / "terms"
@@ -44,3 +44,30 @@ def upsert_terms(terms: List[Dict[str, Any]]) -> None:
         path.write_text(
             json.dumps(term, ensure_ascii=False, indent=2), encoding="utf-8"
         )
+
+
+def iter_terms() -> Iterator[Dict[str, Any]]:
+    """TERM SSoT 전체 순회 (모든 termType 서브디렉토리, 읽을 수 없는 파일은 건너뜀)."""
+    for subdir_name in _TYPE_SUBDIR.values():
+        subdir = SSOT_TERM_DIR / subdir_name
+        if not subdir.is_dir():
+            continue
+        for path in sorted(subdir.glob("*.json")):
+            try:
+                yield json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+
+
+def terms_signature() -> Tuple[int, ...]:
+    """
+    TERM SSoT 변경 감지용 서명 (서브디렉토리 mtime_ns).
+    새 TERM 파일이 생기면 바뀐다 (기존 파일 덮어쓰기는 감지하지 않는다).
+    """
+    signature = []
+    for subdir_name in _TYPE_SUBDIR.values():
+        try:
+            signature.append((SSOT_TERM_DIR / subdir_name).stat().st_mtime_ns)
+        except OSError:
+            signature.append(0)
+    return tuple(signature)
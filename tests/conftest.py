@@ -4,9 +4,28 @@ from pathlib import Path
 
 import pytest
 
+from tractara.llm_gateway import reset_gateway
 from tractara.normalization.doc_mapper import build_doc_baseline
 from tractara.parsing.xml_parser import parse_xml
 
+
+@pytest.fixture(autouse=True)
+def _disable_parse_cache(monkeypatch):
+    """테스트 간 결과 공유를 막기 위해 기본적으로 파싱/메타데이터/TERM 캐시와 페이지 체크포인트를 끈다."""
+    monkeypatch.setenv("PARSE_CACHE_ENABLED", "0")
+    monkeypatch.setenv("METADATA_CACHE_ENABLED", "0")
+    monkeypatch.setenv("TERM_CACHE_ENABLED", "0")
+    monkeypatch.setenv("VISION_CHECKPOINT_ENABLED", "0")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_llm_gateway():
+    """테스트마다 LLM 게이트웨이의 클라이언트/모델 목록/서킷 상태를 새로 시작한다."""
+    reset_gateway()
+    yield
+    reset_gateway()
+
+
 # ---------------------------------------------------------------------------
 # S1000D Golden Fixture — 테스트 XML → ParsedDocument → DOC Baseline JSON
 # ---------------------------------------------------------------------------
@@ -1,8 +1,11 @@
 # tests/test_catalog_loader.py
+import os
+
 import pytest
 from lxml import etree
 
 from tractara.catalogs import catalog_loader
+from tractara.catalogs.catalog_plan import compile_catalog
 from tractara.catalogs.transforms import TRANSFORM_REGISTRY
 
 
@@ -55,3 +58,58 @@ def test_jats_author_names():
     assert len(res) == 2
     assert res[0]["name"] == "John Smith"
     assert res[1]["name"] == "Jane Doe"
+
+
+def test_catalog_plan_cached_until_yaml_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog_loader, "_LOADED_CATALOGS", {})
+    monkeypatch.setattr(catalog_loader, "_CATALOG_SOURCES", {})
+    monkeypatch.setattr(catalog_loader, "_PLANS", {})
+    yaml_file = tmp_path / "demo.yaml"
+    yaml_file.write_text(
+        "format_id: demo\nmetadata:\n  dc_title:\n    xpath: .//title\n",
+        encoding="utf-8",
+    )
+    catalog_loader._load_catalog_file(yaml_file)
+    catalog = catalog_loader._LOADED_CATALOGS["demo"]
+
+    plan = catalog_loader.get_catalog_plan(catalog)
+    assert catalog_loader.get_catalog_plan(catalog) is plan
+    assert plan.index_tags == ("title",)
+
+    yaml_file.write_text(
+        "format_id: demo\nmetadata:\n  dc_title:\n    xpath: .//name\n",
+        encoding="utf-8",
+    )
+    stat = yaml_file.stat()
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = catalog_loader.get_catalog_plan(catalog)
+    assert reloaded is not plan
+    # 호출자가 쥔 카탈로그 dict도 제자리 갱신된다
+    assert catalog["metadata"]["dc_title"]["xpath"] == ".//name"
+    assert reloaded.index_tags == ("name",)
+
+
+def test_bound_plan_matches_element_path():
+    root = etree.fromstring(
+        """<doc xmlns:dc="http://purl.org/dc/elements/1.1/">
+        <head><dc:subject>A - B</dc:subject><techName>Wheel</techName></head>
+        <body><techName>Spoke</techName><a><b>x</b></a></body></doc>"""
+    )
+    plan = compile_catalog(
+        {
+            "format_id": "adhoc",
+            "metadata": {
+                "dc_subject": {"dc_element": "subject"},
+                "dc_title": {"xpath": ".//techName", "combine_with": ".//a/b"},
+            },
+        }
+    )
+    bound = plan.bind(root)
+    (_, (subject,)), (_, (title,)) = plan.metadata_fields
+
+    assert bound.elements(subject) == root.findall(
+        ".//{http://purl.org/dc/elements/1.1/}subject"
+    )
+    assert bound.elements(title) == root.findall(".//techName")
+    assert bound.first(title.combine_with) is root.find(".//a/b")
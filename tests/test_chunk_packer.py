@@ -0,0 +1,75 @@
+"""구조 인식 청크 패커 단위 테스트."""
+# tests/test_chunk_packer.py
+from tractara.normalization.chunk_packer import estimate_tokens, pack_blocks
+from tractara.parsing.models import ParsedBlock
+
+
+def _block(block_type: str, text: str, context=(), block_id=None) -> ParsedBlock:
+    return ParsedBlock(
+        page=1,
+        block_type=block_type,
+        text=text,
+        context_path=list(context),
+        block_id=block_id or f"b-{text[:12]}",
+    )
+
+
+def test_estimate_tokens_counts_non_ascii_conservatively():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("경년열화") == 4
+    assert estimate_tokens("AMP 경년열화") == 1 + 4
+
+
+def test_pack_blocks_groups_siblings_under_one_breadcrumb():
+    blocks = [
+        _block("section", "1. Aging", ()),
+        _block("paragraph", "Short paragraph one about SCC.", ["1. Aging"]),
+        _block("paragraph", "Short paragraph two about fatigue.", ["1. Aging"]),
+        _block("section", "1.1 Scope", ["1. Aging"]),
+        _block(
+            "paragraph",
+            "Nested paragraph on reactor vessels.",
+            ["1. Aging", "1.1 Scope"],
+        ),
+    ]
+
+    (chunk,) = pack_blocks(blocks, max_tokens=200)
+
+    assert chunk.breadcrumb == []
+    assert chunk.block_ids == [b.block_id for b in blocks]
+    assert chunk.text.startswith("1. Aging\n\nShort paragraph one")
+
+    # 섹션 안쪽에서 시작한 청크는 공통 섹션 경로를 한 번만 앞에 붙인다
+    chunks = pack_blocks(blocks[1:3], max_tokens=200)
+    assert [c.text for c in chunks] == [
+        "[1. Aging]\nShort paragraph one about SCC.\n\n"
+        "Short paragraph two about fatigue."
+    ]
+
+
+def test_pack_blocks_respects_budget_and_keeps_tables_whole():
+    paragraphs = [
+        _block("paragraph", f"Paragraph {i} " + "word " * 30, ["Sec"], f"p{i}")
+        for i in range(6)
+    ]
+    table = _block("table", "| a | b |\n" + "| 1 | 2 |\n" * 200, ["Sec"], "tbl")
+    long_para = _block("paragraph", "Sentence about valves. " * 120, ["Sec"], "long")
+
+    chunks = pack_blocks(paragraphs + [table, long_para], max_tokens=100)
+
+    packed = [c for c in chunks if "tbl" not in c.block_ids]
+    assert all(estimate_tokens(c.text.split("\n", 1)[1]) <= 100 for c in packed)
+    assert len([c for c in chunks if set(c.block_ids) & {"p0", "p5"}]) < 6
+    # 표는 예산을 넘어도 한 청크에 통째로
+    (table_chunk,) = [c for c in chunks if "tbl" in c.block_ids]
+    assert table_chunk.block_ids == ["tbl"]
+    assert table.text.strip() in table_chunk.text
+    # 긴 문단은 문장 경계에서 나뉜다
+    pieces = [c for c in chunks if c.block_ids == ["long"]]
+    assert len(pieces) > 1
+    assert all(c.text.rstrip().endswith("valves.") for c in pieces)
+
+
+def test_pack_blocks_drops_tiny_chunks():
+    assert pack_blocks([_block("paragraph", "Figure 1")]) == []
@@ -0,0 +1,91 @@
+"""S1000D CSDB 병렬 인제스트 단위 테스트 (배치 저장 + 매니페스트 재개)."""
+# tests/test_csdb_ingest.py
+import json
+from pathlib import Path
+
+import pytest
+
+from tractara.api import csdb_ingest
+from tractara.landing import landing_repository
+from tractara.ssot import doc_ssot_repository
+
+_DM = """<?xml version="1.0" encoding="UTF-8"?>
+<dmodule>
+  <identAndStatusSection>
+    <dmAddress>
+      <dmIdent><dmCode modelIdentCode="BIKE" systemDiffCode="A" systemCode="{n:02d}"
+        subSystemCode="0" subSubSystemCode="0" assyCode="00" disassyCode="00"
+        disassyCodeVariant="A" infoCode="520" infoCodeVariant="A"
+        itemLocationCode="D"/></dmIdent>
+      <dmAddressItems><issueDate year="2024" month="1" day="2"/>
+        <dmTitle><techName>Bicycle {n}</techName><infoName>Removal</infoName></dmTitle>
+      </dmAddressItems>
+    </dmAddress>
+    <dmStatus issueType="new"/>
+  </identAndStatusSection>
+  <content><procedure><mainProcedure>
+    <proceduralStep><para>Remove wheel {n}.</para></proceduralStep>
+  </mainProcedure></procedure></content>
+</dmodule>
+"""
+
+
+@pytest.fixture
+def stores(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(landing_repository, "LANDING_DIR", tmp_path / "landing")
+    monkeypatch.setattr(doc_ssot_repository, "SSOT_DOC_DIR", tmp_path / "ssot")
+    (tmp_path / "ssot").mkdir()
+    return tmp_path
+
+
+def _csdb(root: Path, count: int) -> Path:
+    csdb = root / "csdb"
+    (csdb / "sub").mkdir(parents=True)
+    for n in range(count):
+        target = csdb / "sub" if n % 2 else csdb
+        (target / f"DMC-BIKE-A-{n:02d}.XML").write_text(
+            _DM.format(n=n), encoding="utf-8"
+        )
+    (csdb / "PMC-BIKE-00001.xml").write_text("<pm/>", encoding="utf-8")
+    return csdb
+
+
+def test_csdb_ingest_batches_and_resumes(stores: Path):
+    csdb = _csdb(stores, 5)
+    broken = csdb / "DMC-BIKE-A-99.xml"
+    broken.write_text("<dmodule><content>", encoding="utf-8")
+    manifest = stores / "manifest.jsonl"
+
+    report = csdb_ingest.ingest_csdb(
+        csdb, workers=2, batch_size=2, extract_terms=False, manifest_path=manifest
+    )
+
+    assert (report.total, report.succeeded, report.failed) == (6, 5, 1)
+    assert report.files_per_second > 0
+    docs = sorted((stores / "landing" / "docs").glob("*.json"))
+    assert [p.name for p in docs] == sorted(p.name for p in (stores / "ssot").iterdir())
+    titles = {json.loads(p.read_text("utf-8"))["metadata"]["dc:title"] for p in docs}
+    assert titles == {f"Bicycle {n} - Removal" for n in range(5)}
+
+    # 재실행: 성공한 모듈은 건너뛰고 실패한 모듈만 다시 시도한다
+    broken.write_text(_DM.format(n=99), encoding="utf-8")
+    report = csdb_ingest.ingest_csdb(
+        csdb, workers=1, extract_terms=False, manifest_path=manifest
+    )
+    assert (report.skipped, report.succeeded, report.failed) == (5, 1, 0)
+    assert len(list((stores / "landing" / "docs").glob("*.json"))) == 6
+
+
+def test_manifest_rolls_back_uncommitted_batch(stores: Path):
+    manifest = csdb_ingest.IngestManifest(stores / "manifest.jsonl")
+    doc = {"documentId": "DOC_partial", "metadata": {}}
+    landing_repository.save_doc_landing_batch([doc])
+    doc_ssot_repository.upsert_docs([doc])
+    manifest.pending_path.write_text(json.dumps(["DOC_partial"]), encoding="utf-8")
+
+    manifest.load()
+
+    assert not (stores / "landing" / "docs" / "DOC_partial.json").exists()
+    assert not (stores / "ssot" / "DOC_partial.json").exists()
+    assert not manifest.pending_path.exists()
@@ -0,0 +1,151 @@
+"""DoclingConverterPool 단위 테스트 (Docling 없이 가짜 파서 팩토리 사용)."""
+# tests/test_docling_pool.py
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tractara.parsing.docling_pool import DoclingConverterPool, DoclingPoolConfig
+from tractara.parsing.models import ParsedBlock, ParsedDocument
+from tractara.parsing.pdf_parser import parse_docling_windowed
+
+
+class _FakeParser:
+    def __init__(self, num_threads: int):
+        self.num_threads = num_threads
+
+    def parse(self, pdf_path: Path) -> ParsedDocument:
+        if pdf_path.name == "broken.pdf":
+            raise ValueError("cannot convert")
+        if pdf_path.name == "stuck.pdf":
+            time.sleep(60)
+        return ParsedDocument(
+            source_path=pdf_path,
+            blocks=[],
+            metadata={"pid": os.getpid(), "num_threads": self.num_threads},
+        )
+
+    def parse_window(self, pdf_path: Path, first: int, last: int):
+        # 첫 시도에서 3번째 창(21-30쪽)만 실패시킨다 (재시도 확인용 표식 파일)
+        marker = pdf_path.with_suffix(".failed")
+        if first == 21 and not marker.exists():
+            marker.touch()
+            raise OSError("worker lost")
+        hung = pdf_path.with_suffix(".hung")
+        if pdf_path.name == "hung.pdf" and first == 21 and not hung.exists():
+            hung.touch()
+            time.sleep(60)
+        blocks = []
+        for page in range(first, last + 1):
+            if page in (1, 15):
+                blocks.append(
+                    ParsedBlock(
+                        page=page,
+                        block_type="section",
+                        text=f"Chapter {page}",
+                        level=1,
+                        block_id=f"h{page}",
+                    )
+                )
+            blocks.append(
+                ParsedBlock(
+                    page=page,
+                    block_type="paragraph",
+                    text=f"Body text of page {page}.",
+                    level=999,
+                    block_id=f"p{page}",
+                )
+            )
+        return blocks
+
+
+def _fake_factory(num_threads: int) -> _FakeParser:
+    return _FakeParser(num_threads)
+
+
+def _failing_factory(num_threads: int):
+    raise ImportError(f"docling not installed ({num_threads})")
+
+
+def test_pool_recycles_workers_and_returns_all_results(tmp_path: Path):
+    config = DoclingPoolConfig(size=1, num_threads=2, max_documents=2)
+    paths = [tmp_path / f"doc{i}.pdf" for i in range(5)]
+
+    with DoclingConverterPool(config, parser_factory=_fake_factory) as pool:
+        futures = [pool.submit(p) for p in paths]
+        results = [f.result(timeout=60) for f in futures]
+
+        with pytest.raises(ValueError):
+            pool.parse(tmp_path / "broken.pdf", timeout=60)
+
+    assert [r.source_path for r in results] == paths
+    assert {r.metadata["num_threads"] for r in results} == {2}
+    # 워커당 2문서 후 교체 → 5문서에 최소 3개 프로세스
+    assert len({r.metadata["pid"] for r in results}) >= 3
+    assert pool.recycled_count >= 2
+
+
+def test_pool_surfaces_init_failure(tmp_path: Path):
+    config = DoclingPoolConfig(size=1)
+    with DoclingConverterPool(config, parser_factory=_failing_factory) as pool:
+        # 초기화 실패가 먼저 도착하면 submit이, 아니면 Future가 ImportError를 낸다
+        with pytest.raises(ImportError):
+            pool.submit(tmp_path / "doc.pdf").result(timeout=60)
+        assert not pool.running
+
+
+def test_hung_conversion_restarts_worker_and_pool_keeps_serving(tmp_path: Path):
+    config = DoclingPoolConfig(size=1, job_timeout=1.0)
+    pool = DoclingConverterPool(config, parser_factory=_fake_factory)
+    pool.start()
+    try:
+        stuck = pool.submit(tmp_path / "stuck.pdf")
+        # 유일한 워커가 멈춘 동안 대기열에 있던 문서는 시간 초과로 세지 않는다
+        queued = pool.submit(tmp_path / "queued.pdf")
+        with pytest.raises(TimeoutError, match="worker 0 restarted"):
+            stuck.result(timeout=30)
+        first = queued.result(timeout=60)
+
+        # 멈춘 워커는 교체되어 이후 문서도 정상 처리된다
+        second = pool.parse(tmp_path / "after.pdf", timeout=60)
+        assert second.source_path == tmp_path / "after.pdf"
+        assert first.metadata["pid"] == second.metadata["pid"]
+        assert pool.running and len(pool._workers) == 1
+        assert not pool._futures and not pool._in_flight
+    finally:
+        pool.shutdown(timeout=1.0)
+
+
+def test_windowed_parse_retries_and_links_across_windows(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("DOCLING_WINDOW_WORKERS", "2")
+    config = DoclingPoolConfig(size=2)
+    pdf_path = tmp_path / "huge.pdf"
+    with DoclingConverterPool(config, parser_factory=_fake_factory) as pool:
+        parsed = parse_docling_windowed(pdf_path, 45, 10, pool=pool)
+
+    assert parsed.metadata["windows"] == 5
+    assert pdf_path.with_suffix(".failed").exists()
+    pages = [b.page for b in parsed.blocks]
+    assert pages == sorted(pages) and set(pages) == set(range(1, 46))
+    by_id = {b.block_id: b for b in parsed.blocks}
+    # 창 경계를 넘어도 직전 제목의 계층을 잇는다
+    assert by_id["p12"].parent_id == "h1"
+    assert by_id["p12"].context_path == ["Chapter 1"]
+    assert by_id["p40"].parent_id == "h15"
+
+
+def test_windowed_parse_grows_the_shared_pool_once(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("DOCLING_WINDOW_WORKERS", "3")
+    config = DoclingPoolConfig(size=1, job_timeout=2.0)
+    with DoclingConverterPool(config, parser_factory=_fake_factory) as pool:
+        first = parse_docling_windowed(tmp_path / "huge.pdf", 45, 10, pool=pool)
+        # 창 21-30의 첫 시도는 멈춘다 → 워커 재시작 후 새 워커에서 재시도
+        second = parse_docling_windowed(tmp_path / "hung.pdf", 45, 10, pool=pool)
+
+        assert pool.running
+        assert pool.config.size == 3 and len(pool._workers) == 3
+
+    assert first.metadata["windows"] == second.metadata["windows"] == 5
+    assert (tmp_path / "hung.hung").exists()
+    assert {b.page for b in second.blocks} == set(range(1, 46))
@@ -0,0 +1,69 @@
+"""EquationDetector 단위 테스트 (분할 지점, 배치 판정, 래퍼 일치)."""
+# tests/test_equation_detector.py
+from tractara.parsing.equation_detector import EquationDetector
+from tractara.parsing.models import ParsedBlock
+from tractara.parsing.pdf_parser import _reclassify_equations, _split_inline_equations
+
+
+def _paragraph(text: str) -> ParsedBlock:
+    return ParsedBlock(page=1, block_type="paragraph", text=text)
+
+
+def test_split_points_keep_skipped_references():
+    text = (
+        "As reported in Ref. (4), the strain rate is defined as "
+        "e = d(eps)/dt (2) and it is bounded above. See Table (5) for values."
+    )
+    splits, suffix = EquationDetector().split_points(text)
+
+    assert len(splits) == 1
+    split = splits[0]
+    assert text[slice(*split.equation)] == "e = d(eps)/dt"
+    assert split.number == "2"
+    # "= 없는" 번호 참조는 버려지지 않고 앞/뒤 조각에 남는다
+    assert text[slice(*split.prefix)] == (
+        "As reported in Ref. (4), the strain rate is defined as"
+    )
+    assert text[slice(*suffix)] == (
+        "and it is bounded above. See Table (5) for values."
+    )
+
+    pieces = _split_inline_equations([_paragraph(text)])
+    assert [b.block_type for b in pieces] == ["paragraph", "equation", "paragraph"]
+    assert pieces[1].equation_data == {"latex": "e = d(eps)/dt", "equationNumber": "2"}
+
+
+def test_split_points_without_anchor_equation():
+    detector = EquationDetector()
+    assert detector.split_points("Results are summarized in Table (3) below.") == (
+        (),
+        None,
+    )
+    # "="이 도입부 없이 너무 멀리 있으면 분할하지 않는다
+    long_text = "x" * 90 + " = y (1)"
+    assert detector.split_points(long_text) == ((), None)
+
+
+def test_analyze_batch_matches_reclassify_wrapper():
+    texts = [
+        "The fatigue life is given by",
+        "N = C / S^n (3.1)",
+        "where S is the stress amplitude and C is a constant.",
+        "Contact: reviewer@example.org, Facsimile: 301-415-2289",
+        "σ = E ε + α ΔT",
+        "See equation (3.1) for the definition.",
+    ]
+    detector = EquationDetector()
+    analyses = detector.analyze_batch(texts)
+    reclassified = _reclassify_equations([_paragraph(t) for t in texts])
+
+    assert [a.is_equation for a in analyses] == [
+        b.block_type == "equation" for b in reclassified
+    ]
+    assert analyses[1].equation_number == "3.1"
+    assert analyses[3].is_equation is False
+
+    # eligible=False 블록은 판정하지 않고 이웃 문맥으로만 쓰인다
+    masked = detector.analyze_batch(texts, eligible=[True, False] * 3)
+    assert masked[1].is_equation is False
+    assert masked[0].is_equation == analyses[0].is_equation
@@ -0,0 +1,95 @@
+"""EquationOcrClient 단위 테스트 (가짜 Gemini 모델 사용)."""
+# tests/test_equation_ocr.py
+import hashlib
+import json
+import threading
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+
+from PIL import Image
+
+from tractara.parsing.equation_ocr import EquationCrop, EquationOcrClient
+from tractara.parsing.parse_cache import ParseCache
+
+
+def _crop(label: str) -> EquationCrop:
+    png = label.encode("utf-8")
+    return EquationCrop(png=png, digest=hashlib.sha256(png).hexdigest())
+
+
+class _FakeModel:
+    """이미지 수에 따라 단건/배치 응답을 흉내 낸다. 라벨은 이미지 크기로 구분한다."""
+
+    def __init__(self, broken_batches: bool = False):
+        self.calls = []
+        self.broken_batches = broken_batches
+        self._lock = threading.Lock()
+
+    def generate_content(self, contents):
+        images = contents[1:]
+        with self._lock:
+            self.calls.append(len(images))
+        labels = [f"x_{img.size[0]} = 1" for img in images]
+        if len(images) == 1:
+            return SimpleNamespace(text=labels[0])
+        if self.broken_batches:
+            return SimpleNamespace(text="not json")
+        return SimpleNamespace(text="```json\n" + json.dumps(labels) + "\n```")
+
+
+def _png_crop(width: int) -> EquationCrop:
+    buf = BytesIO()
+    Image.new("L", (width, 4)).save(buf, format="PNG")
+    png = buf.getvalue()
+    return EquationCrop(png=png, digest=hashlib.sha256(png).hexdigest())
+
+
+def _client(model: _FakeModel, cache=None, **kwargs) -> EquationOcrClient:
+    client = EquationOcrClient(api_key="test-key", **kwargs)
+    client.cache = cache
+    client._model = model
+    return client
+
+
+def test_ocr_many_batches_dedupes_and_keeps_order():
+    crops = [_png_crop(w) for w in (10, 20, 10, 30, 40, 50)]
+    model = _FakeModel()
+    client = _client(model, max_concurrency=3, batch_size=2)
+
+    results = client.ocr_many(crops)
+
+    assert results == [f"x_{w} = 1" for w in (10, 20, 10, 30, 40, 50)]
+    # 5개 고유 크롭 → 2장씩 3요청
+    assert sorted(model.calls) == [1, 2, 2]
+
+
+def test_batch_mismatch_falls_back_to_single_requests():
+    crops = [_png_crop(w) for w in (11, 12, 13)]
+    model = _FakeModel(broken_batches=True)
+    client = _client(model, batch_size=3)
+
+    assert client.ocr_many(crops) == ["x_11 = 1", "x_12 = 1", "x_13 = 1"]
+    assert model.calls == [3, 1, 1, 1]
+
+
+def test_crop_hash_cache_skips_repeat_requests(tmp_path: Path):
+    cache = ParseCache(tmp_path / "cache")
+    crops = [_png_crop(w) for w in (21, 22)]
+
+    first_model = _FakeModel()
+    _client(first_model, cache=cache).ocr_many(crops)
+
+    second_model = _FakeModel()
+    results = _client(second_model, cache=cache).ocr_many(crops)
+
+    assert results == ["x_21 = 1", "x_22 = 1"]
+    assert second_model.calls == []
+    assert cache.stats()["ocr"]["hits"] == 2
+
+
+def test_no_api_key_returns_none(monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    client = EquationOcrClient()
+    assert client.ocr_many([_crop("a"), _crop("b")]) == [None, None]
@@ -0,0 +1,76 @@
+"""Fragment Store 지연 직렬화 및 중첩 조각 참조 단위 테스트."""
+# tests/test_fragment_store.py
+import json
+from pathlib import Path
+
+from lxml import etree
+
+from tractara.normalization.doc_mapper import build_doc_baseline
+from tractara.parsing.xml_parser import parse_xml
+from tractara.ssot.fragment_store import FileFragmentStore
+
+_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<dmodule>
+  <content>
+    <procedure>
+      <mainProcedure>
+        <levelledPara>
+          <title>Wheel</title>
+          <levelledPara>
+            <title>Removal</title>
+            <proceduralStep><para>Loosen &amp; remove the nut.</para>
+              <proceduralStep><para>Hold the axle.</para></proceduralStep>
+            </proceduralStep>
+            <note><notePara>Keep the washer.</notePara></note>
+          </levelledPara>
+        </levelledPara>
+      </mainProcedure>
+    </procedure>
+  </content>
+</dmodule>
+"""
+
+
+def _write_xml(tmp_path: Path) -> Path:
+    path = tmp_path / "DMC-TEST.xml"
+    path.write_text(_XML, encoding="utf-8")
+    return path
+
+
+def test_put_tree_stores_nested_fragments_by_reference(tmp_path: Path):
+    parsed = parse_xml(_write_xml(tmp_path))
+    root = parsed.xml_source.root
+    before = etree.tostring(root)
+    locators = {b.block_id: b.source_xpath for b in parsed.blocks if b.source_xpath}
+    store = FileFragmentStore(tmp_path / "fragments")
+
+    assert store.put_tree(root, locators) == len(locators)
+
+    # 트리는 원래대로 복원되고, 펼친 조각은 즉시 직렬화한 결과와 같다
+    assert etree.tostring(root) == before
+    tree = root.getroottree()
+    for block_id, path in locators.items():
+        expected = etree.tostring(
+            tree.xpath(path)[0], encoding="unicode", with_tail=False
+        )
+        assert store.get(block_id) == expected
+
+    # 바깥 섹션 조각은 하위 블록 내용을 복사하지 않고 참조한다
+    outer = next(b for b in parsed.blocks if b.text == "Wheel")
+    record = json.loads(store._get_path(outer.block_id).read_text(encoding="utf-8"))
+    assert "Hold the axle." not in record["xmlFragment"]
+    assert len(record["fragmentRefs"]) == 1
+
+
+def test_doc_baseline_persists_fragments_from_cached_parse(tmp_path, monkeypatch):
+    parsed = parse_xml(_write_xml(tmp_path))
+    parsed.xml_source = None  # 파싱 캐시 적중처럼 트리 없이 저장 → 원본을 다시 읽는다
+    monkeypatch.chdir(tmp_path)
+
+    doc = build_doc_baseline(parsed)
+
+    step = next(b for b in parsed.blocks if b.text == "Hold the axle.")
+    item = next(c for c in doc["content"] if c["blockId"] == step.block_id)
+    assert item["fragmentRef"] == step.block_id
+    store = FileFragmentStore(tmp_path / "src/data/landing/fragments")
+    assert store.get(step.block_id).startswith("<proceduralStep><para>Hold")
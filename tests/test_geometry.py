@@ -0,0 +1,108 @@
+"""geometry 모듈 및 수식 보충 병합 단위 테스트."""
+# tests/test_geometry.py
+from pathlib import Path
+
+import numpy as np
+import pymupdf
+
+from tractara.parsing.geometry import (
+    PageBoxIndex,
+    first_below,
+    iou_matrix,
+    normalize_to_top_left,
+    overlap_matrix,
+)
+from tractara.parsing.models import BoundingBox, ParsedBlock
+from tractara.parsing.pdf_parser import _supplement_missing_equations
+
+
+def _random_boxes(rng, n: int) -> np.ndarray:
+    xy = rng.uniform(0, 500, size=(n, 2))
+    wh = rng.uniform(1, 80, size=(n, 2))
+    return np.hstack([xy, xy + wh])
+
+
+def test_index_queries_match_brute_force():
+    rng = np.random.default_rng(7)
+    boxes = _random_boxes(rng, 400)
+    queries = _random_boxes(rng, 2500)
+    index = PageBoxIndex.from_page_boxes({1: boxes})
+
+    brute_overlap = overlap_matrix(queries, boxes).any(axis=1)
+    brute_iou = iou_matrix(queries, boxes).max(axis=1)
+    brute_inside = np.array(
+        [
+            any(
+                b[0] <= q[0] and b[1] <= q[1] and b[2] >= q[2] and b[3] >= q[3]
+                for b in boxes
+            )
+            for q in queries
+        ]
+    )
+
+    assert np.array_equal(index.any_overlap(1, queries), brute_overlap)
+    assert np.allclose(index.max_iou(1, queries), brute_iou)
+    assert np.array_equal(index.contained_by(1, queries), brute_inside)
+    assert np.array_equal(index.boxes(1), boxes)
+    assert not index.any_overlap(2, queries).any()
+
+
+def test_touching_edges_overlap_only_when_inclusive():
+    index = PageBoxIndex.from_page_boxes({1: np.array([[0, 0, 10, 10]])})
+    touching = np.array([[10, 0, 20, 10]])
+    assert index.any_overlap(1, touching)[0]
+    assert not index.any_overlap(1, touching, inclusive=False)[0]
+
+
+def test_normalize_to_top_left_flips_and_keeps_top_left_boxes():
+    boxes = np.array([[10, 700, 100, 750], [10, 900, 100, 950]])
+    out = normalize_to_top_left(boxes, 800)
+    assert out[0].tolist() == [10, 50, 100, 100]
+    # 뒤집으면 음수가 되는 박스는 이미 좌상단 원점으로 간주
+    assert out[1].tolist() == [10, 900, 100, 950]
+    assert first_below(np.array([50, 300, 100]), np.array([75, 400])).tolist() == [
+        1,
+        3,
+    ]
+
+
+def test_supplement_inserts_missing_equation_in_reading_order(tmp_path: Path):
+    path = tmp_path / "eq.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page()  # 595 x 842
+    page.insert_text((72, 100), "Introduction paragraph text.", fontsize=11)
+    page.insert_text((72, 200), "y = a x + b (1)", fontsize=11)
+    page.insert_text((72, 300), "z = c x + d (2)", fontsize=11)
+    page.insert_text((72, 400), "Closing paragraph text here.", fontsize=11)
+    doc.save(str(path))
+    doc.close()
+
+    height = 842
+
+    def _docling_block(text: str, top: float) -> ParsedBlock:
+        # Docling 좌하단 원점 bbox
+        return ParsedBlock(
+            page=1,
+            block_type="paragraph",
+            text=text,
+            bbox=BoundingBox(
+                x0=72, y0=height - top - 4, x1=300, y1=height - top + 12, page=1
+            ),
+        )
+
+    docling = [
+        _docling_block("Introduction paragraph text.", 88),
+        _docling_block("z = c x + d (2)", 288),
+        _docling_block("Closing paragraph text here.", 388),
+    ]
+
+    blocks = _supplement_missing_equations(path, docling)
+
+    assert [b.text for b in blocks] == [
+        "Introduction paragraph text.",
+        "y = a x + b (1)",
+        "z = c x + d (2)",
+        "Closing paragraph text here.",
+    ]
+    assert blocks[1].block_type == "equation"
+    assert blocks[1].equation_data["equationNumber"] == "1"
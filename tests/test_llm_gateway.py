@@ -0,0 +1,123 @@
+"""공용 LLM 게이트웨이 단위 테스트 (클라이언트 재사용, 모델 목록 캐시, 토큰 버킷, 서킷 브레이커)."""
+# tests/test_llm_gateway.py
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import google.generativeai as genai
+import pytest
+
+from tractara.llm_gateway import (
+    LLMGateway,
+    ModelUnavailableError,
+    TokenBucket,
+    get_gateway,
+)
+
+
+class _FakeStructuredClient:
+    def __init__(self, name: str, failures: int = 0):
+        self.name = name
+        self.failures = failures
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **_kwargs):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("429 Quota exceeded")
+        return self.name
+
+
+def _routing_gateway(monkeypatch, clients):
+    gateway = LLMGateway()
+    monkeypatch.setattr(
+        gateway, "structured_client", lambda name, api_key=None: clients[name]
+    )
+    return gateway
+
+
+def test_clients_and_model_catalog_are_reused(monkeypatch):
+    configured, listed = [], []
+    monkeypatch.setattr(genai, "configure", lambda **kw: configured.append(kw))
+
+    def list_models():
+        listed.append(1)
+        return [SimpleNamespace(name="models/gemini-2.5-flash")]
+
+    monkeypatch.setattr(genai, "list_models", list_models)
+    monkeypatch.setenv("GEMINI_MODEL", "custom-model")
+    gateway = get_gateway()
+
+    assert gateway.model("gemini-2.5-flash", "k1") is gateway.model(
+        "gemini-2.5-flash", "k1"
+    )
+    for _ in range(3):
+        assert gateway.model_candidates("k1") == ["custom-model", "gemini-2.5-flash"]
+    assert (len(configured), len(listed)) == (1, 1)
+
+    # 모델 목록 TTL이 지나면 다시 조회한다
+    monkeypatch.setenv("LLM_MODEL_CATALOG_TTL_SECONDS", "0")
+    gateway.model_candidates("k1")
+    assert len(listed) == 2
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(requests_per_minute=1200, burst=2)  # 50ms 간격
+    started = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 버스트 2개는 즉시, 나머지 2개는 50ms 간격
+    assert 0.09 <= time.monotonic() - started < 0.5
+
+
+def test_quota_errors_route_to_fallback_and_recover_after_cooldown(monkeypatch):
+    monkeypatch.setenv("LLM_CIRCUIT_FAILURES", "2")
+    monkeypatch.setenv("LLM_CIRCUIT_COOLDOWN_SECONDS", "0.1")
+    primary = _FakeStructuredClient("primary", failures=2)
+    fallback = _FakeStructuredClient("fallback")
+    gateway = _routing_gateway(monkeypatch, {"primary": primary, "fallback": fallback})
+
+    def ask(route=None):
+        return gateway.structured(["primary", "fallback"], [], object, route=route)
+
+    # 쿼터 초과 요청은 같은 요청을 다음 후보로 보내고, 응답한 모델을 기록한다
+    route = {}
+    assert ask(route) == "fallback"
+    assert route == {"model": "fallback"}
+    assert ask() == "fallback"
+    # 두 번 연속 초과로 서킷이 열려 쿨다운 동안에는 선호 모델에 요청하지 않는다
+    assert ask() == "fallback"
+    assert primary.calls == 2
+    # 쿨다운 후 선호 모델로 돌아간다 (영구 강등 없음)
+    time.sleep(0.12)
+    assert ask(route) == "primary"
+    assert route == {"model": "primary"}
+    assert asyncio.run(gateway.astructured(["primary", "fallback"], [], object)) == (
+        "primary"
+    )
+
+
+def test_structured_raises_when_every_candidate_is_exhausted(monkeypatch):
+    monkeypatch.setenv("LLM_CIRCUIT_FAILURES", "1")
+    only = _FakeStructuredClient("only", failures=5)
+    gateway = _routing_gateway(monkeypatch, {"only": only})
+
+    with pytest.raises(ModelUnavailableError):
+        gateway.structured(["only"], [], object)
+    with pytest.raises(ModelUnavailableError):
+        gateway.structured(["only"], [], object)
+    assert only.calls == 1
+
+    # 단일 모델 호출(call)은 열린 서킷의 쿨다운이 끝날 때까지 기다렸다가 시도한다
+    monkeypatch.setattr(gateway.breaker("only"), "cooldown", 0.05)
+    gateway.breaker("only").record_failure()
+    started = time.monotonic()
+    assert gateway.call("only", lambda: "ok") == "ok"
+    assert time.monotonic() - started >= 0.04
+    assert not gateway.breaker("only").is_open
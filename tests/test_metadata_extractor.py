@@ -1,12 +1,20 @@
+import os
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
+import instructor
 import pytest
 from lxml import etree
 
+from tractara.parsing import parse_cache
 from tractara.parsing.metadata_extractor import (
     ExtractedMetadata,
+    LLMMetadata,
     _apply_catalog_metadata,
+    _FrontBlock,
     _merge_xml_metadata,
+    _run_track_b,
 )
 
 
@@ -49,3 +57,44 @@ def test_apply_catalog_metadata_basic():
     assert meta.dc_creator == [{"name": "John Doe", "entityType": "person"}]
     assert meta.dc_subject == "Math"
     assert meta.dc_description == "Line 1 | Line 2"
+
+
+def _front_block(text: str) -> _FrontBlock:
+    return _FrontBlock(text, 11.0, False, 72, 72, 540, 90, 612, 792, 1)
+
+
+def test_track_b_cache_skips_repeat_llm_calls(tmp_path, monkeypatch):
+    monkeypatch.setenv("METADATA_CACHE_ENABLED", "1")
+    monkeypatch.setenv("METADATA_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def create(**_kwargs):
+        calls.append(1)
+        return LLMMetadata(dc_title="Steam Generator Tube Integrity", dc_type="Code")
+
+    fake_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    monkeypatch.setattr(instructor, "from_gemini", lambda **_kwargs: fake_client)
+
+    cover = [_front_block("Steam Generator Tube Integrity"), _front_block("NUREG-1234")]
+    first = _run_track_b(cover, "test-key")
+    # 공백만 다른 같은 표지는 캐시 적중
+    reflowed = [_front_block("Steam  Generator Tube\nIntegrity"), cover[1]]
+    second = _run_track_b(reflowed, "test-key")
+
+    assert calls == [1]
+    assert second == first
+    cache = parse_cache.get_metadata_cache()
+    assert cache.tier_stats(parse_cache.TIER_METADATA)["hitRate"] == 0.5
+
+    _run_track_b(cover, "test-key", use_cache=False)  # 우회 플래그
+    assert len(calls) == 2
+
+    # TTL 경과 항목은 미스로 처리되어 다시 호출한다
+    monkeypatch.setenv("METADATA_CACHE_TTL_DAYS", "1")
+    for entry in tmp_path.rglob("*.json.gz"):
+        stale = time.time() - 2 * 86400
+        os.utime(entry, (stale, stale))
+    _run_track_b(cover, "test-key")
+    assert len(calls) == 3
@@ -0,0 +1,59 @@
+"""ParsedBlock 슬롯 표현 및 공유 ContextPath 단위 테스트."""
+# tests/test_models.py
+import pickle
+import sys
+
+import pytest
+
+from tractara.parsing.models import (
+    EMPTY_CONTEXT_PATH,
+    BoundingBox,
+    ContextPath,
+    ParsedBlock,
+    ParsedDocument,
+)
+
+
+def test_context_path_is_shared_and_behaves_like_list():
+    chapter = EMPTY_CONTEXT_PATH.child("1. Scope")
+    section = chapter.child("1.1 Purpose")
+    first = ParsedBlock(page=1, block_type="paragraph", context_path=section)
+    second = ParsedBlock(page=1, block_type="paragraph", context_path=section)
+
+    assert first.context_path is second.context_path
+    assert section.parent is chapter
+    assert section == ["1. Scope", "1.1 Purpose"]
+    assert section[-1] == "1.1 Purpose" and section[:1] == ["1. Scope"]
+    assert len(section) == 2 and list(EMPTY_CONTEXT_PATH) == []
+    # 리스트로 넘겨도 체인으로 변환된다
+    assert ParsedBlock(page=1, block_type="x", context_path=["a"]).context_path == ["a"]
+
+
+def test_block_is_slotted_and_interns_block_type():
+    block = ParsedBlock(page=1, block_type="".join(["para", "graph"]))
+    assert block.block_type is sys.intern("paragraph")
+    with pytest.raises(AttributeError):
+        block.unknown = 1  # pylint: disable=attribute-defined-outside-init
+
+
+def test_serialization_materializes_context_path():
+    path = ContextPath.of(["Title", "Section"])
+    doc = ParsedDocument(
+        source_path="doc.pdf",
+        blocks=[
+            ParsedBlock(
+                page=2,
+                block_type="paragraph",
+                text="body",
+                bbox=BoundingBox(0, 0, 1, 1, 2),
+                context_path=path,
+            )
+        ],
+    )
+
+    data = doc.to_dict()
+    assert data["blocks"][0]["context_path"] == ["Title", "Section"]
+    assert type(data["blocks"][0]["context_path"]) is list
+    assert "parent_id" not in data["blocks"][0]
+    assert ParsedDocument.from_dict(data).blocks[0] == doc.blocks[0]
+    assert pickle.loads(pickle.dumps(doc)).blocks[0].context_path == path
@@ -0,0 +1,131 @@
+"""페이지 단위 스캔/디지털 판별 및 혼합 PDF 라우팅 단위 테스트."""
+# tests/test_page_triage.py
+from pathlib import Path
+from typing import Iterable
+
+import pymupdf
+
+from tractara.parsing import pdf_parser
+from tractara.parsing.models import ParsedBlock
+from tractara.parsing.page_triage import KIND_DIGITAL, KIND_SCANNED, triage_pages
+from tractara.parsing.pdf_session import PdfSession
+
+
+def _build_mixed_pdf(path: Path, pages: int, scanned: Iterable[int]) -> Path:
+    """scanned 페이지는 페이지 전체를 덮는 이미지만, 나머지는 텍스트만 넣는다."""
+    scanned = set(scanned)
+    pixmap = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 40, 40), False)
+    pixmap.set_rect(pixmap.irect, (200, 200, 200))
+    doc = pymupdf.open()
+    for i in range(pages):
+        page = doc.new_page()
+        if i in scanned:
+            page.insert_image(page.rect, pixmap=pixmap)
+        else:
+            if i % 5 == 0:
+                page.insert_text((72, 60), f"{i // 5 + 1}. Chapter", fontsize=20)
+            page.insert_text((72, 100), f"Body text on page {i + 1}.", fontsize=10)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_triage_classifies_each_page(tmp_path):
+    pdf_path = _build_mixed_pdf(tmp_path / "mixed.pdf", 6, scanned={2, 5})
+    with PdfSession(pdf_path) as pdf:
+        triage = triage_pages(pdf)
+
+    assert [t.kind for t in triage] == [
+        KIND_DIGITAL,
+        KIND_DIGITAL,
+        KIND_SCANNED,
+        KIND_DIGITAL,
+        KIND_DIGITAL,
+        KIND_SCANNED,
+    ]
+    assert triage[2].image_coverage == 1.0 and not triage[2].has_fonts
+
+
+def test_sampled_triage_refines_changed_runs(tmp_path):
+    pdf_path = _build_mixed_pdf(tmp_path / "long.pdf", 120, scanned=range(90, 110))
+    with PdfSession(pdf_path) as pdf:
+        triage = triage_pages(pdf, full_scan_pages=50, sample_stride=8)
+
+    assert [t.page_index for t in triage if t.kind == KIND_SCANNED] == list(
+        range(90, 110)
+    )
+    assert sum(1 for t in triage if t.inferred) > 60
+
+
+def test_parse_pdf_routes_scanned_pages_to_vision(tmp_path, monkeypatch):
+    pdf_path = _build_mixed_pdf(tmp_path / "mixed.pdf", 8, scanned={3, 6})
+    requested = []
+
+    class _FakeVision:
+        def iter_blocks(self, path, session=None, pages=None):
+            requested.extend(pages)
+            for i in pages:
+                yield ParsedBlock(
+                    page=i + 1, block_type="paragraph", text=f"ocr {i + 1}"
+                )
+
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(pdf_parser, "GeminiVisionParser", _FakeVision)
+    monkeypatch.setattr(pdf_parser, "DoclingParser", _raise_import_error)
+
+    parsed = pdf_parser.parse_pdf(pdf_path)
+
+    assert requested == [3, 6]
+    assert parsed.metadata["visionPages"] == [4, 7]
+    pages = [b.page for b in parsed.blocks]
+    assert pages == sorted(pages) and set(pages) == set(range(1, 9))
+    vision = [b for b in parsed.blocks if b.text.startswith("ocr")]
+    assert [b.page for b in vision] == [4, 7]
+    # Vision 블록은 직전 제목의 계층을 잇는다 ("2. Chapter"는 6쪽)
+    assert vision[1].context_path[-1] == "2. Chapter"
+    assert vision[1].parent_id is not None
+
+
+def test_stitch_relinks_blocks_under_headings_found_on_vision_pages():
+    def block(page, block_type, text, level=None):
+        return ParsedBlock(
+            page=page, block_type=block_type, text=text, level=level, block_id=text
+        )
+
+    # Docling OCR이 스캔 페이지(2쪽)에서 "1.1 Scope" 제목을 찾은 경우
+    digital = list(
+        pdf_parser._link_docling_blocks(
+            [
+                block(1, "section", "1. Intro", level=1),
+                block(2, "section", "1.1 Scope", level=2),
+                block(2, "paragraph", "ocr noise"),
+                block(3, "paragraph", "Scope body"),
+                block(3, "section", "1.1.1 Detail", level=3),
+                block(3, "paragraph", "Detail body"),
+            ]
+        )
+    )
+    vision = [ParsedBlock(page=2, block_type="paragraph", text="vision text")]
+
+    merged = pdf_parser._stitch_vision_pages(digital, vision)
+
+    by_text = {b.text: b for b in merged}
+    assert [b.text for b in merged] == [
+        "1. Intro",
+        "vision text",
+        "Scope body",
+        "1.1.1 Detail",
+        "Detail body",
+    ]
+    kept_ids = {b.block_id for b in merged}
+    assert all(b.parent_id is None or b.parent_id in kept_ids for b in merged)
+    assert by_text["vision text"].parent_id == "1. Intro"
+    assert by_text["Scope body"].parent_id == "1. Intro"
+    assert list(by_text["Scope body"].context_path) == ["1. Intro"]
+    assert by_text["1.1.1 Detail"].parent_id == "1. Intro"
+    assert by_text["Detail body"].parent_id == "1.1.1 Detail"
+    assert list(by_text["Detail body"].context_path) == ["1. Intro", "1.1.1 Detail"]
+
+
+def _raise_import_error(*_args, **_kwargs):
+    raise ImportError("docling not installed")
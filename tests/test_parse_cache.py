@@ -0,0 +1,94 @@
+"""ParseCache 단위 테스트."""
+# tests/test_parse_cache.py
+import os
+import time
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+from tractara.parsing import pdf_parser
+from tractara.parsing.parse_cache import TIER_RAW, ParseCache, get_parse_cache
+from tractara.parsing.pdf_parser import parse_pdf
+from tractara.parsing.xml_parser import parse_xml
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch) -> Path:
+    root = tmp_path / "cache"
+    monkeypatch.setenv("PARSE_CACHE_ENABLED", "1")
+    monkeypatch.setenv("PARSE_CACHE_DIR", str(root))
+    return root
+
+
+def _shape(parsed):
+    index = {b.block_id: i for i, b in enumerate(parsed.blocks)}
+    return [
+        (b.block_type, b.text, b.level, index.get(b.parent_id), b.structured_content)
+        for b in parsed.blocks
+    ]
+
+
+def test_parse_xml_uses_parsed_tier(cache_dir: Path, s1000d_xml_path: Path):
+    first = parse_xml(s1000d_xml_path)
+    second = parse_xml(s1000d_xml_path)
+
+    stats = get_parse_cache().stats()["parsed"]
+    assert stats["misses"] == 1 and stats["hits"] == 1
+    assert _shape(second) == _shape(first)
+    assert second.relations == first.relations
+    assert second.blocks[0].block_id == first.blocks[0].block_id
+
+
+def test_parse_pdf_cache_hit_skips_parsers(
+    cache_dir: Path, tmp_path: Path, monkeypatch
+):
+    path = tmp_path / "doc.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page()
+    for i in range(5):
+        page.insert_text((72, 72 + i * 20), f"Line {i} of a digital document body.")
+    doc.save(str(path))
+    doc.close()
+
+    first = parse_pdf(path)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("parser should not run on cache hit")
+
+    monkeypatch.setattr(pdf_parser, "_parse_pdf_hybrid", _fail)
+    second = parse_pdf(path)
+
+    assert [b.text for b in second.blocks] == [b.text for b in first.blocks]
+    assert second.blocks[0].bbox == first.blocks[0].bbox
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path: Path):
+    cache = ParseCache(tmp_path / "lru", max_bytes=10**9)
+    payload = {"data": "x" * 2000}
+    for key in ("aa01", "bb02", "cc03"):
+        cache.put(TIER_RAW, key, payload)
+
+    entry_size = cache._path(TIER_RAW, "aa01").stat().st_size
+    cache.max_bytes = entry_size * 3
+
+    # aa01을 최근 사용으로 만든 뒤 새 항목을 추가하면 bb02가 밀려난다
+    old = time.time() - 100
+    for i, key in enumerate(("aa01", "bb02", "cc03")):
+        os.utime(cache._path(TIER_RAW, key), (old + i, old + i))
+    assert cache.get(TIER_RAW, "aa01") == payload
+    cache.put(TIER_RAW, "dd04", payload)
+
+    assert cache.get(TIER_RAW, "bb02") is None
+    assert cache.get(TIER_RAW, "aa01") == payload
+    assert cache.get(TIER_RAW, "dd04") == payload
+    assert cache.stats()["raw"]["misses"] == 1
+
+
+def test_failed_put_leaves_no_temp_file(tmp_path: Path):
+    cache = ParseCache(tmp_path / "leak", max_bytes=10**9)
+
+    cache.put(TIER_RAW, "aa01", {"data": object()})  # 직렬화 불가
+
+    assert cache.get(TIER_RAW, "aa01") is None
+    assert [p for p in (tmp_path / "leak").rglob("*") if p.is_file()] == []
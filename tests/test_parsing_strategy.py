@@ -12,32 +12,49 @@ from tractara.parsing.pdf_parser import (
 )
 
 
-@patch("tractara.parsing.pdf_parser.pymupdf")
+@patch("tractara.parsing.pdf_session.pymupdf")
 @patch("tractara.parsing.pdf_parser.DoclingParser")
 @patch("tractara.parsing.pdf_parser.PyMuPDFParser")
 def test_docling_pymupdf_parsing(MockPyMuPDF, MockDocling, mock_pymupdf_mod):
     """Docling+PyMuPDF 멀티엔진 테스트 (Mocked)"""
     pdf_path = Path("data/test_sample.pdf")
 
-    # Mock pymupdf.open so parse_pdf doesn't try to open a real file
+    # Mock pymupdf.open so PdfSession doesn't try to open a real file
     mock_doc = MagicMock()
     mock_doc.__len__ = lambda self: 5
     mock_page = MagicMock()
 
     # get_text("dict") 호출 시 올바른 딕셔너리 구조를 반환하도록 수정
+    # (PdfSession은 평문 텍스트도 dict에서 파생하므로 텍스트 span을 포함)
     def mock_get_text(format_type="text", *args, **kwargs):
         if format_type == "dict":
-            return {"blocks": []}
+            span = {
+                "text": "x" * 200,
+                "size": 10.0,
+                "flags": 0,
+                "font": "Times",
+                "bbox": (0, 0, 100, 10),
+            }
+            return {
+                "blocks": [
+                    {"type": 0, "bbox": (0, 0, 100, 10), "lines": [{"spans": [span]}]}
+                ]
+            }
         return "x" * 200
 
     mock_page.get_text.side_effect = mock_get_text
 
     # 페이지의 rect.height 가 Int 등 숫자 자료형으로 반환되도록 Mocking
     mock_rect = MagicMock()
+    mock_rect.width = 600
     mock_rect.height = 800
     mock_page.rect = mock_rect
+    # 페이지 판별(page_triage): 폰트 있음 + 이미지 없음 → 디지털 페이지
+    mock_page.get_fonts.return_value = [(1, "ttf", "TrueType", "Times", "F1", "")]
+    mock_page.get_images.return_value = []
 
     mock_doc.__iter__ = lambda self: iter([mock_page] * 5)
+    mock_doc.__getitem__ = lambda self, idx: mock_page
     mock_pymupdf_mod.open.return_value = mock_doc
 
     # Mock DoclingParser behavior
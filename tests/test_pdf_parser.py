@@ -0,0 +1,121 @@
+"""PyMuPDFParser 단위 테스트 (실제 PDF 생성 기반)."""
+# tests/test_pdf_parser.py
+from pathlib import Path
+from typing import List
+
+import pymupdf
+import pytest
+
+from tractara.parsing.models import ParsedBlock
+from tractara.parsing.pdf_parser import (
+    PyMuPDFParser,
+    _iter_reclassify_equations,
+    _plan_shards,
+    _reclassify_equations,
+)
+
+
+def _build_report_pdf(path: Path, chapters: int, pages_per_chapter: int) -> Path:
+    """장(chapter)마다 북마크가 있는 다중 페이지 보고서 PDF를 생성한다."""
+    doc = pymupdf.open()
+    toc = []
+    for ch in range(1, chapters + 1):
+        for p in range(pages_per_chapter):
+            page = doc.new_page()
+            y = 72
+            if p == 0:
+                page.insert_text((72, y), f"{ch}. Chapter {ch}", fontsize=20)
+                toc.append([1, f"{ch}. Chapter {ch}", doc.page_count])
+                y += 40
+            if p == 1:
+                page.insert_text((72, y), f"{ch}.1 Details", fontsize=15)
+                y += 30
+            for i in range(6):
+                page.insert_text(
+                    (72, y + i * 18),
+                    f"Paragraph {i} of chapter {ch} page {p} with body text.",
+                    fontsize=10,
+                )
+            page.insert_text((72, y + 130), f"x = a + b ({ch}.{p + 1})", fontsize=10)
+    doc.set_toc(toc)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _structure(blocks: List[ParsedBlock]):
+    """block_id(UUID)를 순번으로 치환한 비교용 구조."""
+    index = {b.block_id: i for i, b in enumerate(blocks)}
+    return [
+        (
+            b.page,
+            b.block_type,
+            b.text,
+            b.level,
+            tuple(b.context_path),
+            index.get(b.parent_id),
+            b.section_label,
+            b.equation_data,
+        )
+        for b in blocks
+    ]
+
+
+@pytest.fixture
+def report_pdf(tmp_path: Path) -> Path:
+    return _build_report_pdf(tmp_path / "report.pdf", chapters=6, pages_per_chapter=4)
+
+
+def test_parallel_parse_matches_serial(report_pdf: Path):
+    serial = PyMuPDFParser(max_workers=1).parse(report_pdf)
+    parallel = PyMuPDFParser(max_workers=3, parallel_min_pages=1).parse(report_pdf)
+
+    assert _structure(parallel.blocks) == _structure(serial.blocks)
+    # 샤드 경계를 넘어도 장 제목이 부모로 이어져야 한다
+    chapter_6 = [b for b in parallel.blocks if b.context_path[:1] == ["6. Chapter 6"]]
+    assert chapter_6 and all(b.page >= 21 for b in chapter_6)
+
+
+def test_plan_shards_snaps_to_bookmarks():
+    bookmarks = [[1, "A", 1], [1, "B", 48], [1, "C", 103]]
+    shards = _plan_shards(200, bookmarks, 4)
+
+    assert shards[0][0] == 0 and shards[-1][1] == 200
+    starts = [start for start, _ in shards]
+    assert 47 in starts and 102 in starts
+    assert all(start < end for start, end in shards)
+
+
+def test_plan_shards_single():
+    assert _plan_shards(10, [], 1) == [(0, 10)]
+
+
+def test_iter_blocks_streams_same_blocks_as_parse(report_pdf: Path):
+    parser = PyMuPDFParser(max_workers=1)
+    streamed = list(parser.iter_blocks(report_pdf))
+    parsed = parser.parse(report_pdf)
+
+    assert _structure(streamed) == _structure(parsed.blocks)
+    assert any(b.block_type == "equation" for b in streamed)
+
+
+def test_streaming_reclassify_matches_list_version():
+    texts = [
+        "The energy balance is given by",
+        "Q = m c dT (3)",
+        "where m is the mass of the coolant in the loop.",
+        "Contact: someone@example.org",
+        "x + y = z",
+    ]
+
+    def _blocks():
+        return [
+            ParsedBlock(page=1, block_type="paragraph", text=t, block_id=str(i))
+            for i, t in enumerate(texts)
+        ]
+
+    listed = [b.block_type for b in _reclassify_equations(_blocks())]
+    streamed = [b.block_type for b in _iter_reclassify_equations(iter(_blocks()))]
+
+    assert streamed == listed
+    assert listed[1] == "equation" and listed[3] == "paragraph"
@@ -0,0 +1,136 @@
+"""PdfSession 단위 테스트."""
+# tests/test_pdf_session.py
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+from tractara.parsing import pdf_parser
+from tractara.parsing.metadata_extractor import (
+    DocumentStats,
+    _extract_frontmatter_blocks,
+)
+from tractara.parsing.models import ParsedDocument
+from tractara.parsing.pdf_parser import PyMuPDFParser
+from tractara.parsing.pdf_session import PdfSession
+
+
+@pytest.fixture
+def sample_pdf(tmp_path: Path) -> Path:
+    """제목(큰 폰트) + 본문(11pt) 3페이지 PDF를 생성한다."""
+    path = tmp_path / "sample.pdf"
+    doc = pymupdf.open()
+    for page_no in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"{page_no + 1}. Section Title", fontsize=18)
+        for i in range(5):
+            page.insert_text(
+                (72, 120 + i * 20),
+                f"Body line {i} on page {page_no + 1} with enough text.",
+                fontsize=11,
+            )
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_page_dict_is_decoded_once(sample_pdf: Path, monkeypatch):
+    decode_calls = []
+    original = pymupdf.Page.get_text
+
+    def counting_get_text(self, *args, **kwargs):
+        decode_calls.append(self.number)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(pymupdf.Page, "get_text", counting_get_text)
+
+    with PdfSession(sample_pdf) as session:
+        for i in range(session.page_count):
+            session.page_dict(i)
+            session.page_text(i)
+        session.span_table()
+        session.body_font_size()
+        _extract_frontmatter_blocks(sample_pdf, session)
+        PyMuPDFParser().parse(sample_pdf, session=session)
+
+    assert sorted(decode_calls) == [0, 1, 2]
+
+
+def test_span_table_and_body_font(sample_pdf: Path):
+    with PdfSession(sample_pdf) as session:
+        table = session.span_table()
+        assert len(table) == 18
+        assert table.bbox.shape == (18, 4)
+        assert set(table.page.tolist()) == {0, 1, 2}
+        assert session.body_font_size() == 11.0
+        assert "Body line 0 on page 2" in session.page_text(1)
+
+
+def test_parser_output_same_with_shared_session(sample_pdf: Path):
+    standalone = PyMuPDFParser().parse(sample_pdf)
+    with PdfSession(sample_pdf) as session:
+        shared = PyMuPDFParser().parse(sample_pdf, session=session)
+
+    assert [(b.page, b.block_type, b.text) for b in standalone.blocks] == [
+        (b.page, b.block_type, b.text) for b in shared.blocks
+    ]
+
+
+def _long_pdf(tmp_path: Path, pages: int = 60) -> Path:
+    path = tmp_path / "long.pdf"
+    doc = pymupdf.open()
+    for page_no in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 120), f"Body text on page {page_no + 1}.", fontsize=11)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_standalone_metadata_decodes_bounded_pages(tmp_path: Path, monkeypatch):
+    path = _long_pdf(tmp_path)
+
+    decode_calls = []
+    original = pymupdf.Page.get_text
+
+    def counting_get_text(self, *args, **kwargs):
+        decode_calls.append(self.number)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(pymupdf.Page, "get_text", counting_get_text)
+
+    blocks, body_font_size = _extract_frontmatter_blocks(path)
+    assert body_font_size == 11.0
+    assert {b.page for b in blocks} == {1, 2, 3, 4, 59, 60}
+    assert 6 < len(set(decode_calls)) <= 30  # 표본 24쪽 + 앞뒤 6쪽
+
+    # 파싱 단계 통계가 있으면 앞/뒤 페이지만 디코딩한다
+    decode_calls.clear()
+    _, body_font_size = _extract_frontmatter_blocks(
+        path, stats=DocumentStats(body_font_size=9.5)
+    )
+    assert body_font_size == 9.5
+    assert sorted(decode_calls) == [0, 1, 2, 3, 58, 59]
+
+
+def test_docling_path_records_full_document_body_font(tmp_path: Path, monkeypatch):
+    path = _long_pdf(tmp_path)
+
+    class _FakeDocling:
+        def parse(self, pdf_path):
+            return ParsedDocument(source_path=str(pdf_path), blocks=[])
+
+    monkeypatch.setattr(pdf_parser, "get_default_pool", lambda: None)
+    monkeypatch.setattr(pdf_parser, "DoclingParser", _FakeDocling)
+
+    with PdfSession(path) as session:
+        parsed, _ = pdf_parser._parse_digital_pdf(path, session)
+        assert parsed.metadata["bodyFontSize"] == 11.0
+        assert DocumentStats.from_parsed(parsed).body_font_size == 11.0
+
+    # 모든 페이지 dict가 캐시된 세션에서는 표본 대신 전체 기준 값을 쓴다
+    with PdfSession(path) as session:
+        for _ in session.iter_page_dicts():
+            pass
+        assert session.sample_body_font_size(24) == 11.0
+        assert session._body_font_size == 11.0  # 표본 추정치는 캐시되지 않는다
@@ -0,0 +1,145 @@
+"""LLM TERM 추출 엔진 단위 테스트 (동시 요청, 재시도, 순서 보존, 구조화된 경고)."""
+# tests/test_term_extraction.py
+import threading
+import time
+
+import pytest
+
+from tractara.normalization import term_mapper
+from tractara.normalization.term_mapper import (
+    ExtractedTerm,
+    LLMTermExtractor,
+    TermExtractionResult,
+)
+
+
+@pytest.fixture(autouse=True)
+def _offline_client(monkeypatch):
+    monkeypatch.setattr(
+        LLMTermExtractor, "_get_model_candidates", lambda self: ["test-model"]
+    )
+
+
+def _result(term: str) -> TermExtractionResult:
+    return TermExtractionResult(
+        terms=[
+            ExtractedTerm(
+                term=term,
+                headword_en=term,
+                headword_ko=term,
+                definition_en=f"{term} definition",
+                definition_ko="정의",
+                context=term,
+            )
+        ],
+        reasoning="",
+    )
+
+
+def test_extract_runs_all_chunks_concurrently_in_order(monkeypatch):
+    chunks = [f"Chunk number {i:02d} with enough text." for i in range(12)]
+    active, peak, lock = [0], [0], threading.Lock()
+    attempts = {}
+
+    def fake_extract(self, text, route=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            attempts[text] = attempts.get(text, 0) + 1
+        try:
+            time.sleep(0.05)
+            index = int(text.split()[2])
+            if index == 3 and attempts[text] == 1:
+                raise ConnectionError("transient")
+            if index == 7:
+                raise ValueError("bad response")
+            return _result(f"T{index:02d}")
+        finally:
+            with lock:
+                active[0] -= 1
+
+    monkeypatch.setattr(LLMTermExtractor, "_extract_from_chunk", fake_extract)
+    extractor = LLMTermExtractor(
+        "key", max_concurrency=4, max_retries=1, retry_backoff=0.0
+    )
+
+    started = time.perf_counter()
+    candidates, problems = extractor.extract(chunks)
+    elapsed = time.perf_counter() - started
+
+    assert [c.term for c in candidates] == [f"T{i:02d}" for i in range(12) if i != 7]
+    assert peak[0] == 4
+    # 직렬 14회(재시도 포함) x 50ms보다 훨씬 짧다
+    assert elapsed < 0.5
+    (problem,) = problems
+    assert problem.code == "term_chunk_failed"
+    assert problem.target == "chunks[7]"
+    assert problem.meta == {"chunkIndex": 7, "attempts": 2, "errorType": "ValueError"}
+
+
+def test_extract_stops_on_invalid_api_key(monkeypatch):
+    def fake_extract(self, text, route=None):
+        raise RuntimeError("403 API key expired")
+
+    monkeypatch.setattr(LLMTermExtractor, "_extract_from_chunk", fake_extract)
+    extractor = LLMTermExtractor("key", max_concurrency=1, retry_backoff=0.0)
+
+    candidates, problems = extractor.extract(["A long enough chunk of text."] * 3)
+
+    assert candidates == []
+    (problem,) = problems
+    assert problem.code == "llm_api_key_invalid"
+    assert problem.meta == {"skippedChunks": 3}
+
+
+def test_extract_reuses_cached_chunk_responses(tmp_path, monkeypatch):
+    monkeypatch.setenv("TERM_CACHE_ENABLED", "1")
+    monkeypatch.setenv("TERM_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def fake_extract(self, text, route=None):
+        calls.append(text)
+        return _result(text.split()[1])
+
+    monkeypatch.setattr(LLMTermExtractor, "_extract_from_chunk", fake_extract)
+    chunks = ["Chunk Alpha with enough text.", "Chunk Beta with enough text."]
+
+    first, _ = LLMTermExtractor("key", retry_backoff=0.0).extract(chunks)
+    # 같은 청크(공백만 다른 경우 포함)를 다시 보내면 LLM을 호출하지 않는다
+    second, problems = LLMTermExtractor("key", retry_backoff=0.0).extract(
+        [chunks[0], "Chunk  Beta with\nenough text."]
+    )
+
+    assert len(calls) == 2
+    assert problems == []
+    assert [c.term for c in second] == [c.term for c in first] == ["Alpha", "Beta"]
+    stats = term_mapper.get_term_cache().tier_stats(term_mapper.TIER_TERMS)
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+
+    LLMTermExtractor("key", use_cache=False).extract(chunks)  # 우회 플래그
+    assert len(calls) == 4
+
+
+def test_fallback_model_answers_are_cached_under_the_fallback_model(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv("TERM_CACHE_ENABLED", "1")
+    monkeypatch.setenv("TERM_CACHE_DIR", str(tmp_path))
+    answered_by, calls = ["fallback-model"], []
+
+    def fake_extract(self, text, route=None):
+        calls.append(text)
+        route["model"] = answered_by[0]
+        return _result(answered_by[0])
+
+    monkeypatch.setattr(LLMTermExtractor, "_extract_from_chunk", fake_extract)
+    chunks = ["Chunk Alpha with enough text."]
+
+    LLMTermExtractor("key", retry_backoff=0.0).extract(chunks)
+    # 폴백 모델 응답은 선호 모델(test-model)의 결과로 재사용하지 않는다
+    answered_by[0] = "test-model"
+    second, _ = LLMTermExtractor("key", retry_backoff=0.0).extract(chunks)
+    third, _ = LLMTermExtractor("key", retry_backoff=0.0).extract(chunks)
+
+    assert len(calls) == 2
+    assert [c.term for c in second] == [c.term for c in third] == ["test-model"]
@@ -0,0 +1,115 @@
+"""TERM 사전 필터 단위 테스트 (결정론적 후보 탐지 + SSoT 색인 대조)."""
+# tests/test_term_prefilter.py
+import pytest
+
+from tractara.api.pipeline import extract_term_baselines
+from tractara.normalization import term_mapper
+from tractara.normalization.chunk_packer import TextChunk
+from tractara.normalization.term_prefilter import (
+    find_term_candidates,
+    known_term_index,
+    prefilter_chunks,
+)
+from tractara.parsing.models import ParsedBlock, ParsedDocument
+from tractara.ssot import term_ssot_repository
+
+_KNOWN_TERMS = [
+    {
+        "termId": "term:class:aging_management_program",
+        "term": "AMP",
+        "headword_en": "Aging Management Program",
+        "headword_ko": "경년열화 관리 프로그램",
+    },
+    {
+        "termId": "term:class:stress_corrosion_cracking",
+        "term": "SCC",
+        "headword_en": "Stress Corrosion Cracking",
+        "headword_ko": "응력부식균열",
+    },
+]
+
+
+@pytest.fixture
+def term_ssot(tmp_path, monkeypatch):
+    monkeypatch.setattr(term_ssot_repository, "SSOT_TERM_DIR", tmp_path / "terms")
+    term_ssot_repository.upsert_terms(_KNOWN_TERMS)
+    return tmp_path / "terms"
+
+
+def test_find_term_candidates_covers_abbreviations_phrases_and_korean():
+    english = (
+        "The Aging Management Programs (AMP) monitor Stress Corrosion Cracking. "
+        "In This section the LOCA analysis is summarised."
+    )
+    assert find_term_candidates(english) == {
+        "aging management program",
+        "amp",
+        "stress corrosion cracking",
+        "loca",
+    }
+    korean = "경년열화 관리 프로그램(AMP)은 응력부식균열을 감시해야 한다."
+    assert find_term_candidates(korean) == {"amp", "경년열화", "프로그램", "응력부식균열"}
+    assert find_term_candidates("the valve was closed after inspection.") == set()
+
+
+def test_prefilter_skips_chunks_without_unseen_terms(term_ssot):
+    chunks = [
+        TextChunk("The AMP covers Stress Corrosion Cracking of piping."),
+        TextChunk("the valve was closed after the inspection was complete."),
+        TextChunk("Flow Accelerated Corrosion (FAC) thins carbon steel pipes."),
+        # 섹션 경로 접두어의 용어는 후보로 보지 않는다
+        TextChunk(
+            "[Reactor Vessel Internals]\n응력부식균열(SCC) 감시",
+            breadcrumb=["Reactor Vessel Internals"],
+        ),
+    ]
+
+    result = prefilter_chunks(chunks)
+
+    assert result.chunks == [chunks[2]]
+    assert result.as_metrics() == {"chunks": 4, "skipped": 3}
+
+    # 새 TERM이 SSoT에 승격되면 색인을 다시 읽는다
+    term_ssot_repository.upsert_terms(
+        [
+            {
+                "termId": "term:class:flow_accelerated_corrosion",
+                "term": "FAC",
+                "headword_en": "Flow Accelerated Corrosion",
+            }
+        ]
+    )
+    assert "fac" in known_term_index()
+    assert prefilter_chunks(chunks).chunks == []
+
+
+def test_extract_term_candidates_skips_llm_when_every_chunk_is_known(
+    term_ssot, monkeypatch
+):
+    def no_llm(*_args, **_kwargs):
+        raise AssertionError("LLM must not be called")
+
+    monkeypatch.setattr(term_mapper, "LLMTermExtractor", no_llm)
+    parsed = ParsedDocument(
+        source_path="report.pdf",
+        blocks=[
+            ParsedBlock(
+                page=1,
+                block_type="paragraph",
+                text="The Aging Management Program (AMP) manages SCC in piping.",
+            )
+        ],
+    )
+    stats = {}
+
+    candidates, problems = term_mapper.extract_term_candidates(
+        parsed, llm_api_key="key", stats=stats
+    )
+
+    assert (candidates, problems) == ([], [])
+    assert stats == {"chunks": 1, "skipped": 1}
+
+    # 모든 청크를 건너뛴 것은 "0 terms" 경고 대상이 아니다
+    warnings = []
+    assert extract_term_baselines(parsed, "DOC_1", "key", warnings) == []
+    assert warnings == []
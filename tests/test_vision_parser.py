@@ -0,0 +1,116 @@
+"""GeminiVisionParser 동시 처리/체크포인트 단위 테스트 (가짜 Gemini 모델 사용)."""
+# tests/test_vision_parser.py
+import random
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pymupdf
+import pytest
+
+from tractara.parsing.pdf_parser import GeminiVisionParser
+from tractara.parsing.vision_pages import PageCheckpoint, RateLimiter
+
+_DPI = 72  # 렌더링 폭(px) == 페이지 폭(pt) → 이미지로 페이지 번호 복원
+
+
+def _build_scanned_pdf(path: Path, pages: int) -> Path:
+    """페이지마다 폭이 다른 빈 PDF (폭 = 100 + 페이지 인덱스)."""
+    doc = pymupdf.open()
+    for i in range(pages):
+        doc.new_page(width=100 + i, height=140)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class _FakeModel:
+    """이미지 폭으로 페이지를 식별해 응답한다. 무작위 지연으로 완료 순서를 섞는다."""
+
+    def __init__(self, fail_pages=()):
+        self.requested = []
+        self.fail_pages = set(fail_pages)
+        self._lock = threading.Lock()
+
+    def generate_content(self, contents):
+        page_index = contents[1].size[0] - 100
+        with self._lock:
+            self.requested.append(page_index)
+        time.sleep(random.uniform(0, 0.01))
+        if page_index in self.fail_pages:
+            raise RuntimeError("429 quota exceeded")
+        return SimpleNamespace(text=f"text of page {page_index + 1}")
+
+
+def _parser(model: _FakeModel, checkpoint_dir: Path, **kwargs) -> GeminiVisionParser:
+    parser = GeminiVisionParser(
+        api_key="test-key",
+        max_concurrency=4,
+        requests_per_minute=0,
+        render_workers=1,
+        checkpoint_dir=checkpoint_dir,
+        dpi=_DPI,
+        **kwargs,
+    )
+    parser._model = model
+    return parser
+
+
+@pytest.mark.parametrize("render_workers", [1, 2])
+def test_parses_every_page_in_order(tmp_path, render_workers):
+    pdf_path = _build_scanned_pdf(tmp_path / "scan.pdf", 13)
+    model = _FakeModel()
+    parser = _parser(model, tmp_path / "ckpt")
+    parser.render_workers = render_workers
+
+    parsed = parser.parse(pdf_path)
+
+    assert [b.page for b in parsed.blocks] == list(range(1, 14))
+    assert parsed.blocks[6].text == "text of page 7"
+    assert sorted(model.requested) == list(range(13))
+    # 전체 완료 후 체크포인트 정리
+    assert not any((tmp_path / "ckpt").iterdir())
+
+
+def test_failed_run_resumes_from_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _s: None)  # 재시도 백오프 생략
+    pdf_path = _build_scanned_pdf(tmp_path / "scan.pdf", 10)
+    checkpoint_dir = tmp_path / "ckpt"
+
+    failing = _FakeModel(fail_pages={6})
+    with pytest.raises(RuntimeError, match="page 7"):
+        _parser(failing, checkpoint_dir, max_retries=1).parse(pdf_path)
+    assert failing.requested.count(6) == 2  # 최초 + 재시도 1회
+
+    (ckpt,) = list(checkpoint_dir.iterdir())
+    saved = PageCheckpoint(ckpt).load_all()
+    assert 6 not in saved and set(range(6)) <= set(saved)
+
+    resumed = _FakeModel()
+    parsed = _parser(resumed, checkpoint_dir).parse(pdf_path)
+    assert [b.text for b in parsed.blocks] == [
+        f"text of page {i + 1}" for i in range(10)
+    ]
+    assert sorted(resumed.requested) == sorted(set(range(10)) - set(saved))
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(requests_per_minute=1200)  # 50ms 간격
+    started = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert time.monotonic() - started >= 0.19
+
+
+def test_failed_checkpoint_save_leaves_no_temp_file(tmp_path):
+    checkpoint = PageCheckpoint(tmp_path / "ckpt")
+
+    checkpoint.save(0, "broken \ud800 surrogate")  # UTF-8로 인코딩 불가
+    checkpoint.save(1, "ok")
+
+    assert [p.name for p in (tmp_path / "ckpt").iterdir()] == ["page-000001.json"]
+    assert checkpoint.load_all() == {1: "ok"}
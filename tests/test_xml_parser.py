@@ -5,9 +5,10 @@ from pathlib import Path
 import pytest
 from lxml import etree
 
+from tractara.catalogs import catalog_loader
 from tractara.parsing.metadata_extractor import extract_metadata
 from tractara.parsing.models import ParsedDocument
-from tractara.parsing.xml_parser import parse_xml
+from tractara.parsing.xml_parser import CatalogDrivenStrategy, parse_xml
 
 
 # 테스트용 더미 파일 생성 픽스처
@@ -206,8 +207,50 @@ def test_s1000d_parsing(s1000d_xml_file: Path):
     assert step.source_xpath is not None and "proceduralStep" in step.source_xpath
     assert step.source_element_name.lower() == "proceduralstep"
 
-    # Phase 3 xml fragment
-    assert step.xml_fragment is not None and "<proceduralStep" in step.xml_fragment
+    # Phase 3 xml fragment: 파싱 시에는 직렬화하지 않는다 (Fragment Store 저장 시 생성)
+    assert step.xml_fragment is None
+    assert step.source_xpath == (
+        "/dmodule/content/procedure/mainProcedure/levelledPara/proceduralStep[2]"
+    )
+
+
+def test_iter_blocks_streams_same_blocks_as_parse(s1000d_xml_file: Path):
+    root = etree.parse(str(s1000d_xml_file)).getroot()
+    strategy = CatalogDrivenStrategy(catalog_loader.detect_catalog(root.tag.lower()))
+
+    relations: list = []
+    stream = strategy.iter_blocks(root, relations)
+    first = next(stream)
+    assert first.block_type == "title"
+
+    streamed = [first] + list(stream)
+    parsed = strategy.parse(root, str(s1000d_xml_file))
+
+    def _shape(blocks):
+        index = {b.block_id: i for i, b in enumerate(blocks)}
+        return [(b.block_type, b.text, index.get(b.parent_id)) for b in blocks]
+
+    assert _shape(streamed) == _shape(parsed.blocks)
+    assert relations == parsed.relations
+
+
+def test_applic_id_index_is_built_per_document():
+    def _module(applic_id: str) -> bytes:
+        return (
+            f'<dmodule><identAndStatusSection><dmStatus><applic id="{applic_id}">'
+            "<displayText><simplePara>All</simplePara></displayText></applic>"
+            "</dmStatus></identAndStatusSection><content><procedure><mainProcedure>"
+            '<proceduralStep applicRefId="app-1"><para>Step one.</para>'
+            "</proceduralStep></mainProcedure></procedure></content></dmodule>"
+        ).encode("utf-8")
+
+    strategy = CatalogDrivenStrategy(catalog_loader.detect_catalog("dmodule"))
+    for applic_id, resolved in (("app-1", True), ("app-2", False), ("app-1", True)):
+        blocks = strategy.parse(etree.fromstring(_module(applic_id)), "dm.xml").blocks
+        (step,) = [b for b in blocks if b.block_type == "procedureStep"]
+        assert step.structured_content["applicRefId"] == "app-1"
+        # 앞 문서의 색인을 재사용하지 않는다 (없는 applic 참조는 트리 없이 남는다)
+        assert ("applicTree" in step.structured_content) is resolved
 
 
 def test_s1000d_metadata_extraction(s1000d_xml_file: Path):
@@ -217,6 +260,30 @@ def test_s1000d_metadata_extraction(s1000d_xml_file: Path):
     assert "Verification: tabtop" in meta.dc_description
 
 
+def test_metadata_reuses_parsed_tree(s1000d_xml_file: Path, monkeypatch):
+    parse_calls = []
+    original_parse = etree.parse
+
+    def counting_parse(*args, **kwargs):
+        parse_calls.append(args[0])
+        return original_parse(*args, **kwargs)
+
+    monkeypatch.setattr(etree, "parse", counting_parse)
+
+    parsed = parse_xml(s1000d_xml_file)
+    assert parsed.xml_source is not None
+    assert parsed.xml_source.catalog["format_id"] == catalog_loader.detect_catalog(
+        "dmodule"
+    ).get("format_id")
+    shared = extract_metadata(s1000d_xml_file, xml_source=parsed.xml_source)
+    assert len(parse_calls) == 1
+
+    # 트리가 없으면(예: 캐시 적중) 파일을 한 번 더 파싱해 같은 결과를 낸다
+    assert extract_metadata(s1000d_xml_file) == shared
+    assert len(parse_calls) == 2
+    assert "xml_source" not in parsed.to_dict()
+
+
 def test_generic_xml_parsing(tmp_path: Path):
     generic_xml = """<root>
         <some_node>Some text</some_node>
@@ -0,0 +1,156 @@
+"""iterparse 스트리밍 XML 전략 단위 테스트 (트리 방식과 같은 블록/관계)."""
+# tests/test_xml_stream.py
+from pathlib import Path
+
+from lxml import etree
+
+from tractara.catalogs import catalog_loader
+from tractara.normalization.doc_mapper import build_doc_baseline
+from tractara.parsing import xml_parser
+from tractara.parsing.metadata_extractor import extract_metadata
+from tractara.parsing.xml_parser import CatalogDrivenStrategy
+from tractara.parsing.xml_stream import StreamingCatalogStrategy
+from tractara.ssot.fragment_store import FileFragmentStore
+
+_S1000D = """<?xml version="1.0" encoding="UTF-8"?>
+<dmodule>
+  <identAndStatusSection>
+    <dmAddress>
+      <dmIdent><dmCode modelIdentCode="BIKE" systemDiffCode="A" systemCode="00"
+        subSystemCode="0" subSubSystemCode="0" assyCode="00" disassyCode="00"
+        disassyCodeVariant="A" infoCode="520" infoCodeVariant="A"
+        itemLocationCode="D"/></dmIdent>
+      <dmAddressItems><issueDate year="2024" month="1" day="2"/>
+        <dmTitle><techName>Bicycle</techName><infoName>Wheel removal</infoName></dmTitle>
+      </dmAddressItems>
+    </dmAddress>
+    <dmStatus issueType="new">
+      <applic id="app-1"><displayText><simplePara>All</simplePara></displayText></applic>
+      <brexDmRef><dmRef><dmRefIdent><dmCode modelIdentCode="BIKE" systemDiffCode="A"
+        systemCode="00" subSystemCode="0" subSubSystemCode="0" assyCode="00"
+        disassyCode="00" disassyCodeVariant="A" infoCode="022" infoCodeVariant="A"
+        itemLocationCode="D"/></dmRefIdent></dmRef></brexDmRef>
+    </dmStatus>
+  </identAndStatusSection>
+  <content>
+    <procedure>
+      <preliminaryRqmts>
+        <reqCondGroup><noConds/></reqCondGroup>
+        <reqSafety><safetyRqmts><warning><warningAndCautionPara>Hot</warningAndCautionPara></warning></safetyRqmts></reqSafety>
+      </preliminaryRqmts>
+      <mainProcedure>
+        <levelledPara>
+          <title>Removal</title>
+          <para>Put the bike on a stand.</para>
+          <proceduralStep applicRefId="app-1"><para>Open the brake.</para>
+            <proceduralStep><para>Hold the wheel.</para></proceduralStep>
+          </proceduralStep>
+          <levelledPara>
+            <para>Paragraph before the title.</para>
+            <title>Late title</title>
+            <note><notePara>Keep the washer.</notePara></note>
+          </levelledPara>
+          <levelledPara><para>No title at all.</para></levelledPara>
+        </levelledPara>
+        <proceduralStep><para>Remove the wheel.</para>
+          <torque><torqueValue>40</torqueValue><torqueUnit>Nm</torqueUnit></torque>
+        </proceduralStep>
+      </mainProcedure>
+      <closeRqmts><reqCondGroup><noConds/></reqCondGroup></closeRqmts>
+    </procedure>
+  </content>
+</dmodule>
+"""
+
+_JATS = """<?xml version="1.0" encoding="UTF-8"?>
+<article>
+  <front><article-meta>
+    <title-group><article-title>Streaming test</article-title></title-group>
+  </article-meta></front>
+  <body>
+    <sec><title>1. Introduction</title>
+      <p>See <xref ref-type="bibr" rid="r1">[1]</xref>.</p>
+      <sec><title>1.1 Scope</title><p>Nested.</p></sec>
+    </sec>
+    <sec><title>2. Method</title><disp-formula>E = mc^2</disp-formula></sec>
+  </body>
+  <back><ref-list><ref id="r1">Ref one</ref><ref id="r2">Ref two</ref></ref-list></back>
+</article>
+"""
+
+
+def _write(tmp_path: Path, name: str, content: str) -> Path:
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _normalize(blocks):
+    index = {b.block_id: i for i, b in enumerate(blocks)}
+    return [
+        (
+            b.block_type,
+            b.text,
+            b.level,
+            index.get(b.parent_id),
+            list(b.context_path),
+            b.structured_content,
+            b.source_element_name,
+        )
+        for b in blocks
+    ]
+
+
+def _targets(relations):
+    return [(r["relationType"], r["target"]) for r in relations]
+
+
+def _both(path: Path):
+    tree = etree.parse(str(path))
+    catalog = catalog_loader.detect_catalog(tree.getroot().tag.lower())
+    tree_relations, stream_relations = [], []
+    tree_blocks = list(
+        CatalogDrivenStrategy(catalog).iter_blocks(tree.getroot(), tree_relations)
+    )
+    stream_blocks = list(
+        StreamingCatalogStrategy(catalog).iter_file_blocks(path, stream_relations)
+    )
+    return tree, (tree_blocks, tree_relations), (stream_blocks, stream_relations)
+
+
+def test_streaming_matches_tree_strategy(tmp_path: Path):
+    for name, content in (("dm.xml", _S1000D), ("article.xml", _JATS)):
+        tree, (tree_blocks, tree_rel), (stream_blocks, stream_rel) = _both(
+            _write(tmp_path, name, content)
+        )
+
+        assert _normalize(stream_blocks) == _normalize(tree_blocks)
+        assert _targets(stream_rel) == _targets(tree_rel)
+        # 경로 형식은 다르지만 같은 요소를 가리킨다
+        for old, new in zip(tree_blocks, stream_blocks):
+            if old.source_xpath:
+                assert tree.xpath(new.source_xpath) == tree.xpath(old.source_xpath)
+
+
+def test_parse_xml_streams_large_files(tmp_path: Path, monkeypatch):
+    path = _write(tmp_path, "dm.xml", _S1000D)
+    monkeypatch.setattr(xml_parser, "_use_streaming", lambda _path: True)
+
+    parsed = xml_parser.parse_xml(path)
+
+    assert parsed.metadata["xmlStreaming"] is True
+    # 처리한 본문은 비워지고 헤더는 남아 메타데이터 추출이 재사용한다
+    root = parsed.xml_source.root
+    assert root.find(".//proceduralStep") is None
+    meta = extract_metadata(path, xml_source=parsed.xml_source)
+    assert meta.dc_title == "Bicycle - Wheel removal"
+
+    monkeypatch.chdir(tmp_path)
+    build_doc_baseline(parsed)
+    store = FileFragmentStore(tmp_path / "src/data/landing/fragments")
+    tree = etree.parse(str(path))
+    for block in parsed.blocks:
+        if block.source_xpath:
+            (element,) = tree.xpath(block.source_xpath)
+            expected = etree.tostring(element, encoding="unicode", with_tail=False)
+            assert store.get(block.block_id) == expected